@@ -10,6 +10,47 @@ import os
 from scipy.ndimage import label, find_objects
 from scipy import ndimage
 
+from vector_geometry import PolygonShape, clip_ring
+from image_assets import load_image_asset
+
+# Procedural map polygons (pixel coordinates, x right / y down)
+AFRICA_COASTLINE = [
+    (80, 100), (85, 150), (90, 200), (95, 250), (100, 300), (105, 350),
+    (110, 400), (115, 450), (120, 480), (125, 520), (130, 540),
+    (140, 560), (160, 570), (180, 575), (200, 570), (220, 560), (240, 550),
+    (260, 545), (280, 540), (300, 540), (320, 545), (340, 555), (360, 570),
+    (380, 580), (400, 575), (420, 560), (440, 540), (460, 520), (480, 500),
+    (500, 480), (510, 450), (515, 420), (520, 380), (525, 340), (530, 300),
+    (540, 260), (550, 220), (560, 180), (570, 140), (580, 100),
+    (570, 80), (550, 75), (530, 72), (510, 70), (490, 68), (470, 67),
+    (450, 68), (430, 72), (410, 78), (390, 85), (370, 90), (350, 92),
+    (330, 90), (310, 85), (290, 82), (270, 80), (250, 82), (230, 85),
+    (210, 90), (190, 92), (170, 90), (150, 85), (130, 80), (110, 78), (90, 82), (80, 90), (80, 100)
+]
+
+NIGER_POLYGON = [
+    (280, 200), (380, 210), (390, 270), (380, 280), (280, 275), (270, 220), (280, 200)
+]
+
+# Rasters partagés entre instances: (largeur, hauteur, source) -> masques en pixels.
+# Changer de nombre de drones ne relance ni le dessin PIL ni l'érosion.
+_RASTER_CACHE = {}
+
+# Carte procédurale en géométrie vectorielle: (largeur, hauteur) ->
+# (Afrique trouée par le Niger, Niger), découpés au cadre de l'image
+_VECTOR_SHAPES = {}
+
+
+def get_vector_shapes(width, height):
+    """(Afrique sans le Niger, Niger) triangulés une seule fois par cadre."""
+    key = (width, height)
+    if key not in _VECTOR_SHAPES:
+        frame = (0.0, width - 1.0, 0.0, height - 1.0)
+        niger = clip_ring(NIGER_POLYGON, frame)
+        _VECTOR_SHAPES[key] = (PolygonShape(clip_ring(AFRICA_COASTLINE, frame), holes=[niger]),
+                               PolygonShape(niger))
+    return _VECTOR_SHAPES[key]
+
 class AfricaMapGenerator:
     """Generate Africa map with Niger highlighted for drone formations."""
     
@@ -32,7 +73,7 @@ class AfricaMapGenerator:
     def create_detailed_africa_map(self):
         """Load the Africa map reference image instead of generating."""
         # Try to load reference image
-        ref_path = r"e:\Hama\DRONES-3D-ANEM-2025\data\assets\africa_map_reference.png"
+        ref_path = self._reference_path()
         
         if os.path.exists(ref_path):
             self.map_img = Image.open(ref_path)
@@ -43,31 +84,17 @@ class AfricaMapGenerator:
             img = Image.new('RGB', (self.width, self.height), color=(220, 220, 220))
             draw = ImageDraw.Draw(img)
             
-            africa_coastline = [
-                (80, 100), (85, 150), (90, 200), (95, 250), (100, 300), (105, 350),
-                (110, 400), (115, 450), (120, 480), (125, 520), (130, 540),
-                (140, 560), (160, 570), (180, 575), (200, 570), (220, 560), (240, 550),
-                (260, 545), (280, 540), (300, 540), (320, 545), (340, 555), (360, 570),
-                (380, 580), (400, 575), (420, 560), (440, 540), (460, 520), (480, 500),
-                (500, 480), (510, 450), (515, 420), (520, 380), (525, 340), (530, 300),
-                (540, 260), (550, 220), (560, 180), (570, 140), (580, 100),
-                (570, 80), (550, 75), (530, 72), (510, 70), (490, 68), (470, 67),
-                (450, 68), (430, 72), (410, 78), (390, 85), (370, 90), (350, 92),
-                (330, 90), (310, 85), (290, 82), (270, 80), (250, 82), (230, 85),
-                (210, 90), (190, 92), (170, 90), (150, 85), (130, 80), (110, 78), (90, 82), (80, 90), (80, 100)
-            ]
-            
-            draw.polygon(africa_coastline, outline=(200, 200, 200), fill=(245, 245, 245), width=2)
-            
-            niger_polygon = [
-                (280, 200), (380, 210), (390, 270), (380, 280), (280, 275), (270, 220), (280, 200)
-            ]
-            draw.polygon(niger_polygon, outline=(200, 50, 50), fill=(220, 50, 50), width=3)
+            draw.polygon(AFRICA_COASTLINE, outline=(200, 200, 200), fill=(245, 245, 245), width=2)
+            draw.polygon(NIGER_POLYGON, outline=(200, 50, 50), fill=(220, 50, 50), width=3)
             
             self.map_img = img
         
         return self.map_img
     
+    @staticmethod
+    def _reference_path():
+        return r"e:\Hama\DRONES-3D-ANEM-2025\data\assets\africa_map_reference.png"
+    
     def save_map(self, filepath):
         """Save generated map image."""
         if self.map_img is None:
@@ -91,93 +118,142 @@ class AfricaMapGenerator:
             positions: (N, 3) array of drone positions
             colors: (N, 3) array of RGB colors
         """
-        if self.map_img is None:
-            self.create_detailed_africa_map()
-        
-        # Convert to numpy array for processing
-        img_array = np.array(self.map_img)
-        
-        # === DETECT REGIONS ===
-        # Africa (light gray, ~245)
-        africa_mask = (img_array[:, :, 0] > 240) & \
-                     (img_array[:, :, 1] > 240) & \
-                     (img_array[:, :, 2] > 240)
-        
-        # Niger (red/orange, R>200, G<100, B<100)
-        niger_mask = (img_array[:, :, 0] > 200) & \
-                    (img_array[:, :, 1] < 100) & \
-                    (img_array[:, :, 2] < 100)
-        
-        # Get coordinates
-        africa_coords = np.column_stack(np.where(africa_mask))
-        niger_coords = np.column_stack(np.where(niger_mask))
-        
-        # Also get contours/edges
-        africa_edges = self._get_contour_points(africa_mask)
-        
-        positions = []
-        colors = []
+        positions, colors, _ = self.extract_drone_layers(num_drones)
+        return positions, colors
+
+    def extract_drone_layers(self, num_drones=1000, seed=2025):
+        """
+        Same sampling as extract_drone_coordinates, plus the Niger mask.
+        The procedural map is sampled on its polygons (no raster round trip);
+        a reference image, when present, is sampled from its pixels.
+
+        Returns:
+            positions: (num_drones, 3) float32 (padding drones at the origin)
+            colors: (num_drones, 3) float32
+            niger_mask: (num_drones,) bool, True for the red Niger drones
+        """
+        if not os.path.exists(self._reference_path()):
+            return self._extract_vector_layers(num_drones, seed)
+
+        rng = np.random.default_rng(seed)
+        raster = self.get_raster()
+        africa_coords = raster['africa_coords']
+        niger_coords = raster['niger_coords']
+        africa_edges = raster['africa_edges']
+
+        positions = np.zeros((num_drones, 3), dtype=np.float32)
+        colors = np.zeros((num_drones, 3), dtype=np.float32)
+        niger_mask = np.zeros(num_drones, dtype=bool)
+        count = 0
         
         # === SAMPLE AFRICA OUTLINE (70% of drones) ===
         num_africa = int(num_drones * 0.7)
         
         if len(africa_edges) > 0:
             if len(africa_edges) > num_africa:
-                indices = np.random.choice(len(africa_edges), num_africa, replace=False)
+                indices = rng.choice(len(africa_edges), num_africa, replace=False)
                 africa_sample = africa_edges[indices]
             else:
                 africa_sample = africa_edges
                 # If not enough edges, add some interior points
                 if len(africa_sample) < num_africa:
                     remaining = num_africa - len(africa_sample)
-                    interior_indices = np.random.choice(len(africa_coords), remaining, replace=False)
+                    interior_indices = rng.choice(len(africa_coords), remaining, replace=False)
                     interior_points = africa_coords[interior_indices]
                     africa_sample = np.vstack([africa_sample, interior_points])
             
-            # Convert pixel coords to 3D world space
-            africa_3d = self._pixel_to_3d(africa_sample)
-            positions.append(africa_3d)
-            colors.append(np.tile([0.95, 0.95, 1.0], (len(africa_sample), 1)))  # White/star color
+            # Convert pixel coords to 3D world space (trim to exact num_drones)
+            africa_sample = africa_sample[:num_drones]
+            positions[:len(africa_sample)] = self._pixel_to_3d(africa_sample)
+            colors[:len(africa_sample)] = [0.95, 0.95, 1.0]  # White/star color
+            count = len(africa_sample)
         
         # === SAMPLE NIGER (30% of drones) ===
         num_niger = int(num_drones * 0.3)
         
         if len(niger_coords) > 0:
             if len(niger_coords) > num_niger:
-                indices = np.random.choice(len(niger_coords), num_niger, replace=False)
+                indices = rng.choice(len(niger_coords), num_niger, replace=False)
                 niger_sample = niger_coords[indices]
             else:
                 niger_sample = niger_coords
             
             # Convert to 3D
-            niger_3d = self._pixel_to_3d(niger_sample)
-            positions.append(niger_3d)
-            colors.append(np.tile([1.0, 0.2, 0.2], (len(niger_sample), 1)))  # Red
+            niger_sample = niger_sample[:num_drones - count]
+            end = count + len(niger_sample)
+            positions[count:end] = self._pixel_to_3d(niger_sample)
+            colors[count:end] = [1.0, 0.2, 0.2]  # Red
+            niger_mask[count:end] = True
         
-        # Combine and normalize
-        if positions:
-            all_positions = np.vstack(positions)
-            all_colors = np.vstack(colors)
+        return positions, colors, niger_mask
+
+    def _extract_vector_layers(self, num_drones, seed):
+        """
+        Vector sampling of the procedural map: 70% on the Africa outline
+        (coast + Niger border, arc-length spaced, at most one drone per
+        pixel of perimeter, the rest inside Africa), 30% area-uniform
+        inside Niger. Exact counts, deterministic for a given seed.
+        """
+        africa, niger = get_vector_shapes(self.width, self.height)
+        num_africa = int(num_drones * 0.7)
+        num_niger = int(num_drones * 0.3)
+        num_outline = min(num_africa, int(africa.perimeter))
+
+        # Points (x, y) -> pixel [row, col] for _pixel_to_3d
+        layers = [africa.sample_outline(num_outline, seed),
+                  africa.sample_interior(num_africa - num_outline, seed),
+                  niger.sample_interior(num_niger, seed)]
+        sample = np.vstack(layers)[:, ::-1]
+
+        positions = np.zeros((num_drones, 3), dtype=np.float32)
+        colors = np.zeros((num_drones, 3), dtype=np.float32)
+        niger_mask = np.zeros(num_drones, dtype=bool)
+        count = len(sample)
+        positions[:count] = self._pixel_to_3d(sample)
+        colors[:num_africa] = [0.95, 0.95, 1.0]  # White/star color
+        colors[num_africa:count] = [1.0, 0.2, 0.2]  # Red
+        niger_mask[num_africa:count] = True
+        return positions, colors, niger_mask
+
+    def get_raster(self):
+        """
+        Pixel coordinates of the Africa / Niger masks and of the Africa edges,
+        computed once per (size, source) and shared by every generator.
+        """
+        ref_path = self._reference_path()
+        source = ref_path if os.path.exists(ref_path) else 'procedural'
+        key = (self.width, self.height, source)
+        if key not in _RASTER_CACHE:
+            if source != 'procedural':
+                # Reference image decoded once (memory-mapped asset bundle)
+                img_array = load_image_asset(ref_path).rgb()
+            else:
+                if self.map_img is None:
+                    self.create_detailed_africa_map()
+                # Convert to numpy array for processing
+                img_array = np.array(self.map_img)
             
-            # Pad or trim to exact num_drones
-            current_num = len(all_positions)
-            if current_num < num_drones:
-                padding = num_drones - current_num
-                all_positions = np.vstack([
-                    all_positions,
-                    np.zeros((padding, 3), dtype=np.float32)
-                ])
-                all_colors = np.vstack([
-                    all_colors,
-                    np.zeros((padding, 3), dtype=np.float32)
-                ])
-            elif current_num > num_drones:
-                all_positions = all_positions[:num_drones]
-                all_colors = all_colors[:num_drones]
+            # === DETECT REGIONS ===
+            # Africa (light gray, ~245)
+            africa_mask = (img_array[:, :, 0] > 240) & \
+                         (img_array[:, :, 1] > 240) & \
+                         (img_array[:, :, 2] > 240)
             
-            return all_positions.astype(np.float32), all_colors.astype(np.float32)
-        
-        return np.zeros((num_drones, 3), dtype=np.float32), np.zeros((num_drones, 3), dtype=np.float32)
+            # Niger (red/orange, R>200, G<100, B<100)
+            niger_mask = (img_array[:, :, 0] > 200) & \
+                        (img_array[:, :, 1] < 100) & \
+                        (img_array[:, :, 2] < 100)
+            
+            raster = {
+                'africa_coords': np.column_stack(np.where(africa_mask)),
+                'niger_coords': np.column_stack(np.where(niger_mask)),
+                # Also get contours/edges
+                'africa_edges': self._get_contour_points(africa_mask),
+            }
+            for coords in raster.values():
+                coords.setflags(write=False)
+            _RASTER_CACHE[key] = raster
+        return _RASTER_CACHE[key]
     
     def _get_contour_points(self, mask):
         """Extract contour points from binary mask."""
@@ -0,0 +1,505 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+                  PISTES CAMÉRA KEYFRAMÉES (DONNÉES YAML) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Les mouvements de caméra de chaque phase sont des données
+(config/camera_tracks.yaml) et non plus des branches if/elif:
+
+1. ChannelTrack    : keyframes triées (temps, valeur, easing d'arrivée) d'un
+                     canal (dist, yaw, pitch, target_y, lerp_speed), évaluées
+                     par recherche binaire → O(log k)
+2. CameraTrack     : canaux d'une phase + modificateurs procéduraux
+                     (rate: orbite continue, wave: respiration, shake: vent)
+3. CameraTimeline  : pistes de toute une séquence fusionnées en une piste
+                     globale par canal → cible caméra à un instant arbitraire
+                     du show en O(log k), quel que soit le nombre de phases
+4. Bake            : échantillonne le chemin lissé complet (lerp, dérive,
+                     contraintes narratives) dans un tableau de poses pour la
+                     lecture, la prévisualisation et le rendu hors ligne
+
+Format YAML d'un canal: liste de [t, valeur] ou [t, valeur, easing], ou
+{ease: step, keys: [...]} pour fixer l'easing par défaut. Deux clés au même
+instant forment une discontinuité (la seconde s'applique à partir de t).
+Avant la première clé et après la dernière, la valeur est maintenue.
+
+Usage (bake d'une séquence):  python src/camera_tracks.py [phase ...]
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import bisect
+import math
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import yaml
+
+import curves
+
+
+CHANNELS = ('dist', 'yaw', 'pitch', 'target_y', 'lerp_speed')
+
+# --- NARRATIVE ANCHORS CONFIGURATION (copiés par CameraSystem) ---
+CAMERA_PRESETS = {
+    # Ground Intent: Human/Crane perspective (8-15m)
+    "ground": {"dist": 200.0, "yaw": 12.0, "pitch": -10.0, "target_y": 55.0, "intent": "human"},
+    "desert": {"dist": 180.0, "yaw": -30.0, "pitch": -25.0, "target_y": 30.0, "intent": "plongee"},
+
+    # Interaction Intent: Relationship/Flow perspective (30-50m)
+    "interaction": {"dist": 220.0, "yaw": 18.0, "pitch": -12.0, "target_y": 65.0, "intent": "observer"},
+    "intimate": {"dist": 170.0, "yaw": 10.0, "pitch": -11.0, "target_y": 50.0, "intent": "observer"},
+    "pluie": {"dist": 280.0, "yaw": 12.0, "pitch": -3.0, "target_y": 60.0, "intent": "observer"},
+
+    # Drones Intent: Coverage/Monumental (50-70m)
+    "monument": {"dist": 200.0, "yaw": 12.0, "pitch": -14.0, "target_y": 75.0, "intent": "monumental"},
+    "text": {"dist": 240.0, "yaw": 18.0, "pitch": -13.0, "target_y": 80.0, "intent": "monumental"},
+    "heritage": {"dist": 190.0, "yaw": 20.0, "pitch": -14.0, "target_y": 85.0, "intent": "monumental"},
+    "science": {"dist": 220.0, "yaw": 18.0, "pitch": -13.0, "target_y": 75.0, "intent": "monumental"},
+
+    # Global Intent: Vision System (70-120m)
+    "flag": {"dist": 350.0, "yaw": 20.0, "pitch": -8.0, "target_y": 90.0, "intent": "vision"},
+    "wide": {"dist": 360.0, "yaw": 20.0, "pitch": -7.0, "target_y": 95.0, "intent": "vision"},
+    "wide_opening": {"dist": 150.0, "yaw": 0.0, "pitch": -25.0, "target_y": 30.0, "intent": "vision"},
+
+    # Africa Map - direct overhead view (drone view)
+    "africa_map": {"dist": 150.0, "yaw": 0.0, "pitch": -89.0, "target_y": 50.0, "intent": "vision"},
+}
+
+DEFAULT_TRACKS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   '..', 'config', 'camera_tracks.yaml')
+
+
+def _step(u):
+    """Maintient la valeur précédente jusqu'à la clé (saut au temps de la clé)."""
+    return np.zeros_like(np.asarray(u, dtype=np.float64))[()]
+
+
+EASINGS = {
+    'linear': lambda u: u,
+    'step': _step,
+    'smoothstep': curves.smoothstep,
+    'smootherstep': curves.smootherstep,
+    'min_jerk': curves.min_jerk,
+    'ease_in_quad': curves.ease_in_quad,
+    'ease_out_quad': curves.ease_out_quad,
+    'ease_in_out_quad': curves.ease_in_out_quad,
+    'ease_in_cubic': curves.ease_in_cubic,
+    'ease_out_cubic': curves.ease_out_cubic,
+    'ease_in_out_cubic': curves.ease_in_out_cubic,
+}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                                  CANAUX
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ChannelTrack:
+    """Keyframes d'un canal, évaluées par recherche binaire"""
+
+    def __init__(self, keys: Sequence[Tuple[float, float, str]]):
+        # Tri stable: deux clés au même instant gardent leur ordre (discontinuité)
+        keys = sorted(keys, key=lambda k: k[0])
+        if not keys:
+            raise ValueError("Un canal caméra doit avoir au moins une keyframe")
+        for _, _, ease in keys:
+            if ease not in EASINGS:
+                raise ValueError(f"Easing inconnu: {ease!r} ({', '.join(EASINGS)})")
+        self.times = [float(k[0]) for k in keys]
+        self.values = [float(k[1]) for k in keys]
+        self.eases = [k[2] for k in keys]
+        self._times = np.array(self.times)
+        self._values = np.array(self.values)
+
+    @classmethod
+    def from_yaml(cls, data) -> "ChannelTrack":
+        default = 'linear'
+        if isinstance(data, dict):
+            default = data.get('ease', default)
+            data = data['keys']
+        return cls([(k[0], k[1], k[2] if len(k) > 2 else default) for k in data])
+
+    @classmethod
+    def constant(cls, value: float, time: float = 0.0) -> "ChannelTrack":
+        return cls([(time, value, 'linear')])
+
+    @property
+    def start(self) -> float:
+        return self.times[0]
+
+    @property
+    def end(self) -> float:
+        return self.times[-1]
+
+    def __len__(self):
+        return len(self.times)
+
+    def evaluate(self, t: float) -> float:
+        """Valeur à l'instant t (O(log k))."""
+        i = bisect.bisect_right(self.times, t) - 1
+        if i < 0:
+            return self.values[0]
+        if i >= len(self.times) - 1:
+            return self.values[-1]
+        t0, t1 = self.times[i], self.times[i + 1]
+        u = (t - t0) / (t1 - t0)
+        v0, v1 = self.values[i], self.values[i + 1]
+        return v0 + (v1 - v0) * float(EASINGS[self.eases[i + 1]](u))
+
+    def evaluate_many(self, t: np.ndarray) -> np.ndarray:
+        """Valeurs à tous les instants t (vectorisé, pour le bake)."""
+        t = np.asarray(t, dtype=np.float64)
+        i = np.searchsorted(self._times, t, side='right') - 1
+        last = len(self.times) - 1
+        lo = np.clip(i, 0, last)
+        hi = np.clip(i + 1, 0, last)
+        span = self._times[hi] - self._times[lo]
+        u = np.where(span > 0, (t - self._times[lo]) / np.where(span > 0, span, 1.0), 0.0)
+        eased = np.empty_like(u)
+        arriving = np.array(self.eases, dtype=object)[hi]
+        for name in set(arriving):
+            mask = arriving == name
+            eased[mask] = EASINGS[name](u[mask])
+        result = self._values[lo] + (self._values[hi] - self._values[lo]) * eased
+        result[i < 0] = self.values[0]
+        result[i >= last] = self.values[-1]
+        return result
+
+    def keys(self, offset: float = 0.0, until: Optional[float] = None) -> List[Tuple[float, float, str]]:
+        """Clés décalées de offset, tronquées strictement avant until."""
+        return [(t + offset, v, e) for t, v, e in zip(self.times, self.values, self.eases)
+                if until is None or t + offset < until]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                       MODIFICATEURS PROCÉDURAUX
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@dataclass(frozen=True)
+class TrackModifier:
+    """
+    Terme ajouté à un canal sur [start, end) (temps local de la phase):
+    - rate  : rate × (t - start)               (orbite continue, °/s; acquis après end)
+    - wave  : amplitude × sin(omega × t)       (respiration)
+    - shake : a(t) × (0.5 - frac(t × frequency)), a interpolé de
+              amplitude[0] à amplitude[1]       (tremblement de vent)
+    """
+    type: str
+    channel: str
+    start: float = 0.0
+    end: float = math.inf
+    rate: float = 0.0
+    amplitude: Tuple[float, float] = (0.0, 0.0)
+    omega: float = 0.0
+    frequency: float = 0.0
+
+    @classmethod
+    def from_yaml(cls, data: dict) -> "TrackModifier":
+        data = dict(data)
+        if data.get('type') not in ('rate', 'wave', 'shake'):
+            raise ValueError(f"Modificateur caméra inconnu: {data.get('type')!r}")
+        if data.get('channel') not in CHANNELS:
+            raise ValueError(f"Canal caméra inconnu: {data.get('channel')!r}")
+        amplitude = data.pop('amplitude', 0.0)
+        if not isinstance(amplitude, (list, tuple)):
+            amplitude = (amplitude, amplitude)
+        if data.get('end') is None:
+            data.pop('end', None)
+        return cls(amplitude=tuple(float(a) for a in amplitude), **data)
+
+    def evaluate(self, t: float) -> float:
+        if t < self.start:
+            return 0.0
+        if self.type == 'rate':
+            return self.rate * (min(t, self.end) - self.start)   # Angle acquis conservé
+        if t >= self.end:
+            return 0.0
+        if self.type == 'wave':
+            return self.amplitude[0] * math.sin(self.omega * t)
+        span = self.end - self.start
+        u = (t - self.start) / span if math.isfinite(span) and span > 0 else 0.0
+        amp = self.amplitude[0] + (self.amplitude[1] - self.amplitude[0]) * u
+        return amp * (0.5 - ((t * self.frequency) % 1.0))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                              PISTE D'UNE PHASE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class CameraTrack:
+    """Canaux keyframés + modificateurs d'une phase"""
+    name: str
+    channels: Dict[str, ChannelTrack] = field(default_factory=dict)
+    modifiers: List[TrackModifier] = field(default_factory=list)
+
+    @classmethod
+    def from_yaml(cls, name: str, data: dict) -> "CameraTrack":
+        channels = {}
+        for channel, keys in (data.get('channels') or {}).items():
+            if channel not in CHANNELS:
+                raise ValueError(f"Phase {name}: canal caméra inconnu {channel!r}")
+            channels[channel] = ChannelTrack.from_yaml(keys)
+        modifiers = [TrackModifier.from_yaml(m) for m in data.get('modifiers') or []]
+        return cls(name, channels, modifiers)
+
+    @property
+    def duration(self) -> float:
+        """Instant de la dernière clé (les modificateurs peuvent continuer)."""
+        return max((c.end for c in self.channels.values()), default=0.0)
+
+    def evaluate(self, t: float, base: Dict[str, float]) -> Dict[str, float]:
+        """
+        Cibles à l'instant local t. Les canaux sans clés gardent la valeur de
+        base (preset de la phase, vitesse de lerp choisie par set_phase_view).
+        """
+        values = {ch: (self.channels[ch].evaluate(t) if ch in self.channels else base[ch])
+                  for ch in CHANNELS}
+        for modifier in self.modifiers:
+            values[modifier.channel] += modifier.evaluate(t)
+        return values
+
+
+def load_camera_tracks(path: Optional[str] = None) -> Dict[str, CameraTrack]:
+    """Pistes par phase depuis le YAML (dict vide si le fichier est absent)."""
+    path = path or DEFAULT_TRACKS_PATH
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+    return {name: CameraTrack.from_yaml(name, spec)
+            for name, spec in (data.get('phases') or {}).items()}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                    ORBITE LISSÉE (PARTAGÉE AVEC CameraSystem)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def phase_base(preset: dict, prev_intent: str) -> Dict[str, float]:
+    """Valeurs de base d'une phase, comme CameraSystem.set_phase_view."""
+    # "Return to Earth": descente plus lente depuis une vue globale
+    slow = prev_intent == "vision" and preset["intent"] in ["human", "observer"]
+    return {
+        'dist': preset["dist"],
+        'yaw': preset["yaw"],
+        'pitch': preset["pitch"],
+        'target_y': preset["target_y"],
+        'lerp_speed': 0.25 if slow else 0.8,
+    }
+
+
+def orbit_eye(dist: float, yaw: float, pitch: float, target_y: float,
+              drift_time: float, intent: str) -> Tuple[float, float, float]:
+    """Position de la caméra: micro-dérive vivante + contraintes narratives."""
+    # Living Camera Micro-Drift (Limited to 1-3m for realism)
+    drift_yaw = 1.2 * math.sin(drift_time * 0.08)
+    drift_pitch = 0.6 * math.cos(drift_time * 0.12)
+    drift_dist = 1.5 * math.sin(drift_time * 0.06)
+
+    rad_yaw = math.radians(yaw + drift_yaw)
+    rad_pitch = math.radians(pitch + drift_pitch)
+    final_dist = dist + drift_dist
+
+    x = final_dist * math.sin(rad_yaw) * math.cos(rad_pitch)
+    y = target_y + final_dist * math.sin(rad_pitch)
+    z = final_dist * math.cos(rad_yaw) * math.cos(rad_pitch)
+
+    # Constraint A: NEVER go underground
+    y = max(5.0, y)
+    # Constraint B: Observer Hierarchy (Drones > Camera > Ground), sauf 'plongee'
+    if intent != "plongee" and y > target_y - 5.0:
+        y = max(5.0, target_y - 5.0)
+    return x, y, z
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                      TIMELINE D'UN SHOW COMPLET + BAKE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class CameraPath:
+    """Chemin caméra précalculé: poses eye(3) + target(3) + up(3) à fps fixe"""
+    fps: float
+    poses: np.ndarray                  # (T, 9) float32
+
+    @property
+    def duration(self) -> float:
+        return (len(self.poses) - 1) / self.fps
+
+    def pose_at(self, t: float) -> Tuple[float, ...]:
+        """Pose interpolée à l'instant t (accès direct par index, O(1))."""
+        x = min(max(t * self.fps, 0.0), len(self.poses) - 1)
+        i = min(int(x), len(self.poses) - 2) if len(self.poses) > 1 else 0
+        u = x - i
+        if len(self.poses) == 1:
+            return tuple(float(v) for v in self.poses[0])
+        pose = self.poses[i] * (1.0 - u) + self.poses[i + 1] * u
+        return tuple(float(v) for v in pose)
+
+    def save(self, path: str):
+        np.savez_compressed(path, fps=self.fps, poses=self.poses)
+
+    @classmethod
+    def load(cls, path: str) -> "CameraPath":
+        with np.load(path) as data:
+            return cls(float(data['fps']), data['poses'])
+
+
+class CameraTimeline:
+    """
+    Séquence de phases (nom, durée, preset) fusionnée en une piste globale
+    par canal: cibles à un instant absolu du show en O(log k).
+    """
+
+    def __init__(self, entries: Sequence[Tuple[str, float, dict]],
+                 tracks: Dict[str, CameraTrack], initial_intent: str = "human"):
+        self.names = [name for name, _, _ in entries]
+        self.starts = []
+        self.intents = []
+        self.modifiers: List[List[TrackModifier]] = []
+        keys = {ch: [] for ch in CHANNELS}
+
+        t = 0.0
+        prev_intent = initial_intent
+        previous: Dict[str, Tuple[ChannelTrack, float]] = {}
+        for name, duration, preset in entries:
+            base = phase_base(preset, prev_intent)
+            track = tracks.get(name, CameraTrack(name))
+            end = t + duration
+            for ch in CHANNELS:
+                channel = track.channels.get(ch) or ChannelTrack.constant(base[ch])
+                if ch in previous:
+                    # Valeur atteinte par la phase précédente au moment de la coupe
+                    prev_channel, prev_start = previous[ch]
+                    keys[ch].append((t, prev_channel.evaluate(t - prev_start), 'linear'))
+                # Saut vers la valeur de départ de la phase, puis ses clés (coupées à `end`)
+                keys[ch].append((t, channel.evaluate(0.0), 'step'))
+                keys[ch].extend(k for k in channel.keys(t, until=end) if k[0] > t)
+                previous[ch] = (channel, t)
+            self.starts.append(t)
+            self.intents.append(preset["intent"])
+            self.modifiers.append(list(track.modifiers))   # Temps local de la phase
+            prev_intent = preset["intent"]
+            t = end
+        self.duration = t
+        self.channels = {ch: ChannelTrack(keys[ch]) for ch in CHANNELS}
+
+    def phase_index(self, t: float) -> int:
+        """Phase active à l'instant t (recherche binaire)."""
+        return max(0, bisect.bisect_right(self.starts, t) - 1)
+
+    def evaluate(self, t: float) -> Dict[str, float]:
+        """Cibles caméra à l'instant absolu t du show."""
+        values = {ch: self.channels[ch].evaluate(t) for ch in CHANNELS}
+        i = self.phase_index(t)
+        local = t - self.starts[i]
+        for modifier in self.modifiers[i]:
+            values[modifier.channel] += modifier.evaluate(local)
+        return values
+
+    def bake(self, fps: float = 60.0, initial: Optional[Dict[str, float]] = None) -> CameraPath:
+        """
+        Échantillonne le chemin lissé du show complet (mêmes lerp, dérive et
+        contraintes que CameraSystem.update) à fps constant.
+        """
+        dt = 1.0 / fps
+        frames = int(round(self.duration * fps)) + 1
+        times = np.arange(frames) * dt
+        targets = np.column_stack([self.channels[ch].evaluate_many(times) for ch in CHANNELS])
+        phase = np.searchsorted(np.array(self.starts), times, side='right') - 1
+        np.maximum(phase, 0, out=phase)
+        for i, modifiers in enumerate(self.modifiers):
+            if not modifiers:
+                continue
+            rows = np.flatnonzero(phase == i)
+            for row in rows:
+                local = times[row] - self.starts[i]
+                for modifier in modifiers:
+                    targets[row, CHANNELS.index(modifier.channel)] += modifier.evaluate(local)
+
+        current = (np.array([initial[ch] for ch in CHANNELS[:4]], dtype=np.float64) if initial
+                   else targets[0, :4].copy())
+        poses = np.empty((frames, 9), dtype=np.float32)
+        poses[:, 3] = 0.0
+        poses[:, 5] = 0.0
+        poses[:, 6:9] = (0.0, 1.0, 0.0)
+        for n in range(frames):
+            if n:
+                current += (targets[n, :4] - current) * targets[n, 4] * dt
+            dist, yaw, pitch, target_y = current
+            poses[n, 0:3] = orbit_eye(dist, yaw, pitch, target_y, times[n], self.intents[phase[n]])
+            poses[n, 4] = target_y
+        return CameraPath(fps, poses)
+
+
+def camera_path_for_sequence(phases: Sequence[Tuple[str, float, str]], fps: float = 60.0,
+                             tracks: Optional[Dict[str, CameraTrack]] = None) -> CameraPath:
+    """
+    Bake d'une séquence [(phase, durée, clé de preset)], en partant de la vue
+    "ground" comme CameraSystem au démarrage.
+    """
+    tracks = load_camera_tracks() if tracks is None else tracks
+    entries = [(name, duration, CAMERA_PRESETS.get(key, CAMERA_PRESETS["ground"]))
+               for name, duration, key in phases]
+    timeline = CameraTimeline(entries, tracks)
+    return timeline.bake(fps, initial=phase_base(CAMERA_PRESETS["ground"], "human"))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'CHANNELS',
+    'CAMERA_PRESETS',
+    'ChannelTrack',
+    'TrackModifier',
+    'CameraTrack',
+    'CameraTimeline',
+    'CameraPath',
+    'load_camera_tracks',
+    'phase_base',
+    'orbit_eye',
+    'camera_path_for_sequence',
+]
+
+
+if __name__ == "__main__":
+    import time
+
+    from formation_library import FormationLibrary  # noqa: F401  (enregistre les phases)
+    from phase_registry import get_phase_spec
+
+    tracks = load_camera_tracks()
+    # Argument "phase" ou "phase:durée" (défaut: dernière clé de la piste, sinon 20s)
+    sequence = []
+    for arg in sys.argv[1:] or list(tracks):
+        name, _, duration = arg.partition(':')
+        track = tracks.get(name)
+        default = track.duration if track and track.duration > 0 else 20.0
+        sequence.append((name, float(duration) if duration else default,
+                         get_phase_spec(name).camera_preset))
+
+    start = time.perf_counter()
+    path = camera_path_for_sequence(sequence, tracks=tracks)
+    elapsed = time.perf_counter() - start
+    print(f"{len(sequence)} phases, {path.duration:.1f}s de show, {len(path.poses)} poses "
+          f"à {path.fps:.0f} fps, bake en {elapsed * 1000:.0f} ms")
+    t = 0.0
+    for name, duration, preset in sequence:
+        eye = path.pose_at(t + duration * 0.5)
+        print(f"  {name:24s} [{preset:12s}] {t:6.1f}s  mi-phase: eye=({eye[0]:7.1f}, "
+              f"{eye[1]:6.1f}, {eye[2]:7.1f}) cible y={eye[4]:5.1f}")
+        t += duration
+
+    # Évaluation directe en O(log k) à un instant arbitraire du show
+    timeline = CameraTimeline([(n, d, CAMERA_PRESETS.get(k, CAMERA_PRESETS["ground"]))
+                               for n, d, k in sequence], tracks)
+    probes = np.linspace(0.0, timeline.duration, 10000)
+    start = time.perf_counter()
+    for probe in probes:
+        timeline.evaluate(probe)
+    per_call = (time.perf_counter() - start) / len(probes) * 1e6
+    keys = sum(len(c) for c in timeline.channels.values())
+    print(f"Timeline: {keys} clés, évaluation {per_call:.1f} µs/appel")
@@ -0,0 +1,438 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+              BACKEND DE CALCUL (NUMPY / NUMBA OPTIONNEL) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Les noyaux chauds de la simulation passent par un backend interchangeable:
+
+1. physics_step      : PhysicsEngine.update_drones (cible + turbulence + jitter)
+2. swarm_step        : BioSwarmEngine.calculate_movement (alignement,
+                       séparation, turbulence) - voisins par grille spatiale
+3. living_formation  : micro-mouvements des formations en FORMATION_HOLD
+
+La turbulence (flow, (N, 3)) est échantillonnée par l'appelant dans le champ
+curl-noise partagé (turbulence_field) puis passée telle quelle aux noyaux.
+
+NumpyBackend est toujours disponible (voisinage via cKDTree). NumbaBackend
+n'existe que si Numba est installé: boucles parallèles (prange), noyaux
+compilés avec cache=True, donc mis en cache sur disque (__pycache__) et non
+recompilés à chaque lancement.
+
+Sélection dans performance.yaml:
+    compute_backend: auto      # auto | numpy | numba
+    compute_threads: 0         # 0 = tous les cœurs (Numba)
+
+Usage (équivalence + benchmark):  python src/compute_backend.py [num_drones ...]
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import sys
+import time
+from dataclasses import astuple, dataclass
+from typing import Optional
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+try:
+    import numba
+    from numba import njit, prange
+except ImportError:  # Numba optionnel: repli NumPy
+    numba = None
+
+
+@dataclass(frozen=True)
+class SwarmParams:
+    """Paramètres de BioSwarmEngine (ordre = arguments des noyaux Numba)"""
+    max_speed: float = 8.0
+    max_acceleration: float = 3.0
+    alignment_weight: float = 0.3
+    separation_weight: float = 2.0
+    target_weight: float = 1.0
+    perception_radius: float = 15.0
+    separation_radius: float = 3.0
+
+
+class NumpyBackend:
+    """Noyaux vectorisés NumPy (référence)"""
+
+    name = "numpy"
+
+    def physics_step(self, positions, targets, dt, time_absolute, max_speed, flow):
+        """Nouvelles positions (float64) - même modèle que PhysicsEngine.update_drones."""
+        # 1. Vitesse vers la cible (contrôleur P borné à max_speed)
+        to_target = np.subtract(targets, positions, dtype=np.float64)
+        dist = np.sqrt(np.einsum('ij,ij->i', to_target, to_target))[:, np.newaxis]
+        desired_speed = np.clip(dist * 2.0, 0, max_speed)
+        safe_dist = np.where(dist < 1e-4, 1.0, dist)
+        velocity = (to_target / safe_dist) * desired_speed
+
+        # 2. Turbulence organique (champ curl-noise échantillonné)
+        velocity += flow
+
+        # 3. Jitter par drone (personnalité)
+        phase = np.arange(len(positions)) * 0.1 + time_absolute
+        velocity[:, 0] += np.sin(phase) * 0.5
+        velocity[:, 1] += np.cos(phase * 0.7) * 0.5
+        velocity[:, 2] += np.sin(phase * 0.5) * 0.5
+
+        # 4. Vitesse bornée puis intégration d'Euler
+        speed_sq = np.einsum('ij,ij->i', velocity, velocity)
+        over = speed_sq > max_speed ** 2
+        if over.any():
+            velocity[over] *= (max_speed / np.sqrt(speed_sq[over]))[:, np.newaxis]
+        return positions + velocity * dt
+
+    def swarm_step(self, positions, targets, velocities, time, dt, params: SwarmParams, flow):
+        """Nouvelles positions; velocities (N, 3) est mis à jour en place."""
+        n = len(positions)
+        idx = np.arange(n)
+        to_target = targets - positions
+        distance = np.sqrt(np.einsum('ij,ij->i', to_target, to_target))
+        active = distance >= 0.1
+
+        # Vitesse adaptative vers la cible
+        target_speed = np.where(distance > 50, params.max_speed,
+                                np.where(distance > 20, 5.0,
+                                         np.where(distance > 5, 2.0, distance * 0.5)))
+        direction = to_target / np.maximum(distance, 1e-12)[:, np.newaxis]
+
+        # Voisins: alignement (perception_radius) et séparation (separation_radius)
+        pairs = cKDTree(positions).query_pairs(params.perception_radius, output_type='ndarray')
+        i, j = pairs[:, 0], pairs[:, 1]
+        diff = positions[i] - positions[j]
+        dist = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+        within = dist < params.perception_radius
+        i, j, diff, dist = i[within], j[within], diff[within], dist[within]
+
+        count = np.bincount(i, minlength=n) + np.bincount(j, minlength=n)
+        alignment = np.empty((n, 3))
+        separation = np.empty((n, 3))
+        close = (dist < params.separation_radius) & (dist > 0)
+        push = diff[close] / (dist[close] ** 2)[:, np.newaxis]
+        for k in range(3):
+            alignment[:, k] = (np.bincount(i, velocities[j, k], minlength=n) +
+                               np.bincount(j, velocities[i, k], minlength=n))
+            separation[:, k] = (np.bincount(i[close], push[:, k], minlength=n) -
+                                np.bincount(j[close], push[:, k], minlength=n))
+        alignment /= np.maximum(count, 1)[:, np.newaxis]
+
+        desired = (direction * (target_speed * params.target_weight)[:, np.newaxis] +
+                   alignment * params.alignment_weight +
+                   separation * params.separation_weight +
+                   flow)
+
+        # Accélération douce puis limite de vitesse
+        acceleration = desired - velocities
+        accel = np.sqrt(np.einsum('ij,ij->i', acceleration, acceleration))
+        limit = accel > params.max_acceleration
+        acceleration[limit] *= (params.max_acceleration / accel[limit])[:, np.newaxis]
+        new_velocities = velocities + acceleration * dt
+        speed = np.sqrt(np.einsum('ij,ij->i', new_velocities, new_velocities))
+        fast = speed > params.max_speed
+        new_velocities[fast] *= (params.max_speed / speed[fast])[:, np.newaxis]
+
+        vibration = np.column_stack((np.sin(time * 10 + idx) * 0.03,
+                                     np.cos(time * 8 + idx * 0.7) * 0.02,
+                                     np.sin(time * 12 + idx * 0.5) * 0.03))
+        new_positions = positions + new_velocities * dt + vibration
+
+        # Drones arrivés: ni mouvement ni changement de vitesse
+        velocities[active] = new_velocities[active]
+        new_positions[~active] = positions[~active]
+        return new_positions
+
+    def living_formation(self, positions, t, out):
+        """Respiration + oscillation latérale de formation (écrit dans out)."""
+        phase = np.arange(len(positions))
+        out[:] = positions
+        out[:, 0] += np.sin(t * 0.2 + phase * 0.02) * 0.1
+        out[:, 1] += np.sin(t * 0.3 + phase * 0.01) * 0.15
+        out[:, 2] += np.cos(t * 0.25 + phase * 0.015) * 0.1
+        return out
+
+
+if numba is not None:
+
+    @njit(parallel=True, cache=True)
+    def _physics_kernel(positions, targets, dt, time_absolute, max_speed, flow, out):
+        for i in prange(positions.shape[0]):
+            px, py, pz = positions[i, 0], positions[i, 1], positions[i, 2]
+            tx, ty, tz = targets[i, 0] - px, targets[i, 1] - py, targets[i, 2] - pz
+            dist = np.sqrt(tx * tx + ty * ty + tz * tz)
+            desired = min(max(dist * 2.0, 0.0), max_speed)
+            safe = 1.0 if dist < 1e-4 else dist
+            phase = i * 0.1 + time_absolute
+            vx = tx / safe * desired + flow[i, 0] + np.sin(phase) * 0.5
+            vy = ty / safe * desired + flow[i, 1] + np.cos(phase * 0.7) * 0.5
+            vz = tz / safe * desired + flow[i, 2] + np.sin(phase * 0.5) * 0.5
+            speed_sq = vx * vx + vy * vy + vz * vz
+            if speed_sq > max_speed * max_speed:
+                scale = max_speed / np.sqrt(speed_sq)
+                vx, vy, vz = vx * scale, vy * scale, vz * scale
+            out[i, 0] = px + vx * dt
+            out[i, 1] = py + vy * dt
+            out[i, 2] = pz + vz * dt
+
+    @njit(cache=True)
+    def _build_grid(positions, cell):
+        """Liste de cellules: drones triés par cellule + début de chaque cellule."""
+        n = positions.shape[0]
+        lo = np.empty(3)
+        dims = np.empty(3, dtype=np.int64)
+        for k in range(3):
+            lo[k] = positions[:, k].min()
+            dims[k] = int((positions[:, k].max() - lo[k]) / cell) + 1
+        keys = np.empty(n, dtype=np.int64)
+        for i in range(n):
+            cx = int((positions[i, 0] - lo[0]) / cell)
+            cy = int((positions[i, 1] - lo[1]) / cell)
+            cz = int((positions[i, 2] - lo[2]) / cell)
+            keys[i] = (cx * dims[1] + cy) * dims[2] + cz
+        order = np.argsort(keys)
+        starts = np.zeros(dims[0] * dims[1] * dims[2] + 1, dtype=np.int64)
+        for i in range(n):
+            starts[keys[i] + 1] += 1
+        for c in range(1, starts.shape[0]):
+            starts[c] += starts[c - 1]
+        return lo, dims, order, starts
+
+    @njit(parallel=True, cache=True)
+    def _swarm_kernel(positions, targets, velocities, time, dt, max_speed, max_acceleration,
+                      alignment_weight, separation_weight, target_weight,
+                      perception_radius, separation_radius, flow, new_positions, new_velocities):
+        n = positions.shape[0]
+        lo, dims, order, starts = _build_grid(positions, perception_radius)
+        for i in prange(n):
+            px, py, pz = positions[i, 0], positions[i, 1], positions[i, 2]
+            tx, ty, tz = targets[i, 0] - px, targets[i, 1] - py, targets[i, 2] - pz
+            distance = np.sqrt(tx * tx + ty * ty + tz * tz)
+            new_velocities[i, :] = velocities[i, :]
+            new_positions[i, :] = positions[i, :]
+            if distance < 0.1:
+                continue
+
+            if distance > 50:
+                target_speed = max_speed
+            elif distance > 20:
+                target_speed = 5.0
+            elif distance > 5:
+                target_speed = 2.0
+            else:
+                target_speed = distance * 0.5
+
+            ax = ay = az = 0.0
+            sx = sy = sz = 0.0
+            count = 0
+            cx = int((px - lo[0]) / perception_radius)
+            cy = int((py - lo[1]) / perception_radius)
+            cz = int((pz - lo[2]) / perception_radius)
+            for gx in range(max(cx - 1, 0), min(cx + 2, dims[0])):
+                for gy in range(max(cy - 1, 0), min(cy + 2, dims[1])):
+                    for gz in range(max(cz - 1, 0), min(cz + 2, dims[2])):
+                        key = (gx * dims[1] + gy) * dims[2] + gz
+                        for s in range(starts[key], starts[key + 1]):
+                            j = order[s]
+                            if j == i:
+                                continue
+                            dx = px - positions[j, 0]
+                            dy = py - positions[j, 1]
+                            dz = pz - positions[j, 2]
+                            dist = np.sqrt(dx * dx + dy * dy + dz * dz)
+                            if dist < perception_radius:
+                                ax += velocities[j, 0]
+                                ay += velocities[j, 1]
+                                az += velocities[j, 2]
+                                count += 1
+                            if dist < separation_radius and dist > 0:
+                                d2 = dist * dist
+                                sx += dx / d2
+                                sy += dy / d2
+                                sz += dz / d2
+            if count > 0:
+                ax /= count
+                ay /= count
+                az /= count
+
+            wx = target_speed * target_weight / distance
+            dvx = (tx * wx + ax * alignment_weight + sx * separation_weight +
+                   flow[i, 0] - velocities[i, 0])
+            dvy = (ty * wx + ay * alignment_weight + sy * separation_weight +
+                   flow[i, 1] - velocities[i, 1])
+            dvz = (tz * wx + az * alignment_weight + sz * separation_weight +
+                   flow[i, 2] - velocities[i, 2])
+            accel = np.sqrt(dvx * dvx + dvy * dvy + dvz * dvz)
+            if accel > max_acceleration:
+                scale = max_acceleration / accel
+                dvx, dvy, dvz = dvx * scale, dvy * scale, dvz * scale
+            vx = velocities[i, 0] + dvx * dt
+            vy = velocities[i, 1] + dvy * dt
+            vz = velocities[i, 2] + dvz * dt
+            speed = np.sqrt(vx * vx + vy * vy + vz * vz)
+            if speed > max_speed:
+                scale = max_speed / speed
+                vx, vy, vz = vx * scale, vy * scale, vz * scale
+            new_velocities[i, 0] = vx
+            new_velocities[i, 1] = vy
+            new_velocities[i, 2] = vz
+            new_positions[i, 0] = px + vx * dt + np.sin(time * 10 + i) * 0.03
+            new_positions[i, 1] = py + vy * dt + np.cos(time * 8 + i * 0.7) * 0.02
+            new_positions[i, 2] = pz + vz * dt + np.sin(time * 12 + i * 0.5) * 0.03
+
+    @njit(parallel=True, cache=True)
+    def _living_kernel(positions, t, out):
+        for i in prange(positions.shape[0]):
+            out[i, 0] = positions[i, 0] + np.sin(t * 0.2 + i * 0.02) * 0.1
+            out[i, 1] = positions[i, 1] + np.sin(t * 0.3 + i * 0.01) * 0.15
+            out[i, 2] = positions[i, 2] + np.cos(t * 0.25 + i * 0.015) * 0.1
+
+
+class NumbaBackend:
+    """Noyaux Numba parallèles (compilés au premier appel puis lus du cache disque)"""
+
+    name = "numba"
+
+    def __init__(self, threads: int = 0):
+        if numba is None:
+            raise RuntimeError("Numba n'est pas installé")
+        if threads:
+            numba.set_num_threads(threads)
+
+    def physics_step(self, positions, targets, dt, time_absolute, max_speed, flow):
+        out = np.empty(positions.shape, dtype=np.float64)
+        _physics_kernel(np.asarray(positions, dtype=np.float64), np.asarray(targets, dtype=np.float64),
+                        float(dt), float(time_absolute), float(max_speed),
+                        np.asarray(flow, dtype=np.float64), out)
+        return out
+
+    def swarm_step(self, positions, targets, velocities, time, dt, params: SwarmParams, flow):
+        positions = np.asarray(positions, dtype=np.float64)
+        new_positions = np.empty_like(positions)
+        new_velocities = np.empty_like(velocities)
+        _swarm_kernel(positions, np.asarray(targets, dtype=np.float64), velocities,
+                      float(time), float(dt), *astuple(params), np.asarray(flow, dtype=np.float64),
+                      new_positions, new_velocities)
+        velocities[:] = new_velocities
+        return new_positions
+
+    def living_formation(self, positions, t, out):
+        result = np.empty(positions.shape, dtype=np.float64)
+        _living_kernel(np.asarray(positions, dtype=np.float64), float(t), result)
+        out[:] = result
+        return out
+
+
+_BACKENDS = {}
+
+
+def get_backend(perf_config: Optional[dict] = None):
+    """
+    Backend partagé selon la section `performance` (compute_backend,
+    compute_threads). "auto" choisit Numba s'il est installé, sinon NumPy.
+    """
+    perf_config = perf_config or {}
+    choice = perf_config.get('compute_backend', 'auto')
+    threads = int(perf_config.get('compute_threads', 0) or 0)
+    if choice == 'auto':
+        choice = 'numba' if numba is not None else 'numpy'
+    if choice == 'numba' and numba is None:
+        print("[COMPUTE] Numba indisponible, repli sur NumPy")
+        choice = 'numpy'
+    if choice not in ('numpy', 'numba'):
+        raise ValueError(f"compute_backend inconnu: {choice!r} (auto | numpy | numba)")
+
+    if choice not in _BACKENDS:
+        _BACKENDS[choice] = NumbaBackend(threads) if choice == 'numba' else NumpyBackend()
+    return _BACKENDS[choice]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                     ÉQUIVALENCE & BENCHMARK DES BACKENDS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _sample_state(num_drones, seed=7):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform((-100, 5, -100), (100, 120, 100), (num_drones, 3))
+    targets = positions + rng.normal(0.0, 30.0, (num_drones, 3))
+    targets[::10] = positions[::10]     # Quelques drones déjà arrivés
+    velocities = rng.normal(0.0, 2.0, (num_drones, 3))
+    flow = rng.normal(0.0, 1.0, (num_drones, 3))
+    return positions, targets, velocities, flow
+
+
+def check_equivalence(backend, reference=None, num_drones=2000, tolerance=1e-9):
+    """Écart max (par noyau) entre backend et reference (NumPy par défaut)."""
+    reference = reference or NumpyBackend()
+    positions, targets, velocities, flow = _sample_state(num_drones)
+    params = SwarmParams()
+    errors = {}
+
+    errors['physics_step'] = float(np.abs(
+        backend.physics_step(positions, targets, 0.016, 3.0, 60.0, flow) -
+        reference.physics_step(positions, targets, 0.016, 3.0, 60.0, flow)).max())
+
+    vel_a, vel_b = velocities.copy(), velocities.copy()
+    pos_a = backend.swarm_step(positions, targets, vel_a, 3.0, 0.016, params, flow * 0.1)
+    pos_b = reference.swarm_step(positions, targets, vel_b, 3.0, 0.016, params, flow * 0.1)
+    errors['swarm_step'] = float(max(np.abs(pos_a - pos_b).max(), np.abs(vel_a - vel_b).max()))
+
+    out_a, out_b = np.empty_like(positions), np.empty_like(positions)
+    errors['living_formation'] = float(np.abs(
+        backend.living_formation(positions, 3.0, out_a) -
+        reference.living_formation(positions, 3.0, out_b)).max())
+    return {name: (err, err <= tolerance) for name, err in errors.items()}
+
+
+def benchmark_backend(backend, num_drones, repeats=20):
+    """Temps moyen (ms) par appel de chaque noyau."""
+    positions, targets, velocities, flow = _sample_state(num_drones)
+    params = SwarmParams()
+    out = np.empty_like(positions)
+    kernels = {
+        'physics_step': lambda: backend.physics_step(positions, targets, 0.016, 3.0, 60.0, flow),
+        'swarm_step': lambda: backend.swarm_step(positions, targets, velocities.copy(), 3.0, 0.016,
+                                                 params, flow),
+        'living_formation': lambda: backend.living_formation(positions, 3.0, out),
+    }
+    timings = {}
+    for name, call in kernels.items():
+        call()  # Préchauffage (compilation / lecture du cache Numba)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            call()
+        timings[name] = (time.perf_counter() - start) / repeats * 1000.0
+    return timings
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'SwarmParams',
+    'NumpyBackend',
+    'NumbaBackend',
+    'get_backend',
+    'check_equivalence',
+    'benchmark_backend',
+]
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000]
+    backends = [NumpyBackend()]
+    if numba is not None:
+        start = time.perf_counter()
+        backends.append(NumbaBackend())
+        results = check_equivalence(backends[1])
+        print(f"Équivalence Numba / NumPy ({time.perf_counter() - start:.1f}s, compilation ou cache inclus):")
+        for name, (err, ok) in results.items():
+            print(f"  {name:18s} écart max {err:.2e}  {'OK' if ok else 'FAIL'}")
+    else:
+        print("Numba non installé: seul le backend NumPy est mesuré")
+
+    print(f"{'drones':>8s} {'backend':>8s} {'physics':>10s} {'swarm':>10s} {'living':>10s}  (ms/appel)")
+    for n in sizes:
+        for backend in backends:
+            t = benchmark_backend(backend, n)
+            print(f"{n:8d} {backend.name:>8s} {t['physics_step']:10.2f} {t['swarm_step']:10.2f} "
+                  f"{t['living_formation']:10.2f}")
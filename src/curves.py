@@ -0,0 +1,184 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+                  COURBES VECTORISÉES (EASING, BÉZIER, SPLINES) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Module partagé par le système de transitions, le chorégraphe et les phases:
+
+1. Easing     : quad, cubic, smoothstep, smootherstep, min_jerk - acceptent
+                un scalaire ou un tableau (un appel pour tous les drones)
+2. Bézier     : quadratique / cubique, paramètre t scalaire ou par point
+3. Splines    : chaîne de Bézier cubiques, Catmull-Rom (passe par les points)
+4. CurveLUT   : table 1D précalculée pour les courbes coûteuses
+                (interpolation linéaire, erreur bornée par la résolution)
+
+Un scalaire en entrée donne un scalaire en sortie, un tableau un tableau.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+from typing import Callable, Optional
+
+import numpy as np
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                                  EASING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def ease_in_quad(t):
+    """Accélération quadratique"""
+    t = np.asarray(t, dtype=np.float64)
+    return (t * t)[()]
+
+
+def ease_out_quad(t):
+    """Décélération quadratique"""
+    t = np.asarray(t, dtype=np.float64)
+    return (1.0 - (1.0 - t) * (1.0 - t))[()]
+
+
+def ease_in_out_quad(t):
+    """Accélération puis décélération"""
+    t = np.asarray(t, dtype=np.float64)
+    return np.where(t < 0.5, 2.0 * t * t, 1.0 - (-2.0 * t + 2.0) ** 2 / 2.0)[()]
+
+
+def ease_in_cubic(t):
+    """Accélération cubique (plus douce)"""
+    t = np.asarray(t, dtype=np.float64)
+    return (t * t * t)[()]
+
+
+def ease_out_cubic(t):
+    """Décélération cubique"""
+    t = np.asarray(t, dtype=np.float64)
+    return (1.0 - (1.0 - t) ** 3)[()]
+
+
+def ease_in_out_cubic(t):
+    """Transition cubique complète"""
+    t = np.asarray(t, dtype=np.float64)
+    return np.where(t < 0.5, 4.0 * t ** 3, 1.0 - (-2.0 * t + 2.0) ** 3 / 2.0)[()]
+
+
+def smoothstep(t):
+    """Transition très douce (Hermite), t borné à [0, 1]"""
+    t = np.clip(t, 0.0, 1.0)
+    return (t * t * (3.0 - 2.0 * t))[()]
+
+
+def smootherstep(t):
+    """Transition encore plus douce, t borné à [0, 1]"""
+    t = np.clip(t, 0.0, 1.0)
+    return (t * t * t * (t * (6.0 * t - 15.0) + 10.0))[()]
+
+
+def min_jerk(t):
+    """Profil minimum-jerk s(t) = 10t³ - 15t⁴ + 6t⁵ (identique à smootherstep)"""
+    return smootherstep(t)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                              BÉZIER & SPLINES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _param(t, points):
+    """t scalaire, ou un t par point (forme points.shape[:-1]) → broadcast sur les coordonnées."""
+    t = np.asarray(t, dtype=np.float64)
+    return t[..., np.newaxis] if t.ndim and np.ndim(points) > 1 else t
+
+
+def bezier_quadratic(p0, p1, p2, t):
+    """Bézier quadratique; p* (..., D), t scalaire ou (...)"""
+    t = _param(t, p0)
+    u = 1.0 - t
+    return u * u * p0 + 2.0 * u * t * p1 + t * t * p2
+
+
+def bezier_cubic(p0, p1, p2, p3, t):
+    """Bézier cubique; p* (..., D), t scalaire ou (...)"""
+    t = _param(t, p0)
+    u = 1.0 - t
+    return u * u * u * p0 + 3.0 * u * u * t * p1 + 3.0 * u * t * t * p2 + t * t * t * p3
+
+
+def bezier_chain(points, t):
+    """
+    Chaîne de Bézier cubiques: points (3k+1, D), t (T,) dans [0, 1] réparti
+    uniformément sur les k segments. Retourne (T, D).
+    """
+    points = np.asarray(points, dtype=np.float64)
+    segments = (len(points) - 1) // 3
+    if segments < 1 or len(points) != 3 * segments + 1:
+        raise ValueError("bezier_chain attend 3k+1 points de contrôle")
+    s = np.clip(np.asarray(t, dtype=np.float64), 0.0, 1.0) * segments
+    index = np.minimum(s.astype(np.int64), segments - 1)
+    local = s - index
+    base = 3 * index
+    return bezier_cubic(points[base], points[base + 1], points[base + 2], points[base + 3], local)
+
+
+def catmull_rom(points, t):
+    """
+    Spline de Catmull-Rom uniforme passant par points (K, D), K >= 2,
+    t (T,) dans [0, 1]. Retourne (T, D).
+    """
+    points = np.asarray(points, dtype=np.float64)
+    padded = np.vstack((2.0 * points[0] - points[1], points, 2.0 * points[-1] - points[-2]))
+    # Chaque segment P1→P2 devient une Bézier (P1, P1 + (P2-P0)/6, P2 - (P3-P1)/6, P2)
+    p0, p1, p2, p3 = padded[:-3], padded[1:-2], padded[2:-1], padded[3:]
+    controls = np.empty((3 * len(p1) + 1, points.shape[1]))
+    controls[0:-1:3] = p1
+    controls[1::3] = p1 + (p2 - p0) / 6.0
+    controls[2::3] = p2 - (p3 - p1) / 6.0
+    controls[-1] = points[-1]
+    return bezier_chain(controls, t)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                            TABLES PRÉCALCULÉES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class CurveLUT:
+    """
+    Table 1D d'une courbe f: [lo, hi] → R, échantillonnée sur `size` points.
+    L'évaluation est une interpolation linéaire (t borné à [lo, hi]).
+    """
+
+    def __init__(self, func: Callable, size: int = 1024, lo: float = 0.0, hi: float = 1.0):
+        self.lo, self.hi = lo, hi
+        self._x = np.linspace(lo, hi, size)
+        self._y = np.asarray(func(self._x), dtype=np.float64)
+
+    def __call__(self, t, out: Optional[np.ndarray] = None):
+        result = np.interp(t, self._x, self._y)
+        if out is None:
+            return result
+        out[...] = result
+        return out
+
+    def max_error(self, func: Callable, samples: int = 100_000) -> float:
+        """Écart max mesuré entre la table et la courbe exacte."""
+        x = np.linspace(self.lo, self.hi, samples)
+        return float(np.abs(self(x) - func(x)).max())
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'ease_in_quad',
+    'ease_out_quad',
+    'ease_in_out_quad',
+    'ease_in_cubic',
+    'ease_out_cubic',
+    'ease_in_out_cubic',
+    'smoothstep',
+    'smootherstep',
+    'min_jerk',
+    'bezier_quadratic',
+    'bezier_cubic',
+    'bezier_chain',
+    'catmull_rom',
+    'CurveLUT',
+]
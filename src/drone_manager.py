@@ -29,23 +29,42 @@ class DroneManager:
         """
         self.positions = self.physics.update_drones(self.positions, self.targets, dt, time_absolute)
 
+    def formation_buffers(self):
+        """
+        Preallocated float32 (targets, colors) frame buffers.
+        Pass them as out= to FormationLibrary.get_phase so generators
+        write the frame in place instead of allocating new arrays.
+        """
+        return self.targets, self.colors
+
     def set_formation(self, target_coords, target_colors=None):
         """
         Update target positions from a formation pattern.
+        Buffers obtained from formation_buffers() are already in place (no copy).
         """
         count = min(len(target_coords), self.num_drones)
         
         # Update targets for active drones
-        self.targets[:count] = target_coords[:count]
+        if target_coords is not self.targets:
+            self.targets[:count] = target_coords[:count]
         
         # Drones without a spot in formation could go to a holding area or ground
         # For now, let's keep them where they are or send to ground
         if count < self.num_drones:
             self.targets[count:, 1] = 0 # Land
             
-        if target_colors is not None:
+        if target_colors is not None and target_colors is not self.colors:
              self.colors[:count] = target_colors[:count]
 
+    def reorder(self, order):
+        """
+        Permute drone identities in place: new drone i is old drone order[i].
+        Used when a transition reassigns drones to targets; rendering is unchanged.
+        """
+        self.positions[:] = self.positions[order]
+        self.colors[:] = self.colors[order]
+        self.targets[:] = self.targets[order]
+
     def get_render_data(self):
         """
         Returns data suitable for instanced rendering.
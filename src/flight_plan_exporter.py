@@ -0,0 +1,359 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+              EXPORT DES PLANS DE VOL PAR DRONE (KEYFRAMES) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Transforme un show simulé ou pré-calculé en trajectoires pilotables:
+
+1. KeyframeReducer : réduction de keyframes en flux, dans l'espace-temps.
+   Variante "fenêtre ouvrante" de Douglas–Peucker sur la distance synchrone
+   (écart à l'instant t entre la trajectoire et l'interpolation linéaire des
+   keyframes). Pour chaque drone on garde l'ensemble des vitesses de segment
+   encore admissibles (intersection de boîtes): O(N) par frame, vectorisé,
+   écart garanti <= tolérance, mémoire indépendante de la durée
+2. FlightPlanWriter : archive binaire unique, écrite par blocs au fil du show
+   (positions et couleurs LED réduites séparément), index par drone en fin
+3. FlightPlanArchive : lecture indexée d'une piste, export CSV par drone
+
+Format de l'archive (little-endian):
+    en-tête  : magic, version, num_drones, tolérances
+    blocs    : positions (t, x, y, z) float32 | couleurs (t float32, r, g, b, 0 uint8)
+               triés par drone à l'intérieur de chaque bloc
+    index    : (drone, offset, count) int64 pour chaque flux
+    fin      : offset de l'index + magic
+
+CSV par drone (drone_00000.csv): time_ms, x, y, z, red, green, blue avec
+x = est, y = nord, z = haut (le simulateur est en y vers le haut).
+
+Segments LINÉAIRES uniquement (pas de segments cubiques / Hermite): la
+garantie d'écart <= tolérance ne vaut que pour une interpolation linéaire
+entre keyframes, et c'est ainsi que le contrôleur de vol doit les rejouer
+(comme FlightPlanArchive.sample). La réduction en flux repose sur des
+contraintes de vitesse de segment, linéaires en la position, donc O(N) par
+frame sans garder d'échantillons; vérifier une cubique (vitesses aux
+keyframes) imposerait de réévaluer à chaque frame toute la fenêtre
+d'échantillons de chaque drone depuis sa dernière keyframe, ce qui casse
+le temps et la mémoire bornés. La densité de keyframes compense: plus la
+trajectoire est courbe, plus elles sont rapprochées.
+
+Usage:  python src/flight_plan_exporter.py [num_drones] [minutes] [dossier]
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+_MAGIC = b"ANEMFP01"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIdd")     # magic, version, num_drones, tol position, tol couleur
+_FOOTER = struct.Struct("<q8s")        # offset de l'index, magic
+
+POSITION_RECORD = np.dtype([('t', '<f4'), ('x', '<f4'), ('y', '<f4'), ('z', '<f4')])
+COLOR_RECORD = np.dtype([('t', '<f4'), ('rgb', 'u1', 3), ('pad', 'u1')])
+_INDEX_ENTRY = np.dtype([('drone', '<i8'), ('offset', '<i8'), ('count', '<i8')])
+
+
+class KeyframeReducer:
+    """
+    Réduction de keyframes en flux pour N pistes de dimension `dims`.
+
+    feed(t, values) retourne les keyframes émises par ce pas:
+    (indices des drones, instants, valeurs). Entre deux keyframes
+    consécutives, l'interpolation linéaire reste à moins de `tolerance`
+    (norme euclidienne) de chaque échantillon fourni.
+    """
+
+    def __init__(self, num_drones: int, dims: int = 3, tolerance: float = 0.05):
+        self.num_drones = num_drones
+        self.dims = dims
+        self.tolerance = tolerance
+        # Boîte par axe inscrite dans la boule de rayon tolerance
+        self._axis_tol = tolerance / np.sqrt(dims)
+        self._anchor = np.zeros((num_drones, dims))
+        self._anchor_t = np.zeros(num_drones)
+        self._prev = np.zeros((num_drones, dims))
+        self._prev_t = 0.0
+        self._lo = np.full((num_drones, dims), -np.inf)   # Vitesses de segment admissibles
+        self._hi = np.full((num_drones, dims), np.inf)
+        self._span = np.empty((num_drones, 1))
+        self._velocity = np.empty((num_drones, dims))
+        self._excess = np.empty((num_drones, dims))
+        self._radius = np.empty((num_drones, dims))
+        self._started = False
+
+    def feed(self, t: float, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        values = np.asarray(values, dtype=np.float64)
+        if not self._started:
+            self._started = True
+            self._anchor[:] = values
+            self._anchor_t[:] = t
+            self._prev[:] = values
+            self._prev_t = t
+            drones = np.arange(self.num_drones)
+            return drones, np.full(self.num_drones, t), values.copy()
+
+        # Buffers de travail réutilisés (aucune allocation (N, dims) par frame)
+        span, velocity, excess = self._span, self._velocity, self._excess
+        np.subtract(t, self._anchor_t, out=span[:, 0])
+        np.subtract(values, self._anchor, out=velocity)
+        velocity /= span
+        np.subtract(self._lo, velocity, out=excess)
+        np.subtract(velocity, self._hi, out=self._radius)
+        np.maximum(excess, self._radius, out=excess)
+
+        # Segment ancre → ce point invalide: la frame précédente devient keyframe
+        cut = np.unique(np.flatnonzero(excess > 0.0) // self.dims)
+        emitted = (cut, np.full(len(cut), self._prev_t), self._prev[cut])
+        if len(cut):
+            self._anchor[cut] = self._prev[cut]
+            self._anchor_t[cut] = self._prev_t
+            span[cut] = t - self._prev_t
+            velocity[cut] = (values[cut] - self._anchor[cut]) / span[cut]
+            self._lo[cut] = -np.inf
+            self._hi[cut] = np.inf
+
+        # Contrainte du point courant sur les segments futurs
+        radius = self._radius
+        np.divide(self._axis_tol, span, out=radius)
+        np.subtract(velocity, radius, out=excess)
+        np.maximum(self._lo, excess, out=self._lo)
+        velocity += radius
+        np.minimum(self._hi, velocity, out=self._hi)
+
+        self._prev[:] = values
+        self._prev_t = t
+        return emitted
+
+    def finish(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Keyframes finales (dernier échantillon des pistes non closes)."""
+        if not self._started:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, np.empty(0), np.empty((0, self.dims))
+        open_tracks = np.flatnonzero(self._anchor_t < self._prev_t)
+        return open_tracks, np.full(len(open_tracks), self._prev_t), self._prev[open_tracks].copy()
+
+
+class FlightPlanWriter:
+    """
+    Écriture en flux d'une archive de plans de vol.
+
+    add_frame(t, positions, colors) à chaque frame, puis close(). Les
+    keyframes sont tamponnées jusqu'à flush_keyframes puis écrites en un
+    bloc trié par drone: mémoire bornée quelle que soit la durée du show.
+    """
+
+    def __init__(self, path: str, num_drones: int, position_tolerance: float = 0.05,
+                 color_tolerance: float = 2.0 / 255.0, flush_keyframes: int = 1_000_000):
+        self.path = path
+        self.num_drones = num_drones
+        self.flush_keyframes = flush_keyframes
+        self._positions = KeyframeReducer(num_drones, 3, position_tolerance)
+        self._colors = KeyframeReducer(num_drones, 3, color_tolerance)
+        self._pending = {"positions": [], "colors": []}
+        self._pending_count = 0
+        self._index = {"positions": [], "colors": []}
+        self.frames = 0
+        self.keyframes = {"positions": 0, "colors": 0}
+
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, num_drones,
+                                      position_tolerance, color_tolerance))
+
+    def add_frame(self, t: float, positions: np.ndarray, colors: np.ndarray):
+        self._queue("positions", self._positions.feed(t, positions))
+        self._queue("colors", self._colors.feed(t, colors))
+        self.frames += 1
+        if self._pending_count >= self.flush_keyframes:
+            self.flush()
+
+    def flush(self):
+        """Écrit les keyframes en attente comme un bloc (par flux, trié par drone)."""
+        for stream, record in (("positions", POSITION_RECORD), ("colors", COLOR_RECORD)):
+            chunks = self._pending[stream]
+            if not chunks:
+                continue
+            drones = np.concatenate([c[0] for c in chunks])
+            times = np.concatenate([c[1] for c in chunks])
+            values = np.concatenate([c[2] for c in chunks])
+            order = np.argsort(drones, kind="stable")   # Garde l'ordre temporel par drone
+            drones = drones[order]
+
+            block = np.empty(len(order), dtype=record)
+            block['t'] = times[order]
+            if stream == "positions":
+                block['x'], block['y'], block['z'] = values[order].T
+            else:
+                block['rgb'] = np.clip(np.rint(values[order] * 255.0), 0, 255)
+                block['pad'] = 0
+
+            ids, starts, counts = np.unique(drones, return_index=True, return_counts=True)
+            entries = np.empty(len(ids), dtype=_INDEX_ENTRY)
+            entries['drone'] = ids
+            entries['offset'] = self._file.tell() + starts * record.itemsize
+            entries['count'] = counts
+            self._index[stream].append(entries)
+            self._file.write(block.tobytes())
+            self.keyframes[stream] += len(block)
+            chunks.clear()
+        self._pending_count = 0
+
+    def close(self):
+        """Vide les pistes, écrit l'index et ferme l'archive."""
+        if self._file is None:
+            return
+        self._queue("positions", self._positions.finish())
+        self._queue("colors", self._colors.finish())
+        self.flush()
+
+        index_offset = self._file.tell()
+        for stream in ("positions", "colors"):
+            entries = (np.concatenate(self._index[stream]) if self._index[stream]
+                       else np.empty(0, dtype=_INDEX_ENTRY))
+            self._file.write(struct.pack("<q", len(entries)))
+            self._file.write(entries.tobytes())
+        self._file.write(_FOOTER.pack(index_offset, _MAGIC))
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _queue(self, stream, emitted):
+        drones, times, values = emitted
+        if len(drones):
+            self._pending[stream].append(emitted)
+            self._pending_count += len(drones)
+
+
+class FlightPlanArchive:
+    """Lecture indexée d'une archive écrite par FlightPlanWriter."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.num_drones, self.position_tolerance, self.color_tolerance = \
+            _HEADER.unpack_from(self._data, 0)
+        index_offset, end_magic = _FOOTER.unpack_from(self._data, len(self._data) - _FOOTER.size)
+        if magic != _MAGIC or end_magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path}: archive de plan de vol invalide")
+
+        self._index = {}
+        offset = index_offset
+        for stream in ("positions", "colors"):
+            (count,) = struct.unpack_from("<q", self._data, offset)
+            offset += 8
+            entries = np.frombuffer(self._data, dtype=_INDEX_ENTRY, count=count, offset=offset)
+            offset += count * _INDEX_ENTRY.itemsize
+            # Blocs d'un même drone dans l'ordre d'écriture (donc chronologique)
+            order = np.argsort(entries['drone'], kind="stable")
+            entries = entries[order]
+            bounds = np.searchsorted(entries['drone'], np.arange(self.num_drones + 1))
+            self._index[stream] = (entries, bounds)
+
+    def track(self, drone: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Keyframes (positions, couleurs) d'un drone, tableaux structurés."""
+        return (self._read("positions", POSITION_RECORD, drone),
+                self._read("colors", COLOR_RECORD, drone))
+
+    def sample(self, drone: int, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions (T, 3) et couleurs (T, 3) interpolées linéairement aux instants donnés."""
+        pos, col = self.track(drone)
+        positions = np.column_stack([np.interp(times, pos['t'], pos[k]) for k in ('x', 'y', 'z')])
+        rgb = col['rgb'].astype(np.float64) / 255.0
+        colors = np.column_stack([np.interp(times, col['t'], rgb[:, k]) for k in range(3)])
+        return positions, colors
+
+    def export_csv(self, directory: str, drones: Optional[np.ndarray] = None):
+        """Un CSV par drone: keyframes de position et de couleur fusionnées."""
+        os.makedirs(directory, exist_ok=True)
+        drones = range(self.num_drones) if drones is None else drones
+        for drone in drones:
+            pos, col = self.track(drone)
+            times = np.union1d(pos['t'], col['t'])
+            positions, colors = self.sample(drone, times)
+            table = np.column_stack((
+                np.rint(times * 1000.0),
+                positions[:, 0], -positions[:, 2], positions[:, 1],   # y-up → ENU
+                np.rint(colors * 255.0),
+            ))
+            np.savetxt(os.path.join(directory, f"drone_{drone:05d}.csv"), table,
+                       fmt=("%d", "%.3f", "%.3f", "%.3f", "%d", "%d", "%d"), delimiter=",",
+                       header="time_ms,x,y,z,red,green,blue", comments="")
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+
+    def _read(self, stream, record, drone):
+        entries, bounds = self._index[stream]
+        blocks = entries[bounds[drone]:bounds[drone + 1]]
+        parts = [np.frombuffer(self._data, dtype=record, count=int(b['count']), offset=int(b['offset']))
+                 for b in blocks]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=record)
+
+
+def export_show(frames, path: str, num_drones: int, position_tolerance: float = 0.05,
+                color_tolerance: float = 2.0 / 255.0) -> FlightPlanWriter:
+    """Écrit une archive depuis un itérable de (t, positions, couleurs)."""
+    with FlightPlanWriter(path, num_drones, position_tolerance, color_tolerance) as writer:
+        for t, positions, colors in frames:
+            writer.add_frame(t, positions, colors)
+    return writer
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'KeyframeReducer',
+    'FlightPlanWriter',
+    'FlightPlanArchive',
+    'export_show',
+]
+
+
+if __name__ == "__main__":
+    import yaml
+    from show_validator import simulate_frames
+
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    minutes = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    out_dir = sys.argv[3] if len(sys.argv) > 3 else "flight_plans"
+
+    config_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'config')
+    with open(os.path.join(config_dir, 'simulation.yaml'), 'r', encoding='utf-8') as f:
+        sim_config = yaml.safe_load(f)
+    with open(os.path.join(config_dir, 'visuals.yaml'), 'r', encoding='utf-8') as f:
+        vis_config = yaml.safe_load(f)
+    sim_config['simulation']['max_drones'] = num
+
+    sequence = ["phase2_anem", "phase_22eme_edition", "phase3_jcn", "phase4_fes"]
+    os.makedirs(out_dir, exist_ok=True)
+    archive_path = os.path.join(out_dir, "show.anemfp")
+
+    start = time.perf_counter()
+    frames = ((t, manager.positions, manager.colors) for t, manager, _ in
+              simulate_frames(sim_config, vis_config, sequence, minutes * 60.0 / len(sequence)))
+    writer = export_show(frames, archive_path, num)
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(archive_path)
+    print(f"{writer.frames} frames × {num} drones → {writer.keyframes['positions']} keyframes position, "
+          f"{writer.keyframes['colors']} couleur ({size / 1e6:.1f} Mo) en {elapsed:.1f}s")
+
+    start = time.perf_counter()
+    archive = FlightPlanArchive(archive_path)
+    archive.export_csv(os.path.join(out_dir, "csv"))
+    archive.close()
+    print(f"CSV par drone: {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,189 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+                 CACHE DES FORMATIONS (LRU BORNÉ) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Une seule couche de cache pour toutes les géométries pré-calculées:
+1. Clés structurées (FormationKey) au lieu de chaînes formatées
+2. Budget mémoire en octets (somme des ndarray.nbytes), éviction LRU
+3. Compteurs hits / misses / évictions pour le diagnostic
+4. Les tableaux stockés sont gelés (lecture seule) - copier avant de muter
+5. Entrées progressives : une seule construction à N drones (ordre préfixe),
+                          tout nombre k <= N est servi en vue [:k] sans copie
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import numpy as np
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Dict, Hashable
+
+
+# Clé structurée: kind = famille ("phase", "text", "mesh"...), name = phase/texte,
+# num_drones = taille de l'essaim, params = tuple hashable des paramètres restants
+FormationKey = namedtuple("FormationKey", ["kind", "name", "num_drones", "params"])
+FormationKey.__new__.__defaults__ = ((),)
+
+
+def _freeze(value):
+    """Rend récursivement les ndarray en lecture seule (sans copie)."""
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _freeze(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _freeze(item)
+    return value
+
+
+def _nbytes(value) -> int:
+    """Taille en octets des tableaux contenus dans une entrée de cache."""
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(_nbytes(item) for item in value.values())
+    return 0
+
+
+def _rows(value) -> int:
+    """Nombre de lignes (drones) du premier tableau d'une entrée."""
+    if isinstance(value, np.ndarray):
+        return len(value) if value.ndim else 0
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (tuple, list)):
+        for item in value:
+            rows = _rows(item)
+            if rows:
+                return rows
+    return 0
+
+
+def _prefix(value, count: int, rows: int):
+    """Vues [:count] de tous les tableaux à `rows` lignes (le reste inchangé)."""
+    if isinstance(value, np.ndarray):
+        return value[:count] if value.ndim and len(value) == rows else value
+    if isinstance(value, tuple):
+        return tuple(_prefix(item, count, rows) for item in value)
+    if isinstance(value, list):
+        return [_prefix(item, count, rows) for item in value]
+    if isinstance(value, dict):
+        return {name: _prefix(item, count, rows) for name, item in value.items()}
+    return value
+
+
+class FormationCache:
+    """
+    Cache LRU borné en octets pour les formations statiques.
+
+    Les entrées peuvent être un ndarray, un tuple/list ou un dict de ndarray
+    (plus des scalaires, non comptés). Les tableaux sont gelés à l'insertion:
+    un appelant qui doit animer une forme fait `base.copy()` puis mute la copie.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._resolutions: Dict[Hashable, int] = {}    # Entrées progressives: N construit
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Retourne l'entrée (lecture seule) et la marque comme récente."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        """Insère une entrée, la gèle, puis évince les plus anciennes si besoin."""
+        if key in self._entries:
+            self._discard(key)
+
+        size = _nbytes(value)
+        self._entries[key] = _freeze(value)
+        self._sizes[key] = size
+        self.current_bytes += size
+
+        # Éviction LRU - l'entrée qu'on vient d'insérer est toujours conservée
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.evictions += 1
+        return value
+
+    def get_or_build(self, key, builder: Callable[[], Any]):
+        """Retourne l'entrée en cache, ou la construit via builder() et la stocke."""
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, builder())
+        return value
+
+    def get_or_build_prefix(self, key, count: int, builder: Callable[[int], Any],
+                            resolution: int = 0):
+        """
+        Entrée progressive partagée par tous les nombres de drones: construite
+        une fois via builder(N), N = max(count, resolution), dont tout préfixe
+        est une version réduite valable de la forme. Retourne les vues [:count]
+        (lecture seule, sans copie); reconstruit seulement si count > N.
+        key.num_drones est ignoré.
+        """
+        key = key._replace(num_drones=None)
+        if key in self._entries and self._resolutions.get(key, 0) >= count:
+            value = self.get(key)
+        else:
+            self.misses += 1
+            built = max(count, resolution)
+            value = self.put(key, builder(built))
+            self._resolutions[key] = built
+        return _prefix(value, count, _rows(value))
+
+    def invalidate(self, predicate: Callable[[Hashable], bool] = None):
+        """Supprime toutes les entrées (ou celles dont la clé satisfait predicate)."""
+        for key in [k for k in self._entries if predicate is None or predicate(k)]:
+            self._discard(key)
+
+    def clear(self):
+        self.invalidate()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Compteurs pour le diagnostic (taux de hit, occupation mémoire)."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _discard(self, key):
+        del self._entries[key]
+        self.current_bytes -= self._sizes.pop(key)
+        self._resolutions.pop(key, None)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'FormationKey',
+    'FormationCache',
+]
@@ -21,6 +21,7 @@ from transition_system import (
     TransitionState,
     EasingFunctions
 )
+from show_compiler import state_durations
 
 
 class FormationType(Enum):
@@ -168,10 +169,12 @@ class ShowChoreographer:
         # ACTE 2 : LE DÉSERT S'ÉVEILLE (Version Complexe)
         # ═══════════════════════════════════════════════════════════════
         act2 = ActSequence(name="Le Désert S'éveille")
+        # Parties 1-4 de config/act1_desert_seveille.yaml (timeline)
+        genesis, growth, life, transition = state_durations("act1_desert_seveille", (4.0, 5.0, 4.0, 2.0))
         act2.formations = [
             FormationSequenceItem(
                 formation_type=FormationType.DESERT_GENESIS,
-                duration=4.0,
+                duration=genesis,
                 phase_name="act2_desert_seveille",  # t=0-4
                 hold_after=0.0,
                 transition_to_next=False,  # Pas de blackout, transition fluide
@@ -179,7 +182,7 @@ class ShowChoreographer:
             ),
             FormationSequenceItem(
                 formation_type=FormationType.DESERT_GROWTH,
-                duration=5.0,
+                duration=growth,
                 phase_name="act2_desert_seveille",  # t=4-9
                 hold_after=0.0,
                 transition_to_next=False,
@@ -187,7 +190,7 @@ class ShowChoreographer:
             ),
             FormationSequenceItem(
                 formation_type=FormationType.DESERT_LIFE,
-                duration=4.0,
+                duration=life,
                 phase_name="act2_desert_seveille",  # t=9-13
                 hold_after=0.0,
                 transition_to_next=False,
@@ -195,7 +198,7 @@ class ShowChoreographer:
             ),
             FormationSequenceItem(
                 formation_type=FormationType.DESERT_TRANSITION,
-                duration=2.0,
+                duration=transition,
                 phase_name="act2_desert_seveille",  # t=13-15
                 hold_after=2.0,
                 transition_to_next=True,
@@ -1,9 +1,25 @@
 import numpy as np
-from PIL import Image
-import os
+import zlib
+
+from formation_cache import FormationCache, FormationKey
+from curves import ease_out_cubic, min_jerk, smoothstep
+from phase_registry import register_phase, get_phase_spec
+from vector_geometry import PolygonShape, points_in_polygon
+from poisson_disk import PoissonDiskSampler, mask_predicate, progressive_order
+from image_assets import load_image_asset
+from show_compiler import state_ends
+
+def frame_seed(phase_name, num_drones, t=0.0):
+    """Graine d'une frame: mêmes (phase, nombre de drones, temps local) = mêmes tirages."""
+    return np.random.SeedSequence(
+        [zlib.crc32(phase_name.encode()), num_drones, int(round(t * 1e6)) % 2**63])
+
 
 class FormationLibrary:
-    def __init__(self):
+    # Épaisseur max d'un remplissage creusé pour tenir min_separation (× z_depth)
+    FILL_DEPTH_GAIN = 2.0
+
+    def __init__(self, cache_max_bytes=64 * 1024 * 1024, min_separation=3.0, bake_resolution=0):
         # === AUDIO REACTIVITY STATE ===
         self.audio_bpm = 120.0  # Placeholder: Would come from audio analysis
         self.audio_energy = 0.5  # Normalized [0, 1], from FFT analysis
@@ -84,144 +100,156 @@ class FormationLibrary:
             [3.4411,11.8769],[3.4183,11.8786],[3.403,11.8775],[3.3796,11.8867],[3.3394,11.8852],[3.3219,11.8857],[3.3021,11.8941],[3.2831,11.9342],[3.2725,11.9626]
         ]
         
-        # Cache for static formations
-        self._cache = {}
-        self._phase10_cache = {}
+        self._niger_shape = None    # Frontière triangulée (vector_geometry), à la demande
+        # Espacement minimal des remplissages Poisson-disk (simulation.physics.min_separation_m)
+        self.min_separation = min_separation
 
-    def get_phase(self, phase_name, num_drones, **kwargs):
+        # Cache unique (LRU borné en octets) pour formations statiques et maillages
+        self._cache = FormationCache(max_bytes=cache_max_bytes)
+        # Formations progressives construites à max(num, bake_resolution) drones,
+        # tout nombre inférieur est servi en préfixe (voir get_or_build_prefix)
+        self.bake_resolution = bake_resolution
+        # Tirages aléatoires par frame (jitter, scintillement) sans allocation float64,
+        # regraine par _generate_phase (frame_seed): seek et bake reproductibles
+        self._frame_rng = np.random.default_rng(frame_seed("", 0))
+        # Tampons de travail persistants des générateurs par frame (voir _scratch)
+        self._scratch_buffers = {}
+
+    def get_phase(self, phase_name, num_drones, out=None, **kwargs):
         """
         Returns (positions, colors) for a given phase.
         Supports audio_energy for music-reactive phases.
+
+        out: optional (positions, colors) pair of preallocated (num_drones, 3)
+        buffers (typically DroneManager.formation_buffers()). The frame is
+        written into them and they are returned, so the steady-state frame
+        path allocates no full-size arrays for phases declared writes_out.
         """
         # Extract audio_energy if provided (default 0.5)
         audio_energy = kwargs.pop('audio_energy', 0.5)
         self.audio_energy = audio_energy
-        
-        # Check cache for static phases (no 't' in kwargs)
+        spec = get_phase_spec(phase_name)
+        
+        # Check cache: phases declared static (no t/audio dependency) are served
+        # from cache on every frame: one progressive bake serves every drone
+        # count as a prefix view. Animated ones are cached (t = 0) only when no
+        # 't' is requested, in generator order: drone i keeps the same point as
+        # in the per-frame path, which transitions and reorder() rely on.
+        # Cached results are read-only: callers copy before mutating.
+        if spec.static:
+            result = self._cache.get_or_build_prefix(
+                FormationKey("phase", phase_name, num_drones), num_drones,
+                lambda n: self._progressive(self._generate_phase(phase_name, n, **kwargs)),
+                self.bake_resolution)
+            return result if out is None else self._write_out(result, out)
         if 't' not in kwargs:
-            cache_key = (phase_name, num_drones)
-            if cache_key in self._cache:
-                return self._cache[cache_key]
+            result = self._cache.get_or_build(
+                FormationKey("phase", phase_name, num_drones),
+                lambda: tuple(np.array(a) for a in self._generate_phase(phase_name, num_drones, **kwargs)))
+            return result if out is None else self._write_out(result, out)
         
+        if out is not None and spec.writes_out:
+            return self._generate_phase(phase_name, num_drones, out=out, **kwargs)
         result = self._generate_phase(phase_name, num_drones, **kwargs)
-        
-        if 't' not in kwargs:
-            self._cache[(phase_name, num_drones)] = result
-            
-        return result
+        return result if out is None else self._write_out(result, out)
+
+    @staticmethod
+    def _write_out(result, out):
+        """Copies a generator result into caller-provided frame buffers."""
+        pos, cols = result
+        pos_out, cols_out = out
+        count = min(len(pos), len(pos_out))
+        pos_out[:count] = pos[:count]
+        cols_out[:count] = cols[:count]
+        if count < len(pos_out):
+            pos_out[count:, 1] = 0.0  # Land the drones without a spot
+            cols_out[count:] = 0.0
+        return pos_out, cols_out
+
+    @staticmethod
+    def _progressive(result):
+        """Reorders (positions, colors) so that any prefix is a smaller version of the shape."""
+        pos, cols = np.asarray(result[0]), np.asarray(result[1])
+        order = progressive_order(pos, visible=cols.max(axis=1) > 0)
+        return pos[order], cols[order]
+
+    @staticmethod
+    def _frame_buffers(num, out):
+        """Returns out, or freshly allocated float32 (num, 3) buffers when out is None."""
+        if out is None:
+            return np.zeros((num, 3), dtype=np.float32), np.zeros((num, 3), dtype=np.float32)
+        return out
+
+    def _scratch(self, name, shape, dtype=np.float32):
+        """Persistent work buffer of a per-frame generator, allocated on first use only."""
+        key = (name, shape, np.dtype(dtype))
+        buf = self._scratch_buffers.get(key)
+        if buf is None:
+            buf = self._scratch_buffers[key] = np.empty(shape, dtype=dtype)
+        return buf
+
+    def cache_stats(self):
+        """Hit/miss/eviction counters and memory use of the formation cache."""
+        return self._cache.stats()
     
     # Alias pour le chorégraphe professionnel
     def generate_formation(self, phase_name, num_drones, **kwargs):
         """Alias de get_phase pour compatibilité avec le chorégraphe."""
         return self.get_phase(phase_name, num_drones, **kwargs)
 
-    def _generate_phase(self, phase_name, num_drones, **kwargs):
-        if phase_name == "phase1_pluie":
-            t = kwargs.get('t', 0.0)
-            audio_energy = kwargs.get('audio_energy', self.audio_energy)
-            return self._phase_1_pluie(num_drones, t, audio_energy)
-        elif phase_name == "phase2_anem":
-            t = kwargs.get('t', 0.0)
-            return self._text_formation("ANEM", num_drones, self.colors["star_white"], effect="rotate_ring", t=t) 
-        elif phase_name == "phase3_jcn":
-            t = kwargs.get('t', 0.0)
-            return self._text_formation("JCN2026", num_drones, self.colors["soleil_or"], scale_override=5.5, effect="wave", t=t)
-        elif phase_name == "phase4_fes":
-            t = kwargs.get('t', 0.0)
-            return self._text_formation("FES-MEKNES", num_drones, self.colors["vert_niger"], scale_override=5.0, effect="split_move", t=t)
-        elif phase_name == "phase5_niger":
-            t = kwargs.get('t', 0.0)
-            return self._text_formation("NIGER", num_drones, self.colors["orange_niger"], scale_override=8.5, effect="heartbeat", t=t)
-        elif phase_name == "phase6_drapeau":
-            # Original flag uses national colors
-            return self._phase_6_drapeau(num_drones)
-        elif phase_name == "phase7_carte":
-            return self._phase_7_carte(num_drones)
-        elif phase_name == "phase8_finale":
-            return self._phase_8_finale(num_drones)
-        elif phase_name == "phase9_agadez":
-            return self._phase_9_agadez(num_drones)
-        elif phase_name == "phase10_touareg":
-            t = kwargs.get('t', 0.0)
-            return self._phase_10_touareg(num_drones, t)
-        elif phase_name == "dubai_camel":
-            t = kwargs.get('t', 0.0)
-            return self._phase_dubai_camel(num_drones, t)
-        elif phase_name == "act0_pre_opening":
-            t = kwargs.get('t', 0.0)
-            return self._act_0_pre_opening(num_drones, t)
-        elif phase_name == "act1_desert":
-            t = kwargs.get('t', 0.0)
-            return self._act_1_desert(num_drones, t)
-        elif phase_name == "act2_desert_seveille":
-            t = kwargs.get('t', 0.0)
-            return self._act_2_desert_seveille(num_drones, t)
-        elif phase_name == "act2_sacred_rain":
-            # Redirige vers le nouveau nom
-            return self._act_3_fleuve_niger(num_drones)
-        elif phase_name == "act3_fleuve_niger":
-            return self._act_3_fleuve_niger(num_drones)
-        elif phase_name == "act3_typography":
-            # Monolithic typography in pure starry white
-            return self._text_formation("NIGER", num_drones, self.colors["star_white"], scale_override=16.0)
-        elif phase_name == "phase_touareg_spiral":
-            t = kwargs.get('t', 0.0)
-            audio_energy = kwargs.get('audio_energy', self.audio_energy)
-            return self._phase_touareg_spiral(num_drones, t, audio_energy)
-        elif phase_name == "phase_22eme_edition":
-            t = kwargs.get('t', 0.0)
-            audio_energy = kwargs.get('audio_energy', self.audio_energy)
-            return self._phase_22eme_edition(num_drones, t, audio_energy)
-        elif phase_name == "act4_science":
-            t = kwargs.get('t', 0.0)
-            audio_energy = kwargs.get('audio_energy', self.audio_energy)
-            return self._act_4_science(num_drones, t, audio_energy)
-        elif phase_name == "act5_wildlife":
-            return self._act_5_wildlife(num_drones)
-        elif phase_name == "act5_tree_of_life":
-            t = kwargs.get('t', 0.0)
-            audio_energy = kwargs.get('audio_energy', self.audio_energy)
-            return self._act_5_tree_of_life(num_drones, t, audio_energy)
-        elif phase_name == "act5_african_soul":
-            t = kwargs.get('t', 0.0)
-            audio_energy = kwargs.get('audio_energy', self.audio_energy)
-            return self._act_5_african_soul(num_drones, t, audio_energy)
-        elif phase_name == "act6_identity":
-            # Silver/Diamond styled Agadez Cross for Sacred Identity
-            return self._phase_11_croix_agadez(num_drones)
-        elif phase_name == "act7_flag":
-            # Immense and majestic flag
-            return self._act_7_flag(num_drones)
-        elif phase_name == "act8_finale":
-            t = kwargs.get('t', 0.0)
-            return self._act_8_finale(num_drones, t)
-        elif phase_name == "act9_eagle":
-            t = kwargs.get('t', 0.0)
-            return self._act_9_eagle(num_drones, t)
-        elif phase_name == "miroir_celeste":
-            t = kwargs.get('t', 0.0)
-            return self._act_finale_cosmic(num_drones, t)
-        elif phase_name == "phase11_croix_agadez":
-            return self._phase_11_croix_agadez(num_drones)
-        else:
-            # Default fallback: Sphere
-            return self._shape_sphere(num_drones, 50.0, self.colors["turquoise"])
+    def phase_spec(self, phase_name):
+        """Declared metadata (PhaseSpec) for a phase name."""
+        return get_phase_spec(phase_name)
 
-    def _text_formation(self, text, num_drones, color, scale_override=None, effect=None, t=0.0):
+    def _generate_phase(self, phase_name, num_drones, out=None, **kwargs):
+        spec = get_phase_spec(phase_name)
+        call_kwargs = {} if out is None else {'out': out}
+        if spec.uses_t:
+            call_kwargs['t'] = kwargs.get('t', 0.0)
+        if spec.uses_audio:
+            call_kwargs['audio_energy'] = kwargs.get('audio_energy', self.audio_energy)
+        # Tirages fonction de (phase, nombre, t) seulement, jamais de l'historique:
+        # les générateurs n'utilisent que self._frame_rng ou une graine fixe
+        self._frame_rng = np.random.default_rng(
+            frame_seed(phase_name, num_drones, call_kwargs.get('t', 0.0)))
+        return getattr(self, spec.method)(num_drones, **call_kwargs)
+
+    # --- Text phases (thin wrappers so each one can carry its own metadata) ---
+    @register_phase("phase2_anem", uses_t=True, camera_preset="text", warmup_ms=20, text=True, writes_out=True)
+    def _text_anem(self, num, t=0.0, out=None):
+        return self._text_formation("ANEM", num, self.colors["star_white"], effect="rotate_ring", t=t, out=out)
+
+    @register_phase("phase3_jcn", uses_t=True, camera_preset="text", warmup_ms=20, text=True, writes_out=True)
+    def _text_jcn(self, num, t=0.0, out=None):
+        return self._text_formation("JCN2026", num, self.colors["soleil_or"], scale_override=5.5, effect="wave", t=t, out=out)
+
+    @register_phase("phase4_fes", uses_t=True, camera_preset="text", warmup_ms=20, text=True, writes_out=True)
+    def _text_fes(self, num, t=0.0, out=None):
+        return self._text_formation("FES-MEKNES", num, self.colors["vert_niger"], scale_override=5.0, effect="split_move", t=t, out=out)
+
+    @register_phase("phase5_niger", uses_t=True, camera_preset="text", warmup_ms=20, text=True, writes_out=True)
+    def _text_niger(self, num, t=0.0, out=None):
+        return self._text_formation("NIGER", num, self.colors["orange_niger"], scale_override=8.5, effect="heartbeat", t=t, out=out)
+
+    @register_phase("act3_typography", camera_preset="text", warmup_ms=35, text=True)
+    def _text_typography(self, num):
+        # Monolithic typography in pure starry white
+        return self._text_formation("NIGER", num, self.colors["star_white"], scale_override=16.0)
+
+    def _default_sphere(self, num):
+        # Default fallback: Sphere
+        return self._shape_sphere(num, 50.0, self.colors["turquoise"])
+
+    def _text_formation(self, text, num_drones, color, scale_override=None, effect=None, t=0.0, out=None):
         # Solid Text Rendering: Every character pixel is filled with drones.
         
         scale = scale_override if scale_override else 9.0
         
         # --- CACHING OPTIMIZATION ---
-        cache_key = f"TEXT_{text}_{num_drones}_{scale}"
-        pos = None
-        
-        if cache_key in self._cache:
-            pos_cached, _ = self._cache[cache_key]
-            pos = pos_cached.copy()
-            
-        if pos is None:
-            # Generate static shape if not in cache
+        cache_key = FormationKey("text", text, num_drones, (scale,))
+
+        def build(resolution):
+            # Generate the static shape once, progressive order (any count is a prefix)
             font = {
                 'A': [[0,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[1,1,1,1,1],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1]],
                 'N': [[1,0,0,0,1],[1,1,0,0,1],[1,1,0,0,1],[1,0,1,0,1],[1,0,0,1,1],[1,0,0,1,1],[1,0,0,0,1]],
@@ -246,64 +274,68 @@ class FormationLibrary:
             
             total_w = len(text) * spacing - (spacing - char_w)
             
+            # Glyph stack (len(text), 7, 5); unknown characters stay empty
+            glyphs = np.array([font.get(char, np.zeros((7, 5))) for char in text], dtype=bool)
+
             def is_in_text(lx, ly):
                 x_rel = lx + total_w/2
-                if x_rel < 0 or x_rel > total_w: return False
-                
-                char_idx = int(x_rel // spacing)
-                if char_idx >= len(text): return False
-                
-                char = text[char_idx]
-                if char not in font: return False
-                
-                cx = x_rel % spacing
-                if cx > char_w: return False 
-                
+                char_idx = x_rel // spacing
+                cx = x_rel - char_idx * spacing
                 cy = char_h/2 - ly
-                if cy < 0 or cy > char_h: return False
-                
-                grid_c = int(cx // scale)
-                grid_r = int(cy // scale)
-                
-                if 0 <= grid_r < 7 and 0 <= grid_c < 5:
-                    return font[char][grid_r][grid_c] == 1
-                return False
+                grid_c = cx // scale
+                grid_r = cy // scale
+                valid = ((x_rel >= 0) & (x_rel <= total_w) & (char_idx < len(text)) &
+                         (cx <= char_w) & (cy >= 0) & (cy <= char_h) &
+                         (grid_r >= 0) & (grid_r < 7) & (grid_c >= 0) & (grid_c < 5))
+                inside = np.zeros(np.shape(lx), dtype=bool)
+                inside[valid] = glyphs[char_idx[valid].astype(np.intp),
+                                       grid_r[valid].astype(np.intp),
+                                       grid_c[valid].astype(np.intp)]
+                return inside
 
             # Use helper for solid filling
             # Transform text into a luminous sculpture with significant depth (10m)
-            pos, cols = self._fill_shape_uniformly(is_in_text, (-total_w/2, total_w/2, -char_h/2, char_h/2), num_drones, center=(0, 60, 0), z_depth=10.0)
+            pos, cols = self._fill_shape_uniformly(is_in_text, (-total_w/2, total_w/2, -char_h/2, char_h/2), resolution, center=(0, 60, 0), z_depth=10.0)
             
-            # Save to cache
-            self._cache[cache_key] = (pos, cols)
-            pos = pos.copy()
+            # Cached frozen, float32 like the frame buffers
+            return self._progressive((pos.astype(np.float32), cols))
+
+        # Animate the cached base (prefix view) into the frame buffers
+        base_pos = self._cache.get_or_build_prefix(cache_key, num_drones, build, self.bake_resolution)[0]
+
+        # Frame buffers: caller-provided (zero-allocation path) or fresh
+        pos, cols = self._frame_buffers(num_drones, out)
+        pos[:] = base_pos
 
-        # Override color base if needed (re-tile for every frame to ensure correct initial state before effects)
-        cols = np.tile(color, (num_drones, 1))
+        # Override color base if needed (re-fill for every frame to ensure correct initial state before effects)
+        cols[:] = color
 
         # --- DYNAMIC EFFECTS (LATEST GEN) ---
         if effect == "rotate_ring":
             # Slow rotation around Y
             theta = t * 0.3
             c, s = np.cos(theta), np.sin(theta)
-            x, z = pos[:, 0].copy(), pos[:, 2].copy()  # Relative to origin (0,0,0) ? No, center is (0,60,0)
-            
-            # Recenter for rotation
-            cx, cz = 0, 0 # The text is centered on x=0, z=0
+            # The text is centered on x=0, z=0: rotate the cached base in place
+            x, z = base_pos[:, 0], base_pos[:, 2]
             
             # Apply rotation
-            pos[:, 0] = x * c + z * s
-            pos[:, 2] = -x * s + z * c
+            np.multiply(x, c, out=pos[:, 0])
+            pos[:, 0] += z * s
+            np.multiply(z, c, out=pos[:, 2])
+            pos[:, 2] -= x * s
             
             # Dynamic Pulse on Color
             pulse = 0.5 + 0.5 * np.sin(t * 2.0)
-            cols[:, 0] = np.clip(cols[:, 0] + pulse * 0.2, 0, 1) # Add redness
+            cols[:, 0] = min(1.0, color[0] + pulse * 0.2) # Add redness (uniform base)
 
         elif effect == "wave":
             # Sine wave flowing through text
             wave_amp = 5.0
             freq = 0.1
             speed = 3.0
-            pos[:, 2] += wave_amp * np.sin(pos[:, 0] * freq + t * speed)
+            wave = np.sin(pos[:, 0] * freq + t * speed)
+            wave *= wave_amp
+            pos[:, 2] += wave
             
             # Color gradient shifting
             shift = (np.sin(t) + 1) / 2
@@ -319,8 +351,12 @@ class FormationLibrary:
             
             # Sparkle
             if int(t * 10) % 2 == 0:
-                noise = np.random.uniform(-0.1, 0.1, (num_drones, 3))
-                cols = np.clip(cols + noise, 0, 1)
+                for k in range(3):
+                    noise = self._frame_rng.random(num_drones, dtype=np.float32)
+                    noise -= 0.5
+                    noise *= 0.2
+                    cols[:, k] += noise
+                np.clip(cols, 0, 1, out=cols)
 
         elif effect == "heartbeat":
             # Violent scale pulses
@@ -341,12 +377,16 @@ class FormationLibrary:
         return pos, cols
 
 
-    def _act_finale_cosmic(self, num_drones, t):
+    @register_phase("miroir_celeste", uses_t=True, camera_preset="monument", smart_camera=True,
+                    writes_out=True)
+    def _act_finale_cosmic(self, num_drones, t, out=None):
         """
         The Ultimate Cosmic Finale: Spiral -> Implosion -> Eye -> Silence.
+        Spiral, sphere and eye geometry are cached; each frame scales them in place.
         """
-        pos = np.zeros((num_drones, 3))
-        cols = np.ones((num_drones, 3))
+        base_theta, radius_frac, galaxy_end, sphere_dir, eye_cols = self._cache.get_or_build(
+            FormationKey("mesh", "cosmic_finale", num_drones), lambda: self._build_cosmic_finale(num_drones))
+        pos, cols = self._frame_buffers(num_drones, out)
         
         # Timeline
         # 0-10s: Spiral Galaxy Formation
@@ -358,51 +398,44 @@ class FormationLibrary:
             # GALAXY SPIRAL
             progress = t / 10.0
             # Fibonacci spiral but flat and rotating
-            indices = np.arange(0, num_drones, dtype=float)
-            golden_angle = np.pi * (3 - np.sqrt(5))
-            theta = indices * golden_angle + (t * 2.0) # Rotating
+            theta, radius = self._scratch("cosmic_finale", (2, num_drones))
+            np.add(base_theta, t * 2.0, out=theta) # Rotating
             
             # Radius expands
             max_radius = 150.0 * np.sqrt(progress)
-            radius = np.sqrt(indices / num_drones) * max_radius
+            np.multiply(radius_frac, float(max_radius), out=radius)
             
-            x = radius * np.cos(theta)
-            z = radius * np.sin(theta)
+            np.cos(theta, out=pos[:, 0])
+            pos[:, 0] *= radius
+            np.sin(theta, out=pos[:, 2])
+            pos[:, 2] *= radius
             
             # Height variation (Galaxy bulge)
-            y_bulge = 100.0 + 30.0 * np.exp(-radius * 0.05)
-            y = y_bulge
-            
-            pos = np.column_stack((x, y, z))
-            
-            # Colors: Core Gold -> Edge Blue
-            dist_norm = radius / 150.0
-            cols[:, 0] = 1.0 - dist_norm # Red
-            cols[:, 1] = 0.8 - dist_norm * 0.5 # Green
-            cols[:, 2] = dist_norm + 0.2 # Blue
+            np.multiply(radius, -0.05, out=pos[:, 1])
+            np.exp(pos[:, 1], out=pos[:, 1])
+            pos[:, 1] *= 30.0
+            pos[:, 1] += 100.0
+            
+            # Colors: Core Gold -> Edge Blue (dist_norm = radius / 150)
+            np.multiply(radius, -1.0 / 150.0, out=cols[:, 0]) # Red
+            cols[:, 0] += 1.0
+            np.multiply(radius, -0.5 / 150.0, out=cols[:, 1]) # Green
+            cols[:, 1] += 0.8
+            np.multiply(radius, 1.0 / 150.0, out=cols[:, 2]) # Blue
+            cols[:, 2] += 0.2
             
         elif t < 14.0:
             # IMPLOSION
-            # Interpolate from Galaxy to pure point at (0, 150, 0)
+            # Interpolate from Galaxy (spiral state at t=10) to pure point at (0, 120, 0)
             progress = (t - 10.0) / 4.0
             # Ease in cubic
             progress = progress * progress * progress
             
-            # Recompute spiral state at t=10
-            indices = np.arange(0, num_drones, dtype=float)
-            golden_angle = np.pi * (3 - np.sqrt(5))
-            theta = indices * golden_angle + (20.0)
-            radius = np.sqrt(indices / num_drones) * 150.0
-            x = radius * np.cos(theta)
-            z = radius * np.sin(theta)
-            y = 100.0 + 30.0 * np.exp(-radius * 0.05)
-            start_pos = np.column_stack((x, y, z))
-            target_pos = np.array([0, 120, 0])
-            
-            pos = start_pos * (1.0 - progress) + target_pos * progress
+            np.multiply(galaxy_end, 1.0 - progress, out=pos)
+            pos[:, 1] += 120.0 * progress
             
             # Colors turn to pure white energy
-            cols[:] = [1.0, 1.0, 1.0]
+            cols[:] = 1.0
 
         elif t < 20.0:
             # THE COSMIC EYE / HOLLOW SPHERE
@@ -410,54 +443,53 @@ class FormationLibrary:
             # Rapid expansion to sphere
             expand_radius = 60.0 * (1.0 - np.exp(-progress * 5.0))
             
-            # Sphere positions
-            indices = np.arange(0, num_drones, dtype=float) + 0.5
-            phi = np.arccos(1 - 2*indices/num_drones)
-            theta = np.pi * (1 + 5**0.5) * indices
-            
-            sx = np.cos(theta) * np.sin(phi)
-            sy = np.sin(theta) * np.sin(phi)
-            sz = np.cos(phi)
-            
-            # Flatten front to look like an pupil (Irish)
-            # z > 0 is front
-            
-            pos[:, 0] = sx * expand_radius
-            pos[:, 1] = sy * expand_radius + 120.0
-            pos[:, 2] = sz * expand_radius
-            
-            # Eye Colors
-            # Center (Pupil) -> Black/Void
-            # Iris -> Blue/Gold
-            # Sclera -> White
-            
-            # Determine angle from front vector (0,0,1)
-            # dot product with (0,0,1) is basically sz
-            
-            # Pupil: sz > 0.9
-            # Iris: 0.6 < sz < 0.9
-            # White: sz < 0.6
-            
-            is_pupil = sz > 0.85
-            is_iris = (sz > 0.6) & (sz <= 0.85)
+            np.multiply(sphere_dir, float(expand_radius), out=pos)
+            pos[:, 1] += 120.0
             
-            cols[~is_pupil & ~is_iris] = [0.1, 0.1, 0.1] # Fading out back
-            cols[is_iris] = [0.0, 0.8, 1.0] # Blue/Cyan Iris
-            cols[is_pupil] = [0.0, 0.0, 0.0] # BLACK PUPIL (Negative Space)
-            
-            # Add rotation
-            rot_speed = t * 0.5
-            # Rotate around Y ...
+            # Eye Colors: pupil (black), iris (blue/cyan), fading back
+            cols[:] = eye_cols
             
         else:
              # SILENCE / DRIFT AWAY
-             # Just float upwards and fade
-             pos, _ = self._shape_sphere(num_drones, 60.0, [0,0,0])
+             # Just float upwards and fade (Fibonacci sphere, radius 60)
+             np.multiply(sphere_dir[:, 0], 60.0, out=pos[:, 0])
+             np.multiply(sphere_dir[:, 2], 60.0, out=pos[:, 2])
              pos[:, 1] = 120.0 + (t - 20.0) * 5.0 # Float up
-             cols[:] = [0,0,0] # Invisible
+             cols[:] = 0.0 # Invisible
 
         return pos, cols
 
+    def _build_cosmic_finale(self, num_drones):
+        """Static part of the finale: spiral angles/radii, spiral at t=10, sphere directions, eye colours."""
+        # Fibonacci spiral (angle reduced mod 2π so float32 keeps it exact)
+        indices = np.arange(0, num_drones, dtype=float)
+        golden_angle = np.pi * (3 - np.sqrt(5))
+        base_theta = (indices * golden_angle) % (2 * np.pi)
+        radius_frac = np.sqrt(indices / num_drones)
+
+        # Spiral state at t=10 (start of the implosion)
+        theta = indices * golden_angle + 20.0
+        radius = radius_frac * 150.0
+        galaxy_end = np.column_stack((radius * np.cos(theta), 100.0 + 30.0 * np.exp(-radius * 0.05),
+                                      radius * np.sin(theta)))
+
+        # Sphere positions
+        indices = indices + 0.5
+        phi = np.arccos(1 - 2*indices/num_drones)
+        theta = np.pi * (1 + 5**0.5) * indices
+        sz = np.cos(phi)
+        sphere_dir = np.column_stack((np.cos(theta) * np.sin(phi), np.sin(theta) * np.sin(phi), sz))
+
+        # Eye Colors, from the angle to the front vector (0,0,1), i.e. sz
+        # Pupil: sz > 0.85 -> Black/Void, Iris: 0.6 < sz <= 0.85 -> Blue/Gold, rest fading out
+        is_pupil = sz > 0.85
+        is_iris = (sz > 0.6) & (sz <= 0.85)
+        eye_cols = np.tile([0.1, 0.1, 0.1], (num_drones, 1)) # Fading out back
+        eye_cols[is_iris] = [0.0, 0.8, 1.0] # Blue/Cyan Iris
+        eye_cols[is_pupil] = [0.0, 0.0, 0.0] # BLACK PUPIL (Negative Space)
+
+        return tuple(a.astype(np.float32) for a in (base_theta, radius_frac, galaxy_end, sphere_dir, eye_cols))
+
     def _shape_sphere(self, num, radius, color):
         # Fibonacci sphere
         indices = np.arange(0, num, dtype=float) + 0.5
@@ -474,75 +506,64 @@ class FormationLibrary:
 
     def _fill_shape_uniformly(self, inclusion_func, bounds, num_drones, center=(0, 70, 0), z_depth=8.0):
         """
-        Generates a solid uniform grid of points filtered by inclusion_func.
-        Every drone acts as a pixel in a dense photo.
+        Fills the shape with blue-noise (Poisson-disk) points in a volume of
+        thickness z_depth. inclusion_func(x, y) is vectorized: arrays in,
+        boolean mask out. A silhouette too small for min_separation is
+        deepened (up to FILL_DEPTH_GAIN × z_depth, invisible face-on); any
+        remaining shortfall is reported by show_validator.formation_spacing.
         Sculptural default: z_depth = 8.0 for visibility in oblique camera.
         """
         min_x, max_x, min_y, max_y = bounds
-        
-        # 1. Estimate grid resolution to get ~4x more points than drones for flexibility
-        grid_points_target = num_drones * 20
-        res = int(np.sqrt(grid_points_target))
-        
-        x_grid = np.linspace(min_x, max_x, res)
-        y_grid = np.linspace(min_y, max_y, res)
-        
-        candidates = []
-        for gx in x_grid:
-            for gy in y_grid:
-                if inclusion_func(gx, gy):
-                    candidates.append([gx, gy])
-        
-        candidates = np.array(candidates)
-        if len(candidates) < num_drones:
+
+        def inside(points):
+            return inclusion_func(points[:, 0], points[:, 1])
+
+        if PoissonDiskSampler([(min_x, max_x), (min_y, max_y)], inside=inside).estimate_volume() <= 0.0:
             return self._shape_sphere(num_drones, 20, [1,1,1]) # Emergency fallback
 
-        indices = np.linspace(0, len(candidates)-1, num_drones).astype(int)
-        sampled = candidates[indices]
-        
-        final_pos = np.zeros((num_drones, 3))
-        jitter = 1.0 # Subtle spread to avoid grid-like look
-        final_pos[:, 0] = sampled[:, 0] + center[0] + np.random.uniform(-jitter, jitter, num_drones)
-        final_pos[:, 1] = sampled[:, 1] + center[1] + np.random.uniform(-jitter, jitter, num_drones)
-        final_pos[:, 2] = np.random.uniform(-z_depth/2, z_depth/2, num_drones) + center[2]
+        # Poisson-disk sampling of the extruded shape (stable order, fixed seed);
+        # too tight: retry deeper, by the volume ratio the spacing needs (N ∝ V / r³)
+        max_depth = z_depth * self.FILL_DEPTH_GAIN
+        while True:
+            sampler = PoissonDiskSampler(
+                [(min_x, max_x), (min_y, max_y), (-z_depth/2, z_depth/2)], inside=inside)
+            final_pos = sampler.sample_count(num_drones, min_radius=self.min_separation)
+            if sampler.radius >= self.min_separation or z_depth >= max_depth:
+                break
+            z_depth = min(z_depth * 1.05 * (self.min_separation / max(sampler.radius, 1e-6)) ** 3, max_depth)
+        final_pos += center
         
         final_cols = np.tile(self.colors["blanc_pure"], (num_drones, 1))
         return final_pos, final_cols
 
-    def _sample_from_image(self, image_path, num_drones, target_width=160.0):
-        """Extracts shape and colors from an image file."""
-        if not os.path.exists(image_path):
+    def _sample_from_image(self, image_path, num_drones, target_width=160.0, weighting=None):
+        """
+        Extracts shape and colors from an image file (decoded once, see image_assets).
+        weighting=None: Poisson-disk over the silhouette (min_separation spacing);
+        "uniform" | "luminance" | "edges": weighted pixel sampling.
+        """
+        asset = load_image_asset(image_path)
+        if asset is None:
             print(f"Warning: Image {image_path} not found.")
             return None, None
 
-        img = Image.open(image_path).convert("RGBA")
-        data = np.array(img)
-        
-        # Silhouette: find all non-transparent pixels (Alpha > 128)
-        # Note: We also exclude very white/background pixels if needed, 
-        # but here we rely on the alpha channel.
-        mask = data[:, :, 3] > 128
-        y_indices, x_indices = np.where(mask)
-        
-        if len(x_indices) == 0:
+        # Silhouette: non-transparent pixels (Alpha > 128), stored by the asset
+        if len(asset) == 0:
             return None, None
             
-        # Get coordinates and colors
-        coords = np.column_stack((x_indices, y_indices))
-        colors = data[y_indices, x_indices, :3] / 255.0
-        
-        # Sub-sample to num_drones
-        indices = np.linspace(0, len(coords)-1, num_drones).astype(int)
-        sampled_coords = coords[indices]
-        sampled_colors = colors[indices]
-        
-        # Center and scale
-        min_x, min_y = np.min(sampled_coords, axis=0)
-        max_x, max_y = np.max(sampled_coords, axis=0)
-        
-        width = max_x - min_x
-        height = max_y - min_y
-        scale = target_width / width
+        # Silhouette bounding box and scale (pixels -> meters)
+        min_x, max_x, min_y, max_y = asset.bounds
+        scale = target_width / max(max_x - min_x, 1)
+
+        if weighting is None:
+            # Poisson-disk in pixel space, spacing >= min_separation once scaled
+            crop = asset.mask[min_y:max_y + 1, min_x:max_x + 1]
+            box = [(min_x, max(max_x, min_x + 1)), (min_y, max(max_y, min_y + 1))]
+            sampler = PoissonDiskSampler(box, inside=mask_predicate(crop, box))
+            sampled_coords = sampler.sample_count(num_drones, min_radius=self.min_separation / scale)
+            sampled_colors = asset.colors_at(sampled_coords)
+        else:
+            sampled_coords, sampled_colors = asset.sample(num_drones, weighting)
         
         pos = np.zeros((num_drones, 3))
         # Flip Y because image coordinates start from top
@@ -551,7 +572,9 @@ class FormationLibrary:
         
         return pos, sampled_colors
 
-    def _act_0_pre_opening(self, num, t=0.0):
+    @register_phase("act0_pre_opening", uses_t=True, camera_preset="wide_opening", warmup_ms=2,
+                    writes_out=True)
+    def _act_0_pre_opening(self, num, t=0.0, out=None):
         """
         🎭 ACTE 0 : LE CIEL S'ÉVEILLE - Vision Réaliste
         
@@ -574,24 +597,22 @@ class FormationLibrary:
         Returns:
             (positions, colors) - Arrays numpy pour les 1000 drones
         """
-        rng = np.random.default_rng(2025)
+        # Géométrie de chaque sous-phase en cache (tirages à graine fixe 2025,
+        # voir _build_act0_pre_opening): par frame, interpolations sur place
         
         # ═══════════════════════════════════════════════════════════════
         # PARAMÈTRES DE CONFIGURATION - ALTITUDES RÉALISTES
         # ═══════════════════════════════════════════════════════════════
         
-        # Timing des phases (en secondes)
-        PHASE_1_END = 3.0      # Nuit primordiale
-        PHASE_2_END = 8.0      # Constellation ANEM
-        PHASE_3_END = 12.0     # Cœur cosmique
-        PHASE_4_END = 20.0     # Éclosion finale
+        # Timing des phases (en secondes) - config/act0_naissance_cosmique.yaml (timeline)
+        PHASE_1_END, PHASE_2_END, PHASE_3_END, PHASE_4_END = state_ends(
+            "act0_naissance_cosmique",
+            (3.0,       # Nuit primordiale
+             8.0,       # Constellation ANEM
+             12.0,      # Cœur cosmique
+             20.0))     # Éclosion finale
         
-        # NOUVELLES ALTITUDES RÉALISTES
-        ALTITUDE_ETOILES = 30.0      # Phase 1: 20-40m (moyenne 30m)
-        ALTITUDE_TEXTE = 35.0        # Phase 2: Texte ANEM à 35m
         ALTITUDE_SPHERE = 60.0       # Phase 3: Sphère à 60m
-        ALTITUDE_ARC_BASE = 20.0     # Phase 4: Arc-en-ciel 20-50m
-        ALTITUDE_ARC_MAX = 50.0
         
         # Niveau minimum absolu (au-dessus du sol/eau)
         GROUND_CLEARANCE = 15.0
@@ -603,65 +624,47 @@ class FormationLibrary:
         VERT_NIGER = np.array([0.0, 0.6, 0.2])
         OR_SOLEIL = np.array([1.0, 0.84, 0.0])
         
-        # Arc-en-ciel (7 couleurs)
-        RAINBOW_COLORS = np.array([
-            [0.58, 0.0, 0.83],   # Violet
-            [0.29, 0.0, 0.51],   # Indigo
-            [0.0, 0.0, 1.0],     # Bleu
-            [0.0, 1.0, 0.0],     # Vert
-            [1.0, 1.0, 0.0],     # Jaune
-            [1.0, 0.65, 0.0],    # Orange
-            [1.0, 0.0, 0.0],     # Rouge
-        ])
-        
-        # ═══════════════════════════════════════════════════════════════
-        # DÉTERMINATION DE LA PHASE COURANTE
-        # ═══════════════════════════════════════════════════════════════
+        pos, cols = self._frame_buffers(num, out)
+        wave, tmp = self._scratch("act0_pre_opening", (2, num))
         
-        if t < PHASE_1_END:
-            current_phase = "NUIT_PRIMORDIALE"
-            phase_progress = t / PHASE_1_END
-        elif t < PHASE_2_END:
-            current_phase = "CONSTELLATION_ANEM"
-            phase_progress = (t - PHASE_1_END) / (PHASE_2_END - PHASE_1_END)
-        elif t < PHASE_3_END:
-            current_phase = "COEUR_COSMIQUE"
-            phase_progress = (t - PHASE_2_END) / (PHASE_3_END - PHASE_2_END)
-        else:
-            current_phase = "ECLOSION_FINALE"
-            phase_progress = min(1.0, (t - PHASE_3_END) / (PHASE_4_END - PHASE_3_END))
+        # Toutes les sous-phases construites ensemble: changer de sous-phase n'alloue rien
+        parts = self._cache.get_or_build(
+            FormationKey("mesh", "act0_pre_opening", num),
+            lambda: {part: self._build_act0_part(num, part) for part in self.ACT0_PARTS})
+        geometry = parts.__getitem__
         
-        # Initialisation des arrays
-        pos = np.zeros((num, 3))
-        cols = np.zeros((num, 3))
+        def lerp(start, end, progress, dst):
+            """dst = start * (1 - progress) + end * progress, colonne par colonne."""
+            for k in range(3):
+                np.multiply(start[:, k], 1.0 - progress, out=dst[:, k])
+                np.multiply(end[:, k], progress, out=tmp[:len(dst)])
+                dst[:, k] += tmp[:len(dst)]
         
         # ═══════════════════════════════════════════════════════════════
         # PHASE 1 : ÉTOILES NAISSANTES (0-3s) - Altitude 20-40m
         # "Juste au-dessus des arbres, comme si le ciel s'allumait"
         # ═══════════════════════════════════════════════════════════════
         
-        if current_phase == "NUIT_PRIMORDIALE":
+        if t < PHASE_1_END:
             # Nombre d'étoiles visibles (progression exponentielle)
             visible_stars = int(min(100, 1 + t * t * 11))
             
             # Positions dans un dôme bas (20-40m de hauteur)
-            # Distribution horizontale large, verticale limitée
-            phi = rng.uniform(0, 2 * np.pi, num)
-            r_horizontal = rng.uniform(20, 120, num)  # Rayon horizontal large
-            
-            pos[:, 0] = r_horizontal * np.cos(phi)
-            pos[:, 1] = rng.uniform(20, 40, num)  # ALTITUDE BASSE : 20-40m
-            pos[:, 2] = r_horizontal * np.sin(phi)
+            pos[:] = geometry("stars")[0]
             
             # Couleurs: étoiles blanches scintillantes sur fond nuit
-            cols[:, :] = BLEU_NUIT * 0.3  # Base très sombre
-            
-            # Seuls les premiers 'visible_stars' drones sont visibles
-            visible_mask = np.arange(num) < visible_stars
-            
-            # Effet scintillement
-            twinkle = 0.7 + 0.3 * np.sin(t * 5.0 + np.arange(num) * 0.5)
-            cols[visible_mask] = BLANC * twinkle[visible_mask, None]
+            cols[:] = BLEU_NUIT * 0.3  # Base très sombre
+            
+            # Seuls les premiers 'visible_stars' drones sont visibles, avec scintillement
+            visible = min(visible_stars, num)
+            twinkle = wave[:visible]
+            np.multiply(geometry("phases")[0][:visible], 10.0, out=twinkle)  # i * 0.5
+            twinkle += t * 5.0
+            np.sin(twinkle, out=twinkle)
+            twinkle *= 0.3
+            twinkle += 0.7
+            for k in range(3):
+                cols[:visible, k] = twinkle
             
             # Première étoile plus brillante
             if visible_stars >= 1:
@@ -672,181 +675,83 @@ class FormationLibrary:
         # "Texte géant visible depuis le sol, comme un néon dans le ciel"
         # ═══════════════════════════════════════════════════════════════
         
-        elif current_phase == "CONSTELLATION_ANEM":
+        elif t < PHASE_2_END:
             local_t = t - PHASE_1_END
             
-            # Timing des lettres
-            LETTER_A_START = 0.0
-            LETTER_N_START = 1.0
-            LETTER_E_START = 2.0
-            LETTER_M_START = 3.0
-            
-            # Nombre de drones par lettre
+            # Timing des lettres (A, N, E, M), 200 drones par lettre
             DRONES_PER_LETTER = 200
-            
-            # DIMENSIONS PLUS GRANDES pour visibilité depuis le sol
-            text_width = 120.0      # 120m de large (comme un terrain de foot)
-            text_height = 50.0      # 50m de haut
-            letter_spacing = 15.0
-            letter_width = 22.0     # Lettres plus larges
-            base_y = ALTITUDE_TEXTE  # 35m d'altitude
-            
-            # Fonctions de création des lettres (mêmes formes, nouvelle altitude)
-            def create_letter_A(n_points, x_offset):
-                pts = np.zeros((n_points, 3))
-                for i in range(n_points):
-                    t_param = i / n_points
-                    if t_param < 0.4:
-                        pts[i] = [x_offset - letter_width/2 + t_param * letter_width * 1.25, 
-                                  base_y + t_param * 2.5 * text_height, 0]
-                    elif t_param < 0.5:
-                        pts[i] = [x_offset - letter_width/4 + (t_param - 0.4) * letter_width * 2.5, 
-                                  base_y + text_height * 0.5, 0]
-                    else:
-                        pts[i] = [x_offset + letter_width/2 - (t_param - 0.5) * letter_width * 1.25, 
-                                  base_y + (t_param - 0.5) * 2 * text_height, 0]
-                return pts
-            
-            def create_letter_N(n_points, x_offset):
-                pts = np.zeros((n_points, 3))
-                for i in range(n_points):
-                    t_param = i / n_points
-                    if t_param < 0.33:
-                        pts[i] = [x_offset - letter_width/2, base_y + t_param * 3 * text_height, 0]
-                    elif t_param < 0.66:
-                        pts[i] = [x_offset - letter_width/2 + (t_param - 0.33) * 3 * letter_width,
-                                  base_y + text_height - (t_param - 0.33) * 3 * text_height, 0]
-                    else:
-                        pts[i] = [x_offset + letter_width/2, base_y + (t_param - 0.66) * 3 * text_height, 0]
-                return pts
-            
-            def create_letter_E(n_points, x_offset):
-                pts = np.zeros((n_points, 3))
-                for i in range(n_points):
-                    t_param = i / n_points
-                    if t_param < 0.25:
-                        pts[i] = [x_offset - letter_width/2 + t_param * 4 * letter_width, base_y + text_height, 0]
-                    elif t_param < 0.5:
-                        pts[i] = [x_offset - letter_width/2, base_y + text_height - (t_param - 0.25) * 4 * text_height, 0]
-                    elif t_param < 0.75:
-                        pts[i] = [x_offset - letter_width/2 + (t_param - 0.5) * 3 * letter_width, base_y + text_height * 0.5, 0]
-                    else:
-                        pts[i] = [x_offset - letter_width/2 + (t_param - 0.75) * 4 * letter_width, base_y, 0]
-                return pts
-            
-            def create_letter_M(n_points, x_offset):
-                pts = np.zeros((n_points, 3))
-                for i in range(n_points):
-                    t_param = i / n_points
-                    if t_param < 0.25:
-                        pts[i] = [x_offset - letter_width/2, base_y + t_param * 4 * text_height, 0]
-                    elif t_param < 0.5:
-                        pts[i] = [x_offset - letter_width/2 + (t_param - 0.25) * 2 * letter_width,
-                                  base_y + text_height - (t_param - 0.25) * 2 * text_height, 0]
-                    elif t_param < 0.75:
-                        pts[i] = [x_offset + (t_param - 0.5) * 2 * letter_width,
-                                  base_y + text_height * 0.5 + (t_param - 0.5) * 2 * text_height, 0]
-                    else:
-                        pts[i] = [x_offset + letter_width/2, base_y + text_height - (t_param - 0.75) * 4 * text_height, 0]
-                return pts
-            
-            # Positions X des lettres (bien espacées)
-            letter_positions = [-52, -17, 17, 52]  # 4 lettres centrées
-            
-            # Créer les positions pour chaque lettre
-            letter_A_pos = create_letter_A(DRONES_PER_LETTER, letter_positions[0])
-            letter_N_pos = create_letter_N(DRONES_PER_LETTER, letter_positions[1])
-            letter_E_pos = create_letter_E(DRONES_PER_LETTER, letter_positions[2])
-            letter_M_pos = create_letter_M(DRONES_PER_LETTER, letter_positions[3])
-            
-            # Positions initiales (étoiles dispersées à basse altitude)
-            initial_pos = np.zeros((num, 3))
-            phi = rng.uniform(0, 2 * np.pi, num)
-            r = rng.uniform(30, 100, num)
-            initial_pos[:, 0] = r * np.cos(phi)
-            initial_pos[:, 1] = rng.uniform(20, 45, num)  # Basse altitude
-            initial_pos[:, 2] = r * np.sin(phi) * 0.5
-            
-            # Interpolation ease-out cubic
-            def ease_out_cubic(x):
-                return 1.0 - pow(1.0 - x, 3)
+            letters, initial_pos, jitter = geometry("anem")
             
             def get_letter_progress(start_time, duration=0.8):
                 if local_t < start_time:
                     return 0.0
                 return min(1.0, (local_t - start_time) / duration)
             
-            progress_A = ease_out_cubic(get_letter_progress(LETTER_A_START))
-            progress_N = ease_out_cubic(get_letter_progress(LETTER_N_START))
-            progress_E = ease_out_cubic(get_letter_progress(LETTER_E_START))
-            progress_M = ease_out_cubic(get_letter_progress(LETTER_M_START))
-            
-            # Assigner les drones aux lettres
-            # Lettre A (0-199)
-            pos[0:200] = initial_pos[0:200] * (1 - progress_A) + letter_A_pos * progress_A
-            cols[0:200] = BLANC * (0.2 + 0.8 * progress_A)
-            
-            # Lettre N (200-399)
-            pos[200:400] = initial_pos[200:400] * (1 - progress_N) + letter_N_pos * progress_N
-            cols[200:400] = ORANGE_NIGER * (0.2 + 0.8 * progress_N)
-            
-            # Lettre E (400-599)
-            pos[400:600] = initial_pos[400:600] * (1 - progress_E) + letter_E_pos * progress_E
-            cols[400:600] = VERT_NIGER * (0.2 + 0.8 * progress_E)
-            
-            # Lettre M (600-799)
-            pos[600:800] = initial_pos[600:800] * (1 - progress_M) + letter_M_pos * progress_M
-            cols[600:800] = BLANC * (0.2 + 0.8 * progress_M)
-            
-            # Étoiles de fond (800-999)
-            pos[800:] = initial_pos[800:]
-            twinkle = 0.3 + 0.2 * np.sin(t * 3.0 + np.arange(800, num) * 0.3)
-            cols[800:] = BLANC * twinkle[:, None]
+            # Assigner les drones aux lettres: étoiles dispersées → lettre
+            for letter, (start_time, color) in enumerate(((0.0, BLANC), (1.0, ORANGE_NIGER),
+                                                          (2.0, VERT_NIGER), (3.0, BLANC))):
+                progress = ease_out_cubic(get_letter_progress(start_time))
+                lo = letter * DRONES_PER_LETTER
+                hi = min(lo + DRONES_PER_LETTER, num)
+                if hi > lo:
+                    lerp(initial_pos[lo:hi], letters[letter, :hi - lo], progress, pos[lo:hi])
+                    cols[lo:hi] = color * (0.2 + 0.8 * progress)
+            
+            # Étoiles de fond (800+)
+            if num > 4 * DRONES_PER_LETTER:
+                stars = slice(4 * DRONES_PER_LETTER, num)
+                pos[stars] = initial_pos[stars]
+                twinkle = wave[stars]
+                np.multiply(geometry("phases")[0][stars], 6.0, out=twinkle)  # i * 0.3
+                twinkle += t * 3.0
+                np.sin(twinkle, out=twinkle)
+                twinkle *= 0.2
+                twinkle += 0.3
+                for k in range(3):
+                    cols[stars, k] = twinkle
             
             # Pulsation après formation complète
             if local_t > 4.0:
                 pulse = 1.0 + 0.15 * np.sin((local_t - 4.0) * 2 * np.pi)
-                cols[:800] *= pulse
+                cols[:4 * DRONES_PER_LETTER] *= float(pulse)
             
             # Jitter organique
-            pos += rng.normal(0, 0.3, (num, 3))
+            pos += jitter
         
         # ═══════════════════════════════════════════════════════════════
         # PHASE 3 : ORBE SOLAIRE (8-12s) - Altitude 60m
         # "Sphère dorée pulsante à hauteur raisonnable"
         # ═══════════════════════════════════════════════════════════════
         
-        elif current_phase == "COEUR_COSMIQUE":
+        elif t < PHASE_3_END:
             local_t = t - PHASE_2_END
-            CENTER = np.array([0.0, ALTITUDE_SPHERE, 0.0])  # 60m
-            
             base_radius = 25.0  # Sphère de 25m de rayon
             
             # Convergence spirale (0-1s)
             if local_t < 1.0:
                 convergence = local_t
                 
-                # Positions initiales (depuis les lettres ANEM)
-                phi_init = rng.uniform(0, 2 * np.pi, num)
-                r_init = rng.uniform(40, 80, num)
-                y_init = rng.uniform(25, 55, num)  # Altitude du texte
+                # Positions initiales (depuis les lettres ANEM): angle, rayon, altitude
+                phi_init, r_init, y_init, spiral_offset = geometry("convergence")
                 
                 # Spirale vers le centre
-                spiral_angle = convergence * 4 * np.pi + np.arange(num) * 0.01
-                final_r = r_init * (1 - convergence) + base_radius * convergence
-                
-                pos[:, 0] = final_r * np.cos(phi_init + spiral_angle) * (1 - convergence * 0.5)
-                pos[:, 1] = y_init * (1 - convergence) + CENTER[1] * convergence
-                pos[:, 2] = final_r * np.sin(phi_init + spiral_angle) * (1 - convergence * 0.5)
+                np.add(phi_init, convergence * 4 * np.pi, out=wave)
+                wave += spiral_offset
+                np.multiply(r_init, 1 - convergence, out=tmp)
+                tmp += base_radius * convergence
+                tmp *= 1 - convergence * 0.5
+                
+                np.cos(wave, out=pos[:, 0])
+                pos[:, 0] *= tmp
+                np.multiply(y_init, 1 - convergence, out=pos[:, 1])
+                pos[:, 1] += ALTITUDE_SPHERE * convergence
+                np.sin(wave, out=pos[:, 2])
+                pos[:, 2] *= tmp
                 
                 cols[:] = OR_SOLEIL * (0.5 + 0.5 * convergence)
             
             else:
                 # Sphère formée avec pulsations
-                phi = rng.uniform(0, 2 * np.pi, num)
-                cos_theta = rng.uniform(-1, 1, num)
-                theta = np.arccos(cos_theta)
-                
                 # Trois pulsations de cœur
                 pulse_t = local_t - 1.0
                 pulse1 = np.exp(-((pulse_t - 0.5) ** 2) / 0.05) * 5.0
@@ -856,20 +761,18 @@ class FormationLibrary:
                 total_pulse = pulse1 + pulse2 + pulse3
                 current_radius = base_radius * (1.0 + total_pulse * 0.08)
                 
-                pos[:, 0] = CENTER[0] + current_radius * np.sin(theta) * np.cos(phi)
-                pos[:, 1] = CENTER[1] + current_radius * np.sin(theta) * np.sin(phi)
-                pos[:, 2] = CENTER[2] + current_radius * np.cos(theta)
+                np.multiply(geometry("sphere")[0], float(current_radius), out=pos)
+                pos[:, 1] += ALTITUDE_SPHERE
                 
                 base_intensity = 1.0 + total_pulse * 0.4
-                cols[:] = OR_SOLEIL * base_intensity
-                cols = np.clip(cols, 0, 2.5)
+                cols[:] = np.clip(OR_SOLEIL * base_intensity, 0, 2.5)
         
         # ═══════════════════════════════════════════════════════════════
         # PHASE 4 : ARC-EN-CIEL TERRESTRE (12-20s) - Altitude 20-50m
         # "Comme un pont lumineux au-dessus du public"
         # ═══════════════════════════════════════════════════════════════
         
-        elif current_phase == "ECLOSION_FINALE":
+        else:
             local_t = t - PHASE_3_END
             
             EXPLOSION_DURATION = 0.5
@@ -877,26 +780,14 @@ class FormationLibrary:
             RAINBOW_HOLD_END = 6.0
             TRANSITION_END = 8.0
             
-            # Arc-en-ciel BAS et LARGE (comme un pont)
-            rainbow_width = 140.0   # 140m de large
-            arc_base_height = 20.0  # Base à 20m
-            arc_max_height = 50.0   # Sommet à 50m
             arc_z_position = -20.0  # DEVANT le spectateur
             
-            # Explosion (0-0.5s)
+            # Explosion (0-0.5s): depuis le centre (60m), principalement vers le bas/côtés
             if local_t < EXPLOSION_DURATION:
                 explosion_progress = local_t / EXPLOSION_DURATION
                 
-                # Direction depuis le centre (60m)
-                phi = rng.uniform(0, 2 * np.pi, num)
-                theta = rng.uniform(0.3, 1.2, num)  # Principalement vers le bas/côtés
-                
-                initial_speed = 40.0
-                distance = initial_speed * explosion_progress * (0.7 + 0.3 * rng.uniform(0, 1, num))
-                
-                pos[:, 0] = distance * np.sin(theta) * np.cos(phi)
-                pos[:, 1] = ALTITUDE_SPHERE + distance * np.cos(theta) * 0.3  # Descend
-                pos[:, 2] = distance * np.sin(theta) * np.sin(phi)
+                np.multiply(geometry("explosion")[0], explosion_progress, out=pos)
+                pos[:, 1] += ALTITUDE_SPHERE  # Descend
                 
                 flash_intensity = 2.0 * (1 - explosion_progress) + 1.0
                 cols[:] = BLANC * flash_intensity
@@ -906,111 +797,66 @@ class FormationLibrary:
                 form_progress = (local_t - EXPLOSION_DURATION) / (RAINBOW_FORM_END - EXPLOSION_DURATION)
                 form_ease = form_progress * form_progress * (3.0 - 2.0 * form_progress)
                 
-                drones_per_band = num // 7
-                
-                # Position explosée
-                exploded_pos = np.zeros((num, 3))
-                phi = rng.uniform(0, 2 * np.pi, num)
-                r = 30 + 30 * rng.uniform(0, 1, num)
-                exploded_pos[:, 0] = r * np.cos(phi)
-                exploded_pos[:, 1] = 40 + r * rng.uniform(-0.3, 0.3, num)
-                exploded_pos[:, 2] = r * np.sin(phi) * 0.5
-                
-                # Position finale : arc-en-ciel BAS
-                rainbow_pos = np.zeros((num, 3))
-                
-                for band_idx in range(7):
-                    start_idx = band_idx * drones_per_band
-                    end_idx = start_idx + drones_per_band if band_idx < 6 else num
-                    band_count = end_idx - start_idx
-                    
-                    # Arc de cercle horizontal (pont)
-                    arc_angles = np.linspace(0, np.pi, band_count)
-                    band_height_offset = band_idx * 4  # Bandes empilées
-                    
-                    rainbow_pos[start_idx:end_idx, 0] = (rainbow_width / 2) * np.cos(arc_angles)
-                    # Hauteur : arc de 20m à 50m
-                    rainbow_pos[start_idx:end_idx, 1] = arc_base_height + np.sin(arc_angles) * (arc_max_height - arc_base_height) + band_height_offset
-                    rainbow_pos[start_idx:end_idx, 2] = arc_z_position + rng.uniform(-2, 2, band_count)
-                    
-                    cols[start_idx:end_idx] = RAINBOW_COLORS[band_idx]
-                
-                pos = exploded_pos * (1 - form_ease) + rainbow_pos * form_ease
-                cols *= (0.5 + 0.5 * form_ease)
+                # Position explosée → arc-en-ciel BAS
+                exploded_pos, rainbow_pos = geometry("rainbow_form")
+                lerp(exploded_pos, rainbow_pos, form_ease, pos)
+                np.multiply(geometry("rainbow")[-1], 0.5 + 0.5 * form_ease, out=cols)
             
             # Arc-en-ciel stable BAS (2.0-6.0s)
             elif local_t < RAINBOW_HOLD_END:
-                drones_per_band = num // 7
-                
-                for band_idx in range(7):
-                    start_idx = band_idx * drones_per_band
-                    end_idx = start_idx + drones_per_band if band_idx < 6 else num
-                    band_count = end_idx - start_idx
-                    
-                    arc_angles = np.linspace(0, np.pi, band_count)
-                    band_height_offset = band_idx * 4
-                    
-                    # Légère ondulation vivante
-                    wave = np.sin(arc_angles * 2 + t * 0.5) * 1.5
-                    
-                    pos[start_idx:end_idx, 0] = (rainbow_width / 2) * np.cos(arc_angles)
-                    pos[start_idx:end_idx, 1] = arc_base_height + np.sin(arc_angles) * (arc_max_height - arc_base_height) + band_height_offset + wave
-                    pos[start_idx:end_idx, 2] = arc_z_position + np.sin(arc_angles * 3 + t * 0.3) * 2.0
-                    
-                    pulse = 0.9 + 0.1 * np.sin(t * 2.0 + band_idx * 0.5)
-                    cols[start_idx:end_idx] = RAINBOW_COLORS[band_idx] * pulse
-            
-            # Transition vers désert (6.0-8.0s)
+                arc_x, arc_y, arc_angles, band_phase, rainbow_cols = geometry("rainbow")
+                pos[:, 0] = arc_x
+                
+                # Légère ondulation vivante
+                np.multiply(arc_angles, 2.0, out=wave)
+                wave += t * 0.5
+                np.sin(wave, out=wave)
+                wave *= 1.5
+                np.add(arc_y, wave, out=pos[:, 1])
+                np.multiply(arc_angles, 3.0, out=wave)
+                wave += t * 0.3
+                np.sin(wave, out=wave)
+                wave *= 2.0
+                np.add(wave, arc_z_position, out=pos[:, 2])
+                
+                # Pulsation par bande
+                np.add(band_phase, t * 2.0, out=wave)
+                np.sin(wave, out=wave)
+                wave *= 0.1
+                wave += 0.9
+                for k in range(3):
+                    np.multiply(rainbow_cols[:, k], wave, out=cols[:, k])
+            
+            # Transition vers désert (6.0-8.0s): l'arc s'aplatit en ligne ondulante (dunes)
             else:
                 transition_progress = (local_t - RAINBOW_HOLD_END) / (TRANSITION_END - RAINBOW_HOLD_END)
                 transition_ease = transition_progress * transition_progress
                 
-                drones_per_band = num // 7
+                arc_pos, dune_pos, desert_cols = geometry("desert")
+                lerp(arc_pos, dune_pos, transition_ease, pos)
+                pos[:, 2] = arc_z_position + transition_ease * 30
                 
-                DESERT_COLORS = np.array([
-                    [0.96, 0.64, 0.38],
-                    [0.87, 0.53, 0.25],
-                    [0.82, 0.41, 0.12],
-                ])
-                
-                for band_idx in range(7):
-                    start_idx = band_idx * drones_per_band
-                    end_idx = start_idx + drones_per_band if band_idx < 6 else num
-                    band_count = end_idx - start_idx
-                    
-                    arc_angles = np.linspace(0, np.pi, band_count)
-                    
-                    # Arc qui s'aplatit en ligne ondulante (dunes)
-                    base_x = (rainbow_width / 2) * np.cos(arc_angles)
-                    target_x = np.linspace(-80, 80, band_count)  # Ligne droite élargie
-                    
-                    base_y = arc_base_height + np.sin(arc_angles) * (arc_max_height - arc_base_height)
-                    target_y = 25.0 + np.sin(np.linspace(0, 4*np.pi, band_count)) * 8  # Dunes
-                    
-                    pos[start_idx:end_idx, 0] = base_x * (1 - transition_ease) + target_x * transition_ease
-                    pos[start_idx:end_idx, 1] = base_y * (1 - transition_ease) + target_y * transition_ease
-                    pos[start_idx:end_idx, 2] = arc_z_position + transition_ease * 30
-                    
-                    desert_color = DESERT_COLORS[band_idx % 3]
-                    cols[start_idx:end_idx] = RAINBOW_COLORS[band_idx] * (1 - transition_ease) + desert_color * transition_ease
-                    cols[start_idx:end_idx] *= (1.0 - transition_ease * 0.2)
+                lerp(geometry("rainbow")[-1], desert_cols, transition_ease, cols)
+                cols *= (1.0 - transition_ease * 0.2)
         
         # ═══════════════════════════════════════════════════════════════
         # MICRO-MOUVEMENTS ORGANIQUES
         # ═══════════════════════════════════════════════════════════════
         
-        micro_x = np.sin(t * 1.5 + np.arange(num) * 0.01) * 0.3
-        micro_y = np.cos(t * 1.8 + np.arange(num) * 0.015) * 0.25
-        micro_z = np.sin(t * 2.2 + np.arange(num) * 0.02) * 0.2
-        
-        pos[:, 0] += micro_x
-        pos[:, 1] += micro_y
-        pos[:, 2] += micro_z
+        drone_phase = geometry("phases")[0]  # i * 0.05
+        for k, (oscillate, freq, step, amp) in enumerate(((np.sin, 1.5, 0.01, 0.3),
+                                                           (np.cos, 1.8, 0.015, 0.25),
+                                                           (np.sin, 2.2, 0.02, 0.2))):
+            np.multiply(drone_phase, step / 0.05, out=wave)
+            wave += t * freq
+            oscillate(wave, out=wave)
+            wave *= amp
+            pos[:, k] += wave
         
         # ═══════════════════════════════════════════════════════════════
         # CONTRAINTE DE SOL ABSOLUE - Jamais sous 15m
         # ═══════════════════════════════════════════════════════════════
-        pos[:, 1] = np.maximum(pos[:, 1], GROUND_CLEARANCE)
+        np.maximum(pos[:, 1], GROUND_CLEARANCE, out=pos[:, 1])
         
         # ═══════════════════════════════════════════════════════════════
         # AUDIO-RÉACTIVITÉ
@@ -1020,70 +866,287 @@ class FormationLibrary:
         if audio_energy > 0.65:
             cols *= (1.0 + (audio_energy - 0.65) * 0.4)
         
-        cols = np.clip(cols, 0.0, 3.0)
+        np.clip(cols, 0.0, 3.0, out=cols)
         
         return pos, cols
 
-    def _act_1_desert(self, num, t=0.0):
+    # Sous-phases de l'acte 0 dont la géométrie est en cache
+    ACT0_PARTS = ("phases", "stars", "anem", "convergence", "sphere", "explosion",
+                  "rainbow_form", "rainbow", "desert")
+
+    def _build_act0_part(self, num, part):
         """
-        ACTE 1 : DUNES DU SAHARA - Version Simple et Élégante
-        Grille avec sculpture sinusoïdale, motifs Touareg
+        Géométrie statique (float32) d'une sous-phase de l'acte 0. Chaque
+        sous-phase tire de son propre générateur à graine fixe (2025): mêmes
+        étoiles, même sphère et même arc-en-ciel à chaque frame.
         """
-        bass_energy = 0.5 + 0.3 * np.sin(t * 3.0)
-        
-        # 1. Grille de base
-        grid_side = int(np.ceil(np.sqrt(num))) + 1
-        x = np.linspace(-120, 120, grid_side)
-        z = np.linspace(-120, 120, grid_side)
-        xv, zv = np.meshgrid(x, z)
-        
-        pos = np.zeros((num, 3))
-        flat_x = xv.flatten()
-        flat_z = zv.flatten()
-        
-        pos[:, 0] = flat_x[:num]
-        pos[:, 2] = flat_z[:num]
-        
-        # 2. Sculpture des Dunes (Multi-Layer)
-        amp_bass = 1.0 + bass_energy * 1.5 
-        
-        freq_dune = 0.04
-        freq_ripple = 0.12
-        
-        # Grandes dunes respirantes (hauteur réaliste 15-45m)
-        y_dunes = 20.0 * np.sin(pos[:, 0] * freq_dune + t * 0.5) * np.cos(pos[:, 2] * freq_dune + t * 0.3)
-        
-        # Dunes secondaires
-        y_dunes2 = 10.0 * np.sin(pos[:, 0] * 0.06 + pos[:, 2] * 0.04 + t * 0.4)
-        
-        # Rides de sable (vent)
-        y_ripples = 3.0 * np.sin(pos[:, 0] * freq_ripple + pos[:, 2] * freq_ripple + t * 2.5)
-        
-        # Base à 20m d'altitude
-        pos[:, 1] = 20.0 + (y_dunes + y_dunes2) * amp_bass + y_ripples
-
-        # 3. Couleurs - Motif Sahélien
-        cols = np.tile(self.colors["soleil_or"], (num, 1))
-        
-        # Bandes diagonales (Zébrures Touareg)
-        pattern_mask = (np.abs(pos[:, 0] + pos[:, 2]) % 50.0) < 18.0
+        rng = np.random.default_rng(2025)
         
-        # Sommets brillants
-        peaks_mask = pos[:, 1] > (25.0 + 12.0 * amp_bass)
+        # Arc-en-ciel BAS et LARGE (comme un pont), 7 bandes empilées
+        rainbow_width = 140.0   # 140m de large
+        arc_base_height = 20.0  # Base à 20m
+        arc_max_height = 50.0   # Sommet à 50m
+        RAINBOW_COLORS = np.array([
+            [0.58, 0.0, 0.83],   # Violet
+            [0.29, 0.0, 0.51],   # Indigo
+            [0.0, 0.0, 1.0],     # Bleu
+            [0.0, 1.0, 0.0],     # Vert
+            [1.0, 1.0, 0.0],     # Jaune
+            [1.0, 0.65, 0.0],    # Orange
+            [1.0, 0.0, 0.0],     # Rouge
+        ])
+        drones_per_band = num // 7
+        bands = [(band_idx * drones_per_band,
+                  (band_idx + 1) * drones_per_band if band_idx < 6 else num) for band_idx in range(7)]
         
-        # Application couleurs
-        cols[pattern_mask] = self.colors["orange_niger"] 
-        cols[peaks_mask] = self.colors["blanc_pure"]
+        if part == "phases":
+            # Phase de chaque drone (i * 0.05, les animations en dérivent par un facteur)
+            parts = (np.arange(num) * 0.05,)
         
-        # Contrainte de sol - minimum 10m
-        pos[:, 1] = np.maximum(pos[:, 1], 10.0)
+        elif part == "stars":
+            # Distribution horizontale large, verticale limitée (ALTITUDE BASSE : 20-40m)
+            phi = rng.uniform(0, 2 * np.pi, num)
+            r_horizontal = rng.uniform(20, 120, num)  # Rayon horizontal large
+            y = rng.uniform(20, 40, num)
+            parts = (np.column_stack((r_horizontal * np.cos(phi), y, r_horizontal * np.sin(phi))),)
         
-        return pos, cols
-
-    def _act_2_desert_seveille(self, num, t=0.0):
-        """
-        ═══════════════════════════════════════════════════════════════════════
-        ACTE 2 : LE DÉSERT S'ÉVEILLE - NAISSANCE DES DUNES
+        elif part == "anem":
+            # DIMENSIONS PLUS GRANDES pour visibilité depuis le sol
+            text_height = 50.0      # 50m de haut
+            letter_width = 22.0     # Lettres plus larges
+            base_y = 35.0           # ALTITUDE_TEXTE: 35m d'altitude
+            
+            # Fonctions de création des lettres (mêmes formes, nouvelle altitude)
+            def create_letter_A(n_points, x_offset):
+                pts = np.zeros((n_points, 3))
+                for i in range(n_points):
+                    t_param = i / n_points
+                    if t_param < 0.4:
+                        pts[i] = [x_offset - letter_width/2 + t_param * letter_width * 1.25, 
+                                  base_y + t_param * 2.5 * text_height, 0]
+                    elif t_param < 0.5:
+                        pts[i] = [x_offset - letter_width/4 + (t_param - 0.4) * letter_width * 2.5, 
+                                  base_y + text_height * 0.5, 0]
+                    else:
+                        pts[i] = [x_offset + letter_width/2 - (t_param - 0.5) * letter_width * 1.25, 
+                                  base_y + (t_param - 0.5) * 2 * text_height, 0]
+                return pts
+            
+            def create_letter_N(n_points, x_offset):
+                pts = np.zeros((n_points, 3))
+                for i in range(n_points):
+                    t_param = i / n_points
+                    if t_param < 0.33:
+                        pts[i] = [x_offset - letter_width/2, base_y + t_param * 3 * text_height, 0]
+                    elif t_param < 0.66:
+                        pts[i] = [x_offset - letter_width/2 + (t_param - 0.33) * 3 * letter_width,
+                                  base_y + text_height - (t_param - 0.33) * 3 * text_height, 0]
+                    else:
+                        pts[i] = [x_offset + letter_width/2, base_y + (t_param - 0.66) * 3 * text_height, 0]
+                return pts
+            
+            def create_letter_E(n_points, x_offset):
+                pts = np.zeros((n_points, 3))
+                for i in range(n_points):
+                    t_param = i / n_points
+                    if t_param < 0.25:
+                        pts[i] = [x_offset - letter_width/2 + t_param * 4 * letter_width, base_y + text_height, 0]
+                    elif t_param < 0.5:
+                        pts[i] = [x_offset - letter_width/2, base_y + text_height - (t_param - 0.25) * 4 * text_height, 0]
+                    elif t_param < 0.75:
+                        pts[i] = [x_offset - letter_width/2 + (t_param - 0.5) * 3 * letter_width, base_y + text_height * 0.5, 0]
+                    else:
+                        pts[i] = [x_offset - letter_width/2 + (t_param - 0.75) * 4 * letter_width, base_y, 0]
+                return pts
+            
+            def create_letter_M(n_points, x_offset):
+                pts = np.zeros((n_points, 3))
+                for i in range(n_points):
+                    t_param = i / n_points
+                    if t_param < 0.25:
+                        pts[i] = [x_offset - letter_width/2, base_y + t_param * 4 * text_height, 0]
+                    elif t_param < 0.5:
+                        pts[i] = [x_offset - letter_width/2 + (t_param - 0.25) * 2 * letter_width,
+                                  base_y + text_height - (t_param - 0.25) * 2 * text_height, 0]
+                    elif t_param < 0.75:
+                        pts[i] = [x_offset + (t_param - 0.5) * 2 * letter_width,
+                                  base_y + text_height * 0.5 + (t_param - 0.5) * 2 * text_height, 0]
+                    else:
+                        pts[i] = [x_offset + letter_width/2, base_y + text_height - (t_param - 0.75) * 4 * text_height, 0]
+                return pts
+            
+            # Positions X des lettres (bien espacées), 4 lettres centrées de 200 drones
+            letter_positions = [-52, -17, 17, 52]
+            letters = np.array([create(200, x_offset) for create, x_offset in
+                                zip((create_letter_A, create_letter_N, create_letter_E, create_letter_M),
+                                    letter_positions)])
+            
+            # Positions initiales (étoiles dispersées à basse altitude)
+            initial_pos = np.zeros((num, 3))
+            phi = rng.uniform(0, 2 * np.pi, num)
+            r = rng.uniform(30, 100, num)
+            initial_pos[:, 0] = r * np.cos(phi)
+            initial_pos[:, 1] = rng.uniform(20, 45, num)  # Basse altitude
+            initial_pos[:, 2] = r * np.sin(phi) * 0.5
+            jitter = rng.normal(0, 0.3, (num, 3))
+            parts = (letters, initial_pos, jitter)
+        
+        elif part == "convergence":
+            phi_init = rng.uniform(0, 2 * np.pi, num)
+            r_init = rng.uniform(40, 80, num)
+            y_init = rng.uniform(25, 55, num)  # Altitude du texte
+            parts = (phi_init, r_init, y_init, np.arange(num) * 0.01)
+        
+        elif part == "sphere":
+            # Directions uniformes sur la sphère unité
+            phi = rng.uniform(0, 2 * np.pi, num)
+            theta = np.arccos(rng.uniform(-1, 1, num))
+            parts = (np.column_stack((np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi),
+                                      np.cos(theta))),)
+        
+        elif part == "explosion":
+            # Déplacement final de l'explosion (vitesse initiale 40m/s)
+            phi = rng.uniform(0, 2 * np.pi, num)
+            theta = rng.uniform(0.3, 1.2, num)  # Principalement vers le bas/côtés
+            distance = 40.0 * (0.7 + 0.3 * rng.uniform(0, 1, num))
+            parts = (np.column_stack((distance * np.sin(theta) * np.cos(phi), distance * np.cos(theta) * 0.3,
+                                      distance * np.sin(theta) * np.sin(phi))),)
+        
+        elif part == "rainbow_form":
+            # Position explosée
+            exploded_pos = np.zeros((num, 3))
+            phi = rng.uniform(0, 2 * np.pi, num)
+            r = 30 + 30 * rng.uniform(0, 1, num)
+            exploded_pos[:, 0] = r * np.cos(phi)
+            exploded_pos[:, 1] = 40 + r * rng.uniform(-0.3, 0.3, num)
+            exploded_pos[:, 2] = r * np.sin(phi) * 0.5
+            
+            # Position finale : arc-en-ciel BAS (arc de cercle horizontal, de 20m à 50m)
+            rainbow_pos = np.zeros((num, 3))
+            for band_idx, (start_idx, end_idx) in enumerate(bands):
+                arc_angles = np.linspace(0, np.pi, end_idx - start_idx)
+                rainbow_pos[start_idx:end_idx, 0] = (rainbow_width / 2) * np.cos(arc_angles)
+                rainbow_pos[start_idx:end_idx, 1] = arc_base_height + np.sin(arc_angles) * (arc_max_height - arc_base_height) + band_idx * 4
+                rainbow_pos[start_idx:end_idx, 2] = -20.0 + rng.uniform(-2, 2, end_idx - start_idx)
+            parts = (exploded_pos, rainbow_pos)
+        
+        elif part == "rainbow":
+            # Arc stable: x, hauteur de base (bandes empilées), angle, phase de pulsation, couleur
+            arc_angles = np.concatenate([np.linspace(0, np.pi, end - start) for start, end in bands])
+            band = np.concatenate([np.full(end - start, band_idx) for band_idx, (start, end) in enumerate(bands)])
+            arc_x = (rainbow_width / 2) * np.cos(arc_angles)
+            arc_y = arc_base_height + np.sin(arc_angles) * (arc_max_height - arc_base_height) + band * 4
+            parts = (arc_x, arc_y, arc_angles, band * 0.5, RAINBOW_COLORS[band])
+        
+        elif part == "desert":
+            # Arc de base → ligne droite élargie ondulante (dunes), couleurs désert
+            DESERT_COLORS = np.array([
+                [0.96, 0.64, 0.38],
+                [0.87, 0.53, 0.25],
+                [0.82, 0.41, 0.12],
+            ])
+            arc_pos, dune_pos, desert_cols = np.zeros((num, 3)), np.zeros((num, 3)), np.zeros((num, 3))
+            for band_idx, (start_idx, end_idx) in enumerate(bands):
+                band_count = end_idx - start_idx
+                arc_angles = np.linspace(0, np.pi, band_count)
+                arc_pos[start_idx:end_idx, 0] = (rainbow_width / 2) * np.cos(arc_angles)
+                arc_pos[start_idx:end_idx, 1] = arc_base_height + np.sin(arc_angles) * (arc_max_height - arc_base_height)
+                dune_pos[start_idx:end_idx, 0] = np.linspace(-80, 80, band_count)
+                dune_pos[start_idx:end_idx, 1] = 25.0 + np.sin(np.linspace(0, 4*np.pi, band_count)) * 8
+                desert_cols[start_idx:end_idx] = DESERT_COLORS[band_idx % 3]
+            parts = (arc_pos, dune_pos, desert_cols)
+        
+        return tuple(np.asarray(a, dtype=np.float32) for a in parts)
+
+    @register_phase("act1_desert", uses_t=True, camera_preset="desert", smart_camera=True,
+                    skip_show=True, hold_effect="dune_breathing", hold_amplitude=4.0, writes_out=True)
+    def _act_1_desert(self, num, t=0.0, out=None):
+        """
+        ACTE 1 : DUNES DU SAHARA - Version Simple et Élégante
+        Grille avec sculpture sinusoïdale, motifs Touareg
+        """
+        bass_energy = 0.5 + 0.3 * np.sin(t * 3.0)
+        
+        # 1. Grille de base (statique, en cache)
+        def build_grid():
+            grid_side = int(np.ceil(np.sqrt(num))) + 1
+            x = np.linspace(-120, 120, grid_side)
+            z = np.linspace(-120, 120, grid_side)
+            xv, zv = np.meshgrid(x, z)
+            return xv.ravel()[:num].astype(np.float32), zv.ravel()[:num].astype(np.float32)
+        
+        grid_x, grid_z = self._cache.get_or_build(FormationKey("mesh", "desert_grid", num), build_grid)
+        
+        pos, cols = self._frame_buffers(num, out)
+        pos[:, 0] = grid_x
+        pos[:, 2] = grid_z
+        
+        # 2. Sculpture des Dunes (Multi-Layer)
+        amp_bass = 1.0 + bass_energy * 1.5 
+        
+        freq_dune = 0.04
+        freq_ripple = 0.12
+        
+        # Accumulation en place dans pos[:, 1] via un seul temporaire colonne
+        y = pos[:, 1]
+        tmp = np.empty(num, dtype=np.float32)
+        
+        # Grandes dunes respirantes (hauteur réaliste 15-45m)
+        np.multiply(grid_x, freq_dune, out=tmp)
+        tmp += t * 0.5
+        np.sin(tmp, out=y)
+        np.multiply(grid_z, freq_dune, out=tmp)
+        tmp += t * 0.3
+        np.cos(tmp, out=tmp)
+        y *= tmp
+        y *= 20.0
+        
+        # Dunes secondaires
+        np.multiply(grid_x, 0.06, out=tmp)
+        tmp += grid_z * 0.04
+        tmp += t * 0.4
+        np.sin(tmp, out=tmp)
+        tmp *= 10.0
+        y += tmp
+        y *= amp_bass
+        
+        # Rides de sable (vent)
+        np.add(grid_x, grid_z, out=tmp)
+        tmp *= freq_ripple
+        tmp += t * 2.5
+        np.sin(tmp, out=tmp)
+        tmp *= 3.0
+        y += tmp
+        
+        # Base à 20m d'altitude
+        y += 20.0
+
+        # 3. Couleurs - Motif Sahélien
+        cols[:] = self.colors["soleil_or"]
+        
+        # Bandes diagonales (Zébrures Touareg)
+        np.add(grid_x, grid_z, out=tmp)
+        np.abs(tmp, out=tmp)
+        np.mod(tmp, 50.0, out=tmp)
+        pattern_mask = tmp < 18.0
+        
+        # Sommets brillants
+        peaks_mask = pos[:, 1] > (25.0 + 12.0 * amp_bass)
+        
+        # Application couleurs
+        cols[pattern_mask] = self.colors["orange_niger"] 
+        cols[peaks_mask] = self.colors["blanc_pure"]
+        
+        # Contrainte de sol - minimum 10m
+        np.maximum(y, 10.0, out=y)
+        
+        return pos, cols
+
+    @register_phase("act2_desert_seveille", uses_t=True, smart_camera=True, warmup_ms=6, writes_out=True)
+    def _act_2_desert_seveille(self, num, t=0.0, out=None):
+        """
+        ═══════════════════════════════════════════════════════════════════════
+        ACTE 2 : LE DÉSERT S'ÉVEILLE - NAISSANCE DES DUNES
         ═══════════════════════════════════════════════════════════════════════
         
         Le désert se crée sous nos yeux, grain par grain, jusqu'à former
@@ -1115,35 +1178,40 @@ class FormationLibrary:
         ═══════════════════════════════════════════════════════════════════════
         """
         
-        # Générateur reproductible
-        rng = np.random.default_rng(42)
-        
-        # Initialisation
-        pos = np.zeros((num, 3))
-        cols = np.zeros((num, 3))
+        # Géométrie statique des quatre parties en cache (tirages à graine fixe 42
+        # rejoués par _build_act2_desert): par frame, animation sur place
+        desert = self._cache.get_or_build(FormationKey("mesh", "act2_desert_seveille", num),
+                                          lambda: self._build_act2_desert(num))
+        pos, cols = self._frame_buffers(num, out)
+        a, b, c = self._scratch("act2_desert", (3, num))
+        mask = self._scratch("act2_desert_mask", (num,), bool)
+        x, y, z = pos[:, 0], pos[:, 1], pos[:, 2]
+        grid_x, grid_z = desert["grid_x"], desert["grid_z"]
         
         # ═══════════════════════════════════════════════════════════════════
         # PALETTE "DÉSERT VIVANT"
         # ═══════════════════════════════════════════════════════════════════
-        SABLE_HUMIDE = np.array([0.75, 0.45, 0.15])    # Bas des dunes
-        SABLE_MOYEN = np.array([0.85, 0.55, 0.25])     # Flancs
-        SABLE_SEC = np.array([0.95, 0.65, 0.35])       # Hauts
-        CRETE_SOLEIL = np.array([1.0, 0.75, 0.45])     # Crêtes ensoleillées
-        ORANGE_NIGER = np.array([1.0, 0.5, 0.0])       # Identité nationale
-        OR_COUCHANT = np.array([1.0, 0.4, 0.1])        # Coucher de soleil
-        VIOLET_OMBRE = np.array([0.5, 0.25, 0.4])      # Ombres profondes
+        SABLE_HUMIDE = (0.75, 0.45, 0.15)    # Bas des dunes
+        SABLE_MOYEN = (0.85, 0.55, 0.25)     # Flancs
+        SABLE_SEC = (0.95, 0.65, 0.35)       # Hauts
+        CRETE_SOLEIL = (1.0, 0.75, 0.45)     # Crêtes ensoleillées
+        OR_COUCHANT = (1.0, 0.4, 0.1)        # Coucher de soleil
+        VIOLET_OMBRE = (0.5, 0.25, 0.4)      # Ombres profondes
+        BLEU_FLEUVE = (0.2, 0.4, 0.7)        # Fleuve (transition vers l'acte 3)
+        
+        def gradient(dst, low, high, h):
+            """dst = low * (1 - h) + high * h, couleur par couleur."""
+            for k in range(3):
+                np.multiply(h, high[k] - low[k], out=dst[:, k])
+                dst[:, k] += low[k]
         
         # ═══════════════════════════════════════════════════════════════════
         # SYSTÈME DE VENT GLOBAL
         # ═══════════════════════════════════════════════════════════════════
-        vent_direction_x = np.cos(t * 0.1) * 0.8 + 0.2
-        vent_direction_z = np.sin(t * 0.08) * 0.4
-        vent_vitesse = 0.8 + np.sin(t * 0.3) * 0.4
-        turbulence = 0.5 + np.sin(t * 0.7) * 0.3
-        
-        # Position du "soleil" virtuel pour l'éclairage
-        soleil_altitude = 30 + np.sin(t * 0.1) * 10
-        soleil_azimuth = t * 0.2
+        vent_direction_x = float(np.cos(t * 0.1) * 0.8 + 0.2)
+        vent_direction_z = float(np.sin(t * 0.08) * 0.4)
+        vent_vitesse = float(0.8 + np.sin(t * 0.3) * 0.4)
+        turbulence = float(0.5 + np.sin(t * 0.7) * 0.3)
         
         # ═══════════════════════════════════════════════════════════════════
         # PARTIE 1 : NAISSANCE DU SABLE (0-4s)
@@ -1153,355 +1221,189 @@ class FormationLibrary:
             # Phase 1a : Nuage de grains (0-1s)
             if t < 1.0:
                 progression = t / 1.0
-                n_visible = int(progression * num)
+                n_visible = min(max(int(progression * num), 0), num)
                 
-                # Apparition dans une sphère de poussière cosmique
-                for i in range(num):
-                    if i < n_visible:
-                        # Sphère de rayon 80m
-                        theta = rng.uniform(0, 2 * np.pi)
-                        phi = rng.uniform(0, np.pi)
-                        r = rng.uniform(20, 80)
-                        
-                        pos[i, 0] = r * np.sin(phi) * np.cos(theta)
-                        pos[i, 1] = 40 + r * np.cos(phi) * 0.5  # Centre à 40m
-                        pos[i, 2] = r * np.sin(phi) * np.sin(theta)
-                        
-                        # Scintillement de poussière
-                        cols[i] = SABLE_SEC * (0.5 + rng.uniform(0, 0.5))
-                    else:
-                        pos[i] = [0, -100, 0]  # Caché
-                        cols[i] = [0, 0, 0]
+                # Apparition dans une sphère de poussière cosmique (rayon 80m, centre à 40m)
+                pos[:n_visible] = desert["cloud"][:n_visible]
+                cols[:n_visible] = desert["cloud_cols"][:n_visible]  # Scintillement de poussière
+                pos[n_visible:] = (0, -100, 0)  # Caché
+                cols[n_visible:] = 0
             
             # Phase 1b : Sédimentation (1-2s)
             elif t < 2.0:
                 progression = (t - 1.0) / 1.0
                 
-                for i in range(num):
-                    # Position initiale (reprendre du nuage)
-                    theta = rng.uniform(0, 2 * np.pi)
-                    phi = rng.uniform(0, np.pi)
-                    r = rng.uniform(20, 80)
-                    
-                    x_init = r * np.sin(phi) * np.cos(theta)
-                    y_init = 40 + r * np.cos(phi) * 0.5
-                    z_init = r * np.sin(phi) * np.sin(theta)
-                    
-                    # Vitesse de chute variable (grains lourds vs légers)
-                    vitesse_chute = 0.5 + rng.uniform(0, 1.5) * (i % 10) / 10
-                    
-                    # Position interpolée vers le sol
-                    y_cible = 15 + rng.uniform(-3, 3)
-                    
-                    pos[i, 0] = x_init + vent_direction_x * progression * 10
-                    pos[i, 1] = y_init - (y_init - y_cible) * progression * vitesse_chute
-                    pos[i, 2] = z_init + vent_direction_z * progression * 8
-                    
-                    # Couleur selon la hauteur
-                    h_norm = (pos[i, 1] - 10) / 40
-                    cols[i] = SABLE_HUMIDE * (1 - h_norm) + SABLE_SEC * h_norm
+                # Position initiale (reprendre du nuage), chute vers le sol à vitesse
+                # variable (grains lourds vs légers), dérive avec le vent
+                sediment = desert["sediment"]
+                np.add(sediment[:, 0], vent_direction_x * progression * 10, out=x)
+                np.multiply(desert["sediment_drop"], -progression, out=y)
+                y += sediment[:, 1]
+                np.add(sediment[:, 2], vent_direction_z * progression * 8, out=z)
+                
+                # Couleur selon la hauteur
+                np.subtract(y, 10, out=a)
+                a /= 40
+                gradient(cols, SABLE_HUMIDE, SABLE_SEC, a)
             
             # Phase 1c : Premières rides (2-3s)
             elif t < 3.0:
                 progression = (t - 2.0) / 1.0
                 
-                # Grille de base qui se forme
-                grid_side = int(np.ceil(np.sqrt(num))) + 1
-                x_lin = np.linspace(-100, 100, grid_side)
-                z_lin = np.linspace(-100, 100, grid_side)
-                xv, zv = np.meshgrid(x_lin, z_lin)
-                flat_x = xv.flatten()[:num]
-                flat_z = zv.flatten()[:num]
-                
-                for i in range(num):
-                    # Transition douce vers la grille
-                    x_random = rng.uniform(-100, 100)
-                    z_random = rng.uniform(-100, 100)
-                    
-                    pos[i, 0] = x_random * (1 - progression) + flat_x[i % len(flat_x)] * progression
-                    pos[i, 2] = z_random * (1 - progression) + flat_z[i % len(flat_z)] * progression
-                    
-                    # Premières rides de sable (micro-ondulations)
-                    ride_amp = progression * 3.0
-                    pos[i, 1] = 15 + np.sin(pos[i, 0] * 0.1) * ride_amp + np.sin(pos[i, 2] * 0.08) * ride_amp * 0.7
-                    
-                    cols[i] = SABLE_MOYEN
+                # Transition douce vers la grille de base qui se forme
+                start = desert["ripple_start"]
+                np.multiply(start[:, 0], 1 - progression, out=x)
+                np.multiply(grid_x, progression, out=a)
+                x += a
+                np.multiply(start[:, 1], 1 - progression, out=z)
+                np.multiply(grid_z, progression, out=a)
+                z += a
+                
+                # Premières rides de sable (micro-ondulations)
+                ride_amp = progression * 3.0
+                np.multiply(x, 0.1, out=a)
+                np.sin(a, out=a)
+                a *= ride_amp
+                np.multiply(z, 0.08, out=b)
+                np.sin(b, out=b)
+                b *= ride_amp * 0.7
+                np.add(a, b, out=y)
+                y += 15
+                
+                cols[:] = SABLE_MOYEN
             
             # Phase 1d : Micro-dunes (3-4s)
             else:
                 progression = (t - 3.0) / 1.0
-                
-                grid_side = int(np.ceil(np.sqrt(num))) + 1
-                x_lin = np.linspace(-100, 100, grid_side)
-                z_lin = np.linspace(-100, 100, grid_side)
-                xv, zv = np.meshgrid(x_lin, z_lin)
-                
-                flat_x = xv.flatten()
-                flat_z = zv.flatten()
-                pos[:, 0] = flat_x[:num]
-                pos[:, 2] = flat_z[:num]
+                x[:] = grid_x
+                z[:] = grid_z
                 
                 # Micro-dunes qui grossissent
                 dune_amp = 5.0 + progression * 10.0
-                pos[:, 1] = 15 + dune_amp * np.sin(pos[:, 0] * 0.05 + t * 0.3) * np.cos(pos[:, 2] * 0.04)
-                pos[:, 1] += 3.0 * np.sin(pos[:, 0] * 0.12 + pos[:, 2] * 0.1)
+                np.multiply(grid_x, 0.05, out=a)
+                a += t * 0.3
+                np.sin(a, out=a)
+                a *= desert["dune_cos"]
+                a *= dune_amp
+                np.add(a, 15, out=y)
+                y += desert["dune_ripple"]
                 
                 # Gradient de couleur
-                h_norm = np.clip((pos[:, 1] - 10) / 25, 0, 1)
-                for i in range(num):
-                    cols[i] = SABLE_HUMIDE * (1 - h_norm[i]) + SABLE_SEC * h_norm[i]
+                np.subtract(y, 10, out=a)
+                a /= 25
+                np.clip(a, 0, 1, out=a)
+                gradient(cols, SABLE_HUMIDE, SABLE_SEC, a)
         
         # ═══════════════════════════════════════════════════════════════════
         # PARTIE 2 : CROISSANCE DES DUNES (4-9s)
         # ═══════════════════════════════════════════════════════════════════
         elif t < 9.0:
             
-            # Distribution des drones
-            n_barkhanes = 180       # Croissants migrants
-            n_transversales = 280   # Vagues respirantes
-            n_etoilee = 140         # Centre rotatif
-            n_reg = 180             # Plateau + inselbergs
-            n_erg = 140             # Mer ondulante
-            n_caravane = 20         # Caravane nomade (apparaît à t=8s)
-            n_extra = num - n_barkhanes - n_transversales - n_etoilee - n_reg - n_erg - n_caravane
-            
-            idx = 0
-            progression_globale = (t - 4.0) / 5.0  # 0 à 1 sur 4-9s
-            
-            # ─────────────────────────────────────────────────────────────────
-            # 1. DUNES BARKHANES "MIGRANTES" (croissants qui avancent)
-            # ─────────────────────────────────────────────────────────────────
-            barkhane_centers = [(-60, -40), (50, 30), (-20, 60)]
-            drones_per_barkhane = n_barkhanes // 3
+            # Disposition en cache: avant 8s la caravane n'est pas encore visible
+            # (ses drones et les extras sont posés sur le sable)
+            dunes = desert["dunes_late" if t >= 8.0 else "dunes_early"]
+            pos[:] = dunes["pos"]
+            cols[:] = dunes["cols"]
+            aux = dunes["aux"]
             
             emergence_barkhane = min(1.0, (t - 4.0) / 1.0)  # Émergence en 1s
-            
-            for bi, (cx, cz) in enumerate(barkhane_centers):
-                for i in range(drones_per_barkhane):
-                    if idx >= num:
-                        break
-                    
-                    angle = (i / drones_per_barkhane) * 2 * np.pi
-                    rayon = 30 * (1 - 0.35 * np.cos(angle))
-                    
-                    # MIGRATION : avance vers l'Est
-                    migration = (t - 4.0) * 0.8
-                    
-                    pos[idx, 0] = cx + np.cos(angle) * rayon + migration
-                    pos[idx, 2] = cz + np.sin(angle) * rayon
-                    
-                    # Profil de croissant
-                    hauteur_base = 20 + bi * 5
-                    profil = 0.3 + 0.7 * np.sin(angle * 0.5 + np.pi/4) ** 2
-                    pos[idx, 1] = (hauteur_base + profil * 22) * emergence_barkhane
-                    
-                    # Sable qui vole sur les crêtes
-                    if pos[idx, 1] > 28:
-                        pos[idx, 1] += np.sin(t * 5 + pos[idx, 0] * 0.1) * 1.5
-                    
-                    # Couleur chaude
-                    h = (pos[idx, 1] - 15) / 30
-                    cols[idx] = SABLE_MOYEN * (1 - h) + CRETE_SOLEIL * h
-                    
-                    idx += 1
-            
-            # ─────────────────────────────────────────────────────────────────
-            # 2. DUNES TRANSVERSALES "RESPIRANTES" (gonflent/dégonflent)
-            # ─────────────────────────────────────────────────────────────────
-            n_waves = 5
-            points_per_wave = n_transversales // n_waves
-            
             emergence_trans = min(1.0, (t - 5.0) / 1.0) if t > 5.0 else 0.0
-            
-            for wave_idx in range(n_waves):
-                z_base = -50 + wave_idx * 25
-                
-                for i in range(points_per_wave):
-                    if idx >= num:
-                        break
-                    
-                    x = (i / points_per_wave - 0.5) * 140
-                    
-                    # RESPIRATION : amplitude qui varie comme des poumons
-                    amplitude_respiration = 22 + np.sin(t * 0.8 + wave_idx) * 6
-                    
-                    y = amplitude_respiration * np.sin(x * 0.08 + wave_idx * 0.5 + t * 0.3)
-                    y = (y + 25) * emergence_trans
-                    
-                    pos[idx, 0] = x
-                    pos[idx, 1] = max(12, y)
-                    pos[idx, 2] = z_base + rng.uniform(-4, 4)
-                    
-                    # Couleur selon phase de respiration
-                    respiration_phase = np.sin(t * 0.8 + wave_idx)
-                    if respiration_phase > 0.5:
-                        cols[idx] = CRETE_SOLEIL
-                    else:
-                        cols[idx] = SABLE_SEC
-                    
-                    idx += 1
-            
-            # ─────────────────────────────────────────────────────────────────
-            # 3. DUNE ÉTOILÉE "ROTATIVE" (tourne sur elle-même)
-            # ─────────────────────────────────────────────────────────────────
-            centre_x, centre_z = 0, 0
-            n_bras = 6
-            points_per_bras = n_etoilee // n_bras
-            
             emergence_etoile = min(1.0, (t - 6.0) / 1.0) if t > 6.0 else 0.0
-            angle_rotation = t * 0.25  # Rotation lente
-            
-            for bras in range(n_bras):
-                angle_bras = (bras / n_bras) * 2 * np.pi + angle_rotation
-                
-                for i in range(points_per_bras):
-                    if idx >= num:
-                        break
-                    
-                    distance = i * 2.2
-                    
-                    # Ondulation du bras
-                    angle_var = angle_bras + np.sin(distance * 0.12) * 0.15
-                    
-                    pos[idx, 0] = centre_x + np.cos(angle_var) * distance
-                    pos[idx, 2] = centre_z + np.sin(angle_var) * distance
-                    
-                    # Hauteur décroissante (sommet au centre)
-                    hauteur = 45 * np.exp(-distance / 22) + 15
-                    pos[idx, 1] = hauteur * emergence_etoile
-                    
-                    # Couleur dorée au centre
-                    if distance < 15:
-                        cols[idx] = ORANGE_NIGER
-                    else:
-                        cols[idx] = SABLE_SEC
-                    
-                    idx += 1
-            
-            # ─────────────────────────────────────────────────────────────────
-            # 4. REG "TECTONIQUE" (plaques qui dérivent + inselbergs)
-            # ─────────────────────────────────────────────────────────────────
-            n_surface = int(n_reg * 0.7)
-            n_inselbergs = n_reg - n_surface
-            
-            # Surface plate avec dérive tectonique
-            for i in range(n_surface):
-                if idx >= num:
-                    break
-                
-                base_x = rng.uniform(-90, 90)
-                base_z = rng.uniform(50, 100)
-                
-                # Dérive des plaques
-                derive_x = np.sin(t * 0.2) * 8
-                derive_z = np.cos(t * 0.15) * 6
-                
-                pos[idx, 0] = base_x + derive_x
-                pos[idx, 1] = 10 + rng.uniform(-2, 2)
-                pos[idx, 2] = base_z + derive_z
-                
-                cols[idx] = SABLE_HUMIDE
-                idx += 1
-            
-            # Inselbergs qui "poussent"
-            inselberg_locs = [(60, 70), (-50, 80), (20, 90), (-30, 65)]
-            drones_per_insel = n_inselbergs // 4
-            
-            for (ix, iz) in inselberg_locs:
-                for i in range(drones_per_insel):
-                    if idx >= num:
-                        break
-                    
-                    angle = rng.uniform(0, 2 * np.pi)
-                    dist = rng.uniform(0, 10)
-                    
-                    pos[idx, 0] = ix + np.cos(angle) * dist
-                    pos[idx, 2] = iz + np.sin(angle) * dist
-                    
-                    # Inselbergs qui "poussent" avec le temps
-                    hauteur_insel = 22 * (1 - dist / 10) + np.sin(t * 0.5) * 3
-                    pos[idx, 1] = 10 + hauteur_insel
-                    
-                    cols[idx] = SABLE_MOYEN * 0.8  # Plus sombre
-                    idx += 1
-            
-            # ─────────────────────────────────────────────────────────────────
-            # 5. ERG "DANSANT" (mer de sable ondulante)
-            # ─────────────────────────────────────────────────────────────────
             emergence_erg = min(1.0, (t - 7.0) / 1.0) if t > 7.0 else 0.0
-            erg_rows = 12
-            erg_cols = n_erg // erg_rows
             
-            for zi in range(erg_rows):
-                z = -90 + zi * 8
+            for name, start, end, param in dunes["blocks"]:
+                block = slice(start, end)
+                bx, by, bz, ta, tb = x[block], y[block], z[block], a[block], b[block]
                 
-                for xi in range(erg_cols):
-                    if idx >= num:
-                        break
+                if name == "barkhane":
+                    # 1. DUNES BARKHANES "MIGRANTES": avancent vers l'Est, profil de croissant
+                    bx += (t - 4.0) * 0.8
+                    np.multiply(aux[block], emergence_barkhane, out=by)
                     
-                    x = -90 + xi * (80.0 / erg_cols)
-                    
-                    # Triple sinusoïde pour effet mer agitée
-                    y = (np.sin(x * 0.05 + z * 0.03 + t * 0.4) * 12 +
-                         np.sin(x * 0.12 + z * 0.08 + t * 1.2) * 6 +
-                         np.sin(x * 0.25 + t * 3.0) * 2 +
-                         18)
-                    
-                    pos[idx, 0] = x
-                    pos[idx, 1] = y * emergence_erg
-                    pos[idx, 2] = z + rng.uniform(-2, 2)
+                    # Sable qui vole sur les crêtes
+                    np.greater(by, 28, out=mask[block])
+                    np.multiply(bx, 0.1, out=ta)
+                    ta += t * 5
+                    np.sin(ta, out=ta)
+                    ta *= 1.5
+                    np.add(by, ta, out=by, where=mask[block])
                     
-                    cols[idx] = SABLE_SEC
-                    idx += 1
-            
-            # ─────────────────────────────────────────────────────────────────
-            # 6. CARAVANE NOMADE (apparaît à t=8s)
-            # ─────────────────────────────────────────────────────────────────
-            if t >= 8.0:
-                caravane_visible = min(1.0, (t - 8.0) / 0.5)
-                
-                # Position de tête
-                tete_x = -70 + (t - 8.0) * 3  # Avance à 3 m/s
-                tete_z = 25
+                    # Couleur chaude
+                    np.subtract(by, 15, out=ta)
+                    ta /= 30
+                    gradient(cols[block], SABLE_MOYEN, CRETE_SOLEIL, ta)
                 
-                for i in range(n_caravane):
-                    if idx >= num:
-                        break
-                    
-                    # Ligne de "chameaux"
-                    decalage = i * -3.5
-                    
-                    x = tete_x + decalage
-                    z = tete_z + np.sin(i * 0.5) * 2.5
-                    
-                    # Hauteur du terrain + 2m
-                    terrain_h = 15 + 8 * np.sin(x * 0.04) * np.cos(z * 0.03)
-                    y = terrain_h + 2.5
+                elif name == "trans":
+                    # 2. DUNES TRANSVERSALES "RESPIRANTES": amplitude qui varie comme des poumons
+                    wave_idx = param
+                    respiration_phase = np.sin(t * 0.8 + wave_idx)
+                    amplitude_respiration = 22 + respiration_phase * 6
                     
-                    # Animation de marche
-                    y += np.sin(t * 4 + i * 0.3) * 0.7
+                    np.multiply(bx, 0.08, out=ta)
+                    ta += wave_idx * 0.5 + t * 0.3
+                    np.sin(ta, out=ta)
+                    ta *= float(amplitude_respiration)
+                    ta += 25
+                    ta *= emergence_trans
+                    np.maximum(ta, 12, out=by)
                     
-                    pos[idx, 0] = x
-                    pos[idx, 1] = y * caravane_visible
-                    pos[idx, 2] = z
+                    # Couleur selon phase de respiration
+                    cols[block] = CRETE_SOLEIL if respiration_phase > 0.5 else SABLE_SEC
+                
+                elif name == "etoile":
+                    # 3. DUNE ÉTOILÉE "ROTATIVE": bras ondulants en rotation lente
+                    np.add(dunes["angle"][block], t * 0.25, out=ta)
+                    np.cos(ta, out=bx)
+                    bx *= aux[block]
+                    np.sin(ta, out=bz)
+                    bz *= aux[block]
+                    by *= emergence_etoile  # Hauteur décroissante (sommet au centre)
+                
+                elif name == "reg":
+                    # 4. REG "TECTONIQUE": dérive des plaques
+                    bx += float(np.sin(t * 0.2) * 8)
+                    bz += float(np.cos(t * 0.15) * 6)
+                
+                elif name == "insel":
+                    # Inselbergs qui "poussent" avec le temps
+                    by += float(np.sin(t * 0.5) * 3)
+                
+                elif name == "erg":
+                    # 5. ERG "DANSANT": triple sinusoïde pour effet mer agitée (aux = rangée z)
+                    for freq_x, freq_z, speed, amp in ((0.05, 0.03, 0.4, 12), (0.12, 0.08, 1.2, 6),
+                                                       (0.25, 0.0, 3.0, 2)):
+                        np.multiply(bx, freq_x, out=ta)
+                        np.multiply(aux[block], freq_z, out=tb)
+                        ta += tb
+                        ta += t * speed
+                        np.sin(ta, out=ta)
+                        ta *= amp
+                        if amp == 12:
+                            by[:] = ta
+                        else:
+                            by += ta
+                    by += 18
+                    by *= emergence_erg
+                
+                elif name == "caravane":
+                    # 6. CARAVANE NOMADE (apparaît à t=8s): ligne de "chameaux" à 3 m/s
+                    caravane_visible = min(1.0, (t - 8.0) / 0.5)
+                    bx += -70 + (t - 8.0) * 3
                     
-                    # Couleur sombre (silhouettes)
-                    cols[idx] = np.array([0.3, 0.2, 0.1])
-                    idx += 1
-            else:
-                # Caravane pas encore visible - remplir avec extras
-                for i in range(n_caravane):
-                    if idx >= num:
-                        break
-                    pos[idx] = [rng.uniform(-80, 80), 12, rng.uniform(-80, 80)]
-                    cols[idx] = SABLE_MOYEN
-                    idx += 1
-            
-            # Remplir les extras
-            while idx < num:
-                pos[idx] = [rng.uniform(-90, 90), 12 + rng.uniform(-2, 4), rng.uniform(-90, 90)]
-                cols[idx] = SABLE_MOYEN
-                idx += 1
+                    # Hauteur du terrain + 2.5m, animation de marche (aux = rang)
+                    np.multiply(bx, 0.04, out=ta)
+                    np.sin(ta, out=ta)
+                    np.multiply(bz, 0.03, out=tb)
+                    np.cos(tb, out=tb)
+                    ta *= tb
+                    ta *= 8
+                    ta += 15 + 2.5
+                    np.multiply(aux[block], 0.3, out=tb)
+                    tb += t * 4
+                    np.sin(tb, out=tb)
+                    tb *= 0.7
+                    ta += tb
+                    np.multiply(ta, caravane_visible, out=by)
         
         # ═══════════════════════════════════════════════════════════════════
         # PARTIE 3 : VIE DU DÉSERT (9-13s)
@@ -1510,47 +1412,74 @@ class FormationLibrary:
             
             # Reprendre la structure des dunes de la partie 2
             # mais avec animations vent + vague + coucher de soleil
-            
-            grid_side = int(np.ceil(np.sqrt(num))) + 1
-            x_lin = np.linspace(-100, 100, grid_side)
-            z_lin = np.linspace(-100, 100, grid_side)
-            xv, zv = np.meshgrid(x_lin, z_lin)
-            
-            flat_x = xv.flatten()
-            flat_z = zv.flatten()
-            pos[:, 0] = flat_x[:num]
-            pos[:, 2] = flat_z[:num]
+            x[:] = grid_x
+            z[:] = grid_z
             
             # Terrain de base (multi-dunes)
-            pos[:, 1] = 18 + 18 * np.sin(pos[:, 0] * 0.04 + t * 0.3) * np.cos(pos[:, 2] * 0.035)
-            pos[:, 1] += 8 * np.sin(pos[:, 0] * 0.08 + pos[:, 2] * 0.06 + t * 0.5)
-            pos[:, 1] += 3 * np.sin(pos[:, 0] * 0.15 + t * 2.0)
+            np.multiply(grid_x, 0.04, out=a)
+            a += t * 0.3
+            np.sin(a, out=a)
+            a *= desert["life_cos"]
+            a *= 18
+            np.add(a, 18, out=y)
+            np.multiply(grid_x, 0.08, out=a)
+            np.multiply(grid_z, 0.06, out=b)
+            a += b
+            a += t * 0.5
+            np.sin(a, out=a)
+            a *= 8
+            y += a
+            np.multiply(grid_x, 0.15, out=a)
+            a += t * 2.0
+            np.sin(a, out=a)
+            a *= 3
+            y += a
             
             # ─────────────────────────────────────────────────────────────────
             # EFFET VENT avec rafales
             # ─────────────────────────────────────────────────────────────────
-            facteur_hauteur = np.clip((pos[:, 1] - 15) / 30, 0, 1)
+            facteur_hauteur = c
+            np.subtract(y, 15, out=facteur_hauteur)
+            facteur_hauteur /= 30
+            np.clip(facteur_hauteur, 0, 1, out=facteur_hauteur)
             
             # Vent de base (plus fort en haut)
-            pos[:, 0] += vent_direction_x * vent_vitesse * facteur_hauteur * 0.8
-            pos[:, 2] += vent_direction_z * vent_vitesse * facteur_hauteur * 0.6
+            np.multiply(facteur_hauteur, vent_direction_x * vent_vitesse * 0.8, out=a)
+            x += a
+            np.multiply(facteur_hauteur, vent_direction_z * vent_vitesse * 0.6, out=a)
+            z += a
             
             # Turbulence
-            pos[:, 0] += np.sin(t * 3 + pos[:, 1] * 0.1) * turbulence * facteur_hauteur * 0.5
-            pos[:, 2] += np.cos(t * 2.7 + pos[:, 0] * 0.08) * turbulence * facteur_hauteur * 0.4
-            
-            # Rafales locales (4 points)
-            rafale_centres = [(-40, -30), (50, 20), (-20, 50), (30, -40)]
-            for (rx, rz) in rafale_centres:
-                distance = np.sqrt((pos[:, 0] - rx)**2 + (pos[:, 2] - rz)**2)
-                mask_rafale = distance < 25
-                
-                rafale_force = 1.5 + np.sin(t * 2) * 0.8
-                rafale_effet = (1 - distance[mask_rafale] / 25) * rafale_force
-                
-                pos[mask_rafale, 0] += vent_direction_x * rafale_effet * 0.4
-                pos[mask_rafale, 2] += vent_direction_z * rafale_effet * 0.3
-                pos[mask_rafale, 1] += np.sin(t * 8) * rafale_effet * 0.5
+            np.multiply(y, 0.1, out=a)
+            a += t * 3
+            np.sin(a, out=a)
+            a *= facteur_hauteur
+            a *= turbulence * 0.5
+            x += a
+            np.multiply(x, 0.08, out=a)
+            a += t * 2.7
+            np.cos(a, out=a)
+            a *= facteur_hauteur
+            a *= turbulence * 0.4
+            z += a
+            
+            # Rafales locales (4 points), effet (1 - distance / 25) * force dans un rayon de 25m
+            rafale_force = float(1.5 + np.sin(t * 2) * 0.8)
+            rafale_y = float(np.sin(t * 8) * 0.5)
+            for (rx, rz) in [(-40, -30), (50, 20), (-20, 50), (30, -40)]:
+                np.subtract(x, rx, out=a)
+                np.subtract(z, rz, out=b)
+                np.hypot(a, b, out=a)
+                np.less(a, 25, out=mask)
+                a *= -rafale_force / 25
+                a += rafale_force
+                
+                np.multiply(a, vent_direction_x * 0.4, out=b)
+                np.add(x, b, out=x, where=mask)
+                np.multiply(a, vent_direction_z * 0.3, out=b)
+                np.add(z, b, out=z, where=mask)
+                np.multiply(a, rafale_y, out=b)
+                np.add(y, b, out=y, where=mask)
             
             # ─────────────────────────────────────────────────────────────────
             # VAGUE DE SABLE GÉANTE (t=10-11s)
@@ -1561,19 +1490,23 @@ class FormationLibrary:
                 # Position de la crête
                 crete_x = -100 + progression_vague * 200
                 
-                distance_crete = np.abs(pos[:, 0] - crete_x)
-                mask_vague = distance_crete < 35
+                np.subtract(x, crete_x, out=a)
+                distance_crete = b
+                np.abs(a, out=distance_crete)
+                np.less(distance_crete, 35, out=mask)
                 
                 # Forme de vague
-                amplitude_vague = 15 * (1 - distance_crete[mask_vague] / 35)
-                decalage_vague = amplitude_vague * np.sin((pos[mask_vague, 0] - crete_x) * 0.15)
-                
-                pos[mask_vague, 1] += decalage_vague
+                np.multiply(distance_crete, -15 / 35, out=c)
+                c += 15
+                a *= 0.15
+                np.sin(a, out=a)
+                a *= c
+                np.add(y, a, out=y, where=mask)
                 
                 # Crête qui explose
-                mask_crete = distance_crete < 8
-                pos[mask_crete, 1] += np.sin(t * 12) * 4
-                pos[mask_crete, 0] += np.sin(t * 15) * 0.8
+                np.less(distance_crete, 8, out=mask)
+                np.add(y, float(np.sin(t * 12) * 4), out=y, where=mask)
+                np.add(x, float(np.sin(t * 15) * 0.8), out=x, where=mask)
             
             # ─────────────────────────────────────────────────────────────────
             # COULEURS COUCHER DE SOLEIL
@@ -1581,106 +1514,290 @@ class FormationLibrary:
             progression_coucher = (t - 9.0) / 4.0  # 0 à 1 sur 9-13s
             
             # Normaliser la hauteur
-            h_norm = np.clip((pos[:, 1] - 10) / 35, 0, 1)
-            
-            for i in range(num):
-                h = h_norm[i]
-                
-                # Gradient de base
-                if h < 0.3:
-                    base = SABLE_HUMIDE
-                elif h < 0.6:
-                    blend = (h - 0.3) / 0.3
-                    base = SABLE_HUMIDE * (1 - blend) + SABLE_SEC * blend
-                else:
-                    blend = (h - 0.6) / 0.4
-                    base = SABLE_SEC * (1 - blend) + CRETE_SOLEIL * blend
-                
-                # Transition vers orange/rouge (coucher de soleil)
-                if h > 0.4:
-                    orange_blend = progression_coucher * (h - 0.4) * 1.5
-                    base = base * (1 - orange_blend) + OR_COUCHANT * orange_blend
+            h_norm = c
+            np.subtract(y, 10, out=h_norm)
+            h_norm /= 35
+            np.clip(h_norm, 0, 1, out=h_norm)
+            
+            ombre_blend = progression_coucher * 0.4
+            for k in range(3):
+                col = cols[:, k]
+                
+                # Gradient de base: humide (< 0.3) → sec (< 0.6) → crête
+                col[:] = SABLE_HUMIDE[k]
+                for low, high, h_start, width in ((SABLE_HUMIDE, SABLE_SEC, 0.3, 0.3),
+                                                  (SABLE_SEC, CRETE_SOLEIL, 0.6, 0.4)):
+                    np.greater_equal(h_norm, h_start, out=mask)
+                    np.multiply(h_norm, (high[k] - low[k]) / width, out=a)
+                    a += low[k] - h_start * (high[k] - low[k]) / width
+                    np.copyto(col, a, where=mask)
+                
+                # Transition vers orange/rouge (coucher de soleil) au-dessus de 0.4
+                np.greater(h_norm, 0.4, out=mask)
+                np.subtract(h_norm, 0.4, out=a)
+                a *= progression_coucher * 1.5
+                np.subtract(OR_COUCHANT[k], col, out=b)
+                b *= a
+                np.add(col, b, out=col, where=mask)
                 
                 # Ombres violettes en bas
-                if h < 0.25:
-                    ombre_blend = progression_coucher * 0.4
-                    base = base * (1 - ombre_blend) + VIOLET_OMBRE * ombre_blend
-                
-                cols[i] = base
+                np.less(h_norm, 0.25, out=mask)
+                np.multiply(col, 1 - ombre_blend, out=a)
+                a += VIOLET_OMBRE[k] * ombre_blend
+                np.copyto(col, a, where=mask)
             
             # Miroitement du sable
-            miroitement = np.sin(pos[:, 0] * 0.2 + pos[:, 2] * 0.15 + t * 8) * 0.12
-            cols[:, 0] = np.clip(cols[:, 0] + miroitement * h_norm, 0, 1.2)
-            cols[:, 1] = np.clip(cols[:, 1] + miroitement * h_norm * 0.7, 0, 1.2)
-            
-            # Caravane (20 derniers drones)
-            if t >= 9.0:
-                tete_x = -70 + (t - 8.0) * 3
-                tete_z = 25
-                
-                for i in range(20):
-                    ci = num - 20 + i
-                    decalage = i * -3.5
-                    
-                    pos[ci, 0] = tete_x + decalage
-                    pos[ci, 2] = tete_z + np.sin(i * 0.5) * 2.5
-                    pos[ci, 1] = 18 + 8 * np.sin(pos[ci, 0] * 0.04) + 2.5 + np.sin(t * 4 + i * 0.3) * 0.7
-                    cols[ci] = np.array([0.25, 0.15, 0.08])
+            np.multiply(x, 0.2, out=a)
+            np.multiply(z, 0.15, out=b)
+            a += b
+            a += t * 8
+            np.sin(a, out=a)
+            a *= 0.12
+            a *= h_norm
+            cols[:, 0] += a
+            np.clip(cols[:, 0], 0, 1.2, out=cols[:, 0])
+            a *= 0.7
+            cols[:, 1] += a
+            np.clip(cols[:, 1], 0, 1.2, out=cols[:, 1])
+            
+            # Caravane (20 derniers drones): décalage, profondeur et phase de marche en cache
+            caravan_x, caravan_z, caravan_phase = desert["life_caravan"]
+            caravan = slice(num - len(caravan_x), num)
+            np.add(caravan_x, -70 + (t - 8.0) * 3, out=x[caravan])
+            z[caravan] = caravan_z
+            ta, tb = a[caravan], b[caravan]
+            np.multiply(x[caravan], 0.04, out=ta)
+            np.sin(ta, out=ta)
+            ta *= 8
+            ta += 18 + 2.5
+            np.add(caravan_phase, t * 4, out=tb)
+            np.sin(tb, out=tb)
+            tb *= 0.7
+            np.add(ta, tb, out=y[caravan])
+            cols[caravan] = (0.25, 0.15, 0.08)
         
         # ═══════════════════════════════════════════════════════════════════
         # PARTIE 4 : TRANSITION MAGIQUE (13-15s)
         # ═══════════════════════════════════════════════════════════════════
         else:
             progression_trans = (t - 13.0) / 2.0  # 0 à 1 sur 13-15s
-            
-            grid_side = int(np.ceil(np.sqrt(num))) + 1
-            x_lin = np.linspace(-100, 100, grid_side)
-            z_lin = np.linspace(-100, 100, grid_side)
-            xv, zv = np.meshgrid(x_lin, z_lin)
-            
-            flat_x = xv.flatten()
-            flat_z = zv.flatten()
-            pos[:, 0] = flat_x[:num]
-            pos[:, 2] = flat_z[:num]
+            x[:] = grid_x
+            z[:] = grid_z
             
             # Terrain qui s'aplatit progressivement
             dune_height = 15 * (1 - progression_trans * 0.7)
-            pos[:, 1] = 20 + dune_height * np.sin(pos[:, 0] * 0.04) * np.cos(pos[:, 2] * 0.035)
+            np.multiply(desert["river_terrain"], dune_height, out=y)
+            y += 20
             
             # Forme de fleuve qui apparaît
-            fleuve_mask = np.abs(pos[:, 2] - 20 * np.sin(pos[:, 0] * 0.02)) < (15 + progression_trans * 20)
+            np.less(desert["river_distance"], 15 + progression_trans * 20, out=mask)
             
             # Drones du fleuve descendent légèrement
-            pos[fleuve_mask, 1] = pos[fleuve_mask, 1] * (1 - progression_trans * 0.3)
+            np.multiply(y, 1 - progression_trans * 0.3, out=y, where=mask)
             
-            # Couleurs
-            h_norm = np.clip((pos[:, 1] - 10) / 25, 0, 1)
+            # Couleurs: transition vers bleu sur le fleuve, dunes qui s'assombrissent (nuit qui tombe)
+            for k in range(3):
+                cols[:, k] = SABLE_MOYEN[k] * (1 - progression_trans * 0.4)
+                np.copyto(cols[:, k], SABLE_SEC[k] * (1 - progression_trans) + BLEU_FLEUVE[k] * progression_trans,
+                          where=mask)
+        
+        # ═══════════════════════════════════════════════════════════════════
+        # CONTRAINTES FINALES
+        # ═══════════════════════════════════════════════════════════════════
+        
+        # Sol minimum à 8m
+        np.maximum(y, 8.0, out=y)
+        
+        # Limites spatiales
+        np.clip(x, -120, 120, out=x)
+        np.clip(z, -120, 120, out=z)
+        
+        # Couleurs dans les limites
+        np.clip(cols, 0.0, 1.5, out=cols)
+        
+        return pos, cols
+
+    def _build_act2_desert(self, num):
+        """
+        Partie statique de l'acte 2 (float32): grille des dunes, nuage et
+        sédimentation, dispositions de la partie 2 (avant / après l'arrivée de
+        la caravane) et termes fixes des parties 3 et 4. Chaque partie rejoue
+        les tirages de la graine 42 dans l'ordre où l'acte les consomme.
+        """
+        SABLE_HUMIDE = np.array([0.75, 0.45, 0.15])
+        SABLE_MOYEN = np.array([0.85, 0.55, 0.25])
+        SABLE_SEC = np.array([0.95, 0.65, 0.35])
+        ORANGE_NIGER = np.array([1.0, 0.5, 0.0])
+        
+        grid_side = int(np.ceil(np.sqrt(num))) + 1
+        x_lin = np.linspace(-100, 100, grid_side)
+        z_lin = np.linspace(-100, 100, grid_side)
+        xv, zv = np.meshgrid(x_lin, z_lin)
+        grid_x = xv.flatten()[:num]
+        grid_z = zv.flatten()[:num]
+        
+        def cloud_point(draws):
+            """Sphère de poussière (theta, phi, r) → position, centre à 40m."""
+            theta = draws[:, 0] * 2 * np.pi
+            phi = draws[:, 1] * np.pi
+            r = 20 + draws[:, 2] * 60
+            return np.column_stack((r * np.sin(phi) * np.cos(theta), 40 + r * np.cos(phi) * 0.5,
+                                    r * np.sin(phi) * np.sin(theta)))
+        
+        # Phase 1a : nuage (theta, phi, r, scintillement par drone)
+        draws = np.random.default_rng(42).random((num, 4))
+        cloud = cloud_point(draws)
+        cloud_cols = SABLE_SEC * (0.5 + draws[:, 3:4] * 0.5)
+        
+        # Phase 1b : sédimentation (nuage, vitesse de chute, altitude cible)
+        draws = np.random.default_rng(42).random((num, 5))
+        sediment = cloud_point(draws)
+        vitesse_chute = 0.5 + draws[:, 3] * 1.5 * (np.arange(num) % 10) / 10
+        y_cible = 15 + (-3 + draws[:, 4] * 6)
+        sediment_drop = (sediment[:, 1] - y_cible) * vitesse_chute
+        
+        # Phase 1c : positions aléatoires avant la grille
+        ripple_start = -100 + np.random.default_rng(42).random((num, 2)) * 200
+        
+        def dunes(caravane_visible):
+            """Disposition de la partie 2: positions et couleurs de base, blocs animés."""
+            rng = np.random.default_rng(42)
+            pos, cols = np.zeros((num, 3)), np.zeros((num, 3))
+            aux, angle = np.zeros(num), np.zeros(num)
+            blocks = []
+            idx = 0
+            
+            # 1. Barkhanes (3 croissants), aux = hauteur avant émergence
+            start = idx
+            for bi, (cx, cz) in enumerate([(-60, -40), (50, 30), (-20, 60)]):
+                for i in range(180 // 3):
+                    if idx >= num:
+                        break
+                    angle_i = (i / (180 // 3)) * 2 * np.pi
+                    rayon = 30 * (1 - 0.35 * np.cos(angle_i))
+                    pos[idx] = [cx + np.cos(angle_i) * rayon, 0, cz + np.sin(angle_i) * rayon]
+                    aux[idx] = 20 + bi * 5 + (0.3 + 0.7 * np.sin(angle_i * 0.5 + np.pi/4) ** 2) * 22
+                    idx += 1
+            blocks.append(("barkhane", start, idx, 0))
+            
+            # 2. Transversales (5 vagues)
+            points_per_wave = 280 // 5
+            for wave_idx in range(5):
+                start = idx
+                for i in range(points_per_wave):
+                    if idx >= num:
+                        break
+                    pos[idx] = [(i / points_per_wave - 0.5) * 140, 0, -50 + wave_idx * 25 + rng.uniform(-4, 4)]
+                    idx += 1
+                blocks.append(("trans", start, idx, wave_idx))
+            
+            # 3. Dune étoilée (6 bras), aux = distance au centre
+            start = idx
+            for bras in range(6):
+                for i in range(140 // 6):
+                    if idx >= num:
+                        break
+                    distance = i * 2.2
+                    angle[idx] = (bras / 6) * 2 * np.pi + np.sin(distance * 0.12) * 0.15
+                    aux[idx] = distance
+                    pos[idx, 1] = 45 * np.exp(-distance / 22) + 15
+                    cols[idx] = ORANGE_NIGER if distance < 15 else SABLE_SEC
+                    idx += 1
+            blocks.append(("etoile", start, idx, 0))
+            
+            # 4. Reg: surface plate puis inselbergs (4 sites)
+            n_surface = int(180 * 0.7)
+            start = idx
+            for i in range(n_surface):
+                if idx >= num:
+                    break
+                base_x = rng.uniform(-90, 90)
+                base_z = rng.uniform(50, 100)
+                pos[idx] = [base_x, 10 + rng.uniform(-2, 2), base_z]
+                cols[idx] = SABLE_HUMIDE
+                idx += 1
+            blocks.append(("reg", start, idx, 0))
+            
+            start = idx
+            for (ix, iz) in [(60, 70), (-50, 80), (20, 90), (-30, 65)]:
+                for i in range((180 - n_surface) // 4):
+                    if idx >= num:
+                        break
+                    angle_i = rng.uniform(0, 2 * np.pi)
+                    dist = rng.uniform(0, 10)
+                    pos[idx] = [ix + np.cos(angle_i) * dist, 10 + 22 * (1 - dist / 10), iz + np.sin(angle_i) * dist]
+                    cols[idx] = SABLE_MOYEN * 0.8  # Plus sombre
+                    idx += 1
+            blocks.append(("insel", start, idx, 0))
+            
+            # 5. Erg (12 rangées), aux = z de la rangée
+            start = idx
+            erg_cols = 140 // 12
+            for zi in range(12):
+                z_row = -90 + zi * 8
+                for xi in range(erg_cols):
+                    if idx >= num:
+                        break
+                    pos[idx] = [-90 + xi * (80.0 / erg_cols), 0, z_row + rng.uniform(-2, 2)]
+                    aux[idx] = z_row
+                    cols[idx] = SABLE_SEC
+                    idx += 1
+            blocks.append(("erg", start, idx, 0))
             
-            for i in range(num):
-                if fleuve_mask[i]:
-                    # Transition vers bleu
-                    bleu_fleuve = np.array([0.2, 0.4, 0.7])
-                    cols[i] = SABLE_SEC * (1 - progression_trans) + bleu_fleuve * progression_trans
+            # 6. Caravane (visible à partir de 8s, aux = rang), sinon drones posés sur le sable
+            start = idx
+            for i in range(20):
+                if idx >= num:
+                    break
+                if caravane_visible:
+                    pos[idx] = [i * -3.5, 0, 25 + np.sin(i * 0.5) * 2.5]
+                    aux[idx] = i
+                    cols[idx] = [0.3, 0.2, 0.1]  # Couleur sombre (silhouettes)
                 else:
-                    # Dunes qui s'assombrissent (nuit qui tombe)
-                    cols[i] = SABLE_MOYEN * (1 - progression_trans * 0.4)
-        
-        # ═══════════════════════════════════════════════════════════════════
-        # CONTRAINTES FINALES
-        # ═══════════════════════════════════════════════════════════════════
-        
-        # Sol minimum à 8m
-        pos[:, 1] = np.maximum(pos[:, 1], 8.0)
-        
-        # Limites spatiales
-        pos[:, 0] = np.clip(pos[:, 0], -120, 120)
-        pos[:, 2] = np.clip(pos[:, 2], -120, 120)
-        
-        # Couleurs dans les limites
-        cols = np.clip(cols, 0.0, 1.5)
-        
-        return pos, cols
+                    pos[idx] = [rng.uniform(-80, 80), 12, rng.uniform(-80, 80)]
+                    cols[idx] = SABLE_MOYEN
+                idx += 1
+            if caravane_visible:
+                blocks.append(("caravane", start, idx, 0))
+            
+            # Remplir les extras (x, altitude, z)
+            draws = rng.random((num - idx, 3))
+            pos[idx:, 0] = -90 + draws[:, 0] * 180
+            pos[idx:, 1] = 12 + (-2 + draws[:, 1] * 6)
+            pos[idx:, 2] = -90 + draws[:, 2] * 180
+            cols[idx:] = SABLE_MOYEN
+            
+            layout = {name: value.astype(np.float32) for name, value in
+                      (("pos", pos), ("cols", cols), ("aux", aux), ("angle", angle))}
+            layout["blocks"] = tuple(blocks)
+            return layout
+        
+        # Partie 3 : caravane des 20 derniers drones (décalage, profondeur, phase de marche)
+        rank = np.arange(20)[-num:]
+        life_caravan = np.array([rank * -3.5, 25 + np.sin(rank * 0.5) * 2.5, rank * 0.3])
+        
+        desert = {
+            "grid_x": grid_x,
+            "grid_z": grid_z,
+            "cloud": cloud,
+            "cloud_cols": cloud_cols,
+            "sediment": sediment,
+            "sediment_drop": sediment_drop,
+            "ripple_start": ripple_start,
+            "dune_cos": np.cos(grid_z * 0.04),
+            "dune_ripple": 3.0 * np.sin(grid_x * 0.12 + grid_z * 0.1),
+            "life_cos": np.cos(grid_z * 0.035),
+            "life_caravan": life_caravan,
+            "river_terrain": np.sin(grid_x * 0.04) * np.cos(grid_z * 0.035),
+            "river_distance": np.abs(grid_z - 20 * np.sin(grid_x * 0.02)),
+        }
+        desert = {name: value.astype(np.float32) for name, value in desert.items()}
+        desert["dunes_early"] = dunes(caravane_visible=False)
+        desert["dunes_late"] = dunes(caravane_visible=True)
+        return desert
 
+    @register_phase("act2_sacred_rain", warmup_ms=13)
+    @register_phase("act3_fleuve_niger", warmup_ms=13)
     def _act_3_fleuve_niger(self, num):
         # LE FLEUVE NIGER (The Niger River)
         pos = np.zeros((num, 3))
@@ -1691,65 +1808,119 @@ class FormationLibrary:
             t = (i / num) * 2.0 - 1.0 
             x = t * length / 2
             z = 45.0 * np.sin(x * 0.03) + 15.0 * np.cos(x * 0.07)
-            perp_off = np.random.uniform(-width_base/2, width_base/2)
+            perp_off = self._frame_rng.uniform(-width_base/2, width_base/2)
             y = 65.0 + 12.0 * np.sin(x * 0.015)
-            z_final = z + perp_off + np.random.uniform(-2.0, 2.0)
+            z_final = z + perp_off + self._frame_rng.uniform(-2.0, 2.0)
             pos[i] = [x, y, z_final]
-            if np.random.rand() > 0.8: cols[i] = self.colors["blanc_pure"]
+            if self._frame_rng.random() > 0.8: cols[i] = self.colors["blanc_pure"]
         return pos, cols
 
-    def _phase_1_pluie(self, num, t=0.0, audio_energy=0.5):
+    @register_phase("phase1_pluie", uses_t=True, uses_audio=True, camera_preset="pluie",
+                    warmup_ms=10, skip_show=True, writes_out=True)
+    def _phase_1_pluie(self, num, t=0.0, audio_energy=0.5, out=None):
         # Cœur lumineux rouge (contour + remplissage optionnel)
         # Paramétrique: x=16 sin^3 t, y=13 cos t - 5 cos 2t - 2 cos 3t - cos 4t
-        contour_ratio = 0.6
-        n_contour = int(num * contour_ratio)
-        n_fill = num - n_contour
-
-        # Courbe de cœur
-        ang_contour = np.linspace(0, 2*np.pi, n_contour, endpoint=False)
-        x = 16 * (np.sin(ang_contour) ** 3)
-        y = 13 * np.cos(ang_contour) - 5 * np.cos(2 * ang_contour) - 2 * np.cos(3 * ang_contour) - np.cos(4 * ang_contour)
+        # Contour et phases de pulsation en cache, remplissage et jitter tirés par frame
+        contour, pulse_phase = self._cache.get_or_build(
+            FormationKey("mesh", "pluie_heart", num), lambda: self._build_pluie_heart(num))
+        n_contour = len(contour)
         scale = 3.8  # ~120m largeur, ~100m hauteur
-        x *= scale
-        y *= scale
-
-        contour_pos = np.zeros((n_contour, 3))
-        contour_pos[:, 0] = x
-        contour_pos[:, 1] = y
-
-        # Remplissage
-        if n_fill > 0:
-            ang_fill = np.random.uniform(0, 2*np.pi, n_fill)
-            r_fill = np.random.uniform(0.0, 1.0, n_fill) ** 0.6  # densité vers le bord
-            fx = 16 * (np.sin(ang_fill) ** 3) * scale * r_fill
-            fy = (13 * np.cos(ang_fill) - 5 * np.cos(2 * ang_fill) - 2 * np.cos(3 * ang_fill) - np.cos(4 * ang_fill)) * scale * r_fill
-            fill_pos = np.zeros((n_fill, 3))
-            fill_pos[:, 0] = fx
-            fill_pos[:, 1] = fy
-            pos = np.vstack([contour_pos, fill_pos])
-        else:
-            pos = contour_pos
+
+        pos, cols = self._frame_buffers(num, out)
+        draw, fill_x, fill_y = self._scratch("pluie", (3, num))
+
+        pos[:n_contour, :2] = contour
+        pos[:n_contour, 2] = 0.0
+
+        # Remplissage: angle et rayon (densité vers le bord) tirés dans le scratch
+        if num > n_contour:
+            ang_fill = fill_x[n_contour:]
+            r_fill = fill_y[n_contour:]
+            self._frame_rng.random(dtype=np.float32, out=ang_fill)
+            ang_fill *= 2 * np.pi
+            self._frame_rng.random(dtype=np.float32, out=r_fill)
+            np.power(r_fill, 0.6, out=r_fill)
+            r_fill *= scale
+
+            fx, fy, tmp = pos[n_contour:, 0], pos[n_contour:, 1], draw[n_contour:]
+            np.sin(ang_fill, out=tmp)
+            np.power(tmp, 3, out=fx)
+            fx *= 16
+            np.cos(ang_fill, out=fy)
+            fy *= 13
+            for harmonic, weight in ((2, 5), (3, 2), (4, 1)):
+                np.multiply(ang_fill, harmonic, out=tmp)
+                np.cos(tmp, out=tmp)
+                tmp *= weight
+                fy -= tmp
+            fx *= r_fill
+            fy *= r_fill
+            pos[n_contour:, 2] = 0.0
 
         # Centrage scène
-        center = np.array([0.0, 80.0, 0.0])
-        pos += center
+        pos[:, 1] += 80.0
 
-        # Légère épaisseur/jitter
-        pos[:, 2] += np.random.uniform(-2.0, 2.0, len(pos))
-        pos[:, 0] += np.random.uniform(-0.5, 0.5, len(pos))
-        pos[:, 1] += np.random.uniform(-0.5, 0.5, len(pos))
+        # Légère épaisseur/jitter (z ±2m, x et y ±0.5m)
+        for k, width in ((2, 4.0), (0, 1.0), (1, 1.0)):
+            self._frame_rng.random(dtype=np.float32, out=draw)
+            draw -= 0.5
+            draw *= width
+            pos[:, k] += draw
 
         # Couleurs rouge bloom
-        base_red = np.array([1.0, 0.12, 0.12], dtype=float)
-        cols = np.tile(base_red, (len(pos), 1))
-        pulse = 0.9 + 0.15 * np.sin(t * 2.0 + np.linspace(0, 3.14, len(pos)))
-        cols *= pulse[:, None]
-        cols = np.clip(cols, 0.0, 1.0)
+        np.add(pulse_phase, t * 2.0, out=draw)
+        np.sin(draw, out=draw)
+        draw *= 0.15
+        draw += 0.9
+        for k, base in enumerate((1.0, 0.12, 0.12)):
+            np.multiply(draw, base, out=cols[:, k])
+        np.clip(cols, 0.0, 1.0, out=cols)
 
         return pos, cols
 
-    def _act_4_science(self, num, t=0.0, audio_energy=0.5):
+    def _build_pluie_heart(self, num):
+        """Contour du cœur (60% des drones) et phase de pulsation de chaque drone."""
+        n_contour = int(num * 0.6)
+        ang_contour = np.linspace(0, 2*np.pi, n_contour, endpoint=False)
+        x = 16 * (np.sin(ang_contour) ** 3)
+        y = 13 * np.cos(ang_contour) - 5 * np.cos(2 * ang_contour) - 2 * np.cos(3 * ang_contour) - np.cos(4 * ang_contour)
+        contour = np.column_stack((x, y)) * 3.8
+        pulse_phase = np.linspace(0, 3.14, num)
+        return contour.astype(np.float32), pulse_phase.astype(np.float32)
+
+    @register_phase("act4_science", uses_t=True, uses_audio=True, camera_preset="science", writes_out=True)
+    def _act_4_science(self, num, t=0.0, audio_energy=0.5, out=None):
         # ADN : double hélice + barreaux transversaux
+        # Géométrie statique en cache, seules les pulsations et le jitter sont calculés par frame
+        base_pos, base_cols, pulse_freq, pulse_phase, pulse_offset, pulse_amp = self._cache.get_or_build(
+            FormationKey("mesh", "dna_helix", num), lambda: self._build_dna_helix(num))
+
+        pos, cols = self._frame_buffers(num, out)
+
+        # Pulsation lumineuse le long de l'axe (cyan sur les hélices, magenta sur les barreaux)
+        pulse = pulse_freq * t
+        pulse += pulse_phase
+        np.sin(pulse, out=pulse)
+        pulse *= pulse_amp
+        pulse += pulse_offset
+        for k in range(3):
+            np.multiply(base_cols[:, k], pulse, out=cols[:, k])
+
+        # Jitter léger pour vivant (tirages float32, un temporaire colonne)
+        pos[:] = base_pos
+        for k in (0, 2):
+            jitter = self._frame_rng.random(num, dtype=np.float32)
+            jitter -= 0.5
+            jitter *= 0.8
+            pos[:, k] += jitter
+
+        # Clamp sécurité
+        np.clip(cols, 0.0, 1.0, out=cols)
+
+        return pos, cols
+
+    def _build_dna_helix(self, num):
+        """Partie statique de l'ADN: positions, couleurs de base et paramètres de pulsation."""
         # Paramètres géométriques
         turns = 4.0
         radius = 20.0
@@ -1772,12 +1943,7 @@ class FormationLibrary:
 
         helix1 = np.column_stack((x1, y_vals, z1))
         helix2 = np.column_stack((x2, y_vals, z2))
-
-        # Pulsation lumineuse le long de l'axe
         cyan = np.array([0.05, 0.9, 1.0], dtype=float)
-        pulse = 0.9 + 0.15 * np.sin(1.6 * t + (y_vals / height) * 4 * np.pi)
-        cols_h1 = cyan * pulse[:, None]
-        cols_h2 = cyan * pulse[:, None]
 
         # === Barreaux (magenta) ===
         rung_samples = 8  # points par barre
@@ -1800,32 +1966,22 @@ class FormationLibrary:
 
         rungs = np.column_stack((x_r, y_r, z_r))
         magenta = np.array([1.0, 0.2, 0.85], dtype=float)
-        pulse_r = 0.95 + 0.18 * np.sin(2.2 * t + (y_r / height) * 3 * np.pi)
-        cols_r = magenta * pulse_r[:, None]
 
-        # Assemble
+        # Assemble: pulse = offset + amp * sin(freq * t + phase)
+        n_h, n_r = len(y_vals), len(y_r)
         pos = np.vstack([helix1, helix2, rungs])
-        cols = np.vstack([cols_h1, cols_h2, cols_r])
-
-        # Jitter léger pour vivant
-        pos[:, 0] += np.random.uniform(-0.4, 0.4, len(pos))
-        pos[:, 2] += np.random.uniform(-0.4, 0.4, len(pos))
-
-        # Ajuster à num si surplus ou manque
-        if len(pos) > num:
-            pos = pos[:num]
-            cols = cols[:num]
-        elif len(pos) < num:
-            deficit = num - len(pos)
-            pos = np.vstack([pos, pos[:deficit]])
-            cols = np.vstack([cols, cols[:deficit]])
-
-        # Clamp sécurité
-        cols = np.clip(cols, 0.0, 1.0)
+        cols = np.vstack([np.tile(cyan, (2 * n_h, 1)), np.tile(magenta, (n_r, 1))])
+        freq = np.concatenate([np.full(2 * n_h, 1.6), np.full(n_r, 2.2)])
+        phase = np.concatenate([np.tile((y_vals / height) * 4 * np.pi, 2), (y_r / height) * 3 * np.pi])
+        offset = np.concatenate([np.full(2 * n_h, 0.9), np.full(n_r, 0.95)])
+        amp = np.concatenate([np.full(2 * n_h, 0.15), np.full(n_r, 0.18)])
 
-        return pos, cols
+        # Ajuster à num si surplus ou manque (float32 comme les buffers de frame)
+        idx = np.arange(num) % len(pos) if len(pos) < num else np.arange(num)
+        return tuple(a[idx].astype(np.float32) for a in (pos, cols, freq, phase, offset, amp))
 
-    def _act_5_tree_of_life(self, num, t=0.0, audio_energy=0.5):
+    @register_phase("act5_tree_of_life", uses_t=True, uses_audio=True, warmup_ms=30, writes_out=True)
+    def _act_5_tree_of_life(self, num, t=0.0, audio_energy=0.5, out=None):
         """
         🌳 ARBRE DE VIE GÉANT LUMINEUX - Style Dubai Drone Show World Record
         
@@ -1836,105 +1992,101 @@ class FormationLibrary:
         """
         
         # === CACHE VÉRIFICATION ===
-        cache_key = f"tree_of_life_{num}"
-        if cache_key not in self._phase10_cache:
-            self._phase10_cache[cache_key] = self._generate_tree_of_life_structure(num)
-        
-        base_pos, segment_ids, branch_heights = self._phase10_cache[cache_key]
-        pos = base_pos.copy()
-        
-        # === PALETTE COULEURS ===
-        # Tronc: brun/or lumineux #CF7A36 → #FFD700
-        COL_TRUNK_BASE = np.array([0.81, 0.48, 0.21])    # #CF7A36 - brun orangé
-        COL_TRUNK_GLOW = np.array([1.0, 0.84, 0.0])      # #FFD700 - or pur
-        COL_BRANCH_MID = np.array([0.72, 0.60, 0.20])    # Transition brun→vert
-        COL_LEAF_DARK = np.array([0.11, 0.70, 0.38])     # #1BB360 - vert profond
-        COL_LEAF_BRIGHT = np.array([0.56, 1.0, 0.56])    # #90FF90 - vert éclatant
-        
-        # === COLORATION PAR SEGMENT ===
-        cols = np.zeros((num, 3))
-        
-        for i in range(num):
-            seg = segment_ids[i]
-            h = branch_heights[i]  # Hauteur normalisée 0→1
-            
-            if seg == 0:  # TRONC
-                # Gradient base→haut: bloom doré à la base, brun en montant
-                bloom_factor = 1.0 - h  # Plus lumineux en bas
-                base_col = COL_TRUNK_BASE * (1 - bloom_factor * 0.5) + COL_TRUNK_GLOW * bloom_factor * 0.5
-                # Ajouter bloom intense à la base
-                bloom_intensity = np.exp(-h * 3) * 0.5
-                cols[i] = base_col + bloom_intensity
-                
-            elif seg == 1:  # BRANCHES PRINCIPALES
-                # Gradient brun → vert en montant
-                blend = min(1.0, h * 1.5)
-                cols[i] = COL_TRUNK_BASE * (1 - blend) + COL_BRANCH_MID * blend
-                
-            elif seg == 2:  # BRANCHES SECONDAIRES
-                # Transition vers le vert
-                blend = min(1.0, h * 2)
-                cols[i] = COL_BRANCH_MID * (1 - blend) + COL_LEAF_DARK * blend
-                
-            else:  # seg == 3: FEUILLAGE (Couronne)
-                # Vert éclatant avec variations
-                # Position radiale dans la couronne pour variation
-                cx, cy = 0, 85  # Centre couronne
-                dx, dy = pos[i, 0] - cx, pos[i, 1] - cy
-                radial = np.sqrt(dx*dx + dy*dy) / 50.0  # Normalisé
-                
-                # Centre plus foncé, extérieur plus brillant
-                blend = np.clip(radial, 0, 1)
-                cols[i] = COL_LEAF_DARK * (1 - blend * 0.6) + COL_LEAF_BRIGHT * (blend * 0.6)
-        
+        # Structure, couleurs par segment et phases d'animation en cache: par frame,
+        # seuls le scintillement, le vent et la croissance sont calculés (sur place)
+        base_pos, base_cols, heights, shimmer_phase, shimmer_amp, wind_phase, wind_amp = \
+            self._cache.get_or_build(FormationKey("mesh", "tree_of_life", num),
+                                     lambda: self._build_tree_of_life(num))
+        pos, cols = self._frame_buffers(num, out)
+        wave = self._scratch("tree_of_life", (num,))
+        pos[:] = base_pos
+
         # === ANIMATION: SCINTILLEMENT FEUILLAGE ===
         SHIMMER_FREQ = 4.0  # Hz
-        SHIMMER_AMP = 0.15
-        
-        for i in range(num):
-            if segment_ids[i] == 3:  # Feuillage uniquement
-                # Phase unique par drone pour désynchronisation
-                phase_offset = (pos[i, 0] * 0.1 + pos[i, 1] * 0.07) % (2 * np.pi)
-                shimmer = 1.0 + SHIMMER_AMP * np.sin(2 * np.pi * SHIMMER_FREQ * t + phase_offset)
-                cols[i] *= shimmer
-        
+        np.add(shimmer_phase, 2 * np.pi * SHIMMER_FREQ * t, out=wave)
+        np.sin(wave, out=wave)
+        wave *= shimmer_amp
+        wave += 1.0
+
         # === ANIMATION: RESPIRATION GLOBALE (audio-réactive) ===
-        breath = 1.0 + 0.1 * audio_energy * np.sin(t * 2.0)
-        cols *= breath
-        
+        wave *= float(1.0 + 0.1 * audio_energy * np.sin(t * 2.0))
+        for k in range(3):
+            np.multiply(base_cols[:, k], wave, out=cols[:, k])
+
         # === ANIMATION: VENT DOUX SUR COURONNE ===
+        # Déplacement horizontal ondulant, mouvement en Z (profondeur)
         WIND_FREQ = 0.5
-        WIND_AMP = 2.0
-        
-        for i in range(num):
-            if segment_ids[i] == 3:  # Feuillage
-                # Déplacement horizontal ondulant
-                wave_phase = pos[i, 0] * 0.03 + pos[i, 1] * 0.02
-                wind_offset = WIND_AMP * np.sin(2 * np.pi * WIND_FREQ * t + wave_phase)
-                pos[i, 2] += wind_offset  # Mouvement en Z (profondeur)
-        
+        np.add(wind_phase, 2 * np.pi * WIND_FREQ * t, out=wave)
+        np.sin(wave, out=wave)
+        wave *= wind_amp
+        pos[:, 2] += wave
+
         # === ANIMATION: CROISSANCE (pour les 5 premières secondes) ===
         if t < 5.0:
             growth_progress = t / 5.0
             # Ease-in-out cubic
             growth = growth_progress * growth_progress * (3.0 - 2.0 * growth_progress)
-            
-            # Révéler progressivement du bas vers le haut
-            for i in range(num):
-                h = branch_heights[i]
-                # Si la hauteur normalisée dépasse la progression, masquer
-                if h > growth:
-                    # Réduire la visibilité (couleur très sombre)
-                    fade = max(0, 1.0 - (h - growth) * 5)
-                    cols[i] *= fade
-                    # Aussi comprimer vers la base
-                    pos[i, 1] = pos[i, 1] * (growth * 0.5 + 0.5)
-        
+
+            # Révéler progressivement du bas vers le haut: au-delà de la progression,
+            # fondu vers le noir (fade = 1 en dessous) et compression vers la base
+            hidden = self._scratch("tree_of_life_mask", (num,), bool)
+            np.greater(heights, growth, out=hidden)
+            np.subtract(heights, growth, out=wave)
+            wave *= -5.0
+            wave += 1.0
+            np.clip(wave, 0.0, 1.0, out=wave)
+            for k in range(3):
+                cols[:, k] *= wave
+            np.multiply(pos[:, 1], growth * 0.5 + 0.5, out=pos[:, 1], where=hidden)
+
         # === CLAMP FINAL ===
-        cols = np.clip(cols, 0.0, 1.5)  # Permettre léger HDR pour bloom
-        
+        np.clip(cols, 0.0, 1.5, out=cols)  # Permettre léger HDR pour bloom
+
         return pos, cols
-    
+
+    def _build_tree_of_life(self, num):
+        """
+        Partie statique de l'arbre de vie (float32): positions, couleurs par
+        segment, hauteurs normalisées, phases et amplitudes (feuillage seul)
+        du scintillement et du vent.
+        """
+        pos, segment_ids, heights = self._generate_tree_of_life_structure(num)
+
+        # === PALETTE COULEURS ===
+        # Tronc: brun/or lumineux #CF7A36 → #FFD700
+        COL_TRUNK_BASE = np.array([0.81, 0.48, 0.21])    # #CF7A36 - brun orangé
+        COL_TRUNK_GLOW = np.array([1.0, 0.84, 0.0])      # #FFD700 - or pur
+        COL_BRANCH_MID = np.array([0.72, 0.60, 0.20])    # Transition brun→vert
+        COL_LEAF_DARK = np.array([0.11, 0.70, 0.38])     # #1BB360 - vert profond
+        COL_LEAF_BRIGHT = np.array([0.56, 1.0, 0.56])    # #90FF90 - vert éclatant
+
+        # === COLORATION PAR SEGMENT ===
+        h = heights[:, None]
+        trunk, branch1, branch2, leaf = (segment_ids == k for k in range(4))
+        cols = np.zeros((num, 3))
+
+        # TRONC: bloom doré à la base, brun en montant, plus bloom intense à la base
+        bloom_factor = 1.0 - h
+        cols[trunk] = (COL_TRUNK_BASE * (1 - bloom_factor * 0.5) + COL_TRUNK_GLOW * bloom_factor * 0.5
+                       + np.exp(-h * 3) * 0.5)[trunk]
+        # BRANCHES PRINCIPALES: gradient brun → vert en montant
+        blend = np.minimum(1.0, h * 1.5)
+        cols[branch1] = (COL_TRUNK_BASE * (1 - blend) + COL_BRANCH_MID * blend)[branch1]
+        # BRANCHES SECONDAIRES: transition vers le vert
+        blend = np.minimum(1.0, h * 2)
+        cols[branch2] = (COL_BRANCH_MID * (1 - blend) + COL_LEAF_DARK * blend)[branch2]
+        # FEUILLAGE: centre (0, 85) plus foncé, extérieur plus brillant
+        blend = np.clip(np.hypot(pos[:, 0], pos[:, 1] - 85) / 50.0, 0, 1)[:, None]
+        cols[leaf] = (COL_LEAF_DARK * (1 - blend * 0.6) + COL_LEAF_BRIGHT * (blend * 0.6))[leaf]
+
+        # Phase unique par drone pour désynchroniser scintillement (±15%) et vent (±2m)
+        shimmer_phase = (pos[:, 0] * 0.1 + pos[:, 1] * 0.07) % (2 * np.pi)
+        wind_phase = pos[:, 0] * 0.03 + pos[:, 1] * 0.02
+        shimmer_amp = np.where(leaf, 0.15, 0.0)
+        wind_amp = np.where(leaf, 2.0, 0.0)
+        return tuple(a.astype(np.float32) for a in (pos, cols, heights, shimmer_phase, shimmer_amp,
+                                                    wind_phase, wind_amp))
+
     def _generate_tree_of_life_structure(self, num):
         """
         Génère la structure statique de l'arbre:
@@ -1944,6 +2096,7 @@ class FormationLibrary:
         
         Returns: (positions, segment_ids, normalized_heights)
         """
+        rng = np.random.default_rng(1999 + num)  # Structure en cache: graine fixe
         
         # === DIMENSIONS CIBLES ===
         TREE_HEIGHT = 130.0      # Hauteur totale ~130m
@@ -2023,8 +2176,8 @@ class FormationLibrary:
                 
                 # Épaisseur de branche (plusieurs drones en section)
                 thickness = 2.0 * (1 - t_branch * 0.7)
-                offset_x = np.random.uniform(-thickness, thickness)
-                offset_z = np.random.uniform(-thickness, thickness)
+                offset_x = rng.uniform(-thickness, thickness)
+                offset_z = rng.uniform(-thickness, thickness)
                 
                 pos[idx] = [x + offset_x, y, z + offset_z]
                 segment_ids[idx] = 1
@@ -2039,12 +2192,12 @@ class FormationLibrary:
             theta_base = 2 * np.pi * b / n_sub_branches + 0.2
             
             # Partent des branches principales
-            start_y = TRUNK_HEIGHT + 15 + np.random.uniform(0, 10)
+            start_y = TRUNK_HEIGHT + 15 + rng.uniform(0, 10)
             start_x = CROWN_RADIUS_X * 0.3 * np.cos(theta_base)
             start_z = CROWN_RADIUS_X * 0.3 * np.sin(theta_base)
             
             end_x = CROWN_RADIUS_X * 0.75 * np.cos(theta_base)
-            end_y = CROWN_CENTER_Y + np.random.uniform(-5, 5)
+            end_y = CROWN_CENTER_Y + rng.uniform(-5, 5)
             end_z = CROWN_RADIUS_X * 0.5 * np.sin(theta_base)
             
             for j in range(branch2_per_branch):
@@ -2057,9 +2210,9 @@ class FormationLibrary:
                 z = start_z + t_branch * (end_z - start_z)
                 
                 thickness = 1.0 * (1 - t_branch * 0.5)
-                pos[idx] = [x + np.random.uniform(-thickness, thickness), 
+                pos[idx] = [x + rng.uniform(-thickness, thickness), 
                            y, 
-                           z + np.random.uniform(-thickness, thickness)]
+                           z + rng.uniform(-thickness, thickness)]
                 segment_ids[idx] = 2
                 heights[idx] = 0.6 + t_branch * 0.15  # 0.6-0.75
                 idx += 1
@@ -2101,11 +2254,11 @@ class FormationLibrary:
             # Plus de profondeur au centre, moins aux bords
             z_max = 20.0 * np.sqrt(max(0, 1 - r_base * r_base))
             z_depth = z_max * np.sin(theta * 0.7 + i * 0.1)
-            z_random = np.random.uniform(-4, 4)
+            z_random = rng.uniform(-4, 4)
             
             # Ajouter irrégularités naturelles (feuillage organique)
-            noise_x = np.random.uniform(-4, 4)
-            noise_y = np.random.uniform(-3, 3)
+            noise_x = rng.uniform(-4, 4)
+            noise_y = rng.uniform(-3, 3)
             
             pos[idx] = [local_x + noise_x, y_global + noise_y, z_depth + z_random]
             segment_ids[idx] = 3
@@ -2114,6 +2267,7 @@ class FormationLibrary:
         
         return pos, segment_ids, heights
 
+    @register_phase("act5_wildlife", camera_preset="interaction", warmup_ms=105)
     def _act_5_wildlife(self, num):
         # African Soul (Wildlife Silhouettes)
         # Giraffe and Elephant majestic front-facing paintings
@@ -2121,32 +2275,31 @@ class FormationLibrary:
         def is_in_wildlife(lx, ly):
             # 🦒 GIRAFFE (Left side centered at -30)
             gx, gy = lx + 40, ly - 30
-            # Body
-            if (gx/10)**2 + (gy/15)**2 <= 1.0: return True
-            # Neck
-            if abs(gx+2) < 4 and 10 <= gy <= 50: return True
-            # Head
-            if (gx+4)**2 + (gy-55)**2 <= 25: return True
-            # Legs
-            if abs(gx-5) < 2 and -30 <= gy <= -15: return True
-            if abs(gx+5) < 2 and -30 <= gy <= -15: return True
-            
+            giraffe_legs = (-30 <= gy) & (gy <= -15)
+            giraffe = (
+                ((gx/10)**2 + (gy/15)**2 <= 1.0) |                      # Body
+                ((np.abs(gx+2) < 4) & (10 <= gy) & (gy <= 50)) |        # Neck
+                ((gx+4)**2 + (gy-55)**2 <= 25) |                        # Head
+                ((np.abs(gx-5) < 2) & giraffe_legs) |                   # Legs
+                ((np.abs(gx+5) < 2) & giraffe_legs)
+            )
+
             # 🐘 ELEPHANT (Right side centered at 40)
             ex, ey = lx - 40, ly - 20
-            # Body
-            if (ex/25)**2 + (ey/18)**2 <= 1.0: return True
-            # Head
-            if (ex-25)**2 + (ey-5)**2 <= 100: return True
-            # Trunk
-            if ex > 35 and abs(ey - (- (ex-35)*0.5)) < 4 and ex < 55: return True
-            # Legs
-            if abs(ex-15) < 5 and -40 <= ey <= -18: return True
-            if abs(ex+15) < 5 and -40 <= ey <= -18: return True
-            
-            return False
+            elephant_legs = (-40 <= ey) & (ey <= -18)
+            elephant = (
+                ((ex/25)**2 + (ey/18)**2 <= 1.0) |                      # Body
+                ((ex-25)**2 + (ey-5)**2 <= 100) |                       # Head
+                ((ex > 35) & (np.abs(ey + (ex-35)*0.5) < 4) & (ex < 55)) |  # Trunk
+                ((np.abs(ex-15) < 5) & elephant_legs) |                 # Legs
+                ((np.abs(ex+15) < 5) & elephant_legs)
+            )
+            return giraffe | elephant
 
         return self._fill_shape_uniformly(is_in_wildlife, (-80, 80, -40, 60), num, center=(0, 60, 0), z_depth=12.0)
 
+    @register_phase("act7_flag", camera_preset="flag", warmup_ms=8,
+                    hold_effect="flag_wave", hold_amplitude=15.0)
     def _act_7_flag(self, num):
         # Majestic Flag (Immense & Waving)
         # Larger scale than standard flag
@@ -2169,7 +2322,7 @@ class FormationLibrary:
                 if idx >= num: break
                 x = c * dx - width/2
                 y = (rows_grid - 1 - r) * dy + start_y
-                pos[idx] = [x, y, np.random.uniform(-2.0, 2.0)]
+                pos[idx] = [x, y, self._frame_rng.uniform(-2.0, 2.0)]
                 
                 # Flag Colors
                 if y > start_y + (2*height/3):
@@ -2187,45 +2340,40 @@ class FormationLibrary:
                 idx += 1
         return pos, cols
 
-    def _act_8_finale(self, num, t=0.0):
+    def _heart_base(self, num):
+        """
+        Heart volume (cached, progressive): (positions float32, distance to the
+        center). Rejection samples are independent, so any prefix is a valid
+        smaller heart.
+        """
+        return self._cache.get_or_build_prefix(
+            FormationKey("mesh", "heart", num), num, self._build_heart, self.bake_resolution)
+
+    def _build_heart(self, num):
+        # 3D Heart Formula
+        # (x^2 + 9/4 y^2 + z^2 - 1)^3 - x^2 z^3 - 9/80 y^2 z^3 = 0
+        # Rejection sampling in the [-1.5, 1.5]^3 cube (~1/4 accepted), fixed seed
+        rng = np.random.default_rng(2260 + num)
+        pos = np.empty((0, 3))
+        while len(pos) < num:
+            p = rng.uniform(-1.5, 1.5, (4 * num + 64, 3))
+            x, y, z = p[:, 0], p[:, 1], p[:, 2]
+            a = x**2 + (9/4)*(y**2) + z**2 - 1
+            pos = np.concatenate((pos, p[a**3 - (x**2)*(z**3) - (9/80)*(y**2)*(z**3) <= 0]))
+        pos = pos[:num] * 35.0  # Scale up
+        pos[:, 1] += 70.0       # Center
+        base_pos = pos.astype(np.float32)
+        heart_radius = np.linalg.norm(base_pos - np.array([0.0, 70.0, 0.0]), axis=1).astype(np.float32)
+        return base_pos, heart_radius
+
+    @register_phase("act8_finale", uses_t=True, camera_preset="wide", warmup_ms=10, skip_show=True,
+                    writes_out=True)
+    def _act_8_finale(self, num, t=0.0, out=None):
         # "LE CŒUR DE L'AFRIQUE" (Volumétrie Pulsante)
         # A living, beating heart representing Unity.
         
         # 1. Generate Base Shape (Cached)
-        if not hasattr(self, '_heart_cache'):
-             self._heart_cache = {}
-        
-        cache_key = num
-        if cache_key not in self._heart_cache:
-             # 3D Heart Formula
-             # (x^2 + 9/4 y^2 + z^2 - 1)^3 - x^2 z^3 - 9/80 y^2 z^3 = 0
-             # We use a rejection sampling or parametric approach for better distribution
-             
-             pos = []
-             # Parametric approximation for better point distribution
-             # Using a modified sphere mapping
-             count = 0
-             while count < num:
-                 # Random point in cube
-                 x = np.random.uniform(-1.5, 1.5)
-                 y = np.random.uniform(-1.5, 1.5)
-                 z = np.random.uniform(-1.5, 1.5)
-                 
-                 # Heart equation check
-                 a = x**2 + (9/4)*(y**2) + z**2 - 1
-                 if a**3 - (x**2)*(z**3) - (9/80)*(y**2)*(z**3) <= 0:
-                     pos.append([x, y, z])
-                     count += 1
-             
-             pos = np.array(pos)
-             # Scale up
-             pos *= 35.0 
-             # Center
-             pos[:, 1] += 70.0
-             
-             self._heart_cache[cache_key] = pos
-        
-        base_pos = self._heart_cache[cache_key]
+        base_pos, heart_radius = self._heart_base(num)
         
         # 2. Animation: Heartbeat (Systole/Diastole)
         # Double beat pattern: "Lub-Dub" ... pause ...
@@ -2240,38 +2388,36 @@ class FormationLibrary:
             
         # Apply Scale
         # We scale relative to the center of the heart (0, 70, 0)
-        animated_pos = np.zeros_like(base_pos)
-        animated_pos[:, 0] = base_pos[:, 0] * scale
-        animated_pos[:, 1] = (base_pos[:, 1] - 70.0) * scale + 70.0
-        animated_pos[:, 2] = base_pos[:, 2] * scale
+        animated_pos, cols = self._frame_buffers(num, out)
+        np.multiply(base_pos, scale, out=animated_pos)
+        animated_pos[:, 1] += 70.0 * (1.0 - scale)
         
         # 3. Color Wave (Blood flow / Energy)
         # Wave moves from bottom to top
-        cols = np.zeros((num, 3))
         
         # Define colors
         col_gold = np.array(self.colors["soleil_or"])
         col_red = np.array([1.0, 0.05, 0.1]) # Deep Red
         col_core = np.array([1.0, 0.8, 0.8]) # White-ish center
         
-        for i in range(num):
-            # Calculate distance from center for gradient
-            y_rel = animated_pos[i, 1] - 70.0
-            dist = np.sqrt(animated_pos[i, 0]**2 + y_rel**2 + animated_pos[i, 2]**2)
-            
-            # Pulse wave traveling outwards
-            wave_phase = (dist / 20.0) - (t * 2.0)
-            wave_val = (np.sin(wave_phase) + 1.0) / 2.0 # 0 to 1
-            
-            # Mix Red and Gold based on wave
-            # Core is brighter
-            base_mix = col_red * 0.7 + col_gold * 0.3
-            
-            # Highlight pulse
-            if wave_val > 0.8:
-                cols[i] = col_core # Bright pulse
-            else:
-                cols[i] = base_mix * (0.5 + 0.5 * wave_val) # Breathing brightness
+        # Pulse wave traveling outwards (distance from center, scaled)
+        wave_val = heart_radius * (scale / 20.0)
+        wave_val -= t * 2.0
+        np.sin(wave_val, out=wave_val)
+        wave_val += 1.0
+        wave_val *= 0.5 # 0 to 1
+        
+        # Mix Red and Gold based on wave
+        # Core is brighter
+        base_mix = col_red * 0.7 + col_gold * 0.3
+        
+        # Breathing brightness, highlight pulse on the crest
+        brightness = wave_val
+        brightness *= 0.5
+        brightness += 0.5
+        for k in range(3):
+            np.multiply(brightness, base_mix[k], out=cols[:, k])
+        cols[brightness > 0.9] = col_core # Bright pulse (wave_val > 0.8)
                 
         return animated_pos, cols
 
@@ -2288,6 +2434,8 @@ class FormationLibrary:
         # "NIGER" - Matrix Style, Unified White
         return self._text_formation("NIGER", num, self.colors["blanc_pure"], scale_override=5.5)
 
+    @register_phase("phase6_drapeau", camera_preset="flag", warmup_ms=7, neutral_until_reveal=True,
+                    hold_effect="flag_wave", hold_amplitude=8.0)
     def _phase_6_drapeau(self, num):
         # "Drapeau Flottant / Surface Vivante"
         cols_grid = 40
@@ -2309,7 +2457,7 @@ class FormationLibrary:
                 if idx >= num: break
                 x = c * dx - width/2
                 y = (rows_grid - 1 - r) * dy + start_y
-                pos[idx] = [x, y, np.random.uniform(-2.0, 2.0)]
+                pos[idx] = [x, y, self._frame_rng.uniform(-2.0, 2.0)]
                 
                 # Flag Colors
                 if y > start_y + (2*height/3):
@@ -2327,6 +2475,7 @@ class FormationLibrary:
                 idx += 1
         return pos, cols
 
+    @register_phase("phase7_carte", camera_preset="desert", skip_show=True)
     def _phase_7_carte(self, num):
         # Precise Niger Map - High-Fidelity Image-Based Rendering
         image_path = "C:/Users/mtahiroudaouda/.gemini/antigravity/brain/1bd65539-7aec-43dc-9315-5bbdd944f9a6/uploaded_image_1766836483607.png"
@@ -2334,8 +2483,8 @@ class FormationLibrary:
         pos, cols = self._sample_from_image(image_path, num, target_width=165.0)
         
         if pos is None:
-            # Emergency manual fallback (Old logic)
-            return self._shape_sphere(num, 30, self.colors["orange_niger"])
+            # Fallback: carte vectorielle depuis la frontière GeoJSON du Niger
+            pos, cols = self._niger_vector_map(num, target_width=165.0)
 
         # Offset to clear ground and center
         center_y = 65.0
@@ -2343,67 +2492,48 @@ class FormationLibrary:
         
         # Apply 3D Volumetric Thickness (8m)
         z_depth = 8.0
-        pos[:, 2] = np.random.uniform(-z_depth/2, z_depth/2, num)
+        pos[:, 2] = self._frame_rng.uniform(-z_depth/2, z_depth/2, num)
                 
         return pos, cols
 
+    def _niger_vector_map(self, num, target_width=165.0, outline_ratio=0.25, seed=2025):
+        """
+        Niger échantillonné sur sa frontière GeoJSON (triangulée une fois):
+        contour blanc à espacement régulier + surface orange uniforme.
+        Centré en x, y vers le haut (même cadrage que _sample_from_image).
+        """
+        if self._niger_shape is None:
+            self._niger_shape = PolygonShape(self.niger_coords)
+        shape = self._niger_shape
+        n_outline = int(num * outline_ratio)
+        points = np.vstack((shape.sample_outline(n_outline, seed),
+                            shape.sample_interior(num - n_outline, seed)))
+
+        # Longitude / latitude: échelle cos(latitude moyenne) sur x
+        min_x, max_x, min_y, max_y = shape.bounds
+        aspect = np.cos(np.radians((min_y + max_y) / 2))
+        scale = target_width / ((max_x - min_x) * aspect)
+        pos = np.zeros((num, 3))
+        pos[:, 0] = (points[:, 0] - (min_x + max_x) / 2) * aspect * scale
+        pos[:, 1] = (points[:, 1] - (min_y + max_y) / 2) * scale
+        cols = np.empty((num, 3))
+        cols[:n_outline] = self.colors["blanc_pure"]
+        cols[n_outline:] = self.colors["orange_niger"]
+        return pos, cols
+
     def _is_inside_polygon(self, x, y, poly):
-        # Ray casting algorithm
-        n = len(poly)
-        inside = False
-        p1x, p1y = poly[0]
-        for i in range(n + 1):
-            p2x, p2y = poly[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-        return inside
+        # Ray casting algorithm (x, y scalaires ou tableaux de points)
+        inside = points_in_polygon(np.column_stack((np.ravel(x), np.ravel(y))), poly)
+        return bool(inside[0]) if np.ndim(x) == 0 else inside.reshape(np.shape(x))
 
 
+    @register_phase("phase8_finale", warmup_ms=50)
     def _phase_8_finale(self, num, t=0.0):
         # "LE CŒUR DE L'AFRIQUE" (Volumétrie Pulsante)
         # A living, beating heart representing Unity.
         
         # 1. Generate Base Shape (Cached)
-        if not hasattr(self, '_heart_cache'):
-             self._heart_cache = {}
-        
-        cache_key = num
-        if cache_key not in self._heart_cache:
-             # 3D Heart Formula
-             # (x^2 + 9/4 y^2 + z^2 - 1)^3 - x^2 z^3 - 9/80 y^2 z^3 = 0
-             # We use a rejection sampling or parametric approach for better distribution
-             
-             pos = []
-             # Parametric approximation for better point distribution
-             # Using a modified sphere mapping
-             count = 0
-             while count < num:
-                 # Random point in cube
-                 x = np.random.uniform(-1.5, 1.5)
-                 y = np.random.uniform(-1.5, 1.5)
-                 z = np.random.uniform(-1.5, 1.5)
-                 
-                 # Heart equation check
-                 a = x**2 + (9/4)*(y**2) + z**2 - 1
-                 if a**3 - (x**2)*(z**3) - (9/80)*(y**2)*(z**3) <= 0:
-                     pos.append([x, y, z])
-                     count += 1
-             
-             pos = np.array(pos)
-             # Scale up
-             pos *= 35.0 
-             # Center
-             pos[:, 1] += 70.0
-             
-             self._heart_cache[cache_key] = pos
-        
-        base_pos = self._heart_cache[cache_key]
+        base_pos = self._heart_base(num)[0]
         
         # 2. Animation: Heartbeat (Systole/Diastole)
         # Double beat pattern: "Lub-Dub" ... pause ...
@@ -2453,7 +2583,8 @@ class FormationLibrary:
                 
         return animated_pos, cols
 
-    def _act_9_eagle(self, num, t=0.0):
+    @register_phase("act9_eagle", uses_t=True, smart_camera=True, warmup_ms=26, writes_out=True)
+    def _act_9_eagle(self, num, t=0.0, out=None):
         """
         🦅 AIGLE VIVANT EN VOL - Style Dubai/Shanghai Drone Show
         
@@ -2472,163 +2603,135 @@ class FormationLibrary:
         """
         
         # === CACHE STRUCTURE ===
-        cache_key = f"eagle_vivant_{num}"
-        if cache_key not in self._phase10_cache:
-            self._phase10_cache[cache_key] = self._generate_eagle_structure(num)
-        
-        base_pos, segment_ids, local_coords = self._phase10_cache[cache_key]
-        pos = base_pos.copy()
-        
-        # === PALETTE COULEURS RÉALISTES ===
-        COL_BRONZE_DARK = np.array([0.27, 0.13, 0.05])    # #452209 - plumes foncées
-        COL_BRONZE_MID = np.array([0.63, 0.41, 0.17])     # #A1692C - corps bronze
-        COL_BRONZE_LIGHT = np.array([0.78, 0.55, 0.25])   # Reflets dorés
-        COL_WHITE_HEAD = np.array([1.0, 1.0, 1.0])        # Tête blanche
-        COL_BEAK_YELLOW = np.array([1.0, 0.78, 0.0])      # Bec jaune/or
-        COL_EYE_GOLD = np.array([1.0, 0.85, 0.2])         # Œil doré
-        
-        # === COLORATION PAR SEGMENT ===
-        # Segments: 0=corps, 1=aile_gauche, 2=aile_droite, 3=tête, 4=bec, 5=queue, 6=pattes
-        cols = np.zeros((num, 3))
-        
-        for i in range(num):
-            seg = segment_ids[i]
-            lx, ly = local_coords[i, 0], local_coords[i, 1]
-            
-            if seg == 0:  # CORPS
-                # Gradient bronze avec effet musculaire
-                blend = np.clip((ly + 20) / 40, 0, 1)
-                cols[i] = COL_BRONZE_DARK * (1 - blend) + COL_BRONZE_MID * blend
-                
-            elif seg in [1, 2]:  # AILES
-                # Dégradé du corps vers les extrémités
-                dist_from_body = abs(lx) / 70.0
-                # Plumes primaires (extrémités) plus foncées
-                if dist_from_body > 0.7:
-                    cols[i] = COL_BRONZE_DARK * 0.8
-                elif dist_from_body > 0.4:
-                    cols[i] = COL_BRONZE_MID
-                else:
-                    cols[i] = COL_BRONZE_LIGHT
-                    
-            elif seg == 3:  # TÊTE (blanche)
-                cols[i] = COL_WHITE_HEAD
-                
-            elif seg == 4:  # BEC
-                cols[i] = COL_BEAK_YELLOW
-                
-            elif seg == 5:  # QUEUE
-                # Dégradé bronze foncé
-                cols[i] = COL_BRONZE_DARK * 0.9 + COL_BRONZE_MID * 0.1
-                
-            elif seg == 6:  # PATTES
-                cols[i] = COL_BEAK_YELLOW * 0.9
-        
+        # Structure, couleurs et coefficients d'animation par drone en cache
+        # (nuls hors de leur segment): chaque frame est une combinaison sur place
+        eagle = self._cache.get_or_build(FormationKey("mesh", "eagle_vivant", num),
+                                         lambda: self._build_eagle(num))
+        pos, cols = self._frame_buffers(num, out)
+        tmp = self._scratch("eagle", (num,))
+        pos[:] = eagle["pos"]
+
         # === ANIMATION: BATTEMENT D'AILES ===
         FLAP_FREQ = 1.2  # Hz - battement lent majestueux
-        FLAP_AMP = 15.0  # Amplitude verticale
-        FLAP_TWIST = 8.0  # Torsion en Z
-        
         flap_phase = 2 * np.pi * FLAP_FREQ * t
-        flap_wave = np.sin(flap_phase)
-        flap_wave_delayed = np.sin(flap_phase - 0.3)  # Retard pour effet élastique
-        
-        for i in range(num):
-            seg = segment_ids[i]
-            lx = local_coords[i, 0]
-            
-            if seg in [1, 2]:  # Ailes
-                # Distance normalisée depuis le corps
-                dist_factor = (abs(lx) - 10) / 60.0
-                dist_factor = np.clip(dist_factor, 0, 1)
-                
-                # Mouvement vertical (battement)
-                # Utiliser retard pour effet élastique (extrémités suivent)
-                wave_to_use = flap_wave * (1 - dist_factor * 0.3) + flap_wave_delayed * (dist_factor * 0.3)
-                y_offset = FLAP_AMP * dist_factor * wave_to_use
-                pos[i, 1] += y_offset
-                
-                # Torsion en Z (rotation des plumes)
-                z_twist = FLAP_TWIST * dist_factor * np.cos(flap_phase)
-                pos[i, 2] += z_twist
-                
-                # Légère compression horizontale lors du battement vers le bas
-                if flap_wave < 0:
-                    x_compress = 1.0 - 0.05 * abs(flap_wave) * dist_factor
-                    pos[i, 0] *= x_compress
-        
+        flap_wave = float(np.sin(flap_phase))
+        flap_wave_delayed = float(np.sin(flap_phase - 0.3))  # Retard pour effet élastique
+
+        # Mouvement vertical: les extrémités suivent avec retard (effet élastique)
+        np.multiply(eagle["wing_lift"], flap_wave, out=tmp)
+        pos[:, 1] += tmp
+        np.multiply(eagle["wing_lag"], flap_wave_delayed - flap_wave, out=tmp)
+        pos[:, 1] += tmp
+        # Torsion en Z (rotation des plumes)
+        np.multiply(eagle["wing_twist"], float(np.cos(flap_phase)), out=tmp)
+        pos[:, 2] += tmp
+        # Légère compression horizontale lors du battement vers le bas
+        if flap_wave < 0:
+            np.multiply(eagle["wing_compress"], flap_wave, out=tmp)
+            tmp += 1.0
+            pos[:, 0] *= tmp
+
         # === ANIMATION: MICRO-MOUVEMENTS TÊTE ===
         HEAD_FREQ = 0.4  # Hz - lent et alerte
-        HEAD_AMP_X = 2.0  # Rotation gauche/droite
-        HEAD_AMP_Y = 1.0  # Inclinaison
-        
-        head_rotation = HEAD_AMP_X * np.sin(2 * np.pi * HEAD_FREQ * t)
-        head_tilt = HEAD_AMP_Y * np.sin(2 * np.pi * HEAD_FREQ * 0.7 * t + 1.0)
-        
-        for i in range(num):
-            if segment_ids[i] in [3, 4]:  # Tête et bec
-                # Rotation horizontale
-                pos[i, 0] += head_rotation
-                # Inclinaison
-                pos[i, 1] += head_tilt
-        
+        head_rotation = 2.0 * np.sin(2 * np.pi * HEAD_FREQ * t)
+        head_tilt = 1.0 * np.sin(2 * np.pi * HEAD_FREQ * 0.7 * t + 1.0)
+        np.multiply(eagle["head"], float(head_rotation), out=tmp)
+        pos[:, 0] += tmp
+        np.multiply(eagle["head"], float(head_tilt), out=tmp)
+        pos[:, 1] += tmp
+
         # === ANIMATION: QUEUE ONDULANTE ===
         TAIL_FREQ = 0.8
-        TAIL_AMP = 3.0
-        
-        for i in range(num):
-            if segment_ids[i] == 5:  # Queue
-                ly = local_coords[i, 1]
-                # Plus d'ondulation vers l'extrémité
-                tail_factor = (abs(ly) - 25) / 20.0
-                tail_factor = np.clip(tail_factor, 0, 1)
-                tail_wave = TAIL_AMP * tail_factor * np.sin(2 * np.pi * TAIL_FREQ * t + ly * 0.1)
-                pos[i, 2] += tail_wave
-        
+        np.add(eagle["tail_phase"], 2 * np.pi * TAIL_FREQ * t, out=tmp)
+        np.sin(tmp, out=tmp)
+        tmp *= eagle["tail_amp"]
+        pos[:, 2] += tmp
+
         # === ANIMATION: PATTES (ouverture/fermeture serres) ===
         CLAW_FREQ = 0.6
         claw_state = 0.5 + 0.5 * np.sin(2 * np.pi * CLAW_FREQ * t)
-        
-        for i in range(num):
-            if segment_ids[i] == 6:  # Pattes
-                lx = local_coords[i, 0]
-                # Écarter/rapprocher les serres
-                sign = 1 if lx > 0 else -1
-                pos[i, 0] += sign * 2.0 * claw_state
-        
+        np.multiply(eagle["claw_dir"], float(claw_state), out=tmp)
+        pos[:, 0] += tmp
+
         # === ANIMATION: HOVER GLOBAL ===
-        hover = 3.0 * np.sin(t * 0.8)
-        pos[:, 1] += hover
-        
+        pos[:, 1] += float(3.0 * np.sin(t * 0.8))
+
         # === ANIMATION: COMPRESSION CORPS (effet musculaire) ===
-        body_compress = 1.0 + 0.03 * flap_wave
-        for i in range(num):
-            if segment_ids[i] == 0:  # Corps
-                pos[i, 1] *= body_compress
-        
+        np.multiply(pos[:, 1], 1.0 + 0.03 * flap_wave, out=pos[:, 1], where=eagle["body"])
+
         # === EFFETS LUMINEUX: SCINTILLEMENT PLUMES ===
         SHIMMER_FREQ = 6.0
-        SHIMMER_AMP = 0.12
-        
-        for i in range(num):
-            if segment_ids[i] in [1, 2]:  # Ailes
-                phase_offset = local_coords[i, 0] * 0.05 + local_coords[i, 1] * 0.03
-                shimmer = 1.0 + SHIMMER_AMP * np.sin(2 * np.pi * SHIMMER_FREQ * t + phase_offset)
-                cols[i] *= shimmer
-        
-        # === BLOOM SUR TÊTE BLANCHE ET YEUX ===
-        for i in range(num):
-            if segment_ids[i] == 3:  # Tête
-                # Léger bloom constant
-                cols[i] *= 1.15
-            elif segment_ids[i] == 4:  # Bec
-                cols[i] *= 1.1
-        
+        np.add(eagle["shimmer_phase"], 2 * np.pi * SHIMMER_FREQ * t, out=tmp)
+        np.sin(tmp, out=tmp)
+        tmp *= eagle["shimmer_amp"]
+        tmp += 1.0
+        for k in range(3):
+            np.multiply(eagle["cols"][:, k], tmp, out=cols[:, k])
+
         # === CLAMP FINAL ===
-        cols = np.clip(cols, 0.0, 1.5)
-        
+        np.clip(cols, 0.0, 1.5, out=cols)
+
         return pos, cols
-    
+
+    def _build_eagle(self, num):
+        """
+        Partie statique de l'aigle (float32): positions, couleurs (bloom tête et
+        bec inclus) et, par drone, les coefficients des animations de son segment.
+        Segments: 0=corps, 1=aile_gauche, 2=aile_droite, 3=tête, 4=bec, 5=queue, 6=pattes
+        """
+        pos, segment_ids, local_coords = self._generate_eagle_structure(num)
+        lx, ly = local_coords[:, 0], local_coords[:, 1]
+        body, wing, head, beak = segment_ids == 0, np.isin(segment_ids, (1, 2)), segment_ids == 3, segment_ids == 4
+        tail, legs = segment_ids == 5, segment_ids == 6
+
+        # === PALETTE COULEURS RÉALISTES ===
+        COL_BRONZE_DARK = np.array([0.27, 0.13, 0.05])    # #452209 - plumes foncées
+        COL_BRONZE_MID = np.array([0.63, 0.41, 0.17])     # #A1692C - corps bronze
+        COL_BRONZE_LIGHT = np.array([0.78, 0.55, 0.25])   # Reflets dorés
+        COL_WHITE_HEAD = np.array([1.0, 1.0, 1.0])        # Tête blanche
+        COL_BEAK_YELLOW = np.array([1.0, 0.78, 0.0])      # Bec jaune/or
+
+        # === COLORATION PAR SEGMENT ===
+        cols = np.zeros((num, 3))
+        # CORPS: gradient bronze avec effet musculaire
+        blend = np.clip((ly + 20) / 40, 0, 1)[:, None]
+        cols[body] = (COL_BRONZE_DARK * (1 - blend) + COL_BRONZE_MID * blend)[body]
+        # AILES: plumes primaires (extrémités) plus foncées
+        dist_from_body = np.abs(lx) / 70.0
+        cols[wing] = COL_BRONZE_LIGHT
+        cols[wing & (dist_from_body > 0.4)] = COL_BRONZE_MID
+        cols[wing & (dist_from_body > 0.7)] = COL_BRONZE_DARK * 0.8
+        # TÊTE (blanche) et BEC, avec léger bloom constant
+        cols[head] = COL_WHITE_HEAD * 1.15
+        cols[beak] = COL_BEAK_YELLOW * 1.1
+        # QUEUE: dégradé bronze foncé, PATTES: jaune
+        cols[tail] = COL_BRONZE_DARK * 0.9 + COL_BRONZE_MID * 0.1
+        cols[legs] = COL_BEAK_YELLOW * 0.9
+
+        # Ailes: distance normalisée depuis le corps, battement (15m), torsion (8m)
+        # y += 15 d (w (1 - 0.3 d) + w_retard 0.3 d),  x *= 1 - 0.05 |w| d (w < 0)
+        d = np.where(wing, np.clip((np.abs(lx) - 10) / 60.0, 0, 1), 0.0)
+        # Queue: plus d'ondulation (3m) vers l'extrémité
+        tail_factor = np.where(tail, np.clip((np.abs(ly) - 25) / 20.0, 0, 1), 0.0)
+
+        eagle = {
+            "pos": pos,
+            "cols": cols,
+            "wing_lift": 15.0 * d,
+            "wing_lag": 15.0 * 0.3 * d * d,
+            "wing_twist": 8.0 * d,
+            "wing_compress": 0.05 * d,
+            "head": (head | beak).astype(float),
+            "tail_amp": 3.0 * tail_factor,
+            "tail_phase": ly * 0.1,
+            "claw_dir": np.where(legs, np.where(lx > 0, 2.0, -2.0), 0.0),
+            "shimmer_amp": np.where(wing, 0.12, 0.0),
+            "shimmer_phase": lx * 0.05 + ly * 0.03,
+        }
+        eagle = {name: value.astype(np.float32) for name, value in eagle.items()}
+        eagle["body"] = body
+        return eagle
+
     def _generate_eagle_structure(self, num):
         """
         Génère la structure anatomique détaillée de l'aigle:
@@ -2641,6 +2744,7 @@ class FormationLibrary:
         
         Returns: (positions, segment_ids, local_coords)
         """
+        rng = np.random.default_rng(2668 + num)  # Structure en cache: graine fixe
         
         # === DIMENSIONS ===
         WINGSPAN = 140.0          # Envergure totale
@@ -2674,8 +2778,8 @@ class FormationLibrary:
             if idx >= num:
                 break
             # Distribution sur ellipsoïde
-            u = np.random.uniform(0, 2 * np.pi)
-            v = np.random.uniform(-1, 1)
+            u = rng.uniform(0, 2 * np.pi)
+            v = rng.uniform(-1, 1)
             
             x = BODY_WIDTH * 0.5 * np.sqrt(1 - v*v) * np.cos(u)
             y = BODY_LENGTH * 0.5 * v
@@ -2711,7 +2815,7 @@ class FormationLibrary:
                 wing_chord = 25 * (1 - t_along * 0.6)  # Corde diminue vers l'extrémité
                 
                 # Position Y dans la corde de l'aile
-                y_in_chord = np.random.uniform(-0.3, 0.7)  # Plus de drones vers le haut
+                y_in_chord = rng.uniform(-0.3, 0.7)  # Plus de drones vers le haut
                 y_offset = y_in_chord * wing_chord
                 
                 # Courbure naturelle de l'aile
@@ -2720,7 +2824,7 @@ class FormationLibrary:
                 y = CENTER_Y + y_offset + curve
                 
                 # Profondeur Z pour volume
-                z = np.random.uniform(-3, 3) * (1 - t_along * 0.5)
+                z = rng.uniform(-3, 3) * (1 - t_along * 0.5)
                 
                 # Détail plumes: ondulation sur le bord de fuite
                 if y_in_chord < -0.1:  # Bord de fuite (plumes visibles)
@@ -2740,10 +2844,10 @@ class FormationLibrary:
                 break
             
             # Distribution sur sphère
-            u = np.random.uniform(0, 2 * np.pi)
-            v = np.random.uniform(-0.3, 1)  # Plus de drones vers le haut/avant
+            u = rng.uniform(0, 2 * np.pi)
+            v = rng.uniform(-0.3, 1)  # Plus de drones vers le haut/avant
             
-            r = HEAD_RADIUS * (0.8 + 0.2 * np.random.random())  # Légère variation
+            r = HEAD_RADIUS * (0.8 + 0.2 * rng.random())  # Légère variation
             
             x = r * np.sqrt(1 - v*v) * np.cos(u) * 0.9
             y = r * v
@@ -2770,7 +2874,7 @@ class FormationLibrary:
             
             x = 8 + t_beak * 6  # Pointe vers l'avant
             y = HEAD_Y + CENTER_Y - 2 - t_beak * 3  # Légèrement incliné vers le bas
-            z = np.random.uniform(-1, 1) * (1 - t_beak)  # Plus fin vers la pointe
+            z = rng.uniform(-1, 1) * (1 - t_beak)  # Plus fin vers la pointe
             
             pos[idx] = [x, y, z]
             segment_ids[idx] = 4
@@ -2783,12 +2887,12 @@ class FormationLibrary:
                 break
             
             # Distribution en éventail
-            angle = np.random.uniform(-0.6, 0.6)  # Angle d'éventail
-            t_tail = np.random.uniform(0, 1)  # Distance du corps
+            angle = rng.uniform(-0.6, 0.6)  # Angle d'éventail
+            t_tail = rng.uniform(0, 1)  # Distance du corps
             
             x = np.sin(angle) * TAIL_LENGTH * t_tail
             y = CENTER_Y - 20 - np.cos(angle) * TAIL_LENGTH * t_tail
-            z = np.random.uniform(-2, 2)
+            z = rng.uniform(-2, 2)
             
             # Structure des plumes de queue
             feather_idx = int(abs(angle) / 0.15)
@@ -2841,6 +2945,7 @@ class FormationLibrary:
         
         return pos, segment_ids, local_coords
 
+    @register_phase("phase9_agadez", camera_preset="monument", warmup_ms=45)
     def _phase_9_agadez(self, num):
         # "La Grande Mosquée d'Agadez" - Solid Image Rendering
         # Front-facing silhouette with tapering tower and torons
@@ -2849,29 +2954,28 @@ class FormationLibrary:
             # 1. Main Tower (Tapering)
             # Base width 34, Top width 8, Height 90, starts at Y=20
             h = ly - 20
-            if 0 <= h <= 90:
-                w_curr = 34.0 * (1 - h/90.0) + 8.0 * (h/90.0)
-                if abs(lx) <= w_curr / 2: return True
-                
-                # 2. Torons (Beams)
-                # Every 8 meters vertically
-                if abs(h % 8 - 4) < 1.0: # Horizontal bars
-                    if abs(lx) <= w_curr / 2 + 5.0: return True
-            
+            w_curr = 34.0 * (1 - h/90.0) + 8.0 * (h/90.0)
+            tower = (0 <= h) & (h <= 90) & (
+                (np.abs(lx) <= w_curr / 2) |
+                # 2. Torons (Beams): horizontal bars every 8 meters vertically
+                ((np.abs(h % 8 - 4) < 1.0) & (np.abs(lx) <= w_curr / 2 + 5.0))
+            )
+
             # 3. Base Building
-            if (0 <= ly <= 20) and (-50 <= lx <= 50): return True
-            
-            return False
+            base = (0 <= ly) & (ly <= 20) & (-50 <= lx) & (lx <= 50)
+            return tower | base
 
         pos, cols = self._fill_shape_uniformly(is_in_mosque, (-60, 60, 0, 110), num, center=(0, 20, 0), z_depth=15.0)
         # Apply Miroir Céleste Colors (Gold/Orange mix)
         cols = np.tile(self.colors["soleil_or"], (num, 1))
         # Random mix with orange for a "living" building look
-        orange_indices = np.random.rand(num) > 0.8
+        orange_indices = self._frame_rng.random(num) > 0.8
         cols[orange_indices] = self.colors["orange_niger"]
         return pos, cols
 
-    def _phase_10_touareg(self, num, t=0.0):
+    @register_phase("phase10_touareg", uses_t=True, camera_preset="intimate", warmup_ms=330, morph=True,
+                    writes_out=True)
+    def _phase_10_touareg(self, num, t=0.0, out=None):
         """
         � DROMADAIRE LUMINEUX EN MARCHE – SPÉCIFICATION COMPLÈTE
         
@@ -2908,376 +3012,28 @@ class FormationLibrary:
         • Points clés: Blanc intense + bloom
         
         💡 MOUVEMENTS SECONDAIRES:
-        ──────────────────────────
-        • Bosse: oscillation verticale ±3°
-        • Cou: ondulation horizontale
-        • Queue: balancement à contre-temps
-        • Tête: hochement rythmique
-        
-        Dimensions: ~150m (L) × 90m (H)
-        ═══════════════════════════════════════════════════════════════
-        """
-
-        # === CONSTRUCTION DU MESH (UNE SEULE FOIS) ===
-        if num not in self._phase10_cache:
-            rng = np.random.default_rng(42 + num)
-            from scipy.interpolate import splprep, splev
-            from matplotlib.path import Path
-
-            # ════════════════════════════════════════════════════════════
-            # 1. CONTOUR MAÎTRE SVG – 120+ points de contrôle
-            # ════════════════════════════════════════════════════════════
-            # Profil strict, sens horaire depuis queue
-            # Échelle: ~140m × 80m
-            
-            raw_contour = np.array([
-                # ─── QUEUE (fine, courbée vers le haut) ───
-                [-68, 48], [-66, 52], [-64, 54], [-61, 53], [-58, 50], [-55, 47],
-                
-                # ─── CROUPE (descendante vers bosse) ───
-                [-52, 44], [-48, 41], [-44, 38], [-40, 36], [-36, 35],
-                
-                # ─── BOSSE UNIQUE (dromadaire = 1 bosse haute et marquée) ───
-                [-30, 36], [-24, 40], [-18, 46], [-12, 54], [-6, 60],
-                [0, 64], [6, 66],  # Sommet de la bosse
-                [12, 64], [18, 58], [24, 50], [28, 44],
-                
-                # ─── DOS vers ENCOLURE ───
-                [32, 42], [36, 42],
-                
-                # ─── ENCOLURE (longue, courbure élégante) ───
-                [40, 44], [44, 50], [48, 58], [52, 66], [56, 74], [58, 80],
-                
-                # ─── TÊTE (profil caractéristique avec chanfrein) ───
-                [60, 84], [64, 86], [68, 85], [72, 82],  # Crâne arrondi
-                [75, 78], [78, 74],  # Front
-                [80, 70], [82, 66],  # Chanfrein (ligne du nez)
-                [84, 62], [85, 58],  # Nez/museau
-                [84, 54], [82, 51],  # Lèvre supérieure
-                [79, 49], [76, 48], [73, 49],  # Menton
-                
-                # ─── GORGE (descente vers poitrail) ───
-                [70, 52], [66, 56], [62, 60], [58, 62],
-                [54, 62], [50, 58], [46, 52], [42, 46],
-                
-                # ─── POITRAIL ───
-                [40, 42], [38, 36], [36, 30],
-                
-                # ═══ PATTE AVANT DROITE (FR) – bien séparée ═══
-                [35, 26], [34, 20], [33, 14], [32, 8], [31, 2], [30, -2],
-                [28, -2], [27, 0],  # Sabot FR
-                [26, 6], [25, 14], [24, 22], [23, 28],
-                
-                # ─── ESPACE ENTRE PATTES AVANT (ventre visible) ───
-                [20, 30], [17, 30], [14, 30],
-                
-                # ═══ PATTE AVANT GAUCHE (FL) ═══
-                [12, 28], [11, 22], [10, 14], [9, 6], [8, 0], [7, -2],
-                [5, -2], [4, 0],  # Sabot FL
-                [3, 8], [2, 16], [1, 24],
-                
-                # ─── VENTRE (ligne basse) ───
-                [-2, 26], [-8, 24], [-14, 22], [-20, 20], [-26, 18],
-                
-                # ═══ PATTE ARRIÈRE DROITE (RR) ═══
-                [-30, 18], [-31, 12], [-32, 6], [-33, 0], [-34, -2],
-                [-36, -2], [-37, 0],  # Sabot RR
-                [-38, 8], [-39, 16], [-40, 24],
-                
-                # ─── ESPACE ENTRE PATTES ARRIÈRE ───
-                [-43, 26], [-46, 26], [-49, 26],
-                
-                # ═══ PATTE ARRIÈRE GAUCHE (RL) ═══
-                [-52, 24], [-53, 18], [-54, 10], [-55, 4], [-56, -2],
-                [-58, -2], [-59, 2],  # Sabot RL
-                [-60, 10], [-61, 20], [-62, 30],
-                
-                # ─── REMONTÉE VERS QUEUE ───
-                [-64, 36], [-66, 42], [-68, 48],
-            ], dtype=float)
-
-            # B-spline lissage → 600 points haute définition
-            try:
-                tck, _ = splprep([raw_contour[:, 0], raw_contour[:, 1]], s=2.0, per=True, k=3)
-                u_hd = np.linspace(0, 1, 600)
-                contour_smooth = np.column_stack(splev(u_hd, tck))
-            except Exception:
-                contour_smooth = raw_contour.copy()
-
-            # ════════════════════════════════════════════════════════════
-            # 2. ÉCHANTILLONNAGE – RÉPARTITION OPTIMISÉE 40/40/20
-            # ════════════════════════════════════════════════════════════
-            n_contour = int(num * 0.40)   # 40% sur le contour
-            n_interior = int(num * 0.40)  # 40% remplissage intérieur
-            n_keypoints = num - n_contour - n_interior  # 20% points clés
-            
-            clen = len(contour_smooth)
-            density = np.ones(clen)
-            
-            # Identifier les zones par position X approximative
-            xs = contour_smooth[:, 0]
-            ys = contour_smooth[:, 1]
-            
-            # Queue (×3)
-            density[(xs < -60)] *= 3.0
-            # Bosse (×2.5)
-            density[(xs > -20) & (xs < 20) & (ys > 50)] *= 2.5
-            # Tête/museau (×3)
-            density[(xs > 70)] *= 3.0
-            # Cou (×2)
-            density[(xs > 50) & (xs < 70) & (ys > 60)] *= 2.0
-            # Sabots/genoux (×3) - zones basses des pattes
-            density[(ys < 10)] *= 3.0
-            
-            # Échantillonnage pondéré
-            cumsum = np.cumsum(density)
-            cumsum /= cumsum[-1]
-            sample_u = np.linspace(0, 1, n_contour)
-            idx_sample = np.searchsorted(cumsum, sample_u)
-            idx_sample = np.clip(idx_sample, 0, clen - 1)
-            pts_contour = contour_smooth[idx_sample].copy()
-
-            # ════════════════════════════════════════════════════════════
-            # 3. REMPLISSAGE POISSON-DISC CONTRAINT
-            # ════════════════════════════════════════════════════════════
-            poly_path = Path(contour_smooth)
-            
-            bx_min, bx_max = xs.min() - 2, xs.max() + 2
-            by_min, by_max = ys.min() - 2, ys.max() + 2
-
-            # Zones d'exclusion : espaces entre pattes = moins dense
-            def exclusion_weight(x, y):
-                """Retourne 0-1, 0 = exclure, 1 = garder"""
-                w = 1.0
-                # Entre pattes avant (x: 14-20, y < 32)
-                if 14 < x < 20 and y < 32:
-                    w *= 0.15
-                # Entre pattes arrière (x: -49 à -43, y < 28)
-                if -49 < x < -43 and y < 28:
-                    w *= 0.15
-                # Ventre central = léger
-                if -26 < x < 0 and 18 < y < 28:
-                    w *= 0.4
-                return w
-
-            # Génération Poisson-disc simplifiée avec rejection
-            interior_pts = []
-            batch = max(n_interior * 12, 10000)
-            
-            for _ in range(20):
-                if len(interior_pts) >= n_interior:
-                    break
-                
-                xs_rand = rng.uniform(bx_min, bx_max, batch)
-                ys_rand = rng.uniform(by_min, by_max, batch)
-                candidates = np.column_stack((xs_rand, ys_rand))
-                
-                inside_mask = poly_path.contains_points(candidates)
-                valid = candidates[inside_mask]
-                
-                if len(valid) == 0:
-                    continue
-                
-                # Appliquer pondération d'exclusion
-                probs = np.array([exclusion_weight(p[0], p[1]) for p in valid])
-                
-                # Densité additionnelle : bosse et tête plus denses
-                for i, p in enumerate(valid):
-                    # Bosse
-                    if -15 < p[0] < 15 and p[1] > 45:
-                        probs[i] *= 1.8
-                    # Tête
-                    if p[0] > 60 and p[1] > 50:
-                        probs[i] *= 1.6
-                
-                probs = np.clip(probs, 0.05, 1.0)
-                accept = rng.random(len(valid)) < probs
-                interior_pts.extend(valid[accept].tolist())
-            
-            interior_pts = np.array(interior_pts[:n_interior]) if len(interior_pts) >= n_interior else (
-                np.array(interior_pts) if len(interior_pts) > 0 else np.zeros((0, 2))
-            )
+        ──────────────────────────
+        • Bosse: oscillation verticale ±3°
+        • Cou: ondulation horizontale
+        • Queue: balancement à contre-temps
+        • Tête: hochement rythmique
+        
+        Dimensions: ~150m (L) × 90m (H)
+        ═══════════════════════════════════════════════════════════════
+        """
 
-            # Compléter si nécessaire avec grille
-            if len(interior_pts) < n_interior:
-                needed = n_interior - len(interior_pts)
-                res = int(np.sqrt(needed * 4)) + 10
-                gx = np.linspace(bx_min, bx_max, res)
-                gy = np.linspace(by_min, by_max, res)
-                gxx, gyy = np.meshgrid(gx, gy)
-                grid = np.column_stack((gxx.ravel(), gyy.ravel()))
-                inside = poly_path.contains_points(grid)
-                grid_valid = grid[inside]
-                if len(grid_valid) >= needed:
-                    pick = rng.choice(len(grid_valid), needed, replace=False)
-                    extra = grid_valid[pick]
-                else:
-                    extra = grid_valid
-                interior_pts = np.vstack([interior_pts, extra]) if len(interior_pts) > 0 else extra
-
-            # ════════════════════════════════════════════════════════════
-            # 4. ASSEMBLAGE + SEGMENTATION ANATOMIQUE
-            # ════════════════════════════════════════════════════════════
-            pts_contour += rng.normal(0, 0.3, pts_contour.shape)
-            if len(interior_pts) > 0:
-                interior_pts += rng.normal(0, 0.6, interior_pts.shape)
-
-            all_2d = np.vstack([pts_contour, interior_pts]) if len(interior_pts) > 0 else pts_contour
-
-            # Ajuster au nombre exact
-            if len(all_2d) < num:
-                shortage = num - len(all_2d)
-                idx_dup = rng.choice(len(all_2d), shortage, replace=True)
-                jitter = rng.normal(0, 0.5, (shortage, 2))
-                all_2d = np.vstack([all_2d, all_2d[idx_dup] + jitter])
-            elif len(all_2d) > num:
-                all_2d = all_2d[:num]
-
-            # 3D (profil strict)
-            base_pos = np.zeros((num, 3))
-            base_pos[:, 0] = all_2d[:, 0]
-            base_pos[:, 1] = all_2d[:, 1] + 8  # Élever au-dessus du sol
-            base_pos[:, 2] = rng.uniform(-1.5, 1.5, num)  # Faible profondeur
-
-            # ═══════════════════════════════════════════════════════════
-            # SEGMENTATION ANATOMIQUE STRICTE – ZONES X ABSOLUES
-            # ═══════════════════════════════════════════════════════════
-            # Basé sur le contour SVG réel:
-            # - Pattes avant FR: X ~ 23-36 (contour original)
-            # - Pattes avant FL: X ~ 1-14
-            # - Pattes arrière RR: X ~ -40 à -28
-            # - Pattes arrière RL: X ~ -62 à -50
-            
-            px, py = base_pos[:, 0], base_pos[:, 1]
-            
-            # Ligne du ventre (sépare pattes du corps)
-            BELLY_Y = 32  # Y en dessous duquel = pattes
-            
-            # ─── PATTES AVANT (côté droit, X positif) ───
-            seg_leg_fr = (px >= 22) & (px <= 37) & (py < BELLY_Y)  # Patte avant droite
-            seg_leg_fl = (px >= 0) & (px <= 15) & (py < BELLY_Y)   # Patte avant gauche
-            
-            # ─── PATTES ARRIÈRE (côté gauche, X négatif) ───
-            seg_leg_rr = (px >= -42) & (px <= -27) & (py < BELLY_Y - 2)  # Patte arrière droite
-            seg_leg_rl = (px >= -65) & (px <= -48) & (py < BELLY_Y)      # Patte arrière gauche
-            
-            # ─── TÊTE (extrémité droite, haute) ───
-            seg_head = (px >= 70) & (py >= 55)
-            
-            # ─── COU (entre tête et épaule) ───
-            seg_neck = (px >= 50) & (px < 70) & (py >= 50) & ~seg_head
-            
-            # ─── BOSSE (zone centrale haute) ───
-            seg_hump = (px >= -20) & (px <= 25) & (py >= 62)
-            
-            # ─── QUEUE (extrémité gauche) ───
-            seg_tail = (px <= -60) & (py >= 48)
-            
-            # ─── TORSE (tout le reste) ───
-            seg_torso = ~(seg_head | seg_neck | seg_hump | seg_tail | 
-                          seg_leg_fr | seg_leg_fl | seg_leg_rr | seg_leg_rl)
-            
-            # ─── Points de pivot pour animation (hanches au niveau BELLY_Y) ───
-            pivots = {
-                "hip_fr": np.array([29.5, BELLY_Y]),   # Centre de la zone FR
-                "hip_fl": np.array([7.5, BELLY_Y]),    # Centre de la zone FL
-                "hip_rr": np.array([-34.5, BELLY_Y - 2]),  # Centre de la zone RR
-                "hip_rl": np.array([-56.5, BELLY_Y]),  # Centre de la zone RL
-                "neck_base": np.array([42, 50]),
-                "tail_base": np.array([-62, 50]),
-                # Points d'articulation critiques pour bloom
-                "shoulder": np.array([35, 34]),     # Épaule
-                "knee_fr": np.array([31, 12]),      # Genou avant droit
-                "knee_fl": np.array([8, 12]),       # Genou avant gauche
-                "knee_rr": np.array([-35, 10]),     # Genou arrière droit
-                "knee_rl": np.array([-57, 10]),     # Genou arrière gauche
-                "eye": np.array([75, 78]),          # Œil
-                "muzzle": np.array([85, 56]),       # Museau
-            }
-            
-            # ─── Points clés (articulations + œil + museau) pour haute densité ───
-            keypoint_centers = [
-                pivots["shoulder"], pivots["hip_fr"], pivots["hip_fl"],
-                pivots["hip_rr"], pivots["hip_rl"],
-                pivots["knee_fr"], pivots["knee_fl"], pivots["knee_rr"], pivots["knee_rl"],
-                pivots["eye"], pivots["muzzle"], pivots["neck_base"], pivots["tail_base"],
-            ]
-            
-            # Marquer les drones proches des points clés
-            keypoint_radius = 6.0
-            is_keypoint = np.zeros(num, dtype=bool)
-            for kp in keypoint_centers:
-                dist = np.sqrt((px - kp[0])**2 + (py - kp[1] - 8)**2)  # -8 pour offset Y
-                is_keypoint |= (dist < keypoint_radius)
-
-            # ════════════════════════════════════════════════════════════
-            # 5. PALETTE DE COULEURS ENRICHIE
-            # ════════════════════════════════════════════════════════════
-            # Corps principal : Blanc pur (6000K) → RGB(1.0, 1.0, 1.0)
-            # Zones inférieures : Orange chaud (3500K) → RGB(1.0, 0.75, 0.45)
-            # Contours : Bleu froid accent (7000K) → RGB(0.85, 0.92, 1.0)
-            # Points clés : Blanc intense + bloom
-            
-            base_cols = np.zeros((num, 3))
-            
-            # ─── Contour: Bleu froid accent (7000K) pour silhouette nette ───
-            cool_blue = np.array([0.88, 0.94, 1.0])
-            base_cols[:n_contour] = cool_blue * 1.10
-            
-            # ─── Intérieur: Dégradé blanc pur → orange chaud ───
-            if len(interior_pts) > 0:
-                y_int = base_pos[n_contour:n_contour + len(interior_pts), 1]
-                y_min, y_max = y_int.min(), max(y_int.max(), y_int.min() + 1)
-                y_norm = (y_int - y_min) / (y_max - y_min)
-                
-                warm_orange = np.array([1.0, 0.75, 0.45])   # Bas: 3500K orange chaud
-                pure_white = np.array([1.0, 1.0, 1.0])      # Haut: 6000K blanc pur
-                
-                blend = y_norm[:, None]
-                base_cols[n_contour:n_contour + len(interior_pts)] = warm_orange * (1 - blend) + pure_white * blend
-            
-            # ─── Pattes: glow fort pour visibilité ───
-            for seg in [seg_leg_fr, seg_leg_fl, seg_leg_rr, seg_leg_rl]:
-                base_cols[seg] *= 1.12
-            
-            # ─── Points clés (articulations, œil, museau): Blanc intense + bloom ───
-            intense_white = np.array([1.0, 1.0, 1.0])
-            base_cols[is_keypoint] = intense_white * 1.25  # Surbrillance bloom
-            
-            # ─── Bosse: Point focal brillant ───
-            base_cols[seg_hump] = np.array([1.0, 0.98, 0.92]) * 1.15
-            
-            # ─── Tête et cou: Blanc pur légèrement accentué ───
-            base_cols[seg_head] = np.array([1.0, 1.0, 0.98]) * 1.10
-            base_cols[seg_neck] = np.array([1.0, 0.98, 0.95]) * 1.05
-            
-            base_cols = np.clip(base_cols, 0, 1)
-
-            self._phase10_cache[num] = {
-                "pos": base_pos.copy(),
-                "cols": base_cols.copy(),
-                "n_contour": n_contour,
-                "seg_head": seg_head,
-                "seg_neck": seg_neck,
-                "seg_hump": seg_hump,
-                "seg_tail": seg_tail,
-                "seg_leg_fr": seg_leg_fr,
-                "seg_leg_fl": seg_leg_fl,
-                "seg_leg_rr": seg_leg_rr,
-                "seg_leg_rl": seg_leg_rl,
-                "seg_torso": seg_torso,
-                "pivots": pivots,
-                "is_keypoint": is_keypoint,  # Points clés pour bloom
-            }
+        # Mesh, segments et coefficients de marche en cache (voir _build_touareg)
+        camel = self._cache.get_or_build(FormationKey("mesh", "touareg_dromadaire", num),
+                                         lambda: self._build_touareg(num))
+        animated, cols = self._frame_buffers(num, out)
+        cos_step, sin_step, lift_step, tmp, glow = self._scratch("phase10_touareg", (5, num))
+        x, y, z = animated[:, 0], animated[:, 1], animated[:, 2]
+        n_contour = camel["n_contour"]
 
         # ════════════════════════════════════════════════════════════
         # ANIMATION MARCHE BIOMÉCANIQUE – GAIT LATÉRAL AUTHENTIQUE
         # ════════════════════════════════════════════════════════════
-        cached = self._phase10_cache[num]
-        animated = cached["pos"].copy()
-        cols = cached["cols"].copy()
-        n_contour = cached["n_contour"]
-        pivots = cached["pivots"]
+        animated[:] = camel["pos"]
 
         # ═══════════════════════════════════════════════════════════
         # CYCLE DE MARCHE 4 PHASES (2.0 secondes = réaliste dromadaire)
@@ -3289,22 +3045,10 @@ class FormationLibrary:
         
         CYCLE_DURATION = 2.0
         phi = (t % CYCLE_DURATION) / CYCLE_DURATION  # Phase normalisée 0→1
-        
-        # Identifier la phase actuelle (1-4)
-        current_phase_num = int(phi * 4) + 1  # 1, 2, 3, ou 4
-        phase_progress = (phi * 4) % 1.0      # Progression dans la phase (0→1)
-
-        # ───────────────────────────────────────────────────────────
-        # INTERPOLATION MINIMUM-JERK: s(t) = 10t³ - 15t⁴ + 6t⁵
-        # → Accélération douce, zéro à-coup
-        # ───────────────────────────────────────────────────────────
-        def min_jerk(x):
-            """Interpolation minimum-jerk pour mouvement naturel."""
-            x = np.clip(x, 0, 1)
-            return 10 * x**3 - 15 * x**4 + 6 * x**5
 
         # ───────────────────────────────────────────────────────────
         # TRAJECTOIRE DE PATTE (elliptique avec phase aérienne/sol)
+        # INTERPOLATION MINIMUM-JERK: s(t) = 10t³ - 15t⁴ + 6t⁵
         # ───────────────────────────────────────────────────────────
         def leg_trajectory(phase_offset, step_len=8.0, lift_height=6.0):
             """
@@ -3333,215 +3077,570 @@ class FormationLibrary:
             return dx, dz
 
         # ═══════════════════════════════════════════════════════════
-        # GAIT LATÉRAL (AMBLE) – CHAMEAU AUTHENTIQUE
+        # GAIT LATÉRAL (AMBLE) – CHAMEAU AUTHENTIQUE (TOUAREG_LEGS)
         # ═══════════════════════════════════════════════════════════
-        # FL + RL ensemble (côté gauche)
-        # FR + RR ensemble (côté droit), déphasé de 0.5
-        
-        PHASE_LEFT = 0.0    # Côté gauche: phase 0
-        PHASE_RIGHT = 0.5   # Côté droit: phase 0.5
-
-        def animate_leg(mask, pivot, phase_offset, step_len=8.0, lift_height=6.0, swing_amp=0.20):
-            """
-            Anime une patte avec:
-            - Rotation autour de la hanche (swing)
-            - Translation avant/arrière (step)
-            - Élévation pendant phase aérienne (lift)
-            """
-            if not np.any(mask):
-                return
-            
-            # Calculer trajectoire
-            dx_step, dz_lift = leg_trajectory(phase_offset, step_len, lift_height)
-            
-            # Phase locale pour swing
-            local_phi = (phi + phase_offset) % 1.0
-            swing_angle = swing_amp * np.sin(2 * np.pi * local_phi)
-            
-            # Rotation autour de la hanche
-            cos_a, sin_a = np.cos(swing_angle), np.sin(swing_angle)
-            rel_x = animated[mask, 0] - pivot[0]
-            rel_y = animated[mask, 1] - pivot[1]
-            
-            # Appliquer rotation
-            new_x = pivot[0] + rel_x * cos_a - rel_y * sin_a
-            new_y = pivot[1] + rel_x * sin_a + rel_y * cos_a
-            
-            animated[mask, 0] = new_x
-            animated[mask, 1] = new_y
-            
-            # Appliquer élévation (plus forte au sabot qu'à la cuisse)
-            dist_from_hip = np.sqrt(rel_x**2 + rel_y**2)
-            lift_factor = np.clip(dist_from_hip / 25.0, 0.2, 1.0)
-            animated[mask, 1] += dz_lift * lift_factor
-
-        # ─── Animer les 4 pattes ───
-        # Côté gauche (FL + RL) ensemble
-        animate_leg(cached["seg_leg_fl"], pivots["hip_fl"], PHASE_LEFT, step_len=7.0, lift_height=5.5, swing_amp=0.18)
-        animate_leg(cached["seg_leg_rl"], pivots["hip_rl"], PHASE_LEFT, step_len=6.5, lift_height=5.0, swing_amp=0.16)
-        
-        # Côté droit (FR + RR) ensemble, déphasé de 0.5
-        animate_leg(cached["seg_leg_fr"], pivots["hip_fr"], PHASE_RIGHT, step_len=7.0, lift_height=5.5, swing_amp=0.18)
-        animate_leg(cached["seg_leg_rr"], pivots["hip_rr"], PHASE_RIGHT, step_len=6.5, lift_height=5.0, swing_amp=0.16)
+        # Rotation de chaque patte autour de sa hanche (swing) + élévation pendant
+        # la phase aérienne (plus forte au sabot qu'à la cuisse), constantes par
+        # patte (nulles hors pattes), appliquées avec la position relative à la
+        # hanche: x += rel_x (cos - 1) - rel_y sin,  y += rel_x sin + rel_y (cos - 1) + dz lift
+        cos_step[:] = 0.0
+        sin_step[:] = 0.0
+        lift_step[:] = 0.0
+        for leg, (_, phase_offset, step_len, lift_height, swing_amp) in enumerate(self.TOUAREG_LEGS):
+            _, dz_lift = leg_trajectory(phase_offset, step_len, lift_height)
+            swing_angle = swing_amp * np.sin(2 * np.pi * ((phi + phase_offset) % 1.0))
+            mask = camel["legs"][leg]
+            np.copyto(cos_step, np.cos(swing_angle) - 1.0, where=mask)
+            np.copyto(sin_step, np.sin(swing_angle), where=mask)
+            np.copyto(lift_step, dz_lift, where=mask)
+        
+        # ─── QUEUE: balancement à contre-temps, même rotation autour de sa base ───
+        # Quand pattes gauches avancent → queue va à droite, et inversement
+        tail_mask = camel["tail_mask"]
+        tail_phase = phi + 0.5 + 0.25  # À contre-temps + décalage
+        tail_angle = 0.15 * np.sin(2 * np.pi * tail_phase)  # ±8.5 degrés
+        np.copyto(cos_step, np.cos(tail_angle) - 1.0, where=tail_mask)
+        np.copyto(sin_step, np.sin(tail_angle), where=tail_mask)
+        
+        rel_x, rel_y = camel["rel_x"], camel["rel_y"]
+        np.multiply(rel_x, cos_step, out=tmp)
+        x += tmp
+        np.multiply(rel_y, sin_step, out=tmp)
+        x -= tmp
+        np.multiply(rel_x, sin_step, out=tmp)
+        y += tmp
+        np.multiply(rel_y, cos_step, out=tmp)
+        y += tmp
+        lift_step *= camel["lift_factor"]
+        y += lift_step
 
         # ═══════════════════════════════════════════════════════════
         # MOUVEMENTS SECONDAIRES – TRONC ET BOSSE
         # ═══════════════════════════════════════════════════════════
-        torso_mask = cached["seg_torso"]
-        hump_mask = cached["seg_hump"]
-        body_mask = torso_mask | hump_mask
+        body = camel["body"]
+        hump = camel["hump"]
         
         # ─── Body sway (oscillation latérale Z, synchronisée avec pas) ───
         body_sway = 0.03 * np.sin(4 * np.pi * phi)  # ±3% en Z
-        animated[body_mask, 2] += body_sway * 40  # Échelle monde
+        np.multiply(body, float(body_sway * 40), out=tmp)  # Échelle monde
+        z += tmp
         
         # ─── Body bob (oscillation verticale, 2× par cycle car 2 pas) ───
         body_bob = 0.02 * np.sin(4 * np.pi * phi)  # ±2% en Y
-        animated[body_mask, 1] += body_bob * 50
-        
-        # ─── Légère inclinaison vers l'avant (dynamique de marche) ───
-        # Le buste s'incline légèrement selon la phase
-        tilt_forward = 0.015 * np.sin(2 * np.pi * phi)  # ±1.5%
+        np.multiply(body, float(body_bob * 50), out=tmp)
+        y += tmp
         
         # ─── BOSSE : Oscillation verticale ±3° + inertie retardée ───
         hump_oscillation = np.radians(3.0) * np.sin(4 * np.pi * phi)  # ±3 degrés
         hump_lag = 0.5 * body_sway  # Inertie retardée
         
-        if np.any(hump_mask):
-            # Oscillation verticale de la bosse
-            hump_center_y = 70  # Centre Y approximatif de la bosse
-            rel_y = animated[hump_mask, 1] - hump_center_y
-            animated[hump_mask, 1] += hump_oscillation * np.abs(rel_y) * 0.15
-            # Retard d'inertie latérale
-            animated[hump_mask, 2] += hump_lag * 25
+        # Oscillation verticale de la bosse (centre Y approximatif à 70)
+        np.subtract(y, 70, out=tmp)
+        np.abs(tmp, out=tmp)
+        tmp *= hump
+        tmp *= float(hump_oscillation * 0.15)
+        y += tmp
+        # Retard d'inertie latérale
+        np.multiply(hump, float(hump_lag * 25), out=tmp)
+        z += tmp
 
         # ═══════════════════════════════════════════════════════════
         # TÊTE ET COU – HOCHEMENT RYTHMIQUE + ONDULATION HORIZONTALE
         # ═══════════════════════════════════════════════════════════
-        head_mask = cached["seg_head"]
-        neck_mask = cached["seg_neck"]
-        neck_base = pivots["neck_base"]
+        neck_base = self.TOUAREG_NECK_BASE
         
         # ─── Hochement vertical (synchronisé avec pas, léger retard) ───
+        # Tête haute pendant poussée, basse pendant levée; cou: gradient de
+        # mouvement (base moins, sommet plus), pondération en cache
         head_phase = phi - 0.1  # Retard de 10% du cycle
         head_bob = 3.0 * np.sin(4 * np.pi * head_phase)  # Amplitude augmentée
-        
-        if np.any(head_mask):
-            # Tête haute pendant poussée, basse pendant levée
-            animated[head_mask, 1] += head_bob * 1.2
-        if np.any(neck_mask):
-            # Cou: gradient de mouvement (base moins, sommet plus)
-            neck_y = animated[neck_mask, 1]
-            neck_gradient = np.clip((neck_y - neck_base[1]) / 30.0, 0.3, 1.0)
-            animated[neck_mask, 1] += head_bob * 0.6 * neck_gradient
+        np.multiply(camel["head_bob"], float(head_bob), out=tmp)
+        y += tmp
         
         # ─── Ondulation horizontale du cou (mouvement en S) ───
         neck_wave_phase = phi * 2 * np.pi + 0.3
         neck_wave_amp = 2.5  # Amplitude de l'ondulation
-        
-        if np.any(neck_mask):
-            neck_y = animated[neck_mask, 1]
-            neck_height_factor = np.clip((neck_y - neck_base[1]) / 35.0, 0, 1)
-            neck_wave = neck_wave_amp * np.sin(neck_wave_phase) * neck_height_factor
-            animated[neck_mask, 2] += neck_wave
-        
-        # ─── Balancement latéral de la tête (en Z) ───
+        np.subtract(y, neck_base[1], out=tmp)
+        tmp /= 35.0
+        np.clip(tmp, 0, 1, out=tmp)
+        tmp *= camel["neck"]
+        tmp *= float(neck_wave_amp * np.sin(neck_wave_phase))
+        z += tmp
+        
+        # ─── Balancement latéral de la tête (en Z), cou à 35% ───
         head_sway = 2.2 * np.sin(2 * np.pi * phi + 0.25)
-        if np.any(head_mask):
-            animated[head_mask, 2] += head_sway
-        if np.any(neck_mask):
-            animated[neck_mask, 2] += head_sway * 0.35
+        np.multiply(camel["head_sway"], float(head_sway), out=tmp)
+        z += tmp
 
         # ═══════════════════════════════════════════════════════════
-        # QUEUE – BALANCEMENT À CONTRE-TEMPS NATUREL
+        # QUEUE – ONDULATION LATÉRALE
         # ═══════════════════════════════════════════════════════════
-        tail_mask = cached["seg_tail"]
-        tail_base = pivots["tail_base"]
-        
-        if np.any(tail_mask):
-            # ─── Phase à contre-temps des pattes (opposition naturelle) ───
-            # Quand pattes gauches avancent → queue va à droite, et inversement
-            tail_phase = phi + 0.5 + 0.25  # À contre-temps + décalage
-            
-            # ─── Rotation principale autour de la base ───
-            tail_swing_amp = 0.15  # ±8.5 degrés
-            tail_angle = tail_swing_amp * np.sin(2 * np.pi * tail_phase)
-            cos_t, sin_t = np.cos(tail_angle), np.sin(tail_angle)
-            
-            dx = animated[tail_mask, 0] - tail_base[0]
-            dy = animated[tail_mask, 1] - tail_base[1]
-            
-            animated[tail_mask, 0] = tail_base[0] + dx * cos_t - dy * sin_t
-            animated[tail_mask, 1] = tail_base[1] + dx * sin_t + dy * cos_t
-            
-            # ─── Ondulation latérale (mouvement de fouet en Z) ───
-            # Plus grande amplitude à l'extrémité qu'à la base
-            dist_from_base = np.sqrt(dx**2 + dy**2)
-            wave_factor = np.clip(dist_from_base / 10.0, 0.3, 1.0)
-            tail_wave = 3.5 * np.sin(4 * np.pi * tail_phase - 0.7) * wave_factor
-            animated[tail_mask, 2] += tail_wave
-            
-            # ─── Micro-oscillation secondaire (queue "vivante") ───
-            tail_micro = 0.8 * np.sin(8 * np.pi * phi + dist_from_base * 0.3)
-            animated[tail_mask, 2] += tail_micro
+        # ─── Ondulation latérale (mouvement de fouet en Z) ───
+        # Plus grande amplitude à l'extrémité qu'à la base
+        tail_wave = 3.5 * np.sin(4 * np.pi * tail_phase - 0.7)
+        np.multiply(camel["tail_wave"], float(tail_wave), out=tmp)
+        z += tmp
+        
+        # ─── Micro-oscillation secondaire (queue "vivante") ───
+        np.add(camel["tail_micro_phase"], 8 * np.pi * phi, out=tmp)
+        np.sin(tmp, out=tmp)
+        tmp *= camel["tail"]
+        tmp *= 0.8
+        z += tmp
 
         # ═══════════════════════════════════════════════════════════
         # EFFETS DYNAMIQUES – BLOOM + PULSATION SYNCHRONISÉE
         # ═══════════════════════════════════════════════════════════
+        # Facteur d'éclairage par drone, appliqué aux couleurs de base en fin de frame
         
         # ─── Contour: Bleu froid avec glow pulsé synchronisé ───
         # Pulsation liée au rythme de marche (2× par cycle)
-        glow_pulse = 0.90 + 0.10 * np.sin(4 * np.pi * phi)
-        cols[:n_contour] *= glow_pulse
+        glow[:] = 1.0
+        glow[:n_contour] = 0.90 + 0.10 * np.sin(4 * np.pi * phi)
         
         # ─── Pattes: Bloom augmenté pendant phase de levée ───
-        for seg, phase_offset in [(cached["seg_leg_fl"], PHASE_LEFT),
-                                   (cached["seg_leg_rl"], PHASE_LEFT),
-                                   (cached["seg_leg_fr"], PHASE_RIGHT),
-                                   (cached["seg_leg_rr"], PHASE_RIGHT)]:
-            if np.any(seg):
-                local_phi = (phi + phase_offset) % 1.0
-                # Bloom plus fort pendant phase aérienne (levée)
-                if local_phi < 0.5:
-                    leg_bloom = 1.08 + 0.12 * np.sin(np.pi * local_phi / 0.5)
-                else:
-                    leg_bloom = 1.05
-                cols[seg] *= leg_bloom
+        for leg, (_, phase_offset, *_) in enumerate(self.TOUAREG_LEGS):
+            local_phi = (phi + phase_offset) % 1.0
+            # Bloom plus fort pendant phase aérienne (levée)
+            if local_phi < 0.5:
+                leg_bloom = 1.08 + 0.12 * np.sin(np.pi * local_phi / 0.5)
+            else:
+                leg_bloom = 1.05
+            np.multiply(glow, float(leg_bloom), out=glow, where=camel["legs"][leg])
         
         # ─── Articulations (genoux, hanches): Bloom intense ───
-        # Utiliser is_keypoint du cache
-        is_keypoint = cached.get("is_keypoint", np.zeros(num, dtype=bool))
-        if np.any(is_keypoint):
-            articulation_bloom = 1.15 + 0.10 * np.sin(4 * np.pi * phi + 0.5)
-            cols[is_keypoint] *= articulation_bloom
+        articulation_bloom = 1.15 + 0.10 * np.sin(4 * np.pi * phi + 0.5)
+        np.multiply(glow, float(articulation_bloom), out=glow, where=camel["is_keypoint"])
         
         # ─── Bosse: Point focal avec pulsation lente ───
-        if np.any(hump_mask):
-            hump_glow = 1.10 + 0.08 * np.sin(2 * np.pi * phi)
-            cols[hump_mask] *= hump_glow
+        hump_glow = 1.10 + 0.08 * np.sin(2 * np.pi * phi)
+        np.multiply(glow, float(hump_glow), out=glow, where=camel["hump_mask"])
         
         # ─── Tête: Micro-scintillement + œil brillant ───
-        if np.any(head_mask):
-            n_head = np.sum(head_mask)
-            head_sparkle = 0.95 + 0.08 * np.sin(t * 1.2 + np.arange(n_head) * 0.12)
-            cols[head_mask] *= head_sparkle[:, None]
+        np.add(camel["head_sparkle_phase"], t * 1.2, out=tmp)
+        np.sin(tmp, out=tmp)
+        tmp *= 0.08
+        tmp += 0.95
+        np.multiply(glow, tmp, out=glow, where=camel["head_mask"])
         
         # ─── Queue: Traînée lumineuse (plus brillant à l'extrémité) ───
-        if np.any(tail_mask):
-            tail_x = animated[tail_mask, 0]
-            trail_factor = np.clip((tail_base[0] - tail_x) / 8.0, 0.8, 1.3)
-            cols[tail_mask] *= trail_factor[:, None]
+        np.subtract(self.TOUAREG_TAIL_BASE[0], x, out=tmp)
+        tmp /= 8.0
+        np.clip(tmp, 0.8, 1.3, out=tmp)
+        np.multiply(glow, tmp, out=glow, where=tail_mask)
         
         # Clip final
-        cols = np.clip(cols, 0, 1)
+        for k in range(3):
+            np.multiply(camel["cols"][:, k], glow, out=cols[:, k])
+        np.clip(cols, 0, 1, out=cols)
 
         # Légère ondulation Z pour effet vivant (synchronisée avec le cycle)
-        idx = np.arange(num)
-        animated[:, 2] += 0.3 * np.sin(0.15 * idx + 2 * np.pi * phi)
+        np.add(camel["ripple_phase"], 2 * np.pi * phi, out=tmp)
+        np.sin(tmp, out=tmp)
+        tmp *= 0.3
+        z += tmp
 
         return animated, cols
 
-    def _phase_dubai_camel(self, num, t=0.0):
+    # Pattes du dromadaire touareg: (nom, déphasage, pas, levée, amplitude du swing).
+    # Gait latéral (amble): FL + RL ensemble (côté gauche, phase 0), FR + RR
+    # ensemble (côté droit, déphasé de 0.5)
+    TOUAREG_LEGS = (
+        ("fl", 0.0, 7.0, 5.5, 0.18),
+        ("rl", 0.0, 6.5, 5.0, 0.16),
+        ("fr", 0.5, 7.0, 5.5, 0.18),
+        ("rr", 0.5, 6.5, 5.0, 0.16),
+    )
+    TOUAREG_NECK_BASE = (42.0, 50.0)
+    TOUAREG_TAIL_BASE = (-62.0, 50.0)
+
+    def _build_touareg(self, num):
+        """
+        Partie statique du dromadaire touareg: contour SVG lissé, remplissage,
+        segmentation anatomique, couleurs de base et, par drone, les
+        coefficients de marche (patte, position relative à la hanche ou à la
+        base de la queue, facteur de levée) et des mouvements secondaires.
+        """
+        rng = np.random.default_rng(42 + num)
+        from scipy.interpolate import splprep, splev
+        from matplotlib.path import Path
+
+        # ════════════════════════════════════════════════════════════
+        # 1. CONTOUR MAÎTRE SVG – 120+ points de contrôle
+        # ════════════════════════════════════════════════════════════
+        # Profil strict, sens horaire depuis queue
+        # Échelle: ~140m × 80m
+        
+        raw_contour = np.array([
+            # ─── QUEUE (fine, courbée vers le haut) ───
+            [-68, 48], [-66, 52], [-64, 54], [-61, 53], [-58, 50], [-55, 47],
+            
+            # ─── CROUPE (descendante vers bosse) ───
+            [-52, 44], [-48, 41], [-44, 38], [-40, 36], [-36, 35],
+            
+            # ─── BOSSE UNIQUE (dromadaire = 1 bosse haute et marquée) ───
+            [-30, 36], [-24, 40], [-18, 46], [-12, 54], [-6, 60],
+            [0, 64], [6, 66],  # Sommet de la bosse
+            [12, 64], [18, 58], [24, 50], [28, 44],
+            
+            # ─── DOS vers ENCOLURE ───
+            [32, 42], [36, 42],
+            
+            # ─── ENCOLURE (longue, courbure élégante) ───
+            [40, 44], [44, 50], [48, 58], [52, 66], [56, 74], [58, 80],
+            
+            # ─── TÊTE (profil caractéristique avec chanfrein) ───
+            [60, 84], [64, 86], [68, 85], [72, 82],  # Crâne arrondi
+            [75, 78], [78, 74],  # Front
+            [80, 70], [82, 66],  # Chanfrein (ligne du nez)
+            [84, 62], [85, 58],  # Nez/museau
+            [84, 54], [82, 51],  # Lèvre supérieure
+            [79, 49], [76, 48], [73, 49],  # Menton
+            
+            # ─── GORGE (descente vers poitrail) ───
+            [70, 52], [66, 56], [62, 60], [58, 62],
+            [54, 62], [50, 58], [46, 52], [42, 46],
+            
+            # ─── POITRAIL ───
+            [40, 42], [38, 36], [36, 30],
+            
+            # ═══ PATTE AVANT DROITE (FR) – bien séparée ═══
+            [35, 26], [34, 20], [33, 14], [32, 8], [31, 2], [30, -2],
+            [28, -2], [27, 0],  # Sabot FR
+            [26, 6], [25, 14], [24, 22], [23, 28],
+            
+            # ─── ESPACE ENTRE PATTES AVANT (ventre visible) ───
+            [20, 30], [17, 30], [14, 30],
+            
+            # ═══ PATTE AVANT GAUCHE (FL) ═══
+            [12, 28], [11, 22], [10, 14], [9, 6], [8, 0], [7, -2],
+            [5, -2], [4, 0],  # Sabot FL
+            [3, 8], [2, 16], [1, 24],
+            
+            # ─── VENTRE (ligne basse) ───
+            [-2, 26], [-8, 24], [-14, 22], [-20, 20], [-26, 18],
+            
+            # ═══ PATTE ARRIÈRE DROITE (RR) ═══
+            [-30, 18], [-31, 12], [-32, 6], [-33, 0], [-34, -2],
+            [-36, -2], [-37, 0],  # Sabot RR
+            [-38, 8], [-39, 16], [-40, 24],
+            
+            # ─── ESPACE ENTRE PATTES ARRIÈRE ───
+            [-43, 26], [-46, 26], [-49, 26],
+            
+            # ═══ PATTE ARRIÈRE GAUCHE (RL) ═══
+            [-52, 24], [-53, 18], [-54, 10], [-55, 4], [-56, -2],
+            [-58, -2], [-59, 2],  # Sabot RL
+            [-60, 10], [-61, 20], [-62, 30],
+            
+            # ─── REMONTÉE VERS QUEUE ───
+            [-64, 36], [-66, 42], [-68, 48],
+        ], dtype=float)
+
+        # B-spline lissage → 600 points haute définition
+        try:
+            tck, _ = splprep([raw_contour[:, 0], raw_contour[:, 1]], s=2.0, per=True, k=3)
+            u_hd = np.linspace(0, 1, 600)
+            contour_smooth = np.column_stack(splev(u_hd, tck))
+        except Exception:
+            contour_smooth = raw_contour.copy()
+
+        # ════════════════════════════════════════════════════════════
+        # 2. ÉCHANTILLONNAGE – RÉPARTITION OPTIMISÉE 40/40/20
+        # ════════════════════════════════════════════════════════════
+        n_contour = int(num * 0.40)   # 40% sur le contour
+        n_interior = int(num * 0.40)  # 40% remplissage intérieur
+        n_keypoints = num - n_contour - n_interior  # 20% points clés
+        
+        clen = len(contour_smooth)
+        density = np.ones(clen)
+        
+        # Identifier les zones par position X approximative
+        xs = contour_smooth[:, 0]
+        ys = contour_smooth[:, 1]
+        
+        # Queue (×3)
+        density[(xs < -60)] *= 3.0
+        # Bosse (×2.5)
+        density[(xs > -20) & (xs < 20) & (ys > 50)] *= 2.5
+        # Tête/museau (×3)
+        density[(xs > 70)] *= 3.0
+        # Cou (×2)
+        density[(xs > 50) & (xs < 70) & (ys > 60)] *= 2.0
+        # Sabots/genoux (×3) - zones basses des pattes
+        density[(ys < 10)] *= 3.0
+        
+        # Échantillonnage pondéré
+        cumsum = np.cumsum(density)
+        cumsum /= cumsum[-1]
+        sample_u = np.linspace(0, 1, n_contour)
+        idx_sample = np.searchsorted(cumsum, sample_u)
+        idx_sample = np.clip(idx_sample, 0, clen - 1)
+        pts_contour = contour_smooth[idx_sample].copy()
+
+        # ════════════════════════════════════════════════════════════
+        # 3. REMPLISSAGE POISSON-DISC CONTRAINT
+        # ════════════════════════════════════════════════════════════
+        poly_path = Path(contour_smooth)
+        
+        bx_min, bx_max = xs.min() - 2, xs.max() + 2
+        by_min, by_max = ys.min() - 2, ys.max() + 2
+
+        # Zones d'exclusion : espaces entre pattes = moins dense
+        def exclusion_weight(x, y):
+            """Retourne 0-1, 0 = exclure, 1 = garder"""
+            w = 1.0
+            # Entre pattes avant (x: 14-20, y < 32)
+            if 14 < x < 20 and y < 32:
+                w *= 0.15
+            # Entre pattes arrière (x: -49 à -43, y < 28)
+            if -49 < x < -43 and y < 28:
+                w *= 0.15
+            # Ventre central = léger
+            if -26 < x < 0 and 18 < y < 28:
+                w *= 0.4
+            return w
+
+        # Génération Poisson-disc simplifiée avec rejection
+        interior_pts = []
+        batch = max(n_interior * 12, 10000)
+        
+        for _ in range(20):
+            if len(interior_pts) >= n_interior:
+                break
+            
+            xs_rand = rng.uniform(bx_min, bx_max, batch)
+            ys_rand = rng.uniform(by_min, by_max, batch)
+            candidates = np.column_stack((xs_rand, ys_rand))
+            
+            inside_mask = poly_path.contains_points(candidates)
+            valid = candidates[inside_mask]
+            
+            if len(valid) == 0:
+                continue
+            
+            # Appliquer pondération d'exclusion
+            probs = np.array([exclusion_weight(p[0], p[1]) for p in valid])
+            
+            # Densité additionnelle : bosse et tête plus denses
+            for i, p in enumerate(valid):
+                # Bosse
+                if -15 < p[0] < 15 and p[1] > 45:
+                    probs[i] *= 1.8
+                # Tête
+                if p[0] > 60 and p[1] > 50:
+                    probs[i] *= 1.6
+            
+            probs = np.clip(probs, 0.05, 1.0)
+            accept = rng.random(len(valid)) < probs
+            interior_pts.extend(valid[accept].tolist())
+        
+        interior_pts = np.array(interior_pts[:n_interior]) if len(interior_pts) >= n_interior else (
+            np.array(interior_pts) if len(interior_pts) > 0 else np.zeros((0, 2))
+        )
+
+        # Compléter si nécessaire avec grille
+        if len(interior_pts) < n_interior:
+            needed = n_interior - len(interior_pts)
+            res = int(np.sqrt(needed * 4)) + 10
+            gx = np.linspace(bx_min, bx_max, res)
+            gy = np.linspace(by_min, by_max, res)
+            gxx, gyy = np.meshgrid(gx, gy)
+            grid = np.column_stack((gxx.ravel(), gyy.ravel()))
+            inside = poly_path.contains_points(grid)
+            grid_valid = grid[inside]
+            if len(grid_valid) >= needed:
+                pick = rng.choice(len(grid_valid), needed, replace=False)
+                extra = grid_valid[pick]
+            else:
+                extra = grid_valid
+            interior_pts = np.vstack([interior_pts, extra]) if len(interior_pts) > 0 else extra
+
+        # ════════════════════════════════════════════════════════════
+        # 4. ASSEMBLAGE + SEGMENTATION ANATOMIQUE
+        # ════════════════════════════════════════════════════════════
+        pts_contour += rng.normal(0, 0.3, pts_contour.shape)
+        if len(interior_pts) > 0:
+            interior_pts += rng.normal(0, 0.6, interior_pts.shape)
+
+        all_2d = np.vstack([pts_contour, interior_pts]) if len(interior_pts) > 0 else pts_contour
+
+        # Ajuster au nombre exact
+        if len(all_2d) < num:
+            shortage = num - len(all_2d)
+            idx_dup = rng.choice(len(all_2d), shortage, replace=True)
+            jitter = rng.normal(0, 0.5, (shortage, 2))
+            all_2d = np.vstack([all_2d, all_2d[idx_dup] + jitter])
+        elif len(all_2d) > num:
+            all_2d = all_2d[:num]
+
+        # 3D (profil strict)
+        base_pos = np.zeros((num, 3))
+        base_pos[:, 0] = all_2d[:, 0]
+        base_pos[:, 1] = all_2d[:, 1] + 8  # Élever au-dessus du sol
+        base_pos[:, 2] = rng.uniform(-1.5, 1.5, num)  # Faible profondeur
+
+        # ═══════════════════════════════════════════════════════════
+        # SEGMENTATION ANATOMIQUE STRICTE – ZONES X ABSOLUES
+        # ═══════════════════════════════════════════════════════════
+        # Basé sur le contour SVG réel:
+        # - Pattes avant FR: X ~ 23-36 (contour original)
+        # - Pattes avant FL: X ~ 1-14
+        # - Pattes arrière RR: X ~ -40 à -28
+        # - Pattes arrière RL: X ~ -62 à -50
+        
+        px, py = base_pos[:, 0], base_pos[:, 1]
+        
+        # Ligne du ventre (sépare pattes du corps)
+        BELLY_Y = 32  # Y en dessous duquel = pattes
+        
+        # ─── PATTES AVANT (côté droit, X positif) ───
+        seg_leg_fr = (px >= 22) & (px <= 37) & (py < BELLY_Y)  # Patte avant droite
+        seg_leg_fl = (px >= 0) & (px <= 15) & (py < BELLY_Y)   # Patte avant gauche
+        
+        # ─── PATTES ARRIÈRE (côté gauche, X négatif) ───
+        seg_leg_rr = (px >= -42) & (px <= -27) & (py < BELLY_Y - 2)  # Patte arrière droite
+        seg_leg_rl = (px >= -65) & (px <= -48) & (py < BELLY_Y)      # Patte arrière gauche
+        
+        # ─── TÊTE (extrémité droite, haute) ───
+        seg_head = (px >= 70) & (py >= 55)
+        
+        # ─── COU (entre tête et épaule) ───
+        seg_neck = (px >= 50) & (px < 70) & (py >= 50) & ~seg_head
+        
+        # ─── BOSSE (zone centrale haute) ───
+        seg_hump = (px >= -20) & (px <= 25) & (py >= 62)
+        
+        # ─── QUEUE (extrémité gauche) ───
+        seg_tail = (px <= -60) & (py >= 48)
+        
+        # ─── TORSE (tout le reste) ───
+        seg_torso = ~(seg_head | seg_neck | seg_hump | seg_tail | 
+                      seg_leg_fr | seg_leg_fl | seg_leg_rr | seg_leg_rl)
+        
+        # ─── Points de pivot pour animation (hanches au niveau BELLY_Y) ───
+        pivots = {
+            "hip_fr": np.array([29.5, BELLY_Y]),   # Centre de la zone FR
+            "hip_fl": np.array([7.5, BELLY_Y]),    # Centre de la zone FL
+            "hip_rr": np.array([-34.5, BELLY_Y - 2]),  # Centre de la zone RR
+            "hip_rl": np.array([-56.5, BELLY_Y]),  # Centre de la zone RL
+            "neck_base": np.array(self.TOUAREG_NECK_BASE),
+            "tail_base": np.array(self.TOUAREG_TAIL_BASE),
+            # Points d'articulation critiques pour bloom
+            "shoulder": np.array([35, 34]),     # Épaule
+            "knee_fr": np.array([31, 12]),      # Genou avant droit
+            "knee_fl": np.array([8, 12]),       # Genou avant gauche
+            "knee_rr": np.array([-35, 10]),     # Genou arrière droit
+            "knee_rl": np.array([-57, 10]),     # Genou arrière gauche
+            "eye": np.array([75, 78]),          # Œil
+            "muzzle": np.array([85, 56]),       # Museau
+        }
+        
+        # ─── Points clés (articulations + œil + museau) pour haute densité ───
+        keypoint_centers = [
+            pivots["shoulder"], pivots["hip_fr"], pivots["hip_fl"],
+            pivots["hip_rr"], pivots["hip_rl"],
+            pivots["knee_fr"], pivots["knee_fl"], pivots["knee_rr"], pivots["knee_rl"],
+            pivots["eye"], pivots["muzzle"], pivots["neck_base"], pivots["tail_base"],
+        ]
+        
+        # Marquer les drones proches des points clés
+        keypoint_radius = 6.0
+        is_keypoint = np.zeros(num, dtype=bool)
+        for kp in keypoint_centers:
+            dist = np.sqrt((px - kp[0])**2 + (py - kp[1] - 8)**2)  # -8 pour offset Y
+            is_keypoint |= (dist < keypoint_radius)
+
+        # ════════════════════════════════════════════════════════════
+        # 5. PALETTE DE COULEURS ENRICHIE
+        # ════════════════════════════════════════════════════════════
+        # Corps principal : Blanc pur (6000K) → RGB(1.0, 1.0, 1.0)
+        # Zones inférieures : Orange chaud (3500K) → RGB(1.0, 0.75, 0.45)
+        # Contours : Bleu froid accent (7000K) → RGB(0.85, 0.92, 1.0)
+        # Points clés : Blanc intense + bloom
+        
+        base_cols = np.zeros((num, 3))
+        
+        # ─── Contour: Bleu froid accent (7000K) pour silhouette nette ───
+        cool_blue = np.array([0.88, 0.94, 1.0])
+        base_cols[:n_contour] = cool_blue * 1.10
+        
+        # ─── Intérieur: Dégradé blanc pur → orange chaud ───
+        if len(interior_pts) > 0:
+            y_int = base_pos[n_contour:n_contour + len(interior_pts), 1]
+            y_min, y_max = y_int.min(), max(y_int.max(), y_int.min() + 1)
+            y_norm = (y_int - y_min) / (y_max - y_min)
+            
+            warm_orange = np.array([1.0, 0.75, 0.45])   # Bas: 3500K orange chaud
+            pure_white = np.array([1.0, 1.0, 1.0])      # Haut: 6000K blanc pur
+            
+            blend = y_norm[:, None]
+            base_cols[n_contour:n_contour + len(interior_pts)] = warm_orange * (1 - blend) + pure_white * blend
+        
+        # ─── Pattes: glow fort pour visibilité ───
+        for seg in [seg_leg_fr, seg_leg_fl, seg_leg_rr, seg_leg_rl]:
+            base_cols[seg] *= 1.12
+        
+        # ─── Points clés (articulations, œil, museau): Blanc intense + bloom ───
+        intense_white = np.array([1.0, 1.0, 1.0])
+        base_cols[is_keypoint] = intense_white * 1.25  # Surbrillance bloom
+        
+        # ─── Bosse: Point focal brillant ───
+        base_cols[seg_hump] = np.array([1.0, 0.98, 0.92]) * 1.15
+        
+        # ─── Tête et cou: Blanc pur légèrement accentué ───
+        base_cols[seg_head] = np.array([1.0, 1.0, 0.98]) * 1.10
+        base_cols[seg_neck] = np.array([1.0, 0.98, 0.95]) * 1.05
+        
+        base_cols = np.clip(base_cols, 0, 1)
+
+        # ════════════════════════════════════════════════════════════
+        # 6. COEFFICIENTS D'ANIMATION PAR DRONE
+        # ════════════════════════════════════════════════════════════
+        leg_masks = {"fr": seg_leg_fr, "fl": seg_leg_fl, "rr": seg_leg_rr, "rl": seg_leg_rl}
+        
+        # Pattes: masque par patte (ordre TOUAREG_LEGS), position relative à la hanche;
+        # queue: position relative à sa base
+        legs = np.array([leg_masks[name] for name, *_ in self.TOUAREG_LEGS])
+        rel_x, rel_y = np.zeros(num), np.zeros(num)
+        for mask, pivot in [(leg_masks[name], pivots["hip_" + name]) for name, *_ in self.TOUAREG_LEGS] + \
+                           [(seg_tail, pivots["tail_base"])]:
+            rel_x[mask] = px[mask] - pivot[0]
+            rel_y[mask] = py[mask] - pivot[1]
+        dist_from_pivot = np.hypot(rel_x, rel_y)
+        lift_factor = np.where(legs.any(axis=0), np.clip(dist_from_pivot / 25.0, 0.2, 1.0), 0.0)
+        
+        # Cou: gradient de hochement (base moins, sommet plus)
+        neck_gradient = np.clip((py - pivots["neck_base"][1]) / 30.0, 0.3, 1.0)
+        
+        # Tête: phase de scintillement par rang dans la tête
+        head_sparkle_phase = np.zeros(num)
+        head_sparkle_phase[seg_head] = np.arange(np.count_nonzero(seg_head)) * 0.12
+        
+        camel = {
+            "pos": base_pos,
+            "cols": base_cols,
+            "rel_x": rel_x,
+            "rel_y": rel_y,
+            "lift_factor": lift_factor,
+            "body": (seg_torso | seg_hump).astype(float),
+            "hump": seg_hump.astype(float),
+            "neck": seg_neck.astype(float),
+            "head_bob": np.where(seg_head, 1.2, np.where(seg_neck, 0.6 * neck_gradient, 0.0)),
+            "head_sway": np.where(seg_head, 1.0, np.where(seg_neck, 0.35, 0.0)),
+            "tail": seg_tail.astype(float),
+            "tail_wave": np.where(seg_tail, np.clip(dist_from_pivot / 10.0, 0.3, 1.0), 0.0),
+            "tail_micro_phase": np.where(seg_tail, dist_from_pivot * 0.3, 0.0),
+            "head_sparkle_phase": head_sparkle_phase,
+            "ripple_phase": 0.15 * np.arange(num),
+        }
+        camel = {name: value.astype(np.float32) for name, value in camel.items()}
+        camel.update(n_contour=n_contour, legs=legs, tail_mask=seg_tail, head_mask=seg_head,
+                     hump_mask=seg_hump, is_keypoint=is_keypoint)
+        return camel
+
+    @register_phase("dubai_camel", uses_t=True, warmup_ms=3, morph=True, writes_out=True)
+    def _phase_dubai_camel(self, num, t=0.0, out=None):
         """
         🐫 CHAMEAU DE DUBAÏ – STYLE MINIMALISTE WORLD RECORD
         
@@ -3575,188 +3674,21 @@ class FormationLibrary:
         ═══════════════════════════════════════════════════════════════
         """
         
-        cache_key = f"dubai_camel_{num}"
-        
-        if cache_key not in self._phase10_cache:
-            rng = np.random.default_rng(1001 + num)
-            from scipy.interpolate import splprep, splev
-            
-            # ════════════════════════════════════════════════════════════
-            # CONTOUR MINIMALISTE – CHAMEAU À DEUX BOSSES (BACTRIEN)
-            # ════════════════════════════════════════════════════════════
-            # Style épuré Dubai Drone Show – courbes douces, géométrie simple
-            # Échelle: 100m × 50m
-            
-            raw_contour = np.array([
-                # ─── QUEUE (courte, simple) ───
-                [-48, 22], [-46, 25], [-44, 26],
-                
-                # ─── CROUPE (montée vers bosse arrière) ───
-                [-40, 27], [-36, 30], [-32, 35],
-                
-                # ═══ BOSSE ARRIÈRE (demi-cercle symétrique) ═══
-                [-28, 42], [-24, 48], [-20, 52], [-16, 54],  # Montée
-                [-12, 54], [-8, 52], [-4, 48],               # Sommet
-                [0, 42],                                      # Descente
-                
-                # ─── SELLE (creux entre les bosses) ───
-                [4, 38], [8, 36], [12, 38],
-                
-                # ═══ BOSSE AVANT (demi-cercle symétrique) ═══
-                [16, 42], [20, 48], [24, 52], [28, 54],      # Montée
-                [32, 54], [36, 52], [40, 48],                # Sommet
-                [44, 42],                                     # Descente
-                
-                # ─── ENCOLURE (courbe douce vers tête) ───
-                [48, 40], [52, 42], [56, 48], [60, 56], [64, 64],
-                
-                # ─── TÊTE (triangulaire allongée stylisée) ───
-                [68, 68], [72, 70], [76, 68],   # Crâne
-                [80, 64], [82, 58],             # Front/chanfrein
-                [84, 52], [82, 48],             # Museau
-                [78, 46], [74, 48],             # Menton
-                
-                # ─── GORGE (descente vers poitrail) ───
-                [70, 50], [66, 52], [62, 52], [58, 48],
-                [54, 42], [50, 36], [48, 30],
-                
-                # ═══ PATTE AVANT DROITE (rectangle étroit) ═══
-                [46, 26], [45, 18], [44, 10], [43, 2],
-                [41, 2], [40, 10], [39, 18], [38, 24],
-                
-                # ─── ESPACE AVANT ───
-                [34, 24], [30, 24],
-                
-                # ═══ PATTE AVANT GAUCHE (rectangle étroit) ═══
-                [28, 24], [27, 16], [26, 8], [25, 2],
-                [23, 2], [22, 8], [21, 16], [20, 22],
-                
-                # ─── VENTRE (ligne simple) ───
-                [16, 22], [8, 20], [0, 18], [-8, 18], [-16, 20],
-                
-                # ═══ PATTE ARRIÈRE DROITE (rectangle étroit) ═══
-                [-20, 20], [-21, 12], [-22, 4], [-23, -2],
-                [-25, -2], [-26, 4], [-27, 12], [-28, 18],
-                
-                # ─── ESPACE ARRIÈRE ───
-                [-32, 18], [-36, 18],
-                
-                # ═══ PATTE ARRIÈRE GAUCHE (rectangle étroit) ═══
-                [-38, 18], [-39, 10], [-40, 4], [-41, -2],
-                [-43, -2], [-44, 4], [-45, 12], [-46, 20],
-                
-                # ─── RETOUR VERS QUEUE ───
-                [-48, 22],
-            ], dtype=float)
-            
-            # B-spline lissage pour courbes douces (style Dubai)
-            try:
-                tck, _ = splprep([raw_contour[:, 0], raw_contour[:, 1]], s=3.0, per=True, k=3)
-                u_hd = np.linspace(0, 1, num)  # Tous les drones sur le contour
-                contour_smooth = np.column_stack(splev(u_hd, tck))
-            except Exception:
-                # Fallback: répéter le contour brut
-                repeat = max(1, num // len(raw_contour) + 1)
-                contour_smooth = np.tile(raw_contour, (repeat, 1))[:num]
-            
-            # ════════════════════════════════════════════════════════════
-            # POSITIONNEMENT 3D – CONTOURS UNIQUEMENT (MINIMALISTE)
-            # ════════════════════════════════════════════════════════════
-            pts_2d = contour_smooth[:num].copy()
-            
-            # Ajuster au nombre exact
-            if len(pts_2d) < num:
-                shortage = num - len(pts_2d)
-                idx_dup = rng.choice(len(pts_2d), shortage, replace=True)
-                jitter = rng.normal(0, 0.2, (shortage, 2))
-                pts_2d = np.vstack([pts_2d, pts_2d[idx_dup] + jitter])
-            
-            # Petit jitter pour éviter superposition parfaite
-            pts_2d += rng.normal(0, 0.15, pts_2d.shape)
-            
-            # 3D: profil plat (2D sur plan XY)
-            base_pos = np.zeros((num, 3))
-            base_pos[:, 0] = pts_2d[:, 0]
-            base_pos[:, 1] = pts_2d[:, 1] + 20  # Élever au-dessus du sol
-            base_pos[:, 2] = rng.uniform(-0.5, 0.5, num)  # Très faible profondeur
-            
-            # ════════════════════════════════════════════════════════════
-            # SEGMENTATION SIMPLIFIÉE
-            # ════════════════════════════════════════════════════════════
-            px, py = base_pos[:, 0], base_pos[:, 1]
-            BELLY_Y = 26 + 20  # Ligne du ventre ajustée
-            
-            # Pattes (zones X pour animation)
-            seg_leg_fr = (px >= 38) & (px <= 48) & (py < BELLY_Y)
-            seg_leg_fl = (px >= 20) & (px <= 30) & (py < BELLY_Y)
-            seg_leg_rr = (px >= -28) & (px <= -18) & (py < BELLY_Y)
-            seg_leg_rl = (px >= -48) & (px <= -36) & (py < BELLY_Y)
-            
-            # Tête
-            seg_head = (px >= 68) & (py >= 60)
-            
-            # Cou
-            seg_neck = (px >= 54) & (px < 68) & (py >= 48)
-            
-            # Bosses
-            seg_hump_front = (px >= 12) & (px <= 48) & (py >= 58)
-            seg_hump_rear = (px >= -28) & (px <= 4) & (py >= 56)
-            seg_humps = seg_hump_front | seg_hump_rear
-            
-            # Queue
-            seg_tail = (px <= -44) & (py >= 42)
-            
-            # Torse (reste)
-            seg_torso = ~(seg_head | seg_neck | seg_humps | seg_tail |
-                          seg_leg_fr | seg_leg_fl | seg_leg_rr | seg_leg_rl)
-            
-            # Pivots pour animation
-            pivots = {
-                "hip_fr": np.array([43, BELLY_Y]),
-                "hip_fl": np.array([25, BELLY_Y]),
-                "hip_rr": np.array([-23, BELLY_Y]),
-                "hip_rl": np.array([-42, BELLY_Y]),
-                "neck_base": np.array([50, 56]),
-                "tail_base": np.array([-46, 44]),
-            }
-            
-            # ════════════════════════════════════════════════════════════
-            # COULEURS – BLANC PUR UNIFORME (STYLE DUBAI)
-            # ════════════════════════════════════════════════════════════
-            base_cols = np.ones((num, 3))  # Blanc pur #FFFFFF
-            
-            self._phase10_cache[cache_key] = {
-                "pos": base_pos.copy(),
-                "cols": base_cols.copy(),
-                "seg_head": seg_head,
-                "seg_neck": seg_neck,
-                "seg_humps": seg_humps,
-                "seg_tail": seg_tail,
-                "seg_leg_fr": seg_leg_fr,
-                "seg_leg_fl": seg_leg_fl,
-                "seg_leg_rr": seg_leg_rr,
-                "seg_leg_rl": seg_leg_rl,
-                "seg_torso": seg_torso,
-                "pivots": pivots,
-            }
+        # Contour, segments et coefficients de marche en cache (voir _build_dubai_camel)
+        camel = self._cache.get_or_build(FormationKey("mesh", "dubai_camel", num),
+                                         lambda: self._build_dubai_camel(num))
+        animated, cols = self._frame_buffers(num, out)
+        cos_step, sin_step, lift_step, tmp = self._scratch("dubai_camel", (4, num))
         
         # ════════════════════════════════════════════════════════════
         # ANIMATION MARCHE MAJESTUEUSE (CYCLE LENT 4.0s)
         # ════════════════════════════════════════════════════════════
-        cached = self._phase10_cache[cache_key]
-        animated = cached["pos"].copy()
-        cols = cached["cols"].copy()
-        pivots = cached["pivots"]
+        animated[:] = camel["pos"]
         
         # Cycle de marche lent et majestueux (4 secondes)
         CYCLE_DURATION = 4.0
         phi = (t % CYCLE_DURATION) / CYCLE_DURATION
         
-        # Interpolation minimum-jerk pour fluidité
-        def min_jerk(x):
-            x = np.clip(x, 0, 1)
-            return 10 * x**3 - 15 * x**4 + 6 * x**5
-        
         # Trajectoire de patte simplifiée
         def leg_trajectory(phase_offset, step_len=4.0, lift_height=3.0):
             local_phi = (phi + phase_offset) % 1.0
@@ -3774,77 +3706,242 @@ class FormationLibrary:
             
             return dx, dz
         
-        # Phases de marche (opposées avant/arrière)
-        PHASE_FR = 0.0
-        PHASE_FL = 0.5
-        PHASE_RR = 0.25
-        PHASE_RL = 0.75
-        
-        def animate_leg(mask, pivot, phase_offset, step_len=4.0, lift_height=3.0, swing_amp=0.10):
-            if not np.any(mask):
-                return
-            
-            dx_step, dz_lift = leg_trajectory(phase_offset, step_len, lift_height)
-            local_phi = (phi + phase_offset) % 1.0
-            swing_angle = swing_amp * np.sin(2 * np.pi * local_phi)
-            
-            cos_a, sin_a = np.cos(swing_angle), np.sin(swing_angle)
-            rel_x = animated[mask, 0] - pivot[0]
-            rel_y = animated[mask, 1] - pivot[1]
-            
-            new_x = pivot[0] + rel_x * cos_a - rel_y * sin_a
-            new_y = pivot[1] + rel_x * sin_a + rel_y * cos_a
-            
-            animated[mask, 0] = new_x
-            animated[mask, 1] = new_y
-            
-            dist_from_hip = np.sqrt(rel_x**2 + rel_y**2)
-            lift_factor = np.clip(dist_from_hip / 20.0, 0.2, 1.0)
-            animated[mask, 1] += dz_lift * lift_factor
-        
-        # Animer les 4 pattes
-        animate_leg(cached["seg_leg_fr"], pivots["hip_fr"], PHASE_FR, step_len=3.5, lift_height=2.5, swing_amp=0.08)
-        animate_leg(cached["seg_leg_fl"], pivots["hip_fl"], PHASE_FL, step_len=3.5, lift_height=2.5, swing_amp=0.08)
-        animate_leg(cached["seg_leg_rr"], pivots["hip_rr"], PHASE_RR, step_len=3.0, lift_height=2.0, swing_amp=0.07)
-        animate_leg(cached["seg_leg_rl"], pivots["hip_rl"], PHASE_RL, step_len=3.0, lift_height=2.0, swing_amp=0.07)
+        # Rotation de chaque patte autour de sa hanche + levée, constantes par patte
+        # (nulles hors pattes), appliquées avec la position relative à la hanche:
+        # x += rel_x (cos - 1) - rel_y sin,  y += rel_x sin + rel_y (cos - 1) + dz lift
+        cos_step[:] = 0.0
+        sin_step[:] = 0.0
+        lift_step[:] = 0.0
+        for leg, (_, phase_offset, step_len, lift_height, swing_amp) in enumerate(self.CAMEL_LEGS):
+            _, dz_lift = leg_trajectory(phase_offset, step_len, lift_height)
+            swing_angle = swing_amp * np.sin(2 * np.pi * ((phi + phase_offset) % 1.0))
+            mask = camel["legs"][leg]
+            np.copyto(cos_step, np.cos(swing_angle) - 1.0, where=mask)
+            np.copyto(sin_step, np.sin(swing_angle), where=mask)
+            np.copyto(lift_step, dz_lift, where=mask)
+        
+        rel_x, rel_y = camel["rel_x"], camel["rel_y"]
+        np.multiply(rel_x, cos_step, out=tmp)
+        animated[:, 0] += tmp
+        np.multiply(rel_y, sin_step, out=tmp)
+        animated[:, 0] -= tmp
+        np.multiply(rel_x, sin_step, out=tmp)
+        animated[:, 1] += tmp
+        np.multiply(rel_y, cos_step, out=tmp)
+        animated[:, 1] += tmp
+        lift_step *= camel["lift_factor"]
+        animated[:, 1] += lift_step
         
         # ═══════════════════════════════════════════════════════════
         # MOUVEMENTS SECONDAIRES SUBTILS
         # ═══════════════════════════════════════════════════════════
         
         # Corps: légère oscillation verticale (body_sway = 0.05)
-        body_mask = cached["seg_torso"] | cached["seg_humps"]
         body_bob = 0.05 * np.sin(4 * np.pi * phi) * 30  # ±1.5 unités
-        animated[body_mask, 1] += body_bob
+        np.multiply(camel["body_bob"], float(body_bob), out=tmp)
+        animated[:, 1] += tmp
         
-        # Tête: très léger hochement (head_movement = 0.03)
-        head_mask = cached["seg_head"]
-        neck_mask = cached["seg_neck"]
+        # Tête: très léger hochement (head_movement = 0.03), cou à 40%
         head_phase = phi - 0.08
         head_bob = 0.03 * np.sin(4 * np.pi * head_phase) * 40
-        
-        if np.any(head_mask):
-            animated[head_mask, 1] += head_bob
-        if np.any(neck_mask):
-            animated[neck_mask, 1] += head_bob * 0.4
+        np.multiply(camel["head_bob"], float(head_bob), out=tmp)
+        animated[:, 1] += tmp
         
         # Queue: presque immobile (très subtil)
-        tail_mask = cached["seg_tail"]
-        if np.any(tail_mask):
-            tail_wave = 0.5 * np.sin(2 * np.pi * phi + 0.5)
-            animated[tail_mask, 2] += tail_wave
+        tail_wave = 0.5 * np.sin(2 * np.pi * phi + 0.5)
+        np.multiply(camel["tail"], float(tail_wave), out=tmp)
+        animated[:, 2] += tmp
         
         # ═══════════════════════════════════════════════════════════
         # ÉCLAIRAGE UNIFORME BLANC (MINIMALISME DUBAI)
         # ═══════════════════════════════════════════════════════════
-        # Légère pulsation uniforme pour bloom
+        # Blanc pur #FFFFFF, légère pulsation uniforme pour bloom
         glow_pulse = 0.95 + 0.05 * np.sin(t * 1.5)
-        cols *= glow_pulse
-        
-        cols = np.clip(cols, 0, 1)
+        cols[:] = min(max(glow_pulse, 0.0), 1.0)
         
         return animated, cols
 
+    # Pattes du chameau: (segment, phase de marche, pas, levée, amplitude de balancier),
+    # phases opposées avant/arrière
+    CAMEL_LEGS = (
+        ("fr", 0.0, 3.5, 2.5, 0.08),
+        ("fl", 0.5, 3.5, 2.5, 0.08),
+        ("rr", 0.25, 3.0, 2.0, 0.07),
+        ("rl", 0.75, 3.0, 2.0, 0.07),
+    )
+
+    def _build_dubai_camel(self, num):
+        """
+        Partie statique du chameau: contour lissé, segments et, par drone,
+        les coefficients de marche (patte, position relative à la hanche,
+        facteur de levée) et des mouvements secondaires.
+        """
+        rng = np.random.default_rng(1001 + num)
+        from scipy.interpolate import splprep, splev
+        
+        # ════════════════════════════════════════════════════════════
+        # CONTOUR MINIMALISTE – CHAMEAU À DEUX BOSSES (BACTRIEN)
+        # ════════════════════════════════════════════════════════════
+        # Style épuré Dubai Drone Show – courbes douces, géométrie simple
+        # Échelle: 100m × 50m
+        
+        raw_contour = np.array([
+            # ─── QUEUE (courte, simple) ───
+            [-48, 22], [-46, 25], [-44, 26],
+            
+            # ─── CROUPE (montée vers bosse arrière) ───
+            [-40, 27], [-36, 30], [-32, 35],
+            
+            # ═══ BOSSE ARRIÈRE (demi-cercle symétrique) ═══
+            [-28, 42], [-24, 48], [-20, 52], [-16, 54],  # Montée
+            [-12, 54], [-8, 52], [-4, 48],               # Sommet
+            [0, 42],                                      # Descente
+            
+            # ─── SELLE (creux entre les bosses) ───
+            [4, 38], [8, 36], [12, 38],
+            
+            # ═══ BOSSE AVANT (demi-cercle symétrique) ═══
+            [16, 42], [20, 48], [24, 52], [28, 54],      # Montée
+            [32, 54], [36, 52], [40, 48],                # Sommet
+            [44, 42],                                     # Descente
+            
+            # ─── ENCOLURE (courbe douce vers tête) ───
+            [48, 40], [52, 42], [56, 48], [60, 56], [64, 64],
+            
+            # ─── TÊTE (triangulaire allongée stylisée) ───
+            [68, 68], [72, 70], [76, 68],   # Crâne
+            [80, 64], [82, 58],             # Front/chanfrein
+            [84, 52], [82, 48],             # Museau
+            [78, 46], [74, 48],             # Menton
+            
+            # ─── GORGE (descente vers poitrail) ───
+            [70, 50], [66, 52], [62, 52], [58, 48],
+            [54, 42], [50, 36], [48, 30],
+            
+            # ═══ PATTE AVANT DROITE (rectangle étroit) ═══
+            [46, 26], [45, 18], [44, 10], [43, 2],
+            [41, 2], [40, 10], [39, 18], [38, 24],
+            
+            # ─── ESPACE AVANT ───
+            [34, 24], [30, 24],
+            
+            # ═══ PATTE AVANT GAUCHE (rectangle étroit) ═══
+            [28, 24], [27, 16], [26, 8], [25, 2],
+            [23, 2], [22, 8], [21, 16], [20, 22],
+            
+            # ─── VENTRE (ligne simple) ───
+            [16, 22], [8, 20], [0, 18], [-8, 18], [-16, 20],
+            
+            # ═══ PATTE ARRIÈRE DROITE (rectangle étroit) ═══
+            [-20, 20], [-21, 12], [-22, 4], [-23, -2],
+            [-25, -2], [-26, 4], [-27, 12], [-28, 18],
+            
+            # ─── ESPACE ARRIÈRE ───
+            [-32, 18], [-36, 18],
+            
+            # ═══ PATTE ARRIÈRE GAUCHE (rectangle étroit) ═══
+            [-38, 18], [-39, 10], [-40, 4], [-41, -2],
+            [-43, -2], [-44, 4], [-45, 12], [-46, 20],
+            
+            # ─── RETOUR VERS QUEUE ───
+            [-48, 22],
+        ], dtype=float)
+        
+        # B-spline lissage pour courbes douces (style Dubai)
+        try:
+            tck, _ = splprep([raw_contour[:, 0], raw_contour[:, 1]], s=3.0, per=True, k=3)
+            u_hd = np.linspace(0, 1, num)  # Tous les drones sur le contour
+            contour_smooth = np.column_stack(splev(u_hd, tck))
+        except Exception:
+            # Fallback: répéter le contour brut
+            repeat = max(1, num // len(raw_contour) + 1)
+            contour_smooth = np.tile(raw_contour, (repeat, 1))[:num]
+        
+        # ════════════════════════════════════════════════════════════
+        # POSITIONNEMENT 3D – CONTOURS UNIQUEMENT (MINIMALISTE)
+        # ════════════════════════════════════════════════════════════
+        pts_2d = contour_smooth[:num].copy()
+        
+        # Ajuster au nombre exact
+        if len(pts_2d) < num:
+            shortage = num - len(pts_2d)
+            idx_dup = rng.choice(len(pts_2d), shortage, replace=True)
+            jitter = rng.normal(0, 0.2, (shortage, 2))
+            pts_2d = np.vstack([pts_2d, pts_2d[idx_dup] + jitter])
+        
+        # Petit jitter pour éviter superposition parfaite
+        pts_2d += rng.normal(0, 0.15, pts_2d.shape)
+        
+        # 3D: profil plat (2D sur plan XY)
+        base_pos = np.zeros((num, 3))
+        base_pos[:, 0] = pts_2d[:, 0]
+        base_pos[:, 1] = pts_2d[:, 1] + 20  # Élever au-dessus du sol
+        base_pos[:, 2] = rng.uniform(-0.5, 0.5, num)  # Très faible profondeur
+        
+        # ════════════════════════════════════════════════════════════
+        # SEGMENTATION SIMPLIFIÉE
+        # ════════════════════════════════════════════════════════════
+        px, py = base_pos[:, 0], base_pos[:, 1]
+        BELLY_Y = 26 + 20  # Ligne du ventre ajustée
+        
+        # Pattes (zones X pour animation)
+        seg_leg_fr = (px >= 38) & (px <= 48) & (py < BELLY_Y)
+        seg_leg_fl = (px >= 20) & (px <= 30) & (py < BELLY_Y)
+        seg_leg_rr = (px >= -28) & (px <= -18) & (py < BELLY_Y)
+        seg_leg_rl = (px >= -48) & (px <= -36) & (py < BELLY_Y)
+        
+        # Tête
+        seg_head = (px >= 68) & (py >= 60)
+        
+        # Cou
+        seg_neck = (px >= 54) & (px < 68) & (py >= 48)
+        
+        # Bosses
+        seg_hump_front = (px >= 12) & (px <= 48) & (py >= 58)
+        seg_hump_rear = (px >= -28) & (px <= 4) & (py >= 56)
+        seg_humps = seg_hump_front | seg_hump_rear
+        
+        # Queue
+        seg_tail = (px <= -44) & (py >= 42)
+        
+        # Torse (reste)
+        seg_torso = ~(seg_head | seg_neck | seg_humps | seg_tail |
+                      seg_leg_fr | seg_leg_fl | seg_leg_rr | seg_leg_rl)
+        
+        # Pivots pour animation
+        pivots = {
+            "hip_fr": np.array([43, BELLY_Y]),
+            "hip_fl": np.array([25, BELLY_Y]),
+            "hip_rr": np.array([-23, BELLY_Y]),
+            "hip_rl": np.array([-42, BELLY_Y]),
+        }
+        leg_masks = {"fr": seg_leg_fr, "fl": seg_leg_fl, "rr": seg_leg_rr, "rl": seg_leg_rl}
+        
+        # Pattes: masque par patte (ordre CAMEL_LEGS), position relative à la hanche
+        legs = np.array([leg_masks[name] for name, *_ in self.CAMEL_LEGS])
+        rel_x, rel_y = np.zeros(num), np.zeros(num)
+        for name, *_ in self.CAMEL_LEGS:
+            mask = leg_masks[name]
+            pivot = pivots["hip_" + name]
+            rel_x[mask] = px[mask] - pivot[0]
+            rel_y[mask] = py[mask] - pivot[1]
+        lift_factor = np.where(legs.any(axis=0), np.clip(np.hypot(rel_x, rel_y) / 20.0, 0.2, 1.0), 0.0)
+        
+        camel = {
+            "pos": base_pos,
+            "rel_x": rel_x,
+            "rel_y": rel_y,
+            "lift_factor": lift_factor,
+            "body_bob": (seg_torso | seg_humps).astype(float),
+            "head_bob": np.where(seg_head, 1.0, np.where(seg_neck, 0.4, 0.0)),
+            "tail": seg_tail.astype(float),
+        }
+        camel = {name: value.astype(np.float32) for name, value in camel.items()}
+        camel["legs"] = legs
+        return camel
+
+    @register_phase("act6_identity", camera_preset="heritage", warmup_ms=200, skip_show=True)
+    @register_phase("phase11_croix_agadez", camera_preset="heritage", warmup_ms=200, skip_show=True)
     def _phase_11_croix_agadez(self, num):
         # "Croix d'Agadez" - Solid Image Rendering
         # Composite inclusion function for the sacred symbol
@@ -3861,7 +3958,7 @@ class FormationLibrary:
         def is_in_croix(lx, ly):
             # 1. Ring
             dist = np.sqrt(lx**2 + ly**2)
-            if inner_r <= dist <= outer_r: return True
+            ring = (inner_r <= dist) & (dist <= outer_r)
             
             # 2. Lateral Arms
             def in_arm(px, py, flip=False):
@@ -3869,143 +3966,195 @@ class FormationLibrary:
                 ang = -angle_rad if not flip else angle_rad
                 rx = px * np.cos(ang) + py * np.sin(ang)
                 ry = -px * np.sin(ang) + py * np.cos(ang)
-                return (-arm_w/2 <= rx <= arm_w/2) and (-arm_h/2 <= ry <= arm_h/2)
+                return (np.abs(rx) <= arm_w/2) & (np.abs(ry) <= arm_h/2)
             
-            if in_arm(lx - arm_off_x, ly - arm_off_y): return True
-            if in_arm(lx + arm_off_x, ly - arm_off_y, True): return True
+            arms = in_arm(lx - arm_off_x, ly - arm_off_y) | in_arm(lx + arm_off_x, ly - arm_off_y, True)
             
             # 3. Upper Part (Diamond Head + Neck)
-            # Neck
-            if (-3 <= lx <= 3) and (outer_r <= ly <= outer_r + 12): return True
-            # Head
-            dy = ly - (outer_r + 20)
-            if (abs(lx) + abs(dy) <= d_size): return True
+            neck = (-3 <= lx) & (lx <= 3) & (outer_r <= ly) & (ly <= outer_r + 12)
+            head = np.abs(lx) + np.abs(ly - (outer_r + 20)) <= d_size
             
             # 4. Lower Part (Tapering Body + Terminal)
-            if ((-16 - 40)*sc <= ly <= -outer_r): # Body range
-                h_rel = (ly + outer_r) / (-40.0 * sc)
-                if 0 <= h_rel <= 1:
-                    w_curr = 12.0 * sc * (1 - h_rel) + 4.0 * sc * h_rel
-                    if abs(lx) <= w_curr / 2: return True
-            # Terminal
-            ty = ly - ((-16 - 40 - 8) * sc)
-            if (abs(lx) + abs(ty) <= t_size): return True
+            h_rel = (ly + outer_r) / (-40.0 * sc)
+            w_curr = 12.0 * sc * (1 - h_rel) + 4.0 * sc * h_rel
+            body = ((-16 - 40)*sc <= ly) & (ly <= -outer_r) & (h_rel <= 1) & (np.abs(lx) <= w_curr / 2)
+            terminal = np.abs(lx) + np.abs(ly - ((-16 - 40 - 8) * sc)) <= t_size
             
-            return False
+            return ring | arms | neck | head | body | terminal
 
         # center_z = -30.0 Move it "un peu derriere"
         return self._fill_shape_uniformly(is_in_croix, (-35*sc, 35*sc, -70*sc, 45*sc), num, center=(0, 75, -30.0), z_depth=10.0)
 
-    def _phase_touareg_spiral(self, num, t=0.0, audio_energy=0.5):
+    @register_phase("phase_touareg_spiral", uses_t=True, uses_audio=True, camera_preset="monument",
+                    warmup_ms=40, morph=True, writes_out=True)
+    def _phase_touareg_spiral(self, num, t=0.0, audio_energy=0.5, out=None):
         """
         Spirale Touareg Sacrale: Géométrie traditionnelle sahélienne.
         Morphe graduellement vers 22EMEEDITION après 3 secondes.
         Couleurs: Doré→Vert→Bleu (gradient sahélien).
+        Table d'angles en cache: chaque frame est un calcul sur tableaux entiers.
         """
-        
         # === PARAMETERS ===
         spiral_radius_outer = 60.0
         spiral_radius_inner = 10.0
         spiral_height = 80.0  # Z dimension for 3D spiral
-        spiral_turns = 3.0    # Nombre de rotations
-        
-        # === ANIMATION ===
-        # Phase 0-3s: Spiral full (entry)
-        # Phase 3-5s: Morphing vers 22EMEEDITION (dissolve)
-        if t < 3.0:
-            morph_progress = 0.0  # No morphing yet
-        elif t < 5.0:
-            morph_progress = (t - 3.0) / 2.0  # Morph over 2 seconds
-        else:
-            morph_progress = 1.0  # Fully morphed (shouldn't see this)
-        
-        # === VOXEL GENERATION ===
-        pos = np.zeros((num, 3))
-        cols = np.zeros((num, 3))
-        
-        voxel_count = 0
-        voxels = []
-        voxel_colors = []
-        
-        # Generate spiral pattern
-        angle_step = 2.0 * np.pi / (num // 4)  # Distribute drones around spiral
-        
-        for i in range(num):
-            angle = (i / (num / (spiral_turns * 2.0 * np.pi))) + t * 0.5  # Rotating spiral
-            
-            # Spiral radius (from inner to outer)
-            radius = spiral_radius_inner + (spiral_radius_outer - spiral_radius_inner) * (angle / (spiral_turns * 2.0 * np.pi))
-            radius = np.clip(radius, spiral_radius_inner, spiral_radius_outer)
-            
-            # Position on spiral
-            x = radius * np.cos(angle)
-            z = radius * np.sin(angle)
-            y = 50.0 + (angle / (spiral_turns * 2.0 * np.pi)) * spiral_height
-            
-            # Oscillation for organic motion
-            oscillation = 3.0 * np.sin(angle * 2.0 + t) * np.cos(t * 0.8)
-            x += oscillation * np.cos(angle)
-            z += oscillation * np.sin(angle)
-            
-            voxels.append([x, y, z])
-            
-            # Color gradient: Doré (outer) → Vert (mid) → Bleu (inner)
-            radius_norm = (radius - spiral_radius_inner) / (spiral_radius_outer - spiral_radius_inner)
-            
-            if radius_norm > 0.66:
-                # Outer: Doré
-                t_blend = (radius_norm - 0.66) / 0.34
-                col = (1 - t_blend) * np.array([1.0, 0.84, 0.0]) + t_blend * np.array([1.0, 0.7, 0.0])
-            elif radius_norm > 0.33:
-                # Mid: Vert Sahara
-                t_blend = (radius_norm - 0.33) / 0.33
-                col = (1 - t_blend) * np.array(self.colors["vert_niger"]) + t_blend * np.array([1.0, 0.7, 0.0])
-            else:
-                # Inner: Bleu Nuit
-                t_blend = radius_norm / 0.33
-                col = (1 - t_blend) * np.array(self.colors["bleu_nuit"]) + t_blend * np.array(self.colors["vert_niger"])
-            
-            voxel_colors.append(col)
-        
-        voxels = np.array(voxels)
-        voxel_colors = np.array(voxel_colors)
-        
+        spiral_span = 3.0 * 2.0 * np.pi    # 3 rotations
+
+        base_angle, gradient = self._cache.get_or_build(
+            FormationKey("mesh", "touareg_spiral", num), lambda: self._build_touareg_spiral(num))
+        pos, cols = self._frame_buffers(num, out)
+        # Lignes de travail: angle, u, radius_norm, radius, temporaire (sans allocation par frame)
+        angle, u, radius_norm, radius, tmp = self._scratch("touareg_spiral", (5, num))
+        mask = self._scratch("touareg_spiral_mask", (num,), bool)
+
+        # === VOXEL GENERATION (spirale en rotation) ===
+        np.add(base_angle, t * 0.5, out=angle)
+        np.multiply(angle, 1.0 / spiral_span, out=u)
+        np.clip(u, 0.0, 1.0, out=radius_norm)
+        np.multiply(radius_norm, spiral_radius_outer - spiral_radius_inner, out=radius)
+        radius += spiral_radius_inner
+
+        # Oscillation for organic motion (le long du rayon)
+        np.multiply(angle, 2.0, out=tmp)
+        tmp += t
+        np.sin(tmp, out=tmp)
+        tmp *= float(3.0 * np.cos(t * 0.8))
+        radius += tmp
+        np.cos(angle, out=pos[:, 0])
+        pos[:, 0] *= radius
+        np.multiply(u, spiral_height, out=pos[:, 1])
+        pos[:, 1] += 50.0
+        np.sin(angle, out=pos[:, 2])
+        pos[:, 2] *= radius
+
+        # Color gradient: Doré (outer) → Vert (mid) → Bleu (inner), par segments:
+        # chaque segment est affine en radius_norm, les suivants écrasent au-delà de leur borne
+        breaks, seg_offset, seg_slope = gradient
+        for k in range(3):
+            np.multiply(radius_norm, seg_slope[0][k], out=cols[:, k])
+            cols[:, k] += seg_offset[0][k]
+        for segment, bound in enumerate(breaks, start=1):
+            np.greater(radius_norm, bound, out=mask)
+            for k in range(3):
+                np.multiply(radius_norm, seg_slope[segment][k], out=tmp)
+                tmp += seg_offset[segment][k]
+                np.copyto(cols[:, k], tmp, where=mask)
+
         # === MORPHING TRANSITION ===
+        # Phase 0-3s: Spiral full (entry), 3-5s: Morphing vers 22EMEEDITION (dissolve)
+        morph_progress = min(max((t - 3.0) / 2.0, 0.0), 1.0)
         if morph_progress > 0:
-            # Get target 22EMEEDITION positions
-            target_pos, target_cols = self._phase_22eme_edition(num, t, audio_energy)
-            
-            # Ease-in morphing
-            ease = morph_progress * morph_progress * (3.0 - 2.0 * morph_progress)
-            
-            pos = (1.0 - ease) * voxels + ease * target_pos
-            cols = (1.0 - ease) * voxel_colors + ease * target_cols
-        else:
-            pos = voxels
-            cols = voxel_colors
-        
+            target_pos, target_cols = self._phase_22eme_edition(
+                num, t, audio_energy, out=self._scratch("touareg_spiral_morph", (2, num, 3)))
+            ease = float(smoothstep(morph_progress))
+            target_pos -= pos
+            target_pos *= ease
+            pos += target_pos
+            target_cols -= cols
+            target_cols *= ease
+            cols += target_cols
+
         # === PULSATION ON AUDIO ENERGY ===
-        pulse = 0.9 + 0.1 * np.sin(t * (2.0 + audio_energy * 3.0))
-        cols = cols * pulse
-        
-        return pos, np.clip(cols, 0, 1)
+        cols *= float(0.9 + 0.1 * np.sin(t * (2.0 + audio_energy * 3.0)))
+        np.clip(cols, 0.0, 1.0, out=cols)
 
+        return pos, cols
+
+    def _build_touareg_spiral(self, num):
+        """Partie statique de la spirale: angle de chaque drone et segments affines du gradient."""
+        base_angle = (np.arange(num) * (3.0 * 2.0 * np.pi / num)).astype(np.float32)
+        # Segments (bornes, début, largeur, couleur basse, couleur haute) sur radius_norm:
+        # ]0.66, 1] doré, ]0.33, 0.66] vert → orange, [0, 0.33] bleu nuit → vert
+        breaks = (0.33, 0.66)
+        seg_start = np.array([0.0, 0.33, 0.66])[:, None]
+        seg_width = np.array([0.33, 0.33, 0.34])[:, None]
+        seg_lo = np.array([self.colors["bleu_nuit"], self.colors["vert_niger"], [1.0, 0.84, 0.0]])
+        seg_hi = np.array([self.colors["vert_niger"], [1.0, 0.7, 0.0], [1.0, 0.7, 0.0]])
+        # lo + (hi - lo) * (r - start) / width  ==  offset + slope * r
+        # (listes de floats Python: scalaires sans promotion float64 des tampons float32)
+        seg_slope = (seg_hi - seg_lo) / seg_width
+        seg_offset = seg_lo - seg_slope * seg_start
+        return base_angle, (breaks, seg_offset.tolist(), seg_slope.tolist())
 
-    def _phase_22eme_edition(self, num, t=0.0, audio_energy=0.5):
+    @register_phase("phase_22eme_edition", uses_t=True, uses_audio=True, camera_preset="text",
+                    warmup_ms=23, writes_out=True)
+    def _phase_22eme_edition(self, num, t=0.0, audio_energy=0.5, out=None):
         """
         Advanced 3D Typography: "22EMEEDITION"
         - Chiffres "22" avec pulsation et halo doré
         - Lettres "EMEEDITION" avec gradient vert/blanc et micro-ondulations
         - Audio-réactivité : pulsations sur basses (kick), ondulations sur aigus
+        Voxels du texte en cache par nombre de drones, animation vectorisée.
         """
-        
+        voxels, num_digits, digit_center_x = self._cache.get_or_build(
+            FormationKey("text", "22EMEEDITION", num), lambda: self._build_22eme_edition(num))
+        pos, cols = self._frame_buffers(num, out)
+        # Les chiffres occupent les num_digits premiers drones: tranches contiguës, sans copie
+        digit_pos, letter_pos = pos[:num_digits], pos[num_digits:]
+        digit_voxels, letter_voxels = voxels[:num_digits], voxels[num_digits:]
+        letter_cols = cols[num_digits:]
+        wave, y_norm, tmp = self._scratch("22eme_edition", (3, num))[:, num_digits:]
+        top = self._scratch("22eme_edition_mask", (num,), bool)[num_digits:]
+        digit_tmp = self._scratch("22eme_edition", (3, num))[2, :num_digits]
+
+        # === DIGIT ANIMATION (Pulsation + Glow) ===
+        # DIGITS: Pulsation on beat (kick from audio_energy), faster on high energy
+        # Scalaires Python: un np.float64 forcerait une boucle float64 tamponnée (NEP 50)
+        pulse = float(0.5 + 0.5 * np.sin(t * (2 + 4 * audio_energy)))
+        scale = 0.9 + 0.15 * pulse
+        # Apply scale around character center: c + (v - c) * s == v * s + c * (1 - s)
+        np.multiply(digit_voxels[:, 0], scale, out=digit_pos[:, 0])
+        np.multiply(digit_center_x, 1.0 - scale, out=digit_tmp)
+        digit_pos[:, 0] += digit_tmp
+        np.multiply(digit_voxels[:, 1], scale, out=digit_pos[:, 1])
+        digit_pos[:, 1] += 70 * (1.0 - scale)
+        digit_pos[:, 2] = 0.0
+        # Color: Golden halo (Soleil Or), brighten on pulse
+        cols[:num_digits] = np.array([1.0, 0.84, 0.0]) * (0.7 + 0.3 * pulse)
+
+        # === LETTERS: Micro-oscillations + gradient color ===
+        # Wave through letters based on X position
+        np.multiply(letter_voxels[:, 0], 0.05, out=wave)
+        wave += t * 2.0
+        letter_pos[:, 0] = letter_voxels[:, 0]
+        np.sin(wave, out=tmp)
+        tmp *= 2.0
+        np.add(letter_voxels[:, 1], tmp, out=letter_pos[:, 1])
+        np.cos(wave, out=letter_pos[:, 2])
+        letter_pos[:, 2] *= 1.5
+
+        # Color gradient: Vert/Blanc (bottom half) → Orange → Doré (top half)
+        np.subtract(letter_pos[:, 1], 60, out=y_norm)
+        y_norm /= 20
+        np.clip(y_norm, 0, 1, out=y_norm)
+        np.greater(y_norm, 0.5, out=top)
+        low_base = np.array(self.colors["vert_niger"])
+        low_slope = ((np.array(self.colors["blanc_pure"]) - low_base) / 0.5).tolist()
+        low_base = low_base.tolist()
+        high_base = [1.0, 0.7, 0.0]
+        high_slope = [0.0, 0.14 / 0.5, 0.0]
+        for k in range(3):
+            np.multiply(y_norm, low_slope[k], out=letter_cols[:, k])
+            letter_cols[:, k] += low_base[k]
+            np.multiply(y_norm, high_slope[k], out=tmp)
+            tmp += high_base[k] - 0.5 * high_slope[k]
+            np.copyto(letter_cols[:, k], tmp, where=top)
+
+        # === ENTRY ANIMATION (Zoom in from beginning) ===
+        # First 1 second: zoom from center (0 → 1)
+        if t < 1.0:
+            pos *= t
+
+        return pos, cols
+
+    def _build_22eme_edition(self, num):
+        """Voxels 5x5 de "22EMEEDITION" échantillonnés sur num drones, chiffres / lettres séparés."""
         # === PART 1: "22" (Golden, Pulsing) ===
-        # Each digit is a 5x7 grid voxelized
         digit_font = {
             '2': [[0,1,1,1,0],[1,0,0,0,1],[0,0,1,1,0],[0,1,0,0,0],[1,1,1,1,1]],
             '0': [[0,1,1,1,0],[1,0,0,0,1],[1,0,0,0,1],[1,0,0,0,1],[0,1,1,1,0]],
         }
-        
+
         # === PART 2: "EMEEDITION" (Letters, Gradient) ===
         letter_font = {
             'E': [[1,1,1,1,1],[1,0,0,0,0],[1,1,1,0,0],[1,0,0,0,0],[1,1,1,1,1]],
@@ -4015,116 +4164,38 @@ class FormationLibrary:
             'T': [[1,1,1,1,1],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0],[0,0,1,0,0]],
             'N': [[1,0,0,0,1],[1,1,0,0,1],[1,0,1,0,1],[1,0,0,1,1],[1,0,0,0,1]],
         }
-        
-        # Combined text: "22EMEEDITION"
+
         text = "22EMEEDITION"
-        
-        # Grid generation
         char_width = 8  # voxels wide (5 + spacing) - ENLARGED from 6
-        char_height = 9  # ENLARGED from 7
         total_width = len(text) * char_width
-        
-        # Allocate positions and colors
-        pos = np.zeros((num, 3))
-        cols = np.zeros((num, 3))
-        
-        # Generate voxel grid for each character
+
         voxels = []
-        voxel_colors = []
-        char_idx_list = []  # Track which character each voxel belongs to
-        
+        char_info = []  # (char_pos, is_digit) de chaque voxel
         for char_pos, char in enumerate(text):
-            # Get font grid
-            if char in digit_font:
-                grid = digit_font[char]
-                is_digit = True
-            elif char in letter_font:
-                grid = letter_font[char]
-                is_digit = False
-            else:
-                continue
-            
-            # Fill grid with voxels
+            is_digit = char in digit_font
+            if not is_digit and char not in letter_font:
+                continue    # Pas de glyphe (le 'O' reste un espace)
+            grid = np.array(digit_font[char] if is_digit else letter_font[char])
+            rows, columns = np.nonzero(grid)
             base_x = char_pos * char_width - total_width / 2
-            
-            for row, line in enumerate(grid):
-                for col, pixel in enumerate(line):
-                    if pixel == 1:
-                        vx = base_x + col
-                        vy = 70 - row  # Y centered at 70m
-                        vz = 0
-                        voxels.append([vx, vy, vz])
-                        voxel_colors.append((char_pos, is_digit))
-                        char_idx_list.append(char_pos)
-        
-        # === ANIMATION LOGIC ===
-        # Sample voxels uniformly across the 1000 drones
-        voxels = np.array(voxels) if voxels else np.zeros((1, 3))
-        voxel_colors = np.array(voxel_colors) if voxel_colors else np.array([(0, True)])
-        
-        if len(voxels) < num:
-            # Repeat/pad if not enough voxels
-            indices = np.linspace(0, len(voxels)-1, num).astype(int)
-            voxels = voxels[indices]
-            voxel_colors = voxel_colors[indices]
-        else:
-            # Sample uniformly
-            indices = np.linspace(0, len(voxels)-1, num).astype(int)
-            voxels = voxels[indices]
-            voxel_colors = voxel_colors[indices]
-        
-        pos = voxels.copy()
-        
-        # === DIGIT ANIMATION (Pulsation + Glow) ===
-        for i in range(num):
-            char_pos, is_digit = voxel_colors[i]
-            
-            if is_digit:
-                # DIGITS: Pulsation on beat (kick from audio_energy)
-                pulse = 0.5 + 0.5 * np.sin(t * (2 + 4*audio_energy))  # Faster on high energy
-                scale = 0.9 + 0.15 * pulse
-                
-                # Apply scale around character center
-                char_center_x = char_pos * char_width - total_width/2 + char_width/2
-                pos[i, 0] = char_center_x + (pos[i, 0] - char_center_x) * scale
-                pos[i, 1] = 70 + (pos[i, 1] - 70) * scale
-                
-                # Color: Golden halo
-                base_col = np.array([1.0, 0.84, 0.0])  # Soleil Or
-                # Glow: Brighten on pulse
-                cols[i] = base_col * (0.7 + 0.3 * pulse)
-                
-            else:
-                # LETTERS: Micro-oscillations + gradient color
-                
-                # Micro-oscillation: Wave through letters based on X position
-                wave_x = pos[i, 0] * 0.05
-                oscillation_y = 2.0 * np.sin(wave_x + t * 2.0)
-                oscillation_z = 1.5 * np.cos(wave_x + t * 2.0)
-                
-                pos[i, 1] += oscillation_y
-                pos[i, 2] += oscillation_z
-                
-                # Color gradient: Doré (top) → Vert/Blanc (bottom)
-                y_norm = (pos[i, 1] - 60) / 20  # Normalize within character height
-                y_norm = np.clip(y_norm, 0, 1)
-                
-                if y_norm > 0.5:
-                    # Top half: Orange transition
-                    t_blend = (y_norm - 0.5) / 0.5
-                    cols[i] = (1 - t_blend) * np.array([1.0, 0.7, 0.0]) + t_blend * np.array([1.0, 0.84, 0.0])
-                else:
-                    # Bottom half: Vert to Blanc
-                    t_blend = y_norm / 0.5
-                    cols[i] = (1 - t_blend) * np.array(self.colors["vert_niger"]) + t_blend * np.array(self.colors["blanc_pure"])
-        
-        # === ENTRY ANIMATION (Zoom in from beginning) ===
-        # First 1 second: zoom from center
-        if t < 1.0:
-            entry_scale = t  # 0 → 1 over 1 second
-            pos = pos * entry_scale
-        
-        return pos, cols
+            # Y centered at 70m
+            voxels.append(np.column_stack((base_x + columns, 70 - rows, np.zeros(len(rows)))))
+            char_info.append(np.column_stack((np.full(len(rows), char_pos),
+                                              np.full(len(rows), is_digit))))
+        voxels = np.vstack(voxels).astype(float)
+        char_info = np.vstack(char_info)
+
+        # Sample voxels uniformly across the drones (repeat if not enough voxels)
+        indices = np.linspace(0, len(voxels) - 1, num).astype(int)
+        voxels = voxels[indices]
+        char_pos, is_digit = char_info[indices, 0], char_info[indices, 1].astype(bool)
+
+        # "22" ouvre le texte et l'échantillonnage conserve l'ordre: les chiffres
+        # sont les num_digits premiers drones (tranches contiguës à l'animation)
+        num_digits = int(np.count_nonzero(is_digit))
+        assert is_digit[:num_digits].all()
+        digit_center_x = char_pos[:num_digits] * char_width - total_width / 2 + char_width / 2
+        return voxels.astype(np.float32), num_digits, digit_center_x.astype(np.float32)
 
     def _miroir_celeste(self, num, t):
         # Miroir Céleste Show (45s total)
@@ -4136,11 +4207,11 @@ class FormationLibrary:
             c = np.tile(self.colors["soleil_or"], (n, 1))
             for i in range(n):
                 if i < n * 0.4: # Base building
-                    p[i] = [np.random.uniform(-50, 50), np.random.uniform(0, 20), np.random.uniform(-5, 5)]
+                    p[i] = [self._frame_rng.uniform(-50, 50), self._frame_rng.uniform(0, 20), self._frame_rng.uniform(-5, 5)]
                 else: # Main Tower
-                    h = np.random.uniform(0, 90)
+                    h = self._frame_rng.uniform(0, 90)
                     w = 34.0 * (1 - h/90.0) + 8.0 * (h/90.0)
-                    p[i] = [np.random.uniform(-w/2, w/2), 20 + h, np.random.uniform(-w/2, w/2)]
+                    p[i] = [self._frame_rng.uniform(-w/2, w/2), 20 + h, self._frame_rng.uniform(-w/2, w/2)]
             return p, c
 
         # --- Sub-Phases ---
@@ -4151,7 +4222,7 @@ class FormationLibrary:
             for i in range(n_ext):
                 eh = (i / n_ext) * 80.0 * prog
                 w = 8.0 * (1 - eh/80.0)
-                p[i] = [np.random.uniform(-w/2, w/2), 110 + eh, np.random.uniform(-w/2, w/2)]
+                p[i] = [self._frame_rng.uniform(-w/2, w/2), 110 + eh, self._frame_rng.uniform(-w/2, w/2)]
                 mix = i / n_ext
                 c[i] = np.array(self.colors["soleil_or"]) * (1-mix) + np.array(self.colors["star_white"]) * mix
             return p, c
@@ -4181,12 +4252,14 @@ class FormationLibrary:
             prog = min(1.0, (t-35.0)/10.0)
             for i in range(num):
                 p[i, 1] += prog * 180
-                p[i, 2] += np.random.uniform(-50, 50) * prog
-                p[i, 0] += np.random.uniform(-50, 50) * prog
+                p[i, 2] += self._frame_rng.uniform(-50, 50) * prog
+                p[i, 0] += self._frame_rng.uniform(-50, 50) * prog
                 c[i] = np.array(self.colors["star_white"]) * (1-prog)
             return p, c
 
-    def _act_5_african_soul(self, num_drones, t, audio_energy):
+    @register_phase("act5_african_soul", uses_t=True, uses_audio=True, camera_preset="africa_map", warmup_ms=45,
+                    writes_out=True)
+    def _act_5_african_soul(self, num_drones, t, audio_energy, out=None):
         """
         ACT 5: L'âme africaine - Africa Map with Niger highlighted in red.
         
@@ -4196,19 +4269,16 @@ class FormationLibrary:
         6-9s: Zoom on Niger with pulsation based on audio
         9+: Hold formation with dynamic brightness
         """
-        # Pre-cached positions and colors for performance
-        # Generate once and reuse
-        if not hasattr(self, '_act5_cache'):
-            from africa_map_generator import AfricaMapGenerator
-            generator = AfricaMapGenerator(width=400, height=400, scale=0.8)
-            base_pos_tmp, base_colors_tmp = generator.extract_drone_coordinates(num_drones)
-            self._act5_cache = (base_pos_tmp, base_colors_tmp)
+        # Carte en cache par nombre de drones (float32, complétée à num_drones,
+        # indices des drones du Niger précalculés); le raster est partagé
+        base_pos, base_colors, niger_idx = self._cache.get_or_build(
+            FormationKey("mesh", "african_soul", num_drones),
+            lambda: self._build_african_soul(num_drones))
         
-        base_pos, base_colors = self._act5_cache
-        
-        # Ensure float32 for color operations
-        base_pos = base_pos.astype(np.float32)
-        base_colors = base_colors.astype(np.float32)
+        # Frame buffers (float32 when provided by DroneManager)
+        positions, colors = self._frame_buffers(num_drones, out)
+        positions[:] = base_pos
+        colors[:] = base_colors
         
         # Time progression within phase
         phase_t = t % 12.0  # 12 second cycle
@@ -4217,69 +4287,47 @@ class FormationLibrary:
             # Start with full map visible, gradually brighten
             progress = phase_t / 3.0
             
-            positions = base_pos.copy()
-            colors = base_colors.copy()
-            
             # Gradually brighten from dim to full brightness
             brightness = 0.3 + 0.7 * progress
-            colors = colors * brightness
+            colors *= brightness
             
         elif phase_t < 6.0:  # === NIGER HIGHLIGHT (3-6s) ===
             # Emphasize Niger in red, dim rest
             progress = (phase_t - 3.0) / 3.0
             
-            positions = base_pos.copy()
-            colors = base_colors.copy()
-            
-            # Identify Niger drones (red)
-            niger_mask = np.all(colors > np.array([0.8, 0, 0]), axis=1)
-            
-            # Brighten Niger
-            colors[niger_mask] = np.array([1, 0, 0], dtype=np.float32)
-            # Dim Africa outline
-            colors[~niger_mask] = colors[~niger_mask] * (0.5 + 0.5 * progress)
+            # Dim Africa outline, then brighten Niger
+            colors *= (0.5 + 0.5 * progress)
+            colors[niger_idx] = (1, 0, 0)
             
         elif phase_t < 9.0:  # === ZOOM ON NIGER (6-9s) ===
             # Zoom transformation: center on Niger
             progress = (phase_t - 6.0) / 3.0
             zoom_factor = 1.0 + progress * 1.5  # Zoom up to 2.5x
             
-            positions = base_pos.copy()
-            colors = base_colors.copy()
-            
             # Niger center (approximate)
             niger_center = np.array([0, 50, 0], dtype=np.float32)
             
             # Zoom: move drones toward Niger center
-            vectors = niger_center - positions
-            positions = positions + vectors * (1 - 1/zoom_factor)
+            # p + (c - p) * k  ==  p * (1 - k) + c * k
+            k = 1 - 1/zoom_factor
+            positions *= (1 - k)
+            positions += niger_center * k
             
             # Audio-reactive pulsation (beat based)
             pulsation = 0.8 + 0.2 * np.sin(audio_energy * np.pi) * np.sin(t * 3.0)
-            colors = colors * pulsation
+            colors *= pulsation
             
         else:  # === HOLD (9+s) ===
-            positions = base_pos.copy()
-            colors = base_colors.copy()
-            
-            # Audio-reactive brightness on Niger
-            niger_mask = np.all(base_colors > np.array([0.8, 0, 0]), axis=1)
-            
-            # Pulsate red drones with audio energy
+            # Audio-reactive brightness on Niger: pulsate red drones with audio energy
             brightness = 0.7 + 0.3 * audio_energy
-            colors[niger_mask] = np.array([1, 0, 0], dtype=np.float32) * brightness
-            colors[~niger_mask] = colors[~niger_mask] * (0.6 + 0.4 * audio_energy)
-        
-        # Ensure valid array shape and dtype
-        positions = positions.astype(np.float32)
-        colors = colors.astype(np.float32)
-        
-        if len(positions) < num_drones:
-            padding = num_drones - len(positions)
-            positions = np.vstack([positions, np.zeros((padding, 3), dtype=np.float32)])
-            colors = np.vstack([colors, np.zeros((padding, 3), dtype=np.float32)])
-        elif len(positions) > num_drones:
-            positions = positions[:num_drones]
-            colors = colors[:num_drones]
+            colors *= (0.6 + 0.4 * audio_energy)
+            colors[niger_idx] = np.array([1, 0, 0], dtype=np.float32) * brightness
         
         return positions, colors
+
+    def _build_african_soul(self, num_drones):
+        """Carte de l'Afrique échantillonnée pour num_drones + indices des drones du Niger."""
+        from africa_map_generator import AfricaMapGenerator
+        generator = AfricaMapGenerator(width=400, height=400, scale=0.8)
+        base_pos, base_colors, niger_mask = generator.extract_drone_layers(num_drones)
+        return base_pos, base_colors, np.flatnonzero(niger_mask)
@@ -0,0 +1,342 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+              CODEC DE FRAMES PRÉ-CALCULÉES (QUANTIFIÉ + DELTA) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Stockage compact de l'état DroneManager (positions + couleurs) d'un show
+pré-calculé:
+
+1. Quantification: positions en int16 dans la boîte `space` de
+   simulation.yaml (pas ≈ 6 mm pour 400 m, saturé hors de la boîte),
+   couleurs en uint8 (bornées à [0, 1])
+2. Delta temporel: chaque chunk commence par une frame clé absolue, les
+   suivantes sont des différences (arithmétique modulaire, exacte)
+   codées en zigzag (petites valeurs positives)
+3. Octets réordonnés par plan (octets faibles / forts) puis zlib par chunk
+4. Index des chunks en fin de fichier: accès O(1) à n'importe quelle frame
+   (un seul chunk à décompresser)
+
+Format (little-endian):
+    en-tête : magic, version, num_drones, rate, chunk_frames, bornes (6 × f64)
+    chunks  : zlib(plans d'octets des deltas positions int16 | couleurs uint8)
+    index   : nombre de frames, nombre de chunks, (offset, taille) int64 par chunk
+    fin     : offset de l'index + magic
+
+Usage (benchmark):  python src/frame_codec.py [num_drones] [secondes] [rate_hz]
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import mmap
+import struct
+import sys
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+_MAGIC = b"ANEMFC01"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIdI6d")   # magic, version, num_drones, rate, chunk_frames, bornes
+_FOOTER = struct.Struct("<q8s")
+
+
+@dataclass(frozen=True)
+class FrameQuantizer:
+    """Quantification des positions (int16 dans une boîte) et couleurs (uint8)"""
+    lower: Tuple[float, float, float]
+    upper: Tuple[float, float, float]
+
+    @classmethod
+    def from_config(cls, sim_config):
+        space = sim_config['simulation']['space']
+        ranges = (space['x_range'], space['y_range'], space['z_range'])
+        return cls(lower=tuple(float(r[0]) for r in ranges),
+                   upper=tuple(float(r[1]) for r in ranges))
+
+    @property
+    def step(self) -> np.ndarray:
+        """Pas de quantification par axe (m); erreur max = step / 2 dans la boîte."""
+        return (np.array(self.upper) - np.array(self.lower)) / 65535.0
+
+    def quantize_positions(self, positions: np.ndarray, out: np.ndarray) -> np.ndarray:
+        lower = np.array(self.lower, dtype=np.float32)
+        scaled = (positions - lower) / self.step.astype(np.float32)
+        np.clip(np.rint(scaled), 0, 65535, out=scaled)
+        np.subtract(scaled, 32768, out=out, casting='unsafe')
+        return out
+
+    def dequantize_positions(self, quantized: np.ndarray, out: np.ndarray) -> np.ndarray:
+        offset = np.array(self.lower, dtype=np.float32) + 32768 * self.step.astype(np.float32)
+        np.multiply(quantized, self.step.astype(np.float32), out=out)
+        out += offset
+        return out
+
+    @staticmethod
+    def quantize_colors(colors: np.ndarray, out: np.ndarray) -> np.ndarray:
+        scaled = colors * np.float32(255.0)
+        np.clip(np.rint(scaled), 0, 255, out=scaled)
+        out[:] = scaled
+        return out
+
+    @staticmethod
+    def dequantize_colors(quantized: np.ndarray, out: np.ndarray) -> np.ndarray:
+        np.multiply(quantized, np.float32(1.0 / 255.0), out=out)
+        return out
+
+
+def _zigzag(delta: np.ndarray, unsigned) -> np.ndarray:
+    """Entiers signés → non signés (0, -1, 1, -2 ... → 0, 1, 2, 3 ...)."""
+    bits = delta.dtype.itemsize * 8
+    return ((delta << 1) ^ (delta >> (bits - 1))).view(unsigned)
+
+
+def _unzigzag(value: np.ndarray, signed) -> np.ndarray:
+    return (value >> 1).view(signed) ^ -(value & 1).view(signed)
+
+
+def _shuffle(array: np.ndarray) -> bytes:
+    """Plans d'octets: tous les octets de rang 0, puis de rang 1... (mieux compressé)."""
+    width = array.dtype.itemsize
+    return np.ascontiguousarray(array.view(np.uint8).reshape(-1, width).T).tobytes()
+
+
+def _unshuffle(data: memoryview, dtype, shape) -> np.ndarray:
+    width = np.dtype(dtype).itemsize
+    planes = np.frombuffer(data, dtype=np.uint8).reshape(width, -1)
+    return np.ascontiguousarray(planes.T).view(dtype).reshape(shape)
+
+
+class FrameCodecWriter:
+    """
+    Encodeur en flux: add_frame(positions, colors) pour chaque frame puis
+    close(). Seul le chunk courant (chunk_frames frames) est en mémoire.
+    """
+
+    def __init__(self, path: str, num_drones: int, quantizer: FrameQuantizer,
+                 rate: float = 30.0, chunk_frames: int = 30, level: int = 1):
+        self.path = path
+        self.num_drones = num_drones
+        self.quantizer = quantizer
+        self.rate = rate
+        self.chunk_frames = chunk_frames
+        self.level = level
+        self.frames = 0
+        self._positions = np.empty((chunk_frames, num_drones, 3), dtype=np.int16)
+        self._colors = np.empty((chunk_frames, num_drones, 3), dtype=np.uint8)
+        self._fill = 0
+        self._index = []
+
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, num_drones, rate, chunk_frames,
+                                      *quantizer.lower, *quantizer.upper))
+
+    def add_frame(self, positions: np.ndarray, colors: np.ndarray):
+        self.quantizer.quantize_positions(positions, self._positions[self._fill])
+        self.quantizer.quantize_colors(colors, self._colors[self._fill])
+        self._fill += 1
+        self.frames += 1
+        if self._fill == self.chunk_frames:
+            self._write_chunk()
+
+    def close(self):
+        if self._file is None:
+            return
+        if self._fill:
+            self._write_chunk()
+        index_offset = self._file.tell()
+        index = np.array(self._index, dtype=np.int64).reshape(-1, 2)
+        self._file.write(struct.pack("<qq", self.frames, len(index)))
+        self._file.write(index.tobytes())
+        self._file.write(_FOOTER.pack(index_offset, _MAGIC))
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _write_chunk(self):
+        count = self._fill
+        positions, colors = self._positions[:count], self._colors[:count]
+        # Deltas modulaires (la première frame reste absolue): exacts au décodage
+        pos_delta = positions.copy()
+        np.subtract(positions[1:], positions[:-1], out=pos_delta[1:])
+        col_delta = colors.copy()
+        np.subtract(colors[1:], colors[:-1], out=col_delta[1:])
+
+        payload = (_shuffle(_zigzag(pos_delta, np.uint16)) +
+                   _zigzag(col_delta.view(np.int8), np.uint8).tobytes())
+        compressed = zlib.compress(payload, self.level)
+        self._index.append((self._file.tell(), len(compressed)))
+        self._file.write(compressed)
+        self._fill = 0
+
+
+class BakedShowReader:
+    """
+    Lecture d'un show encodé: le fichier est projeté en mémoire (mmap), seul
+    le chunk demandé est lu et décompressé par frame(i) (mis en cache, donc
+    lecture séquentielle = un zlib.decompress par chunk).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.num_drones, self.rate, self.chunk_frames, *bounds = \
+            _HEADER.unpack_from(self._data, 0)
+        index_offset, end_magic = _FOOTER.unpack_from(self._data, len(self._data) - _FOOTER.size)
+        if magic != _MAGIC or end_magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path}: fichier de frames invalide")
+        self.quantizer = FrameQuantizer(lower=tuple(bounds[:3]), upper=tuple(bounds[3:]))
+        self.num_frames, chunks = struct.unpack_from("<qq", self._data, index_offset)
+        self._index = np.frombuffer(self._data, dtype=np.int64, count=2 * chunks,
+                                    offset=index_offset + 16).reshape(chunks, 2).copy()
+        self._chunk_id = None
+        self._positions = None
+        self._colors = None
+
+    @property
+    def duration(self) -> float:
+        return self.num_frames / self.rate
+
+    def frame(self, index: int, out: Optional[Tuple[np.ndarray, np.ndarray]] = None
+              ) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions et couleurs float32 (N, 3) de la frame index (dans out si fourni)."""
+        if not 0 <= index < self.num_frames:
+            raise IndexError(f"frame {index} hors de [0, {self.num_frames})")
+        chunk, row = divmod(index, self.chunk_frames)
+        if chunk != self._chunk_id:
+            self._decode_chunk(chunk)
+        if out is None:
+            out = (np.empty((self.num_drones, 3), dtype=np.float32),
+                   np.empty((self.num_drones, 3), dtype=np.float32))
+        self.quantizer.dequantize_positions(self._positions[row], out[0])
+        self.quantizer.dequantize_colors(self._colors[row], out[1])
+        return out
+
+    def frame_at(self, t: float, out=None):
+        """Frame la plus proche de l'instant t (s)."""
+        return self.frame(min(max(int(round(t * self.rate)), 0), self.num_frames - 1), out)
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _decode_chunk(self, chunk):
+        offset, size = self._index[chunk]
+        count = min(self.chunk_frames, self.num_frames - chunk * self.chunk_frames)
+        shape = (count, self.num_drones, 3)
+        payload = memoryview(zlib.decompress(self._data[offset:offset + size]))
+        pos_bytes = count * self.num_drones * 3 * 2
+
+        pos_delta = _unzigzag(_unshuffle(payload[:pos_bytes], np.uint16, shape), np.int16)
+        col_delta = _unzigzag(np.frombuffer(payload[pos_bytes:], dtype=np.uint8).reshape(shape), np.int8)
+        # Somme cumulée modulaire: reconstruit exactement les valeurs quantifiées
+        self._positions = np.cumsum(pos_delta, axis=0, dtype=np.int16)
+        self._colors = np.cumsum(col_delta.view(np.uint8), axis=0, dtype=np.uint8)
+        self._chunk_id = chunk
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          BENCHMARK DU CODEC
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def benchmark_codec(sim_config, vis_config, path, seconds=10.0, rate=30.0, phases=None):
+    """
+    Encode un show simulé puis le relit: taux de compression (vs float32
+    brut), erreurs max de reconstruction et débit de décodage (frames/s).
+    """
+    from show_validator import simulate_frames
+
+    num = sim_config['simulation']['max_drones']
+    phases = phases or ["phase2_anem", "phase_22eme_edition", "phase3_jcn", "phase4_fes"]
+    quantizer = FrameQuantizer.from_config(sim_config)
+    reference = []   # Quelques frames conservées pour mesurer l'erreur
+
+    start = time.perf_counter()
+    with FrameCodecWriter(path, num, quantizer, rate=rate) as writer:
+        for t, manager, _ in simulate_frames(sim_config, vis_config, phases,
+                                             seconds / len(phases), rate_hz=rate):
+            writer.add_frame(manager.positions, manager.colors)
+            if writer.frames % 7 == 1:
+                reference.append((writer.frames - 1, manager.positions.copy(), manager.colors.copy()))
+    encode_time = time.perf_counter() - start
+
+    out = (np.empty((num, 3), dtype=np.float32), np.empty((num, 3), dtype=np.float32))
+    pos_error = col_error = 0.0
+    with BakedShowReader(path) as reader:
+        for index, positions, colors in reference:
+            reader.frame(index, out)
+            pos_error = max(pos_error, float(np.abs(out[0] - positions).max()))
+            col_error = max(col_error, float(np.abs(out[1] - np.clip(colors, 0.0, 1.0)).max()))
+
+    with BakedShowReader(path) as reader:
+        start = time.perf_counter()
+        for index in range(reader.num_frames):
+            reader.frame(index, out)
+        decode_fps = reader.num_frames / (time.perf_counter() - start)
+        frames, encoded_bytes = reader.num_frames, len(reader._data)
+
+    raw_bytes = frames * num * 6 * 4
+    return {
+        "frames": frames,
+        "raw_mb": raw_bytes / 1e6,
+        "encoded_mb": encoded_bytes / 1e6,
+        "ratio": raw_bytes / encoded_bytes,
+        "max_position_error": pos_error,
+        "max_color_error": col_error,
+        "encode_s": encode_time,
+        "decode_fps": decode_fps,
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'FrameQuantizer',
+    'FrameCodecWriter',
+    'BakedShowReader',
+    'benchmark_codec',
+]
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import yaml
+
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+    rate = float(sys.argv[3]) if len(sys.argv) > 3 else 30.0
+
+    config_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'config')
+    with open(os.path.join(config_dir, 'simulation.yaml'), 'r', encoding='utf-8') as f:
+        sim_config = yaml.safe_load(f)
+    with open(os.path.join(config_dir, 'visuals.yaml'), 'r', encoding='utf-8') as f:
+        vis_config = yaml.safe_load(f)
+    sim_config['simulation']['max_drones'] = num
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = benchmark_codec(sim_config, vis_config, os.path.join(tmp, "show.anemfc"), seconds, rate)
+    step = FrameQuantizer.from_config(sim_config).step
+    print(f"{num} drones, {stats['frames']} frames à {rate:.0f} Hz")
+    print(f"Brut float32: {stats['raw_mb']:.1f} Mo  encodé: {stats['encoded_mb']:.1f} Mo  "
+          f"ratio {stats['ratio']:.1f}×")
+    print(f"Erreur max: position {stats['max_position_error'] * 1000:.2f} mm "
+          f"(pas {step.max() * 1000:.2f} mm), couleur {stats['max_color_error']:.4f}")
+    print(f"Encodage: {stats['encode_s']:.1f}s (simulation incluse)  "
+          f"décodage: {stats['decode_fps']:.0f} frames/s")
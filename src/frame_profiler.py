@@ -0,0 +1,119 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+                PROFILAGE MÉMOIRE DU CHEMIN DE FRAME - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Mesure (tracemalloc) le pic d'allocation d'une frame "en régime" de chaque
+phase animée lorsqu'elle écrit dans les buffers préalloués du DroneManager
+(get_phase(..., out=...)).
+
+Une allocation est "grande" si elle atteint la taille d'un buffer de frame
+float32 (num_drones × 3 × 4 octets). Aucune phase animée ne doit franchir ce
+seuil, à une marge fixe près pour les buffers internes des ufuncs NumPy
+(bornés à 8192 éléments, indépendants de N): toutes écrivent en place
+(writes_out=True) à partir de géométries statiques en cache.
+
+Avec --lod, mesure plutôt l'étape LOD du rendu (render_lod) pour chaque
+phase vue depuis la caméra "ground": drones visibles, halos, splats et coût
+de dessin économisé (sommets envoyés vs 2 points par drone).
+
+Usage:  python src/frame_profiler.py [num_drones] [--lod]   (10000 par défaut)
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+from formation_library import FormationLibrary
+from phase_registry import PHASE_REGISTRY
+from render_lod import DroneLOD, orbit_camera_pose
+
+
+# Marge fixe: buffers de casting/stride des ufuncs (8192 éléments float64 max)
+UFUNC_BUFFER_ALLOWANCE = 128 * 1024
+
+
+def frame_buffer_bytes(num_drones):
+    """Taille d'un buffer de frame float32 (seuil des grandes allocations)."""
+    return num_drones * 3 * np.dtype(np.float32).itemsize
+
+
+def measure_frame_allocations(library, phase_name, num_drones, t=5.0, warmup_frames=2):
+    """
+    Pic d'allocation (octets) d'une frame de phase_name écrite dans des
+    buffers float32 préalloués, après warmup_frames frames de préchauffage
+    (remplissage des caches statiques).
+    """
+    out = (np.zeros((num_drones, 3), dtype=np.float32),
+           np.zeros((num_drones, 3), dtype=np.float32))
+    for k in range(warmup_frames):
+        library.get_phase(phase_name, num_drones, t=t - 0.016 * (warmup_frames - k), out=out)
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        library.get_phase(phase_name, num_drones, t=t, out=out)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - baseline)
+
+
+def check_frame_allocations(num_drones=10000, phases=None, library=None):
+    """
+    Rapport {phase: (peak_bytes, writes_out, ok)} pour les phases animées.
+    ok est False si la phase alloue au moins un buffer de frame.
+    """
+    library = library or FormationLibrary()
+    threshold = frame_buffer_bytes(num_drones) + UFUNC_BUFFER_ALLOWANCE
+    if phases is None:
+        phases = [name for name, spec in PHASE_REGISTRY.items() if not spec.static]
+
+    report = {}
+    for name in phases:
+        spec = PHASE_REGISTRY[name]
+        peak = measure_frame_allocations(library, name, num_drones)
+        report[name] = (peak, spec.writes_out, peak < threshold)
+    return report
+
+
+def check_lod(num_drones=10000, phases=None, library=None, camera_pose=None,
+              perf_config=None, aspect=16 / 9):
+    """
+    Rapport {phase: (LODStats, build_ms)} de l'étape LOD pour une frame de
+    chaque phase, vue depuis camera_pose (preset "ground" par défaut).
+    """
+    library = library or FormationLibrary()
+    camera_pose = camera_pose or orbit_camera_pose(200.0, 12.0, -10.0, 55.0)
+    lod = DroneLOD.from_config(perf_config, num_drones)
+    phases = phases or sorted(PHASE_REGISTRY)
+
+    report = {}
+    for name in phases:
+        positions, colors = library.get_phase(name, num_drones, t=5.0)
+        positions = np.ascontiguousarray(positions, dtype=np.float32)
+        start = time.perf_counter()
+        stats = lod.build(positions, colors, camera_pose, aspect=aspect)
+        report[name] = (stats, (time.perf_counter() - start) * 1000.0)
+    return report
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if a != '--lod']
+    n = int(args[0]) if args else 10000
+    if '--lod' in sys.argv:
+        print(f"LOD depuis la caméra ground ({n} drones, référence {2 * n} sommets)")
+        print(f"  {'phase':24s} {'visibles':>8s} {'halos':>6s} {'splats':>6s} "
+              f"{'sommets':>8s} {'économie':>9s} {'build':>8s}")
+        for name, (stats, ms) in check_lod(n).items():
+            print(f"  {name:24s} {stats.visible:8d} {stats.halos:6d} {stats.splats:6d} "
+                  f"{stats.vertices:8d} {stats.saved:8.0%} {ms:6.2f}ms")
+        sys.exit(0)
+    results = check_frame_allocations(n)
+    print(f"Seuil grande allocation: {frame_buffer_bytes(n) + UFUNC_BUFFER_ALLOWANCE} octets ({n} drones)")
+    for name, (peak, writes_out, ok) in sorted(results.items(), key=lambda kv: kv[1][0]):
+        mode = "out" if writes_out else "copy"
+        status = "OK" if ok else "FAIL"
+        print(f"  {name:24s} {mode:4s} {peak / 1024:10.1f} KiB  {status}")
+    sys.exit(0 if all(ok for _, _, ok in results.values()) else 1)
@@ -0,0 +1,207 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+                 CACHE D'IMAGES DÉCODÉES (ASSETS) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Chaque image source (PNG/JPG de data/assets, silhouettes) n'est décodée par
+PIL qu'une seule fois:
+
+1. Clé          : chemin absolu + mtime + taille du fichier (une image
+                  modifiée est redécodée, l'ancien paquet est supprimé)
+2. Paquet disque: <cache>/<nom>-<clé>/ avec un .npy par tableau
+                  (masque alpha, coordonnées et couleurs des pixels opaques,
+                  poids luminance / contours) + asset.json
+3. Chargement   : np.load(mmap_mode='r') - aucun décodage ni copie, les
+                  pages sont lues à la demande et partagées entre processus
+4. Mémoire      : un seul ImageAsset par fichier et par processus
+5. Tirage       : n pixels pour tout nombre de drones, uniforme ou pondéré
+                  (luminance, contours), stratifié le long du balayage
+
+Si le dossier de cache n'est pas inscriptible, l'image est décodée en
+mémoire (même API, sans persistance).
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+from scipy import ndimage
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'cache', 'images')
+ALPHA_THRESHOLD = 128           # Pixel opaque: alpha > 128 (comme _sample_from_image)
+BUNDLE_VERSION = 1
+WEIGHTINGS = ("uniform", "luminance", "edges")
+
+_ARRAYS = ("mask", "coords", "colors", "luminance", "edges")
+
+# Assets ouverts dans ce processus: clé du fichier -> ImageAsset
+_ASSETS: Dict[str, "ImageAsset"] = {}
+
+
+def _source_key(path: str) -> str:
+    """Empreinte (chemin, mtime, taille): change dès que le fichier change."""
+    stat = os.stat(path)
+    token = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}|v{BUNDLE_VERSION}"
+    return hashlib.sha1(token.encode('utf-8')).hexdigest()[:16]
+
+
+def decode_image(path: str) -> Dict[str, np.ndarray]:
+    """Décodage PIL + extraction des pixels opaques (coûteux, fait une fois)."""
+    data = np.array(Image.open(path).convert("RGBA"))
+    mask = data[:, :, 3] > ALPHA_THRESHOLD
+    ys, xs = np.nonzero(mask)
+    rgb = data[:, :, :3].astype(np.float32) / 255.0
+
+    # Luminance (Rec. 709) et force des contours (Sobel sur luminance × alpha)
+    luma = rgb @ np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+    shape = luma * (data[:, :, 3] / 255.0)
+    edges = np.hypot(ndimage.sobel(shape, axis=0), ndimage.sobel(shape, axis=1))
+    edges = edges[ys, xs]
+    peak = edges.max() if len(edges) else 0.0
+    return {
+        'mask': mask,
+        'coords': np.column_stack((xs, ys)).astype(np.int32),
+        'colors': data[ys, xs, :3],
+        'luminance': luma[ys, xs].astype(np.float32),
+        'edges': (edges / peak if peak > 0 else edges).astype(np.float32),
+    }
+
+
+class ImageAsset:
+    """Image décodée: masque alpha + pixels opaques (tableaux en lecture seule)"""
+
+    def __init__(self, path: str, arrays: Dict[str, np.ndarray]):
+        self.path = path
+        self.mask = arrays['mask']                  # (H, W) bool
+        self.coords = arrays['coords']              # (M, 2) int32, (x, y) en ordre de balayage
+        self.colors = arrays['colors']              # (M, 3) uint8
+        self.luminance = arrays['luminance']        # (M,) float32 [0, 1]
+        self.edges = arrays['edges']                # (M,) float32 [0, 1]
+        self.height, self.width = self.mask.shape
+        self._pixel_ids = None
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    @property
+    def bounds(self) -> Tuple[int, int, int, int]:
+        """(min_x, max_x, min_y, max_y) des pixels opaques"""
+        lo, hi = self.coords.min(axis=0), self.coords.max(axis=0)
+        return int(lo[0]), int(hi[0]), int(lo[1]), int(hi[1])
+
+    def rgb(self) -> np.ndarray:
+        """Image (H, W, 3) uint8 reconstruite (pixels transparents à 0)."""
+        image = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        image[self.coords[:, 1], self.coords[:, 0]] = self.colors
+        return image
+
+    def colors_at(self, points: np.ndarray) -> np.ndarray:
+        """Couleurs float (N, 3) du pixel opaque le plus proche de chaque point (x, y)."""
+        if self._pixel_ids is None:
+            self._pixel_ids = self.coords[:, 1].astype(np.int64) * self.width + self.coords[:, 0]
+        px = np.clip(np.rint(points[:, 0]).astype(np.int64), 0, self.width - 1)
+        py = np.clip(np.rint(points[:, 1]).astype(np.int64), 0, self.height - 1)
+        index = np.searchsorted(self._pixel_ids, py * self.width + px)
+        return self.colors[np.minimum(index, len(self) - 1)] / 255.0
+
+    def sample(self, num: int, weighting: str = "uniform", seed: int = 2025):
+        """
+        num points (x, y) float et leurs couleurs (num, 3) float: tirage
+        systématique pondéré le long du balayage (répartition homogène pour
+        tout num) + décalage sous-pixel.
+        """
+        if weighting not in WEIGHTINGS:
+            raise ValueError(f"Pondération inconnue: {weighting} (attendu: {', '.join(WEIGHTINGS)})")
+        rng = np.random.default_rng(seed)
+        if weighting == "uniform":
+            cumulative = np.arange(1, len(self) + 1, dtype=np.float64)
+        else:
+            weights = self.luminance if weighting == "luminance" else self.edges
+            cumulative = np.cumsum(weights + 1e-3, dtype=np.float64)   # Jamais de poids nul
+        target = (np.arange(num) + rng.random(num)) * (cumulative[-1] / max(num, 1))
+        index = np.minimum(np.searchsorted(cumulative, target, side='right'), len(self) - 1)
+        points = self.coords[index] + rng.random((num, 2)) - 0.5
+        return points, self.colors[index] / 255.0
+
+
+def _save_bundle(folder: str, path: str, arrays: Dict[str, np.ndarray]):
+    """Écriture atomique du paquet (dossier temporaire puis renommage)."""
+    parent = os.path.dirname(folder)
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix='.tmp-', dir=parent)
+    try:
+        for name in _ARRAYS:
+            np.save(os.path.join(staging, f"{name}.npy"), arrays[name])
+        with open(os.path.join(staging, 'asset.json'), 'w', encoding='utf-8') as f:
+            json.dump({'source': os.path.abspath(path), 'version': BUNDLE_VERSION,
+                       'width': int(arrays['mask'].shape[1]), 'height': int(arrays['mask'].shape[0]),
+                       'opaque_pixels': int(len(arrays['coords']))}, f, indent=2)
+        os.replace(staging, folder)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        if not os.path.isdir(folder):
+            raise
+    _prune_stale(folder, path)
+
+
+def _prune_stale(folder: str, path: str):
+    """Supprime les paquets d'anciennes versions du même fichier source."""
+    parent, current = os.path.split(folder)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    for name in os.listdir(parent):
+        if name == current or not name.startswith(f"{stem}-"):
+            continue
+        try:
+            with open(os.path.join(parent, name, 'asset.json'), encoding='utf-8') as f:
+                stale = json.load(f).get('source') == os.path.abspath(path)
+        except (OSError, ValueError):
+            continue
+        if stale:
+            shutil.rmtree(os.path.join(parent, name), ignore_errors=True)
+
+
+def load_image_asset(path: str, cache_dir: Optional[str] = None) -> Optional[ImageAsset]:
+    """
+    ImageAsset de path (None si le fichier n'existe pas): mémoire du
+    processus, sinon paquet disque en mmap, sinon décodage + écriture.
+    """
+    if not os.path.exists(path):
+        return None
+    key = _source_key(path)
+    if key in _ASSETS:
+        return _ASSETS[key]
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    folder = os.path.join(cache_dir or DEFAULT_CACHE_DIR, f"{stem}-{key}")
+    if os.path.isfile(os.path.join(folder, 'asset.json')):
+        arrays = {name: np.load(os.path.join(folder, f"{name}.npy"), mmap_mode='r') for name in _ARRAYS}
+    else:
+        arrays = decode_image(path)
+        try:
+            _save_bundle(folder, path, arrays)
+            arrays = {name: np.load(os.path.join(folder, f"{name}.npy"), mmap_mode='r') for name in _ARRAYS}
+        except OSError as e:
+            print(f"Warning: cache d'image non inscriptible ({e}), décodage en mémoire")
+            for array in arrays.values():
+                array.setflags(write=False)
+
+    asset = ImageAsset(path, arrays)
+    _ASSETS[key] = asset
+    return asset
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'ImageAsset',
+    'load_image_asset',
+    'decode_image',
+    'WEIGHTINGS',
+]
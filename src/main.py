@@ -21,6 +21,11 @@ def main():
         print(f"Error loading config: {e}")
         sys.exit(1)
 
+    # Optional performance settings (compute backend, LOD...), shared via sim_config
+    perf_path = os.path.join(config_dir, 'performance.yaml')
+    if os.path.exists(perf_path):
+        sim_config['performance'] = load_config(perf_path)['performance']
+
     app = QApplication(sys.argv)
     app.setApplicationName(sim_config['simulation']['title'])
 
@@ -0,0 +1,75 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+                 REGISTRE DES PHASES (DÉCLARATIF) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Chaque générateur de FormationLibrary se déclare avec @register_phase:
+- nom de la phase (plusieurs alias possibles en empilant le décorateur)
+- dépendance au temps `t` et/ou à `audio_energy`
+- preset caméra préféré, coût de préchauffage estimé
+- comportements scénographiques (texte, morph legacy, hold, caméra intelligente)
+
+Le dispatch devient une simple recherche dans un dict, et SimulationCore /
+le cache / un éventuel prefetcher décident à partir de ces métadonnées.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class PhaseSpec:
+    """Métadonnées déclarées par un générateur de phase"""
+    name: str
+    method: str                       # Nom de la méthode FormationLibrary
+    uses_t: bool = False              # Géométrie/couleurs animées dans le temps
+    uses_audio: bool = False          # Réagit à audio_energy
+    camera_preset: str = "ground"     # Clé de CameraSystem.presets
+    smart_camera: bool = False        # Caméra cinématique auto-cadrée
+    warmup_ms: float = 1.0            # Coût estimé du premier appel (1000 drones)
+    writes_out: bool = False          # Accepte out=(pos, cols) et écrit en place
+    text: bool = False                # Phase typographique (fondu furtif en transit)
+    morph: bool = False               # Morphing legacy depuis la formation précédente
+    skip_show: bool = False           # FADE_IN → HOLD sans light show
+    neutral_until_reveal: bool = False  # Étoiles neutres jusqu'à la révélation
+    hold_effect: Optional[str] = None   # "flag_wave" | "dune_breathing"
+    hold_amplitude: float = 0.0
+
+    @property
+    def static(self) -> bool:
+        """Sortie indépendante de t/audio: une construction progressive en cache sert tous les nombres de drones."""
+        return not (self.uses_t or self.uses_audio)
+
+
+PHASE_REGISTRY: Dict[str, PhaseSpec] = {}
+
+# Phase inconnue: sphère turquoise (voir FormationLibrary._default_sphere)
+DEFAULT_PHASE = PhaseSpec(name="default", method="_default_sphere")
+
+
+def register_phase(name, **meta):
+    """Décorateur: enregistre la méthode décorée comme générateur de `name`."""
+    def decorator(func):
+        if name in PHASE_REGISTRY:
+            raise ValueError(f"Phase '{name}' déjà enregistrée")
+        PHASE_REGISTRY[name] = PhaseSpec(name=name, method=func.__name__, **meta)
+        return func
+    return decorator
+
+
+def get_phase_spec(name) -> PhaseSpec:
+    """Métadonnées d'une phase (DEFAULT_PHASE si inconnue)."""
+    return PHASE_REGISTRY.get(name, DEFAULT_PHASE)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'PhaseSpec',
+    'PHASE_REGISTRY',
+    'DEFAULT_PHASE',
+    'register_phase',
+    'get_phase_spec',
+]
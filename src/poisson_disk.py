@@ -0,0 +1,245 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+              ÉCHANTILLONNAGE POISSON-DISK (BRUIT BLEU) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Remplissage des formations (texte, silhouettes, images) par des points
+séparés d'au moins `radius` mètres, en 2D (masques) ou 3D (volumes):
+
+1. Réservoir      : candidats uniformes tirés dans la forme (graine fixe),
+                    ~8 par point final, avec un ordre d'arrivée aléatoire
+2. Conflits       : paires de candidats à moins de r trouvées par KD-tree
+                    (scipy, en C) - remplace la grille de fond de Bridson
+3. Dart throwing  : un candidat est accepté si aucun candidat arrivé avant
+                    lui et déjà accepté n'est en conflit. Résultat identique
+                    au tir séquentiel, obtenu en quelques passes vectorisées
+                    (un candidat est décidé dès que ses prédécesseurs le sont)
+4. Nombre cible   : rayon le plus grand donnant au moins n points, cherché
+                    sur le même graphe de conflits (une seule requête KD-tree),
+                    puis sous-ensemble stable de n points
+
+Sortie triée par cellule de grille (côté r/√d, ordre de balayage) et graine
+fixe: une formation mise en cache est reproductible à l'identique.
+
+progressive_order() classe un nuage quelconque par point le plus éloigné
+(farthest-point glouton): les k premiers points forment, pour tout k, une
+version réduite de la forme presque aussi espacée qu'un remplissage natif.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import logging
+import math
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+logger = logging.getLogger(__name__)
+
+
+def mask_predicate(mask: np.ndarray, bounds: Sequence[Sequence[float]]) -> Callable:
+    """
+    Prédicat d'appartenance vectorisé pour un masque booléen 2D (lignes = y,
+    colonnes = x) couvrant bounds = ((min_x, max_x), (min_y, max_y)).
+    Les axes suivants (épaisseur d'un volume) ne sont pas testés.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    (min_x, max_x), (min_y, max_y) = bounds[0], bounds[1]
+    rows, cols = mask.shape
+    sx = (cols - 1) / (max_x - min_x) if max_x > min_x else 0.0
+    sy = (rows - 1) / (max_y - min_y) if max_y > min_y else 0.0
+
+    def inside(points):
+        c = np.rint((points[:, 0] - min_x) * sx).astype(np.intp)
+        r = np.rint((points[:, 1] - min_y) * sy).astype(np.intp)
+        valid = (c >= 0) & (c < cols) & (r >= 0) & (r < rows)
+        result = np.zeros(len(points), dtype=bool)
+        result[valid] = mask[r[valid], c[valid]]
+        return result
+
+    return inside
+
+
+class PoissonDiskSampler:
+    """Échantillonneur Poisson-disk (dart throwing sur réservoir), 2D ou 3D"""
+
+    PACKING = 0.65      # n · r^d / volume d'un remplissage quasi maximal
+
+    def __init__(self, bounds: Sequence[Sequence[float]], inside: Optional[Callable] = None,
+                 seed: int = 2025, oversample: int = 8):
+        self.bounds = np.asarray(bounds, dtype=np.float64)
+        self.dim = len(self.bounds)
+        if self.dim not in (2, 3):
+            raise ValueError("PoissonDiskSampler: 2 ou 3 dimensions")
+        self.inside = inside
+        self.seed = seed
+        self.oversample = oversample
+        self.radius = None
+
+    @property
+    def extent(self) -> np.ndarray:
+        return self.bounds[:, 1] - self.bounds[:, 0]
+
+    def estimate_volume(self, samples: int = 8192) -> float:
+        """Aire / volume de la forme (Monte-Carlo, graine fixe)."""
+        volume = float(np.prod(self.extent))
+        if self.inside is None:
+            return volume
+        rng = np.random.default_rng(self.seed + 1)
+        probe = self.bounds[:, 0] + rng.random((samples, self.dim)) * self.extent
+        return volume * float(np.mean(self.inside(probe)))
+
+    def _pool(self, count: int) -> np.ndarray:
+        """Jusqu'à count candidats uniformes dans la forme, dans leur ordre d'arrivée."""
+        rng = np.random.default_rng(self.seed)
+        pool, found = [], 0
+        for _ in range(32):
+            batch = self.bounds[:, 0] + rng.random((count, self.dim)) * self.extent
+            if self.inside is not None:
+                batch = batch[self.inside(batch)]
+            pool.append(batch)
+            found += len(batch)
+            if found >= count:
+                break
+        return np.concatenate(pool)[:count]
+
+    @staticmethod
+    def _pair_distances(candidates: np.ndarray, radius: float):
+        """Paires (i < j) à moins de radius et leurs distances."""
+        pairs = cKDTree(candidates).query_pairs(radius, output_type='ndarray')
+        delta = candidates[pairs[:, 0]] - candidates[pairs[:, 1]]
+        return pairs, np.einsum('ij,ij->i', delta, delta) ** 0.5
+
+    @staticmethod
+    def _throw(count: int, pairs: np.ndarray) -> np.ndarray:
+        """
+        Dart throwing dans l'ordre d'arrivée (indice croissant): masque des
+        candidats acceptés. Chaque passe décide tous les candidats dont les
+        prédécesseurs en conflit sont déjà décidés.
+        """
+        state = np.zeros(count, dtype=np.int8)          # 0 indécis, 1 accepté, 2 rejeté
+        first, later = pairs[:, 0], pairs[:, 1]
+        while True:
+            waiting = np.zeros(count, dtype=bool)
+            waiting[later] = True
+            ready = (state == 0) & ~waiting
+            if not ready.any():
+                break
+            state[ready] = 1
+            state[later[ready[first]]] = 2
+            keep = (state[first] == 0) & (state[later] == 0)
+            first, later = first[keep], later[keep]
+        return state != 2
+
+    def _ordered(self, points: np.ndarray, radius: float) -> np.ndarray:
+        """Points triés par cellule de grille (ordre de balayage stable)."""
+        cells = np.floor((points - self.bounds[:, 0]) / (radius / math.sqrt(self.dim))).astype(np.int64)
+        return points[np.lexsort(cells.T[::-1])]
+
+    def sample(self, radius: float) -> np.ndarray:
+        """Remplissage quasi maximal (N, dim) à l'espacement radius."""
+        volume = self.estimate_volume()
+        count = int(self.oversample * self.PACKING * volume / radius ** self.dim) + 1
+        candidates = self._pool(count)
+        if len(candidates) == 0:
+            return np.empty((0, self.dim))
+        pairs, _ = self._pair_distances(candidates, radius)
+        self.radius = radius
+        return self._ordered(candidates[self._throw(len(candidates), pairs)], radius)
+
+    def sample_count(self, n: int, min_radius: float = 0.0, tolerance: float = 0.02) -> np.ndarray:
+        """
+        Exactement n points (n, dim) avec le plus grand espacement possible.
+        Si la forme ne permet pas de respecter min_radius, le rayon obtenu
+        (self.radius) est plus petit: journalisé en DEBUG, le bilan par
+        phase revient à show_validator.formation_spacing.
+        """
+        volume = self.estimate_volume()
+        if n <= 0 or volume <= 0.0:
+            return np.empty((0, self.dim))
+        candidates = self._pool(self.oversample * n)
+        if len(candidates) < n:
+            raise ValueError(f"PoissonDiskSampler: forme trop petite pour {n} points")
+
+        # Le rayon d'un remplissage maximal borne la recherche: une seule requête KD-tree
+        high = (self.PACKING * volume / n) ** (1.0 / self.dim)
+        pairs, distance = self._pair_distances(candidates, high)
+
+        def throw(radius):
+            return self._throw(len(candidates), pairs[distance < radius])
+
+        best, best_radius = throw(0.0), 0.0             # r = 0: tous les candidats
+        low, radius = 0.0, high
+        while True:
+            accepted = throw(radius)
+            found = int(accepted.sum())
+            if found >= n:
+                best, best_radius, low = accepted, radius, radius
+            else:
+                high = radius
+            if high - low <= tolerance * high or found == n:
+                break
+            # Sécante sur N ∝ r^-d, gardée dans l'intervalle [low, high]
+            guess = radius * (found / n) ** (1.0 / self.dim)
+            radius = min(max(guess, low + 0.1 * (high - low)), high - 0.1 * (high - low))
+
+        if best_radius < min_radius:
+            logger.debug("%d points impossibles à l'espacement %.2f, rayon réduit à %.2f",
+                         n, min_radius, best_radius)
+        self.radius = best_radius
+        points = candidates[best]
+        if len(points) > n:
+            keep = np.sort(np.random.default_rng(self.seed).choice(len(points), n, replace=False))
+            points = points[keep]
+        return self._ordered(points, max(best_radius, 1e-6))
+
+
+def progressive_order(points: np.ndarray, visible: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Permutation (N,) telle que tout préfixe points[order[:k]] couvre la forme
+    de façon homogène: départ au point le plus proche du centre, puis toujours
+    le point le plus éloigné de ceux déjà choisis (O(N²) vectorisé, ~0.3 s
+    pour 10k points - fait une fois par formation). Les points non visibles
+    (drones éteints) sont rangés en dernier, dans leur ordre d'origine.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    shown = np.flatnonzero(np.ones(len(points), dtype=bool) if visible is None else visible)
+    hidden = np.setdiff1d(np.arange(len(points)), shown)
+    if len(shown) == 0:
+        return hidden
+
+    axes = [np.ascontiguousarray(points[shown, k]) for k in range(points.shape[1])]
+    nearest = np.full(len(shown), np.inf)
+    dist2 = np.empty(len(shown))
+    delta = np.empty(len(shown))
+    order = np.empty(len(shown), dtype=np.int64)
+    current = int(np.argmin(((points[shown] - points[shown].mean(axis=0)) ** 2).sum(axis=1)))
+    for i in range(len(shown)):
+        order[i] = current
+        dist2.fill(0.0)
+        for k, axis in enumerate(axes):
+            np.subtract(axis, axis[current], out=delta)
+            delta *= delta
+            dist2 += delta
+        np.minimum(nearest, dist2, out=nearest)
+        current = int(np.argmax(nearest))
+    return np.concatenate((shown[order], hidden))
+
+
+def min_distance(points: np.ndarray) -> float:
+    """Plus petite distance entre deux points (diagnostic, KD-tree)."""
+    if len(points) < 2:
+        return math.inf
+    dist, _ = cKDTree(points).query(points, k=2)
+    return float(dist[:, 1].min())
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'PoissonDiskSampler',
+    'mask_predicate',
+    'progressive_order',
+    'min_distance',
+]
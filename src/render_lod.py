@@ -0,0 +1,179 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+              NIVEAUX DE DÉTAIL & CULLING DU RENDU DES DRONES - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Étape LOD exécutée une fois par frame avant paintGL, entièrement vectorisée:
+
+1. Frustum    : les drones hors du champ de la caméra (position, cible, fov,
+                aspect, plans near/far) ne sont pas envoyés au GPU
+2. Proches    : distance caméra < lod_distance_threshold → halo + cœur
+                (deux points, rendu d'origine)
+3. Lointains  : un seul "splat" coloré un peu plus gros qui fusionne halo et
+                cœur (un sommet au lieu de deux)
+
+Les sommets sont compactés dans des buffers float32 préalloués (positions,
+couleurs RGBA) prêts pour glVertexPointer / glColorPointer + glDrawArrays.
+
+Configuration (performance.yaml):
+    lod_enabled: true
+    lod_distance_threshold: 100.0
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+@dataclass
+class LODStats:
+    """Compteurs d'une frame (affichés par le profiler)"""
+    total: int = 0
+    visible: int = 0
+    halos: int = 0
+    splats: int = 0
+
+    @property
+    def culled(self) -> int:
+        return self.total - self.visible
+
+    @property
+    def vertices(self) -> int:
+        """Sommets envoyés: halo + cœur pour les proches, un splat pour les lointains."""
+        return 2 * self.halos + self.splats
+
+    @property
+    def saved(self) -> float:
+        """Fraction du coût de dessin économisée (référence: 2 points par drone)."""
+        return 1.0 - self.vertices / (2.0 * self.total) if self.total else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'total': self.total,
+            'visible': self.visible,
+            'culled': self.culled,
+            'halos': self.halos,
+            'splats': self.splats,
+            'vertices': self.vertices,
+            'saved': self.saved,
+        }
+
+
+def orbit_camera_pose(dist: float, yaw: float, pitch: float, target_y: float) -> tuple:
+    """Pose eye(3) + target(3) + up(3) d'une orbite CameraSystem (sans dérive)."""
+    rad_yaw, rad_pitch = math.radians(yaw), math.radians(pitch)
+    eye = (dist * math.sin(rad_yaw) * math.cos(rad_pitch),
+           max(5.0, target_y + dist * math.sin(rad_pitch)),
+           dist * math.cos(rad_yaw) * math.cos(rad_pitch))
+    return (*eye, 0.0, target_y, 0.0, 0.0, 1.0, 0.0)
+
+
+class DroneLOD:
+    """Culling frustum + LOD par distance, sommets compactés pour le rendu"""
+
+    # Tailles des points (pixels), identiques à paintGL
+    HALO_SIZE = 12.0
+    CORE_SIZE = 4.0
+    SPLAT_SIZE = 6.0
+
+    def __init__(self, num_drones: int, threshold: float = 100.0, enabled: bool = True,
+                 fov: float = 45.0, near: float = 0.1, far: float = 1000.0, margin: float = 2.0):
+        self.threshold = float(threshold)
+        self.enabled = enabled
+        self.fov = fov
+        self.near = near
+        self.far = far
+        self.margin = margin          # Rayon (m) d'un halo: pas de pop-in au bord de l'écran
+        self.stats = LODStats()
+        self._allocate(num_drones)
+
+    @classmethod
+    def from_config(cls, perf_config: Optional[dict], num_drones: int, **kwargs) -> "DroneLOD":
+        perf_config = perf_config or {}
+        return cls(num_drones,
+                   threshold=perf_config.get('lod_distance_threshold', 100.0),
+                   enabled=perf_config.get('lod_enabled', True),
+                   **kwargs)
+
+    def _allocate(self, num_drones: int):
+        self.num_drones = num_drones
+        self.halo_positions = np.zeros((num_drones, 3), dtype=np.float32)
+        self.halo_colors = np.zeros((num_drones, 4), dtype=np.float32)
+        self.splat_positions = np.zeros((num_drones, 3), dtype=np.float32)
+        self.splat_colors = np.zeros((num_drones, 4), dtype=np.float32)
+        self._phase = np.arange(num_drones) * 0.13     # Scintillement des halos
+
+    def classify(self, positions: np.ndarray, camera_pose: Sequence[float],
+                 aspect: float = 1.0):
+        """Indices (halos, splats) des drones visibles, proches puis lointains."""
+        n = len(positions)
+        if not self.enabled:
+            return np.arange(n), np.arange(0)
+
+        pose = np.asarray(camera_pose, dtype=np.float64)
+        eye, target, up = pose[0:3], pose[3:6], pose[6:9]
+        forward = target - eye
+        forward /= np.linalg.norm(forward)
+        right = np.cross(forward, up)
+        right /= np.linalg.norm(right)
+        true_up = np.cross(right, forward)
+
+        # Coordonnées caméra de tous les drones en un produit matriciel
+        view = (np.asarray(positions, dtype=np.float32) - eye.astype(np.float32)) @ \
+            np.column_stack((right, true_up, forward)).astype(np.float32)
+        x, y, depth = view[:, 0], view[:, 1], view[:, 2]
+        tan_y = math.tan(math.radians(self.fov) / 2.0)
+        tan_x = tan_y * aspect
+        # Tolérance perpendiculaire à un plan latéral: margin / cos(demi-angle)
+        pad_x = self.margin * math.sqrt(1.0 + tan_x * tan_x)
+        pad_y = self.margin * math.sqrt(1.0 + tan_y * tan_y)
+        inside = ((depth > self.near - self.margin) & (depth < self.far + self.margin) &
+                  (np.abs(x) <= depth * tan_x + pad_x) &
+                  (np.abs(y) <= depth * tan_y + pad_y))
+
+        visible = np.flatnonzero(inside)
+        distance_sq = np.einsum('ij,ij->i', view[visible], view[visible])
+        close = distance_sq < self.threshold * self.threshold
+        return visible[close], visible[~close]
+
+    def build(self, positions: np.ndarray, colors: np.ndarray, camera_pose: Sequence[float],
+              light_multiplier: float = 1.0, sim_time: float = 0.0, aspect: float = 1.0) -> LODStats:
+        """
+        Classe les drones puis remplit les buffers compactés:
+        halo_positions/halo_colors[:halos] et splat_positions/splat_colors[:splats].
+        """
+        if len(positions) != self.num_drones:
+            self._allocate(len(positions))
+        halos, splats = self.classify(positions, camera_pose, aspect)
+        k, m = len(halos), len(splats)
+        light = float(light_multiplier)
+
+        # Halos: couleur × lumière, alpha = scintillement (même formule que l'ancien paintGL)
+        self.halo_positions[:k] = positions[halos]
+        self.halo_colors[:k, :3] = colors[halos]
+        self.halo_colors[:k, :3] *= light
+        self.halo_colors[:k, 3] = (0.2 + 0.05 * np.sin(self._phase[halos] + sim_time * 5.0)) * light
+
+        # Splats: halo et cœur blanc fusionnés en une couleur éclaircie
+        self.splat_positions[:m] = positions[splats]
+        self.splat_colors[:m, :3] = colors[splats]
+        self.splat_colors[:m, :3] *= 0.6
+        self.splat_colors[:m, :3] += 0.4
+        self.splat_colors[:m, :3] *= light
+        self.splat_colors[:m, 3] = light
+
+        self.stats = LODStats(total=len(positions), visible=k + m, halos=k, splats=m)
+        return self.stats
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'LODStats',
+    'DroneLOD',
+    'orbit_camera_pose',
+]
@@ -124,7 +124,8 @@ class ShaderProgram:
     
     def compile_shaders(self, vertex_src, fragment_src):
         """Compile vertex and fragment shaders."""
-        if not HAS_SHADER_SUPPORT:
+        # Re-check once a context exists (HAS_SHADER_SUPPORT is probed at import time)
+        if not (HAS_SHADER_SUPPORT or check_shader_support()):
             print(f"WARNING: Shader support not available on this GPU. Skipping {self.name}.")
             self.program = None
             return
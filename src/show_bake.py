@@ -0,0 +1,297 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+                BAKE PARALLÈLE DU SHOW (POOL DE PROCESSUS) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Pré-calcul des frames (positions + couleurs) d'un show complet réparti sur
+plusieurs processus, grâce à l'horloge seekable (show_clock):
+
+1. Segments  : le show est découpé aux débuts de phase puis toutes les
+               `segment_seconds` secondes (frames [first, last))
+2. Workers   : ProcessPoolExecutor, chaque processus garde son ShowRunner
+               (FormationLibrary + caches chauds) d'un segment à l'autre
+3. Sortie    : fichier .npy (frames, drones, 6) float32 ouvert en mmap par
+               chaque worker, qui écrit ses frames à leur offset - aucune
+               copie ni fusion; métadonnées dans <fichier>.json
+4. Raccord   : la physique dépend du segment précédent. 1er tour: chaque
+               segment démarre de l'essaim posé sur la formation
+               `warmup` secondes avant son début (l'essaim converge vers
+               ses cibles). Tours suivants (parareal): seuls les segments
+               dont l'état de départ s'écarte de plus de `tolerance` mètres
+               de la fin réelle du précédent sont recalculés depuis cette
+               fin, jusqu'à rejoindre (à tolerance près) les frames déjà
+               écrites. Au-delà de `max_rounds` tours, la suite est
+               enchaînée en série depuis le premier raccord non convergé
+               (avertissement). Les tirages des phases ne dépendent que de
+               (phase, temps local) (formation_library.frame_seed): avec
+               tolerance=0, même résultat que le bake séquentiel
+5. Rapport   : temps, frames/s, tours, segments recalculés, erreur de raccord
+               et efficacité T(1) / (n × T(n)) pour chaque nombre de workers
+
+Usage (rapport de scaling):  python src/show_bake.py [workers ...]
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from show_clock import ShowClock, ShowRunner
+
+
+@dataclass(frozen=True)
+class Segment:
+    """Frames [first, last) du show calculées par un même worker"""
+    index: int
+    first: int
+    last: int
+
+
+@dataclass
+class BakeReport:
+    """Résultat d'un bake (voir bake_show)"""
+    path: str
+    workers: int
+    frames: int
+    segments: int
+    rounds: int
+    resimulated: int            # Reprises de segments après le premier tour
+    computed: int               # Frames calculées (total + reprises)
+    max_stitch_error: float     # Écart final (m) début de segment / fin du précédent
+    elapsed: float
+
+    @property
+    def fps(self) -> float:
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def plan_segments(clock: ShowClock, rate: float, segment_seconds: float) -> List[Segment]:
+    """Découpe aux débuts de phase, puis toutes les segment_seconds dans chaque phase."""
+    frames = int(math.floor(clock.duration * rate + 1e-9)) + 1
+    cuts = {frames}
+    for start, duration in zip(clock.starts, clock.durations):
+        end = int(round((start + duration) * rate))
+        cut = int(round(start * rate))
+        step = max(1, int(round(segment_seconds * rate)))
+        while cut < min(end, frames):
+            cuts.add(cut)
+            cut += step
+    cuts = sorted(cuts)
+    return [Segment(i, a, b) for i, (a, b) in enumerate(zip(cuts[:-1], cuts[1:]))]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                       WORKER (UN SHOWRUNNER PAR PROCESSUS)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_RUNNER: Optional[ShowRunner] = None
+
+
+def _init_worker(sim_config, vis_config, entries, physics_dt, seed):
+    """
+    Initialiseur du pool: même graine partout → mêmes positions initiales
+    (DroneManager). Le bruit des phases est regrainé à chaque frame.
+    """
+    global _RUNNER
+    np.random.seed(seed)
+    _RUNNER = ShowRunner(sim_config, vis_config, ShowClock(entries), dt=physics_dt)
+
+
+def _bake_segment(path: str, segment: Segment, substeps: int, start: Optional[np.ndarray],
+                  warmup_frames: int, tolerance: Optional[float] = None):
+    """
+    Calcule les frames du segment dans le fichier partagé. Retourne l'état de
+    départ utilisé, l'état à la première frame du segment suivant et le
+    nombre de frames calculées. Avec tolerance (reprise après un mauvais
+    raccord), s'arrête dès qu'une frame recalculée rejoint celle déjà écrite:
+    la suite du segment et son état final sont conservés (fin = None).
+    """
+    runner = _RUNNER
+    first_step = segment.first * substeps
+    if start is not None:
+        runner.restore(first_step, start)
+    elif segment.first == 0:
+        runner.restore(0, runner.initial_positions)
+    else:
+        # Spéculation: essaim posé sur la formation warmup frames plus tôt
+        runner.restore(max(0, segment.first - warmup_frames) * substeps)
+        while runner.step_index < first_step:
+            runner.step()
+    begin = runner.manager.positions.copy()
+
+    frames = np.load(path, mmap_mode='r+')
+    try:
+        for f in range(segment.first, segment.last):
+            if f > segment.first:
+                for _ in range(substeps):
+                    runner.step()
+                if tolerance is not None and \
+                        float(np.abs(frames[f, :, :3] - runner.manager.positions).max()) <= tolerance:
+                    return segment.index, begin, None, f - segment.first
+            frames[f, :, :3] = runner.manager.positions
+            frames[f, :, 3:] = runner.manager.colors
+    finally:
+        frames.flush()
+        del frames
+    for _ in range(substeps):
+        runner.step()
+    return segment.index, begin, runner.manager.positions.copy(), segment.last - segment.first
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                                 DRIVER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def bake_show(sim_config, vis_config, clock: ShowClock, path: str, workers: int = 1,
+              rate: float = 30.0, physics_dt: float = 1.0 / 60.0, segment_seconds: float = 5.0,
+              warmup: float = 2.0, tolerance: float = 0.05, seed: int = 2025,
+              max_rounds: int = 4) -> BakeReport:
+    """
+    Bake du show dans path (.npy (frames, drones, 6) float32: xyz + rgb).
+    workers <= 1: un seul processus, segments enchaînés dans l'ordre (bake
+    séquentiel exact, référence du rapport de scaling). Les raccords non
+    convergés après max_rounds tours parallèles sont enchaînés en série.
+    """
+    num = sim_config['simulation']['max_drones']
+    substeps = max(1, int(round(1.0 / (rate * physics_dt))))
+    physics_dt = 1.0 / (rate * substeps)
+    segments = plan_segments(clock, rate, segment_seconds)
+    entries = list(zip(clock.phases, clock.durations))
+    total = segments[-1].last
+    started = time.perf_counter()
+
+    np.lib.format.open_memmap(path, mode='w+', dtype=np.float32, shape=(total, num, 6)).flush()
+    with open(f"{path}.json", 'w', encoding='utf-8') as f:
+        json.dump({'num_drones': num, 'rate': rate, 'frames': total, 'physics_dt': physics_dt,
+                   'phases': [{'phase': p, 'start': s, 'duration': d}
+                              for p, s, d in zip(clock.phases, clock.starts, clock.durations)],
+                   'segments': [asdict(s) for s in segments]}, f, indent=2)
+
+    begins: List[Optional[np.ndarray]] = [None] * len(segments)
+    ends: List[Optional[np.ndarray]] = [None] * len(segments)
+    warmup_frames = int(round(warmup * rate))
+
+    if workers <= 1:
+        _init_worker(sim_config, vis_config, entries, physics_dt, seed)
+        start = None
+        for segment in segments:
+            _, begins[segment.index], ends[segment.index], _ = _bake_segment(
+                path, segment, substeps, start, warmup_frames)
+            start = ends[segment.index]
+        rounds, resimulated, computed = 1, 0, total
+    else:
+        starts: List[Optional[np.ndarray]] = [None] * len(segments)
+        pending = [s.index for s in segments]
+        rounds, resimulated, computed = 0, 0, 0
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(sim_config, vis_config, entries, physics_dt, seed)) as pool:
+            while pending and rounds < max_rounds:
+                rounds += 1
+                resume = tolerance if rounds > 1 else None
+                if rounds > 1:
+                    resimulated += len(pending)
+                futures = [pool.submit(_bake_segment, path, segments[k], substeps, starts[k],
+                                       warmup_frames, resume) for k in pending]
+                for future in futures:
+                    k, begins[k], end, count = future.result()
+                    computed += count
+                    if end is not None:
+                        ends[k] = end
+                # Raccords: tout segment qui ne part pas de la fin (actuelle) du précédent est repris
+                pending = []
+                for k in range(1, len(segments)):
+                    if float(np.abs(begins[k] - ends[k - 1]).max()) > tolerance:
+                        starts[k] = ends[k - 1]
+                        pending.append(k)
+
+            if pending:
+                # Pas de convergence: chaîne série depuis le premier raccord faux
+                print(f"[BAKE] raccords non convergés après {rounds} tours "
+                      f"({len(pending)} segments): chaîne séquentielle depuis le segment {pending[0]}")
+                rounds += 1
+                for k in range(pending[0], len(segments)):
+                    if float(np.abs(begins[k] - ends[k - 1]).max()) <= tolerance:
+                        continue
+                    resimulated += 1
+                    _, begins[k], end, count = pool.submit(
+                        _bake_segment, path, segments[k], substeps, ends[k - 1],
+                        warmup_frames, tolerance).result()
+                    computed += count
+                    if end is not None:
+                        ends[k] = end
+
+    stitch = max((float(np.abs(begins[k] - ends[k - 1]).max()) for k in range(1, len(segments))),
+                 default=0.0)
+    return BakeReport(path, max(1, workers), total, len(segments), rounds, resimulated,
+                      computed, stitch, time.perf_counter() - started)
+
+
+def load_bake(path: str) -> Tuple[np.ndarray, dict]:
+    """Frames bakées (mmap en lecture seule) et leurs métadonnées."""
+    with open(f"{path}.json", 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    return np.load(path, mmap_mode='r'), meta
+
+
+def scaling_report(sim_config, vis_config, clock: ShowClock, folder: str,
+                   worker_counts: Sequence[int] = (1, 2, 4), **options) -> List[BakeReport]:
+    """
+    Bake le même show pour chaque nombre de workers. Le premier bake (1
+    worker: séquentiel) sert de référence pour l'accélération et l'écart
+    max des frames (positions, mètres).
+    """
+    reports, reference = [], None
+    for workers in worker_counts:
+        report = bake_show(sim_config, vis_config, clock,
+                           os.path.join(folder, f"show_w{workers}.npy"), workers, **options)
+        frames, _ = load_bake(report.path)
+        if reference is None:
+            reference = report
+            deviation = 0.0
+        else:
+            base, _ = load_bake(reference.path)
+            deviation = float(np.abs(frames[:, :, :3] - base[:, :, :3]).max())
+        speedup = reference.elapsed / report.elapsed
+        print(f"  {workers:2d} worker(s): {report.elapsed:6.2f}s  {report.fps:6.0f} frames/s  "
+              f"accélération {speedup:4.2f}×  efficacité {speedup / report.workers:5.0%}  "
+              f"tours {report.rounds}  reprises {report.resimulated:2d}/{report.segments} "
+              f"(+{report.computed / report.frames - 1:4.0%} frames)  "
+              f"raccord {report.max_stitch_error:.3f} m  écart {deviation:.3f} m")
+        reports.append(report)
+        del frames
+    return reports
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'Segment',
+    'BakeReport',
+    'plan_segments',
+    'bake_show',
+    'load_bake',
+    'scaling_report',
+]
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+
+    from show_compiler import load_show
+    from simulation_process import _benchmark_config
+
+    worker_counts = [int(a) for a in sys.argv[1:]] or [1, 2, 4]
+    sim_config, vis_config = _benchmark_config(1000)
+    clock = ShowClock.from_timeline(load_show())
+    print(f"Show {clock.duration:.1f}s, {len(clock)} phases, 1000 drones, "
+          f"{len(plan_segments(clock, 30.0, 5.0))} segments, {os.cpu_count()} CPU")
+    with tempfile.TemporaryDirectory() as tmp:
+        scaling_report(sim_config, vis_config, clock, tmp, worker_counts)
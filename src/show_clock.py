@@ -0,0 +1,309 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+                HORLOGE DU SHOW + SEEK PAR CHECKPOINTS - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Accès direct à n'importe quel instant du show, sans rejouer depuis le début:
+
+1. ShowClock        : temps global → (phase, temps local, état de révélation)
+                      par recherche binaire sur les débuts de phase. Séquence
+                      auto (phases × durée) ou timeline compilée des actes
+2. reveal_state()   : machine à états TRANSIT → ARRIVED → BLACKOUT → FADE_IN
+                      → SHOW → HOLD de SimulationCore écrite en fonction pure
+                      du temps local (plus de phase_state/state_timer cumulés)
+3. Sans état        : cibles/couleurs (FormationLibrary.get_phase à t local),
+                      caméra (pistes keyframées), animateur (temps = temps du
+                      show) s'évaluent directement à l'instant demandé
+4. Checkpoints      : seule la physique de l'essaim dépend du passé. Positions
+                      (copie exacte) enregistrées toutes les `interval` secondes;
+                      seek(t) = checkpoint ≤ t + au plus interval/dt pas
+5. Pas fixes        : temps = n × dt (indice entier), aucun cumul flottant -
+                      deux passes du même show donnent les mêmes positions
+
+Usage (enregistrement + seeks aléatoires):  python src/show_clock.py [phase ...]
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import bisect
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from phase_registry import get_phase_spec
+
+
+# --- MACHINE À ÉTATS DE RÉVÉLATION (SimulationCore.step_simulation) ---
+REVEAL_STATES = ("TRANSIT", "ARRIVED", "BLACKOUT", "FADE_IN", "SHOW", "HOLD")
+TRANSIT_TIME = 4.0      # Vol vers la formation
+ARRIVED_TIME = 0.5      # Pause dans le noir
+BLACKOUT_TIME = 0.5     # Silence visuel
+FADE_IN_TIME = 1.0      # Allumage progressif
+SHOW_TIME = 1.5         # Jeu de lumière (sauté si PhaseSpec.skip_show)
+
+
+def reveal_state(t: float, skip_show: bool = False) -> Tuple[int, float]:
+    """(état 0-5, temps dans l'état) au temps local t de la phase."""
+    durations = (TRANSIT_TIME, ARRIVED_TIME, BLACKOUT_TIME, FADE_IN_TIME) + (() if skip_show else (SHOW_TIME,))
+    for state, duration in enumerate(durations):
+        if t <= duration:
+            return state, t
+        t -= duration
+    return 5, t
+
+
+def placeholder_audio_energy(t: float) -> float:
+    """Énergie audio de remplacement sans fichier audio (sinus du temps local)."""
+    return 0.5 + 0.5 * math.sin(t * 2.0)
+
+
+@dataclass(frozen=True)
+class ClockPosition:
+    """Position dans le show à un instant global"""
+    show_time: float
+    index: int                  # Indice de la phase dans la séquence
+    phase: str
+    local_time: float           # Temps depuis le début de la phase
+    state: int                  # Indice dans REVEAL_STATES
+    state_time: float           # Temps depuis le début de l'état
+    cues: tuple = ()            # Cues actives (ShowTimeline), si l'horloge en a une
+
+    @property
+    def state_name(self) -> str:
+        return REVEAL_STATES[self.state]
+
+
+class ShowClock:
+    """Séquence de phases (nom, durée): temps global → phase / temps local en O(log n)"""
+
+    def __init__(self, entries: Sequence[Tuple[str, float]], timeline=None):
+        if not entries:
+            raise ValueError("ShowClock: séquence vide")
+        self.phases = [name for name, _ in entries]
+        self.durations = [float(duration) for _, duration in entries]
+        self.starts = [0.0]
+        for duration in self.durations[:-1]:
+            self.starts.append(self.starts[-1] + duration)
+        self.duration = self.starts[-1] + self.durations[-1]
+        self.timeline = timeline
+
+    @classmethod
+    def from_sequence(cls, phases: Sequence[str], duration_per_phase: float) -> "ShowClock":
+        """Séquence automatique de SimulationCore (même durée par phase)."""
+        return cls([(name, duration_per_phase) for name in phases])
+
+    @classmethod
+    def from_timeline(cls, timeline) -> "ShowClock":
+        """Actes d'une ShowTimeline compilée (show_compiler) ayant une phase."""
+        return cls([(act.phase, act.duration) for act in timeline.acts if act.phase], timeline)
+
+    def __len__(self) -> int:
+        return len(self.phases)
+
+    def index_at(self, t: float) -> int:
+        return min(max(bisect.bisect_right(self.starts, t) - 1, 0), len(self.phases) - 1)
+
+    def locate(self, t: float) -> ClockPosition:
+        """Phase, temps local et état de révélation à l'instant global t (borné au show)."""
+        t = min(max(t, 0.0), self.duration)
+        index = self.index_at(t)
+        phase = self.phases[index]
+        local = t - self.starts[index]
+        state, state_time = reveal_state(local, get_phase_spec(phase).skip_show)
+        cues = self.timeline.active_at(t) if self.timeline is not None else ()
+        return ClockPosition(t, index, phase, local, state, state_time, cues)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                     ESSAIM SANS GUI + CHECKPOINTS DE PHYSIQUE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class CheckpointStore:
+    """Positions de l'essaim (copies en lecture seule) à des pas réguliers, triées par pas"""
+
+    def __init__(self, dt: float):
+        self.dt = dt
+        self.steps: List[int] = []
+        self.positions: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(p.nbytes for p in self.positions)
+
+    def add(self, step: int, positions: np.ndarray):
+        if self.steps and step <= self.steps[-1]:
+            i = bisect.bisect_left(self.steps, step)
+            del self.steps[i:], self.positions[i:]          # Réenregistrement: fin invalidée
+        frozen = np.array(positions)                    # Même dtype: reprise bit à bit
+        frozen.setflags(write=False)
+        self.steps.append(step)
+        self.positions.append(frozen)
+
+    def at_or_before(self, step: int) -> Optional[Tuple[int, np.ndarray]]:
+        i = bisect.bisect_right(self.steps, step) - 1
+        return (self.steps[i], self.positions[i]) if i >= 0 else None
+
+    def save(self, path: str):
+        np.savez_compressed(path, dt=self.dt, steps=np.array(self.steps, dtype=np.int64),
+                            positions=np.stack(self.positions) if self.positions else np.empty((0, 0, 3)))
+
+    @classmethod
+    def load(cls, path: str) -> "CheckpointStore":
+        with np.load(path) as data:
+            store = cls(float(data['dt']))
+            for step, positions in zip(data['steps'], data['positions']):
+                store.add(int(step), positions)
+        return store
+
+
+class ShowRunner:
+    """
+    Essaim sans GUI (formations + physique, comme le backend process) piloté
+    par une ShowClock à pas fixes: enregistre des checkpoints puis se
+    positionne à un instant arbitraire en quelques millisecondes.
+    """
+
+    def __init__(self, sim_config, vis_config, clock: ShowClock, dt: float = 0.016,
+                 checkpoint_interval: float = 1.0, library=None):
+        from drone_manager import DroneManager
+        from formation_library import FormationLibrary
+
+        self.clock = clock
+        self.dt = dt
+        self.num_drones = sim_config['simulation']['max_drones']
+        self.manager = DroneManager(sim_config, vis_config)
+        self.library = library or FormationLibrary(
+            min_separation=sim_config['simulation']['physics']['min_separation_m'])
+        self.checkpoint_every = max(1, int(round(checkpoint_interval / dt)))
+        self.checkpoints = CheckpointStore(dt)
+        self.initial_positions = self.manager.positions.copy()
+        self.step_index = 0
+
+    @property
+    def time(self) -> float:
+        return self.step_index * self.dt
+
+    @property
+    def total_steps(self) -> int:
+        return int(math.floor(self.clock.duration / self.dt + 1e-9))
+
+    def _targets(self, t: float) -> ClockPosition:
+        """Cibles et couleurs de l'instant t écrites dans les buffers du manager."""
+        position = self.clock.locate(t)
+        targets, colors = self.library.get_phase(
+            position.phase, self.num_drones, t=position.local_time,
+            audio_energy=placeholder_audio_energy(position.local_time),
+            out=self.manager.formation_buffers())
+        self.manager.set_formation(targets, colors)
+        return position
+
+    def step(self) -> ClockPosition:
+        """Un pas de simulation (dt) au pas suivant de l'horloge."""
+        self.step_index += 1
+        position = self._targets(self.time)
+        self.manager.update(self.dt, time_absolute=position.local_time)
+        return position
+
+    def restore(self, step: int, positions: Optional[np.ndarray] = None) -> ClockPosition:
+        """Repart du pas step avec ces positions (None: essaim posé sur la formation)."""
+        self.step_index = step
+        position = self._targets(self.time)
+        # Nouveau tableau du même dtype que la source: reprise bit à bit
+        self.manager.positions = np.array(self.manager.targets if positions is None else positions)
+        return position
+
+    def reset(self):
+        self.restore(0, self.initial_positions)
+
+    def record(self, until: Optional[float] = None) -> CheckpointStore:
+        """Joue le show depuis le début (ou jusqu'à until) en posant les checkpoints."""
+        last = self.total_steps if until is None else min(self.total_steps, int(round(until / self.dt)))
+        self.reset()
+        self.checkpoints.add(0, self.manager.positions)
+        while self.step_index < last:
+            self.step()
+            if self.step_index % self.checkpoint_every == 0:
+                self.checkpoints.add(self.step_index, self.manager.positions)
+        return self.checkpoints
+
+    def seek(self, t: float) -> ClockPosition:
+        """
+        Positionne l'essaim à l'instant t: checkpoint le plus proche avant t
+        puis simulation jusqu'à t. Sans checkpoint couvrant t, rejoue depuis
+        le dernier état connu (jamais d'erreur, seulement plus lent).
+        """
+        target = min(max(int(round(t / self.dt)), 0), self.total_steps)
+        checkpoint = self.checkpoints.at_or_before(target)
+        if checkpoint is not None and (checkpoint[0] > self.step_index or target < self.step_index):
+            position = self.restore(*checkpoint)
+        elif target < self.step_index:
+            position = self.restore(0, self.initial_positions)
+        else:
+            position = self._targets(self.time)
+        while self.step_index < target:
+            position = self.step()
+        return position
+
+    def formation_at(self, t: float, out=None):
+        """Cibles (positions, couleurs) à l'instant t, sans état ni physique."""
+        position = self.clock.locate(t)
+        return self.library.get_phase(position.phase, self.num_drones, t=position.local_time,
+                                      audio_energy=placeholder_audio_energy(position.local_time),
+                                      out=out)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'REVEAL_STATES',
+    'reveal_state',
+    'placeholder_audio_energy',
+    'ClockPosition',
+    'ShowClock',
+    'CheckpointStore',
+    'ShowRunner',
+]
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from show_compiler import load_show
+    from simulation_process import _benchmark_config
+
+    sim_config, vis_config = _benchmark_config(1000)
+    if len(sys.argv) > 1:
+        clock = ShowClock.from_sequence(sys.argv[1:], 8.0)
+    else:
+        clock = ShowClock.from_timeline(load_show())
+    runner = ShowRunner(sim_config, vis_config, clock)
+
+    start = time.perf_counter()
+    store = runner.record()
+    record_s = time.perf_counter() - start
+    print(f"Show {clock.duration:.1f}s ({len(clock)} phases, {runner.total_steps} pas): "
+          f"enregistré en {record_s:.2f}s, {len(store)} checkpoints, {store.nbytes / 1e6:.1f} Mo")
+
+    # Seeks aléatoires: comparaison avec la passe linéaire de référence
+    rng = np.random.default_rng(7)
+    worst, timings = 0.0, []
+    for t in rng.uniform(0.0, clock.duration, 8):
+        start = time.perf_counter()
+        position = runner.seek(t)
+        timings.append((time.perf_counter() - start) * 1000)
+        sought = runner.manager.positions.copy()
+
+        reference = ShowRunner(sim_config, vis_config, clock, library=runner.library)
+        reference.initial_positions = runner.initial_positions
+        reference.record(until=runner.time)
+        worst = max(worst, float(np.abs(reference.manager.positions - sought).max()))
+        print(f"  t={t:6.2f}s → {position.phase:24s} local {position.local_time:5.2f}s "
+              f"{position.state_name:8s} seek {timings[-1]:6.1f} ms")
+    print(f"Seek: moyen {np.mean(timings):.1f} ms, max {np.max(timings):.1f} ms | "
+          f"écart max vs passe linéaire: {worst:.2e} m")
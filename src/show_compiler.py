@@ -0,0 +1,547 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+                COMPILATEUR DE SHOW (YAML → TIMELINE INDEXÉE) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Les fichiers d'acte de config/ (act0_naissance_cosmique.yaml, ...) sont la
+source des timings du show; config/show.yaml fixe l'ordre des actes et la
+phase FormationLibrary qui joue chacun d'eux.
+
+1. Normalisation : les formats d'acte (timing.states, timeline start/end,
+                   choreography "0-3s", camera_sequence, plans caméra,
+                   effects time_start/time_end) deviennent des Cue
+                   [start, end) en temps absolu du show, par piste:
+                   phase, state, step, camera, effect
+2. Validation    : trous et chevauchements des pistes state et camera,
+                   cues hors de la durée de l'acte - signalés à la
+                   compilation (strict=True: ValueError)
+3. Index         : bornes triées + cues actives par segment élémentaire,
+                   "qu'est-ce qui est actif à t" en O(log n) (bisect)
+4. Cache         : forme compilée en JSON dans data/cache/show/, clé =
+                   chemin + mtime + taille des YAML (et de ce module) -
+                   démarrage sans analyse YAML tant que rien ne change
+
+Usage (rapport de compilation):  python src/show_compiler.py [t ...]
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import re
+import tempfile
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import yaml
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'config')
+DEFAULT_SHOW_PATH = os.path.join(CONFIG_DIR, 'show.yaml')
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'cache', 'show')
+COMPILER_VERSION = 1
+
+TRACKS = ("phase", "state", "step", "camera", "effect")
+CONTIGUOUS_TRACKS = ("state", "camera")     # Doivent couvrir l'acte sans trou ni chevauchement
+EPSILON = 1e-6
+
+# "0-3s", "1.5-4s", "10.0s - 11.5s", "9-13s (progression)", "8s", 3.0
+_SPAN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*s?\s*(?:-\s*(\d+(?:\.\d+)?)\s*s?)?')
+
+
+@dataclass(frozen=True)
+class Cue:
+    """Intervalle [start, end) d'une piste, en secondes absolues du show"""
+    start: float
+    end: float
+    track: str                      # Une des TRACKS
+    act: str                        # Clé de l'acte (racine du YAML)
+    name: str                       # Clé YAML de l'entrée (ex: "partie_1_naissance_sable")
+    label: str = ""                 # Nom lisible (name / description / action)
+    phase: Optional[str] = None     # Phase FormationLibrary de l'acte
+    params: dict = field(default_factory=dict, compare=False, hash=False)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def contains(self, t: float) -> bool:
+        return self.start <= t < self.end
+
+
+@dataclass(frozen=True)
+class ActInfo:
+    """Acte placé dans le show"""
+    key: str
+    config: str                     # Fichier YAML (relatif à config/)
+    phase: Optional[str]
+    start: float
+    duration: float
+    title: str = ""
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          NORMALISATION DES FORMATS D'ACTE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def parse_span(value) -> Optional[Tuple[float, float]]:
+    """
+    (start, end) d'une valeur de timing YAML: "a-bs", "as" (instant, end=start),
+    nombre, [a, b], ou dict {start, end} / {time_start, time_end} /
+    {time} / {timing}. None si la valeur ne décrit pas un temps.
+    """
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value), float(value)
+    if isinstance(value, (list, tuple)):
+        if len(value) == 2 and all(isinstance(v, (int, float)) for v in value):
+            return float(value[0]), float(value[1])
+        return None
+    if isinstance(value, str):
+        match = _SPAN.match(value)
+        if not match:
+            return None
+        start = float(match.group(1))
+        return start, float(match.group(2)) if match.group(2) else start
+    if isinstance(value, dict):
+        for a, b in (('start', 'end'), ('time_start', 'time_end')):
+            if isinstance(value.get(a), (int, float)) and isinstance(value.get(b), (int, float)):
+                return float(value[a]), float(value[b])
+        for key in ('time', 'timing'):
+            if key in value:
+                return parse_span(value[key])
+    return None
+
+
+def _label(entry, default: str = "") -> str:
+    if isinstance(entry, dict):
+        for key in ('name', 'label', 'event', 'action', 'visual', 'description'):
+            if isinstance(entry.get(key), str):
+                return entry[key].strip().split('\n')[0]
+    return default
+
+
+def _scalars(entry: dict) -> dict:
+    """Paramètres simples d'une entrée (nombres, textes courts, listes de nombres)."""
+    params = {}
+    for key, value in entry.items():
+        if isinstance(value, (int, float, bool)) or \
+                (isinstance(value, str) and '\n' not in value) or \
+                (isinstance(value, list) and all(isinstance(v, (int, float)) for v in value)):
+            params[key] = value
+    return params
+
+
+def _act_root(data: dict, stem: str) -> Tuple[str, dict]:
+    """Racine de l'acte: clé unique du fichier (act0_*), sinon le fichier entier."""
+    if len(data) == 1:
+        key, root = next(iter(data.items()))
+        if isinstance(root, dict):
+            return key, root
+    return stem, data
+
+
+def _act_duration(root: dict) -> Optional[float]:
+    for section, key in (('timing', 'total_duration'), ('metadata', 'duration'), ('act_info', 'duration')):
+        value = (root.get(section) or {}).get(key)
+        if isinstance(value, (int, float)):
+            return float(value)
+    return None
+
+
+def _act_title(root: dict) -> str:
+    for section in ('metadata', 'act_info'):
+        if isinstance((root.get(section) or {}).get('name'), str):
+            return root[section]['name']
+    return ""
+
+
+def _steps(entries: list, parent: Tuple[float, float]) -> List[Tuple[float, float, dict]]:
+    """
+    Sous-étapes d'une liste: un instant dure jusqu'à l'étape suivante (ou la
+    fin du parent). Une liste qui commence avant son parent est en temps
+    local du parent (pulsations: 1.5s, 2.5s... dans le cœur cosmique).
+    """
+    timed = [(parse_span(e), e) for e in entries if isinstance(e, dict)]
+    timed = [(span, e) for span, e in timed if span is not None]
+    if timed and timed[0][0][0] < parent[0] - EPSILON:
+        timed = [((start + parent[0], end + parent[0]), e) for (start, end), e in timed]
+    parent_end = parent[1]
+    steps = []
+    for i, ((start, end), entry) in enumerate(timed):
+        if end <= start:
+            end = timed[i + 1][0][0] if i + 1 < len(timed) else parent_end
+        if end > start:
+            steps.append((start, end, entry))
+    return steps
+
+
+def compile_act(path: str, offset: float = 0.0, phase: Optional[str] = None
+                ) -> Tuple[ActInfo, List[Cue]]:
+    """Cues d'un fichier d'acte, décalées de offset secondes."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+    key, root = _act_root(data, os.path.splitext(os.path.basename(path))[0])
+    cues: List[Cue] = []
+
+    def add(track, start, end, name, entry=None, label=""):
+        params = _scalars(entry) if isinstance(entry, dict) else {}
+        cues.append(Cue(offset + start, offset + end, track, key, name,
+                        label or _label(entry, name), phase, params))
+
+    # États: timing.states (rideau), timeline (start/end), choreography ("a-bs")
+    states = (root.get('timing') or {}).get('states') or root.get('timeline') or root.get('choreography') or {}
+    state_spans = {}
+    for name, entry in states.items():
+        span = parse_span(entry)
+        if span is None or span[1] <= span[0]:
+            continue
+        state_spans[name] = span
+        add("state", span[0], span[1], name, entry)
+        for child, value in entry.items():
+            if child == 'audio_sync':
+                continue
+            if isinstance(value, list):
+                for start, end, step in _steps(value, span):
+                    add("step", start, end, f"{name}.{child}", step)
+            elif isinstance(value, dict):
+                child_span = parse_span(value)
+                if child_span and child_span[1] > child_span[0]:
+                    add("effect", child_span[0], child_span[1], f"{name}.{child}", value)
+
+    duration = _act_duration(root)
+    if duration is None:
+        duration = max((end for _, end in state_spans.values()), default=0.0)
+
+    # Caméra: camera_sequence (par état), camera (plans "a-bs", phase_N → N-ième état, sous-phases)
+    ordered_states = sorted(state_spans.values())
+    for name, entry in (root.get('camera_sequence') or {}).items():
+        if name in state_spans:
+            add("camera", *state_spans[name], name, entry)
+    for name, entry in (root.get('camera') or {}).items():
+        if not isinstance(entry, dict):
+            continue
+        sub_phases = entry.get('sub_phases') or {}
+        if sub_phases:
+            for sub, value in sub_phases.items():
+                span = parse_span(value)
+                if span and span[1] > span[0]:
+                    add("camera", span[0], span[1], f"{name}.{sub}", value, _label(entry, name))
+            continue
+        span = parse_span(entry)
+        match = re.fullmatch(r'phase_(\d+)', name)
+        if span is None and match and 0 < int(match.group(1)) <= len(ordered_states):
+            span = ordered_states[int(match.group(1)) - 1]
+        if span and span[1] > span[0]:
+            add("camera", span[0], span[1], name, entry)
+
+    # Effets globaux (effects.coucher_soleil: time_start / time_end)
+    for name, entry in (root.get('effects') or {}).items():
+        span = parse_span(entry) if isinstance(entry, dict) else None
+        if span and span[1] > span[0]:
+            add("effect", span[0], span[1], name, entry)
+
+    config = os.path.basename(path)
+    info = ActInfo(key, config, phase, offset, duration, _act_title(root))
+    cues.append(Cue(offset, offset + duration, "phase", key, phase or key, info.title, phase))
+    return info, cues
+
+
+def validate_act(info: ActInfo, cues: Sequence[Cue]) -> List[str]:
+    """Trous / chevauchements des pistes continues et cues hors de l'acte."""
+    issues = []
+    for track in CONTIGUOUS_TRACKS:
+        track_cues = sorted((c for c in cues if c.track == track), key=lambda c: (c.start, c.end))
+        if not track_cues:
+            continue
+        cursor, previous = info.start, None
+        for cue in track_cues:
+            if cue.start > cursor + EPSILON:
+                after = f"après {previous}" if previous else "au début"
+                issues.append(f"{info.key}/{track}: trou de {cue.start - cursor:.2f}s {after} "
+                              f"({cursor - info.start:.2f}s → {cue.start - info.start:.2f}s)")
+            elif cue.start < cursor - EPSILON:
+                issues.append(f"{info.key}/{track}: {cue.name} chevauche {previous} "
+                              f"de {cursor - cue.start:.2f}s")
+            cursor, previous = max(cursor, cue.end), cue.name
+        if cursor < info.end - EPSILON:
+            issues.append(f"{info.key}/{track}: trou de {info.end - cursor:.2f}s en fin d'acte")
+    states = {c.name: c for c in cues if c.track == "state"}
+    for cue in cues:
+        parent = states.get(cue.name.split('.')[0]) if cue.track == "step" else None
+        if parent and (cue.start < parent.start - EPSILON or cue.end > parent.end + EPSILON):
+            issues.append(f"{info.key}/step: {cue.name} ({cue.start - info.start:.2f}-"
+                          f"{cue.end - info.start:.2f}s) hors de l'état {parent.name}")
+        if cue.start < info.start - EPSILON or cue.end > info.end + EPSILON:
+            issues.append(f"{info.key}/{cue.track}: {cue.name} "
+                          f"({cue.start - info.start:.2f}-{cue.end - info.start:.2f}s) "
+                          f"hors de l'acte (0-{info.duration:.2f}s)")
+    return issues
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                             TIMELINE INDEXÉE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ShowTimeline:
+    """
+    Toutes les cues du show + index par segments élémentaires: les bornes
+    triées découpent le show en segments où l'ensemble des cues actives est
+    constant, précalculé une fois → active_at(t) en O(log n).
+    """
+
+    def __init__(self, acts: Sequence[ActInfo], cues: Sequence[Cue], issues: Sequence[str] = ()):
+        self.acts = list(acts)
+        self.cues = sorted(cues, key=lambda c: (c.start, TRACKS.index(c.track), c.end))
+        self.issues = list(issues)
+        self.duration = max((a.end for a in self.acts), default=0.0)
+
+        starting: Dict[float, List[int]] = {}
+        ending: Dict[float, List[int]] = {}
+        for i, cue in enumerate(self.cues):
+            starting.setdefault(cue.start, []).append(i)
+            ending.setdefault(cue.end, []).append(i)
+        self.bounds = sorted(set(starting) | set(ending))
+
+        # Balayage: cues actives sur [bounds[k], bounds[k + 1])
+        self._active: List[Tuple[int, ...]] = []
+        active = set()
+        for bound in self.bounds[:-1]:
+            active.difference_update(ending.get(bound, ()))
+            active.update(starting.get(bound, ()))
+            self._active.append(tuple(sorted(active)))
+        self._acts_by_key = {a.key: a for a in self.acts}
+        self._state_bounds: Dict[str, List[Tuple[str, float, float]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.cues)
+
+    def active_at(self, t: float, track: Optional[str] = None) -> Tuple[Cue, ...]:
+        """Cues actives à l'instant absolu t (toutes pistes, ou une seule)."""
+        k = bisect.bisect_right(self.bounds, t) - 1
+        if k < 0 or k >= len(self._active):
+            return ()
+        cues = (self.cues[i] for i in self._active[k])
+        return tuple(c for c in cues if track is None or c.track == track)
+
+    def cue_at(self, t: float, track: str) -> Optional[Cue]:
+        cues = self.active_at(t, track)
+        return cues[0] if cues else None
+
+    def phase_at(self, t: float) -> Tuple[Optional[str], float]:
+        """(phase FormationLibrary, temps local de l'acte) à l'instant t."""
+        cue = self.cue_at(t, "phase")
+        if cue is None:
+            return None, 0.0
+        return cue.phase, t - cue.start
+
+    def act(self, key: str) -> Optional[ActInfo]:
+        return self._acts_by_key.get(key)
+
+    def act_cues(self, key: str, track: str) -> List[Cue]:
+        return [c for c in self.cues if c.act == key and c.track == track]
+
+    def state_bounds(self, key: str) -> List[Tuple[str, float, float]]:
+        """États de l'acte (nom, début, fin) en temps local de l'acte."""
+        if key not in self._state_bounds:
+            info = self.act(key)
+            self._state_bounds[key] = [] if info is None else \
+                [(c.name, c.start - info.start, c.end - info.start) for c in self.act_cues(key, "state")]
+        return self._state_bounds[key]
+
+    def to_json(self) -> dict:
+        return {'version': COMPILER_VERSION,
+                'acts': [asdict(a) for a in self.acts],
+                'cues': [asdict(c) for c in self.cues],
+                'issues': self.issues}
+
+    @classmethod
+    def from_json(cls, data: dict) -> "ShowTimeline":
+        return cls([ActInfo(**a) for a in data['acts']], [Cue(**c) for c in data['cues']], data['issues'])
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          COMPILATION + CACHE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _manifest(show_path: str) -> List[Tuple[str, Optional[str]]]:
+    with open(show_path, 'r', encoding='utf-8') as f:
+        acts = ((yaml.safe_load(f) or {}).get('show') or {}).get('acts') or []
+    folder = os.path.dirname(os.path.abspath(show_path))
+    return [(os.path.join(folder, a['config']), a.get('phase')) for a in acts]
+
+
+def _sources_key(paths: Sequence[str]) -> str:
+    """Empreinte (chemin, mtime, taille) des YAML compilés et du compilateur."""
+    digest = hashlib.sha1(f"v{COMPILER_VERSION}".encode('utf-8'))
+    for path in list(paths) + [os.path.abspath(__file__)]:
+        stat = os.stat(path)
+        digest.update(f"|{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def compile_show(show_path: Optional[str] = None, strict: bool = False) -> ShowTimeline:
+    """Compile les actes de show.yaml bout à bout (analyse YAML complète)."""
+    acts, cues, issues = [], [], []
+    offset = 0.0
+    for path, phase in _manifest(show_path or DEFAULT_SHOW_PATH):
+        info, act_cues = compile_act(path, offset, phase)
+        issues.extend(validate_act(info, act_cues))
+        acts.append(info)
+        cues.extend(act_cues)
+        offset = info.end
+    if strict and issues:
+        raise ValueError("Timeline du show invalide:\n  " + "\n  ".join(issues))
+    for issue in issues:
+        print(f"Warning: {issue}")
+    return ShowTimeline(acts, cues, issues)
+
+
+def _save_compiled(path: str, timeline: ShowTimeline):
+    """Écriture atomique, puis suppression des compilations précédentes."""
+    folder = os.path.dirname(path)
+    os.makedirs(folder, exist_ok=True)
+    fd, staging = tempfile.mkstemp(prefix='.tmp-', suffix='.json', dir=folder)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(timeline.to_json(), f, ensure_ascii=False)
+        os.replace(staging, path)
+    except OSError:
+        if os.path.exists(staging):
+            os.remove(staging)
+        raise
+    for name in os.listdir(folder):
+        if name.startswith('show-') and name.endswith('.json') and name != os.path.basename(path):
+            try:
+                os.remove(os.path.join(folder, name))
+            except OSError:
+                pass
+
+
+def load_show(show_path: Optional[str] = None, cache_dir: Optional[str] = None,
+              strict: bool = False) -> ShowTimeline:
+    """
+    Timeline du show: forme compilée du cache si aucun YAML n'a changé,
+    sinon compilation + écriture du cache (ignorée si non inscriptible).
+    """
+    show_path = show_path or DEFAULT_SHOW_PATH
+    paths = [show_path] + [p for p, _ in _manifest(show_path)]
+    cache_file = os.path.join(cache_dir or DEFAULT_CACHE_DIR, f"show-{_sources_key(paths)}.json")
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == COMPILER_VERSION and not (strict and data['issues']):
+            return ShowTimeline.from_json(data)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    timeline = compile_show(show_path, strict)
+    try:
+        _save_compiled(cache_file, timeline)
+    except OSError as e:
+        print(f"Warning: cache du show non inscriptible ({e})")
+    return timeline
+
+
+# Timeline partagée par le processus (FormationLibrary, chorégraphe)
+_SHOW: Optional[ShowTimeline] = None
+_SHOW_FAILED = False
+
+
+def show_timeline() -> Optional[ShowTimeline]:
+    """Timeline du show chargée une fois par processus (None si la config est illisible)."""
+    global _SHOW, _SHOW_FAILED
+    if _SHOW is None and not _SHOW_FAILED:
+        try:
+            _SHOW = load_show()
+        except (OSError, yaml.YAMLError, KeyError, TypeError, ValueError) as e:
+            print(f"Warning: timeline du show indisponible ({e}), timings par défaut")
+            _SHOW_FAILED = True
+    return _SHOW
+
+
+def state_ends(act: str, default: Sequence[float]) -> Tuple[float, ...]:
+    """
+    Fins des états de l'acte (temps local) depuis la config, ou default si
+    l'acte n'est pas compilé ou n'a pas le même nombre d'états.
+    """
+    timeline = show_timeline()
+    bounds = timeline.state_bounds(act) if timeline else []
+    if len(bounds) != len(default):
+        return tuple(default)
+    return tuple(end for _, _, end in bounds)
+
+
+def state_durations(act: str, default: Sequence[float]) -> Tuple[float, ...]:
+    """Durées des états de l'acte depuis la config (même repli que state_ends)."""
+    timeline = show_timeline()
+    bounds = timeline.state_bounds(act) if timeline else []
+    if len(bounds) != len(default):
+        return tuple(default)
+    return tuple(end - start for _, start, end in bounds)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'TRACKS',
+    'Cue',
+    'ActInfo',
+    'ShowTimeline',
+    'parse_span',
+    'compile_act',
+    'validate_act',
+    'compile_show',
+    'load_show',
+    'show_timeline',
+    'state_ends',
+    'state_durations',
+]
+
+
+if __name__ == "__main__":
+    import glob
+    import sys
+    import time
+
+    # Validation de tous les actes de config/, y compris ceux hors du show
+    for path in sorted(glob.glob(os.path.join(CONFIG_DIR, 'act*.yaml'))):
+        info, act_cues = compile_act(path)
+        issues = validate_act(info, act_cues)
+        counts = {track: sum(c.track == track for c in act_cues) for track in TRACKS[1:]}
+        print(f"{info.config:32s} {info.duration:5.1f}s  " +
+              "  ".join(f"{track}={n}" for track, n in counts.items()) +
+              ("  OK" if not issues else f"  {len(issues)} problème(s)"))
+        for issue in issues:
+            print(f"    - {issue}")
+
+    start = time.perf_counter()
+    compiled = compile_show()
+    compile_ms = (time.perf_counter() - start) * 1000
+    load_show()                                         # Écrit le cache
+    start = time.perf_counter()
+    timeline = load_show()
+    load_ms = (time.perf_counter() - start) * 1000
+    print(f"\nShow: {len(timeline.acts)} actes, {timeline.duration:.1f}s, {len(timeline)} cues, "
+          f"{len(timeline.bounds)} bornes | compilation YAML {compile_ms:.1f} ms, cache {load_ms:.1f} ms")
+    for info in timeline.acts:
+        print(f"  {info.start:6.1f}-{info.end:6.1f}s  {info.phase or '-':24s} {info.title}")
+
+    times = [float(a) for a in sys.argv[1:]] or [0.0, 5.5, 21.0, 44.0]
+    for t in times:
+        phase, local = timeline.phase_at(t)
+        print(f"\nt={t:.2f}s → {phase} (t local {local:.2f}s)")
+        for cue in timeline.active_at(t):
+            if cue.track != "phase":
+                print(f"  [{cue.track:6s}] {cue.name:40s} {cue.label}")
+
+    start = time.perf_counter()
+    for i in range(100000):
+        timeline.active_at((i * 0.00061) % timeline.duration)
+    print(f"\nactive_at: {(time.perf_counter() - start) * 10:.2f} µs/requête")
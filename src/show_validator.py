@@ -0,0 +1,342 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+              VALIDATEUR DE SÉCURITÉ DU SHOW (SÉPARATION) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Vérifie un show simulé ou pré-calculé contre les limites de simulation.yaml:
+1. Séparation minimale: toutes les paires de drones sous min_separation
+   (cKDTree.query_pairs), coût O(N log N + paires) par frame
+2. Vitesse et accélération par différences finies (max_speed / acceleration)
+3. Géofence: boîte `space` (x_range, y_range, z_range)
+4. Formations cibles: espacement de chaque phase (formation_spacing), signalé
+   une fois par phase plutôt qu'à chaque construction de forme
+
+Le validateur est en flux: il ne garde que les deux frames précédentes et un
+top-K des pires paires, donc une mémoire O(N + paires de la frame) quelle
+que soit la durée.
+
+Usage:  python src/show_validator.py [num_drones] [minutes] [rate_hz]
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+@dataclass(frozen=True)
+class SafetyLimits:
+    """Limites physiques et géofence du show"""
+    min_separation: float
+    collision_radius: float
+    max_speed: float
+    max_acceleration: float
+    x_range: Tuple[float, float]
+    y_range: Tuple[float, float]
+    z_range: Tuple[float, float]
+
+    @classmethod
+    def from_config(cls, sim_config):
+        sim = sim_config['simulation']
+        physics, space = sim['physics'], sim['space']
+        return cls(
+            min_separation=physics['min_separation_m'],
+            collision_radius=physics['collision_radius_m'],
+            max_speed=physics['max_speed_m_s'],
+            max_acceleration=physics['acceleration_m_s2'],
+            x_range=tuple(space['x_range']),
+            y_range=tuple(space['y_range']),
+            z_range=tuple(space['z_range']),
+        )
+
+
+@dataclass
+class ValidationReport:
+    """Rapport compact de validation"""
+    frames: int = 0
+    duration: float = 0.0
+    first_violation_time: Optional[float] = None
+    first_violation_kind: Optional[str] = None
+    separation_violations: int = 0      # Paires × frames sous min_separation
+    collisions: int = 0                 # Paires × frames sous collision_radius
+    min_distance: float = float("inf")
+    speed_violations: int = 0           # Drones × frames au-dessus de max_speed
+    max_speed: float = 0.0
+    accel_violations: int = 0
+    max_acceleration: float = 0.0
+    geofence_violations: int = 0
+    worst_pairs: List[Tuple[float, float, int, int, str]] = field(default_factory=list)
+    per_phase: Dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    tight_formations: Dict[str, float] = field(default_factory=dict)  # Phase -> espacement cible < min
+
+    @property
+    def ok(self) -> bool:
+        return self.first_violation_time is None
+
+    def summary(self) -> str:
+        lines = [
+            f"Frames: {self.frames}  durée: {self.duration:.1f}s  "
+            f"{'OK' if self.ok else 'VIOLATIONS'}",
+        ]
+        if not self.ok:
+            lines.append(f"Première violation: {self.first_violation_kind} à t={self.first_violation_time:.2f}s")
+        lines += [
+            f"Séparation < min: {self.separation_violations}  collisions: {self.collisions}  "
+            f"distance min: {self.min_distance:.2f}m",
+            f"Vitesse > max: {self.speed_violations}  (max {self.max_speed:.1f} m/s)",
+            f"Accélération > max: {self.accel_violations}  (max {self.max_acceleration:.1f} m/s²)",
+            f"Hors géofence: {self.geofence_violations}",
+        ]
+        if self.worst_pairs:
+            lines.append("Pires paires (distance, t, i, j, phase):")
+            for dist, t, i, j, phase in self.worst_pairs:
+                lines.append(f"  {dist:6.2f}m  t={t:7.2f}s  {i:6d} - {j:6d}  {phase}")
+        if self.per_phase:
+            lines.append("Par phase:")
+            for phase, counts in self.per_phase.items():
+                detail = "  ".join(f"{k}={v}" for k, v in sorted(counts.items()))
+                lines.append(f"  {phase:28s} {detail}")
+        if self.tight_formations:
+            lines.append("Formations cibles sous l'espacement minimal:")
+            for phase, spacing in sorted(self.tight_formations.items(), key=lambda item: item[1]):
+                lines.append(f"  {phase:28s} {spacing:.2f}m")
+        return "\n".join(lines)
+
+
+class ShowValidator:
+    """
+    Validateur en flux: appeler feed(t, positions, phase) pour chaque frame,
+    puis report(). Les drones posés au sol (y <= ground_level) sont exclus
+    du contrôle de séparation (pads de décollage).
+    """
+
+    def __init__(self, limits: SafetyLimits, worst_pairs: int = 20, ground_level: float = 0.5):
+        self.limits = limits
+        self.ground_level = ground_level
+        self._k = worst_pairs
+        self._worst = {}  # (i, j) -> (distance, t, phase): top-K des paires les plus proches
+        self._prev_pos = None
+        self._prev_vel = None
+        self._prev_t = None
+        self._first_t = None
+        self._report = ValidationReport()
+
+    def feed(self, t, positions, phase=""):
+        """Valide une frame (positions (N, 3), temps t en secondes)."""
+        lim, rep = self.limits, self._report
+        pos = np.asarray(positions, dtype=np.float64)
+        counts = rep.per_phase[phase]
+        if self._first_t is None:
+            self._first_t = t
+
+        # 1. Séparation: toutes les paires en vol sous min_separation
+        airborne = np.flatnonzero(pos[:, 1] > self.ground_level)
+        if len(airborne) > 1:
+            tree = cKDTree(pos[airborne])
+            pairs = tree.query_pairs(lim.min_separation, output_type='ndarray')
+            if len(pairs):
+                first, second = airborne[pairs[:, 0]], airborne[pairs[:, 1]]
+                delta = pos[first] - pos[second]
+                dist = np.sqrt(np.einsum('ij,ij->i', delta, delta))
+                # query_pairs inclut la borne (<=): ne garder que les paires strictement sous le minimum
+                close = np.flatnonzero(dist < lim.min_separation)
+                if len(close):
+                    first, second, dist = first[close], second[close], dist[close]
+                    n_coll = int(np.count_nonzero(dist < lim.collision_radius))
+                    rep.separation_violations += len(close)
+                    rep.collisions += n_coll
+                    rep.min_distance = min(rep.min_distance, float(dist.min()))
+                    counts["separation"] += len(close)
+                    counts["collision"] += n_coll
+                    self._flag(t, "separation")
+                    self._keep_worst(t, phase, first, second, dist)
+
+        # 2. Géofence
+        outside = ((pos[:, 0] < lim.x_range[0]) | (pos[:, 0] > lim.x_range[1]) |
+                   (pos[:, 1] < lim.y_range[0]) | (pos[:, 1] > lim.y_range[1]) |
+                   (pos[:, 2] < lim.z_range[0]) | (pos[:, 2] > lim.z_range[1]))
+        n_out = int(np.count_nonzero(outside))
+        if n_out:
+            rep.geofence_violations += n_out
+            counts["geofence"] += n_out
+            self._flag(t, "geofence")
+
+        # 3. Vitesse / accélération par différences finies
+        if self._prev_pos is not None and t > self._prev_t:
+            dt = t - self._prev_t
+            vel = (pos - self._prev_pos) / dt
+            speed = np.sqrt(np.einsum('ij,ij->i', vel, vel))
+            rep.max_speed = max(rep.max_speed, float(speed.max()))
+            n_fast = int(np.count_nonzero(speed > lim.max_speed))
+            if n_fast:
+                rep.speed_violations += n_fast
+                counts["speed"] += n_fast
+                self._flag(t, "speed")
+
+            if self._prev_vel is not None:
+                acc = vel - self._prev_vel
+                acc /= dt
+                accel = np.sqrt(np.einsum('ij,ij->i', acc, acc))
+                rep.max_acceleration = max(rep.max_acceleration, float(accel.max()))
+                n_acc = int(np.count_nonzero(accel > lim.max_acceleration))
+                if n_acc:
+                    rep.accel_violations += n_acc
+                    counts["accel"] += n_acc
+                    self._flag(t, "accel")
+            self._prev_vel = vel
+
+        if self._prev_pos is None:
+            self._prev_pos = pos.copy()
+        else:
+            self._prev_pos[:] = pos
+        self._prev_t = t
+        rep.frames += 1
+        rep.duration = t - self._first_t
+
+    def report(self) -> ValidationReport:
+        """Rapport courant (pires paires triées par distance croissante)."""
+        self._report.worst_pairs = sorted((d, t, i, j, ph) for (i, j), (d, t, ph) in self._worst.items())
+        return self._report
+
+    def _flag(self, t, kind):
+        if self._report.first_violation_time is None:
+            self._report.first_violation_time = t
+            self._report.first_violation_kind = kind
+
+    def _keep_worst(self, t, phase, first, second, dist):
+        # Seules les k plus proches de la frame peuvent entrer dans le top-K global;
+        # une paire n'y figure qu'une fois, à sa distance minimale
+        candidates = np.argpartition(dist, self._k)[:self._k] if len(dist) > self._k else np.arange(len(dist))
+        for idx in candidates[np.argsort(dist[candidates])]:
+            pair = tuple(sorted((int(first[idx]), int(second[idx]))))
+            d = float(dist[idx])
+            known = self._worst.get(pair)
+            if known is not None:
+                if d < known[0]:
+                    self._worst[pair] = (d, t, phase)
+                continue
+            if len(self._worst) < self._k:
+                self._worst[pair] = (d, t, phase)
+                continue
+            farthest = max(self._worst, key=lambda k: self._worst[k][0])
+            if d >= self._worst[farthest][0]:
+                break  # Candidats triés: les suivants sont plus loin
+            del self._worst[farthest]
+            self._worst[pair] = (d, t, phase)
+
+
+def simulate_frames(sim_config, vis_config, phases, duration_per_phase=8.0,
+                    rate_hz=20.0, physics_dt=1.0 / 60.0):
+    """
+    Génère (t, manager, phase) à rate_hz en simulant DroneManager +
+    FormationLibrary (physique à physics_dt). manager est le même
+    DroneManager à chaque frame: lire positions/couleurs avant la suivante.
+    """
+    from drone_manager import DroneManager
+    from formation_library import FormationLibrary
+
+    num = sim_config['simulation']['max_drones']
+    manager = DroneManager(sim_config, vis_config)
+    library = FormationLibrary(min_separation=sim_config['simulation']['physics']['min_separation_m'])
+    substeps = max(1, int(round(1.0 / (rate_hz * physics_dt))))
+    dt = 1.0 / (rate_hz * substeps)
+    frames_per_phase = int(round(duration_per_phase * rate_hz))
+
+    t_show = 0.0
+    yield t_show, manager, phases[0] if phases else ""
+    for phase in phases:
+        phase_time = 0.0
+        for _ in range(frames_per_phase):
+            for _ in range(substeps):
+                phase_time += dt
+                targets, colors = library.get_phase(phase, num, t=phase_time,
+                                                    out=manager.formation_buffers())
+                manager.set_formation(targets, colors)
+                manager.update(dt, time_absolute=phase_time)
+            t_show += dt * substeps
+            yield t_show, manager, phase
+
+
+def simulate_show(sim_config, vis_config, phases, duration_per_phase=8.0,
+                  rate_hz=20.0, physics_dt=1.0 / 60.0):
+    """
+    Génère (t, positions, phase) à rate_hz (voir simulate_frames). Les
+    positions sont une vue réutilisée: le consommateur doit copier s'il les
+    conserve.
+    """
+    for t, manager, phase in simulate_frames(sim_config, vis_config, phases,
+                                             duration_per_phase, rate_hz, physics_dt):
+        yield t, manager.positions, phase
+
+
+def formation_spacing(sim_config, phases) -> Dict[str, float]:
+    """
+    Plus proche voisin de la formation cible (t=0) de chaque phase, pour les
+    phases dont l'espacement est sous min_separation_m (drones en vol).
+    """
+    from formation_library import FormationLibrary
+    from poisson_disk import min_distance
+
+    num = sim_config['simulation']['max_drones']
+    min_separation = sim_config['simulation']['physics']['min_separation_m']
+    library = FormationLibrary(min_separation=min_separation)
+    tight = {}
+    for phase in dict.fromkeys(phases):
+        targets, _ = library.get_phase(phase, num)
+        targets = np.asarray(targets, dtype=np.float64)
+        spacing = min_distance(targets[targets[:, 1] > 0.5])
+        if spacing < min_separation:
+            tight[phase] = spacing
+    return tight
+
+
+def validate_show(frames, limits: SafetyLimits, worst_pairs: int = 20) -> ValidationReport:
+    """Valide un itérable de (t, positions, phase) et retourne le rapport."""
+    validator = ShowValidator(limits, worst_pairs=worst_pairs)
+    for t, positions, phase in frames:
+        validator.feed(t, positions, phase)
+    return validator.report()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'SafetyLimits',
+    'ValidationReport',
+    'ShowValidator',
+    'simulate_frames',
+    'simulate_show',
+    'formation_spacing',
+    'validate_show',
+]
+
+
+if __name__ == "__main__":
+    import os
+    import yaml
+
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    minutes = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    rate = float(sys.argv[3]) if len(sys.argv) > 3 else 20.0
+
+    config_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'config')
+    with open(os.path.join(config_dir, 'simulation.yaml'), 'r', encoding='utf-8') as f:
+        sim_config = yaml.safe_load(f)
+    with open(os.path.join(config_dir, 'visuals.yaml'), 'r', encoding='utf-8') as f:
+        vis_config = yaml.safe_load(f)
+    sim_config['simulation']['max_drones'] = num
+
+    sequence = ["phase2_anem", "phase_22eme_edition", "phase3_jcn", "phase4_fes"]
+    per_phase = minutes * 60.0 / len(sequence)
+    start = time.perf_counter()
+    report = validate_show(simulate_show(sim_config, vis_config, sequence, per_phase, rate),
+                           SafetyLimits.from_config(sim_config))
+    report.tight_formations = formation_spacing(sim_config, sequence)
+    print(report.summary())
+    print(f"Validation: {time.perf_counter() - start:.1f}s pour {num} drones, {minutes} min à {rate} Hz")
@@ -1,13 +1,15 @@
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 from PyQt6.QtCore import QTimer, Qt
 import OpenGL.GL as gl
+import OpenGL.GLU as glu
 import numpy as np
-import math
+import threading
+from dataclasses import replace
 
 from drone_manager import DroneManager
 from camera_system import CameraSystem
 from lighting_system import LightingSystem
-from formation_library import FormationLibrary
+from formation_library import FormationLibrary, frame_seed
 from audio_system import AudioSystem
 from shader_system import PostProcessingPipeline
 
@@ -19,8 +21,16 @@ from transition_system import (
     EasingFunctions
 )
 from formation_choreographer import ShowChoreographer, TransitionPresets
+from simulation_thread import FrameExchange, SimulationWorker
+from simulation_process import ProcessSimulationBackend
+from curves import smoothstep
+from render_lod import DroneLOD, LODStats
+from water_surface import WaterSurface
+from show_clock import CheckpointStore, ShowClock, reveal_state, FADE_IN_TIME
 
 class SimulationCore(QOpenGLWidget):
+    CHECKPOINT_INTERVAL = 2.0   # Secondes de lecture entre deux checkpoints de séquence
+
     def __init__(self, sim_config, vis_config):
         super().__init__()
         self.sim_config = sim_config
@@ -33,23 +43,33 @@ class SimulationCore(QOpenGLWidget):
         self.drone_manager = DroneManager(sim_config, vis_config)
         self.camera = CameraSystem()
         self.lighting = LightingSystem(vis_config)
-        self.formations = FormationLibrary()
+        self.formations = FormationLibrary(
+            min_separation=sim_config['simulation']['physics']['min_separation_m'])
         self.audio = AudioSystem()  # New audio system
         self.post_processing = PostProcessingPipeline()  # Bloom/glow shaders
         
+        # LOD: culling frustum + splats pour les drones lointains (performance.yaml)
+        self.lod = DroneLOD.from_config(sim_config.get('performance'), num_drones, fov=self.camera.fov)
+        self.aspect = 1.0
+        self.water = WaterSurface()  # VBO créé dans initializeGL
+        
         # === SYSTÈME DE TRANSITIONS PROFESSIONNELLES ===
-        self.pro_transition = ProfessionalTransitionSystem(num_drones)
-        self.living_animator = LivingFormationAnimator()
+        self.pro_transition = ProfessionalTransitionSystem(
+            num_drones, min_separation=sim_config['simulation']['physics']['min_separation_m'],
+            backend=self.drone_manager.physics.backend,
+            turbulence=self.drone_manager.physics.turbulence)
+        self.living_animator = LivingFormationAnimator(self.drone_manager.physics.turbulence)
         self.choreographer = ShowChoreographer(num_drones, self.formations)
         
         # Mode professionnel activé/désactivé
         self.pro_mode_enabled = True  # Active le système pro par défaut
         self.global_light_multiplier = 1.0  # Multiplicateur de lumière global
         
-        # Render Timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_simulation)
-        self.timer.start(16) # ~60 FPS
+        # Frames publiées par la simulation, lues par paintGL (triple buffer)
+        self.frame_exchange = FrameExchange(num_drones)
+        self.sim_worker = None
+        self.process_backend = None  # Backend hors processus (mémoire partagée)
+        self._backend_playing = False
         
         # Interaction
         self.last_mouse_pos = None
@@ -60,6 +80,8 @@ class SimulationCore(QOpenGLWidget):
         self.state_timer = 0.0
         self.phase_state = 0
         self.target_colors = np.ones((num_drones, 3)) # Default White
+        # Buffers des effets par frame (scintillement, vagues HOLD): aucune allocation
+        self._effect_buffers = np.empty((2, num_drones), dtype=np.float32)
         
         # === AUDIO REACTIVITY ===
         self.audio_energy = 0.5  # Normalized [0, 1], from FFT or placeholder
@@ -76,11 +98,30 @@ class SimulationCore(QOpenGLWidget):
         self.sequence_timer = 0.0
         self.sequence_duration = 8.0  # Seconds per phase
         self.sequence_paused = False
+        # Physique de la séquence (positions exactes) posée pendant la lecture, pour seek()
+        self.checkpoints = CheckpointStore(0.016)
         
         # === POST-PROCESSING EFFECTS ===
         self.bloom_enabled = True  # Default: enable bloom
         self.bloom_intensity = 1.5
         self.bloom_threshold = 0.7
+        
+        self._publish_frame()
+        
+        # Render Timer: en mode thread/process, le thread GUI ne fait que redessiner
+        # backend: "thread" (défaut) | "process" (très grands essaims) | "timer"
+        self.timer = QTimer()
+        backend = sim_config['simulation']['time'].get('backend', 'thread')
+        if backend == 'thread':
+            self.sim_worker = SimulationWorker(self.step_simulation, self._publish_frame)
+            self.sim_worker.start()
+            self.timer.timeout.connect(self.update)
+        elif backend == 'process':
+            self.process_backend = ProcessSimulationBackend(sim_config, vis_config).start()
+            self.timer.timeout.connect(self.update_process_frame)
+        else:
+            self.timer.timeout.connect(self.update_simulation)
+        self.timer.start(16) # ~60 FPS
 
     def initializeGL(self):
         gl.glClearColor(0.02, 0.02, 0.05, 1) # DEEP COSMIC BLUE/BLACK
@@ -92,6 +133,7 @@ class SimulationCore(QOpenGLWidget):
         gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
         
         self.lighting.setup()
+        self.water.initialize()
         
         # OPTIMIZATION: USE A SIMPLE QUAD FOR DRONE (BILLBOARD) instead of heavy geometry
         # This Display List will just be a flat square on XY plane
@@ -127,54 +169,60 @@ class SimulationCore(QOpenGLWidget):
         gl.glViewport(0, 0, w, h)
         gl.glMatrixMode(gl.GL_PROJECTION)
         gl.glLoadIdentity()
-        import OpenGL.GLU as glu
         aspect = w / h if h > 0 else 1.0
-        glu.gluPerspective(45.0, aspect, 0.1, 1000.0)
+        self.aspect = aspect
+        glu.gluPerspective(self.lod.fov, aspect, self.lod.near, self.lod.far)
         gl.glMatrixMode(gl.GL_MODELVIEW)
 
     def paintGL(self):
         gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
         gl.glLoadIdentity()
         
-        self.camera.apply_view()
+        # Dernière frame complète publiée par la simulation (immuable)
+        frame = self._latest_frame()
+        glu.gluLookAt(*frame.camera_pose)
         
         # Draw Drones
-        positions, colors = self.drone_manager.get_render_data()
-        
-        # OPTIMIZATION: USE GL_POINT_SPRITES (Fastest possible method for thousands of particles)
-        # Instead of looping and drawing spheres
-        
-        gl.glEnable(gl.GL_POINT_SMOOTH)
-        
-        # 1. Macro Halo (Background Glow) - Draw first, No Depth Write
-        # Appliquer le multiplicateur de lumière global pour le blackout
-        gl.glDepthMask(gl.GL_FALSE)
-        gl.glPointSize(12.0)
-        
-        light_mult = float(self.global_light_multiplier)  # Convertir en float Python
-        
-        if light_mult > 0.01:  # Ne dessiner que si pas en blackout total
-            gl.glBegin(gl.GL_POINTS)
-            for i in range(len(positions)):
-                col = colors[i]
-                # Simple flicker + multiplicateur de lumière
-                pulse = (0.2 + 0.05 * math.sin(i*0.13 + self.phase_timer*5.0)) * light_mult
-                gl.glColor4f(float(col[0] * light_mult), float(col[1] * light_mult), float(col[2] * light_mult), float(pulse)) 
-                gl.glVertex3f(float(positions[i,0]), float(positions[i,1]), float(positions[i,2]))
-            gl.glEnd()
-        gl.glDepthMask(gl.GL_TRUE)
-        
-        # 2. Core (White Hot Center) - Draw second, avec multiplicateur de lumière
-        gl.glPointSize(4.0)
-        light_mult = float(self.global_light_multiplier)  # Convertir en float Python
+        light_mult = frame.light_multiplier
         
         if light_mult > 0.01:  # Ne dessiner que si pas en blackout total
-            gl.glBegin(gl.GL_POINTS)
-            for i in range(len(positions)):
+            # LOD: drones visibles compactés (proches: halo + cœur, lointains: splat)
+            lod = self.lod
+            stats = lod.build(frame.positions, frame.colors, frame.camera_pose,
+                              light_mult, frame.sim_time, self.aspect)
+            
+            gl.glEnable(gl.GL_POINT_SMOOTH)
+            gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+            gl.glEnableClientState(gl.GL_COLOR_ARRAY)
+            
+            # 1. Macro Halo (Background Glow) - Draw first, No Depth Write
+            if stats.halos:
+                gl.glDepthMask(gl.GL_FALSE)
+                gl.glPointSize(lod.HALO_SIZE)
+                gl.glVertexPointer(3, gl.GL_FLOAT, 0, lod.halo_positions)
+                gl.glColorPointer(4, gl.GL_FLOAT, 0, lod.halo_colors)
+                gl.glDrawArrays(gl.GL_POINTS, 0, stats.halos)
+                gl.glDepthMask(gl.GL_TRUE)
+            
+            # 2. Splats lointains (halo et cœur fusionnés)
+            if stats.splats:
+                gl.glPointSize(lod.SPLAT_SIZE)
+                gl.glVertexPointer(3, gl.GL_FLOAT, 0, lod.splat_positions)
+                gl.glColorPointer(4, gl.GL_FLOAT, 0, lod.splat_colors)
+                gl.glDrawArrays(gl.GL_POINTS, 0, stats.splats)
+            gl.glDisableClientState(gl.GL_COLOR_ARRAY)
+            
+            # 3. Core (White Hot Center) - mêmes sommets que les halos, couleur unique
+            if stats.halos:
+                gl.glPointSize(lod.CORE_SIZE)
                 gl.glColor4f(light_mult, light_mult, light_mult, light_mult)
-                gl.glVertex3f(float(positions[i,0]), float(positions[i,1]), float(positions[i,2]))
-            gl.glEnd()
+                gl.glVertexPointer(3, gl.GL_FLOAT, 0, lod.halo_positions)
+                gl.glDrawArrays(gl.GL_POINTS, 0, stats.halos)
+            gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
+        else:
+            self.lod.stats = LODStats(total=len(frame.positions))
             
+
         # Draw Water Surface
         self._draw_grid()
 
@@ -185,60 +233,28 @@ class SimulationCore(QOpenGLWidget):
         # ═══════════════════════════════════════════════════════════════
         # SURFACE D'EAU RÉFLÉCHISSANTE - "Lac de Nuit"
         # ═══════════════════════════════════════════════════════════════
-        # Plan d'eau à Y = -5m (sous le niveau du sol visible)
-        # Effet de profondeur et reflets subtils
-        
-        water_level = -5.0
-        water_size = 300.0
+        # Plan d'eau à Y = -5m, reflets ondulés et cercle de gouttes:
+        # VBO statique construit dans initializeGL, vagues dans le vertex shader
         
         # Activer le blending pour la transparence
         gl.glEnable(gl.GL_BLEND)
         gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
         
-        # Surface d'eau principale (bleu nuit profond avec transparence)
-        # RGBA: Bleu nuit très sombre avec alpha 0.85
-        gl.glColor4f(0.02, 0.04, 0.12, 0.85)
-        
-        gl.glBegin(gl.GL_QUADS)
-        gl.glVertex3f(-water_size, water_level, -water_size)
-        gl.glVertex3f(water_size, water_level, -water_size)
-        gl.glVertex3f(water_size, water_level, water_size)
-        gl.glVertex3f(-water_size, water_level, water_size)
-        gl.glEnd()
-        
-        # Lignes de reflets subtils (simulation de vagues légères)
-        # Utiliser le temps de simulation pour animer légèrement
-        import time
-        t = time.time() * 0.3  # Animation lente
-        
-        gl.glColor4f(0.05, 0.08, 0.18, 0.4)  # Bleu légèrement plus clair, semi-transparent
-        gl.glBegin(gl.GL_LINES)
-        
-        # Lignes horizontales ondulées (reflets de la lune)
-        import math
-        for i in range(-10, 11, 2):
-            z_base = i * 25
-            for x in range(-int(water_size), int(water_size) + 1, 10):
-                z_offset = math.sin(x * 0.02 + t) * 3
-                gl.glVertex3f(x, water_level + 0.1, z_base + z_offset)
-                gl.glVertex3f(x + 10, water_level + 0.1, z_base + math.sin((x + 10) * 0.02 + t) * 3)
-        gl.glEnd()
-        
-        # Cercles concentriques subtils (effet de gouttes de pluie passées)
-        gl.glColor4f(0.08, 0.12, 0.22, 0.25)
-        gl.glBegin(gl.GL_LINE_LOOP)
-        for angle in range(0, 360, 15):
-            rad = math.radians(angle)
-            r = 50 + math.sin(t * 2) * 5
-            gl.glVertex3f(math.cos(rad) * r, water_level + 0.1, math.sin(rad) * r)
-        gl.glEnd()
+        self.water.draw()
         
         gl.glDisable(gl.GL_BLEND)
         gl.glEnable(gl.GL_LIGHTING)
 
     def set_phase(self, phase_name):
         """Définit une nouvelle phase avec transition professionnelle optionnelle"""
-        
+        self._on_sim_thread(self._set_phase, phase_name)
+        self.update()
+
+    def _set_phase(self, phase_name):
+        if self.process_backend is not None:
+            self._set_remote_phase(phase_name)
+            return
+
         old_phase = self.current_phase
         self.current_phase = phase_name
         self.phase_timer = 0.0
@@ -247,6 +263,7 @@ class SimulationCore(QOpenGLWidget):
         
         num_drones = self.sim_config['simulation']['max_drones']
         targets, colors = self.formations.get_phase(phase_name, num_drones)
+        spec = self.formations.phase_spec(phase_name)
         
         # === TRANSITION PROFESSIONNELLE (MODE PRO) ===
         # Utilise le système de blackout magique si activé
@@ -261,6 +278,8 @@ class SimulationCore(QOpenGLWidget):
                 to_positions=targets.copy(),
                 to_colors=colors.copy()
             )
+            # Plan calculé hors du thread de simulation: la réaffectation des
+            # drones aux cibles est appliquée dans step_simulation à son arrivée
             
             print(f"[PRO TRANSITION] {old_phase} → {phase_name}")
             print(f"  - Fade Out: {self.pro_transition.timing.fade_out}s")
@@ -272,7 +291,7 @@ class SimulationCore(QOpenGLWidget):
             self.pro_transition.is_active = False
         
         # === MORPHING TRANSITION SETUP (Legacy) ===
-        should_transition = phase_name in ["phase10_touareg", "dubai_camel", "phase_touareg_spiral"] or self.sequence_enabled
+        should_transition = spec.morph or self.sequence_enabled
         
         if should_transition and not self.pro_mode_enabled:
             if self.transition_mode == False:
@@ -294,13 +313,108 @@ class SimulationCore(QOpenGLWidget):
         self.target_colors = colors 
         
         # --- DYNAMIC CAMERA PRESET ---
-        self.camera.set_phase_view(phase_name)
-        
+        self.camera.set_phase_view(phase_name, spec.camera_preset)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # THREAD DE SIMULATION - FRAMES & COMMANDES
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def _on_sim_thread(self, func, *args, **kwargs):
+        """
+        Exécute une mutation d'état sur le thread de simulation (mis en file
+        si le worker tourne), ou immédiatement en mode mono-thread.
+        """
+        worker = self.sim_worker
+        if worker is not None and worker.is_alive() and threading.current_thread() is not worker:
+            worker.submit(func, *args, **kwargs)
+        else:
+            func(*args, **kwargs)
+
+    def _publish_frame(self):
+        """Copie l'état courant dans un slot libre de l'échange et le publie."""
+        positions, colors = self.frame_exchange.begin_write()
+        src_pos, src_cols = self.drone_manager.get_render_data()
+        np.copyto(positions, src_pos)
+        np.copyto(colors, src_cols)
+        cam = self.camera
+        self.frame_exchange.publish(
+            self.phase_timer,
+            self.global_light_multiplier,
+            (*cam.position, *cam.target, *cam.up),
+        )
+
+    def _latest_frame(self):
+        """Frame à dessiner: processus de simulation, sinon échange local."""
+        if self.process_backend is not None:
+            remote = self.process_backend.latest()
+            if remote is not None:
+                cam = self.camera
+                return replace(remote,
+                               light_multiplier=self.global_light_multiplier,
+                               camera_pose=(*cam.position, *cam.target, *cam.up))
+        return self.frame_exchange.latest()
+
+    def shutdown(self):
+        """Arrête le thread / processus de simulation (à appeler à la fermeture)."""
+        self.timer.stop()
+        if self.sim_worker is not None:
+            self.sim_worker.stop()
+        self.pro_transition.shutdown()
+        if self.process_backend is not None:
+            self.process_backend.shutdown()
+
+    # --- Backend hors processus: formations + physique dans l'enfant,
+    # --- caméra et séquençage restent ici (transitions pro non disponibles)
+
+    def _set_remote_phase(self, phase_name):
+        self.current_phase = phase_name
+        self.phase_timer = 0.0
+        self.state_timer = 0.0
+        self.phase_state = 0
+        self.process_backend.set_phase(phase_name)
+        spec = self.formations.phase_spec(phase_name)
+        self.camera.set_phase_view(phase_name, spec.camera_preset)
+
+    def update_process_frame(self):
+        """Tick QTimer du backend process: caméra, séquençage, repaint."""
+        dt = 0.016
+        if self.is_playing != self._backend_playing:
+            if self.is_playing:
+                self.process_backend.play()
+            else:
+                self.process_backend.pause()
+            self._backend_playing = self.is_playing
+        if self.is_playing:
+            self.phase_timer += dt
+            self._advance_sequence(dt)
+            spec = self.formations.phase_spec(self.current_phase)
+            if spec.smart_camera:
+                frame = self.process_backend.latest()
+                if frame is not None:
+                    self.camera.update_smart_cinematic(frame.positions, dt)
+            else:
+                self.camera.update(dt)
         self.update()
 
+    def _advance_sequence(self, dt):
+        """Passe à la phase suivante de la séquence automatique si besoin."""
+        if self.sequence_enabled and not self.sequence_paused:
+            self.sequence_timer += dt
+            if self.sequence_timer >= self.sequence_duration:
+                # Advance to next phase
+                self.sequence_timer = 0.0
+                self.sequence_index = (self.sequence_index + 1) % len(self.sequence_list)
+                self._set_phase(self.sequence_list[self.sequence_index])
+
     def update_simulation(self):
+        """Pas de simulation piloté par QTimer (mode mono-thread)."""
+        self.step_simulation(0.016)
+        self._publish_frame()
+        self.update()
+
+    def step_simulation(self, dt):
+        """Avance la simulation d'un pas (thread de simulation ou QTimer)."""
         if self.is_playing:
-            dt = 0.016 
             self.phase_timer += dt
             self.state_timer += dt
             
@@ -322,17 +436,23 @@ class SimulationCore(QOpenGLWidget):
                 # Mettre à jour la transition
                 self.pro_transition.update(dt)
                 
+                # Plan de transit arrivé: les drones ont été réaffectés aux cibles,
+                # suivre la même numérotation
+                assignment = self.pro_transition.take_assignment()
+                if assignment is not None:
+                    self.drone_manager.reorder(assignment)
+                
                 # Obtenir le multiplicateur de lumière (pour blackout/fade)
                 self.global_light_multiplier = self.pro_transition.get_light_multiplier()
                 
-                # Obtenir les positions pendant le transit (dans le noir)
-                positions = self.pro_transition.get_positions()
-                colors = self.pro_transition.get_colors()
+                # Obtenir les positions pendant le transit (dans le noir),
+                # écrites directement dans les buffers du drone manager
+                positions, colors = self.pro_transition.get_frame(
+                    out=self.drone_manager.formation_buffers())
                 
                 # Appliquer les intensités individuelles
                 intensities = self.pro_transition.get_intensities()
-                for i in range(len(colors)):
-                    colors[i] = colors[i] * intensities[i]
+                colors *= intensities[:, np.newaxis]
                 
                 # Mettre à jour le drone manager
                 self.drone_manager.set_formation(positions, colors)
@@ -351,19 +471,13 @@ class SimulationCore(QOpenGLWidget):
                 self.global_light_multiplier = 1.0
             
             # === AUTO-SEQUENCING SYSTEM ===
-            if self.sequence_enabled and not self.sequence_paused:
-                self.sequence_timer += dt
-                if self.sequence_timer >= self.sequence_duration:
-                    # Advance to next phase
-                    self.sequence_timer = 0.0
-                    self.sequence_index = (self.sequence_index + 1) % len(self.sequence_list)
-                    next_phase = self.sequence_list[self.sequence_index]
-                    self.set_phase(next_phase)
+            self._advance_sequence(dt)
             
             # --- LIVING CINEMATIC CAMERA ---
             # Handles smooth transitions, phase-presets, and micro-drifts
-            # Use Smart Cinematic for dynamic "living" phases (Act 1 Desert, Act 2, Act 9 Eagle)
-            if self.current_phase in ["act1_desert", "act2_desert_seveille", "act9_eagle", "miroir_celeste"]:
+            # Use Smart Cinematic for dynamic "living" phases (declared smart_camera)
+            spec = self.formations.phase_spec(self.current_phase)
+            if spec.smart_camera:
                 positions, _ = self.drone_manager.get_render_data()
                 self.camera.update_smart_cinematic(positions, dt)
             else:
@@ -371,156 +485,9 @@ class SimulationCore(QOpenGLWidget):
             
             # --- STATE MACHINE LOGIC (seulement si pas en transition pro) ---
             if not (self.pro_mode_enabled and self.pro_transition.is_active):
-            
-                # Constants
-                TRANSIT_TIME = 4.0 # Time for travel (Faster)
-                BLACKOUT_TIME = 0.5 # Arret/Extinction
-                FADE_IN_TIME = 1.0  # Allumage Progressif
-                SHOW_TIME = 1.5     # Jeu de lumiere
-                
-                # Default Targets (Static)
-                current_targets, current_colors = self.formations.get_phase(
-                    self.current_phase, 
-                    self.sim_config['simulation']['max_drones'],
-                    t=self.phase_timer,
-                    audio_energy=self.audio_energy
-                )
-                
-                # --- PHASE SPECIFIC OVERRIDES (Animation) ---
-                if self.current_phase == "phase1_pluie":
-                    # Descent Animation: "3 Vagues / Contingents"
-                    # Split drones into 3 groups based on index
-                    # Wave 1: 0-333 drops t=0..4
-                    # Wave 2: 334-666 drops t=4..8
-                    # Wave 3: 667-1000 drops t=8..12
-                    # TRANSIT_TIME must be long enough (e.g. 15s)
-                    
-                    if self.phase_state == 0: # TRANSIT
-                         num_drones = len(current_targets)
-                         num_layers = 5 # Matching _phase_1_pluie
-                         drones_per_layer = num_drones // num_layers
-                         
-                         fall_start_h = 100.0 # Height above target
-                         wave_duration = 1.2 # How long one wave takes to fall
-                         delay_between_waves = 0.8
-                         
-                         for l in range(num_layers):
-                             start_idx = l * drones_per_layer
-                             end_idx = (l+1) * drones_per_layer if l < num_layers-1 else num_drones
-                             
-                             start_time = l * delay_between_waves
-                             local_t = self.state_timer - start_time
-                             
-                             if local_t < 0:
-                                 current_targets[start_idx:end_idx, 1] += fall_start_h
-                             elif local_t < wave_duration:
-                                 progress = local_t / wave_duration
-                                 offset = fall_start_h * (1.0 - progress)
-                                 current_targets[start_idx:end_idx, 1] += offset
-                         else:
-                             pass # Landed
-                
-                # --- STATE MACHINE COLOR OVERRIDES ---
-                
-                # Determine if this is a "Text" or "Narrative" phase for specific logic
-                TEXT_PHASES = ["phase2_anem", "phase3_jcn", "phase4_fes", "phase5_niger", "act3_typography"]
-                is_text_phase = self.current_phase in TEXT_PHASES
-                is_flag_phase = self.current_phase == "phase6_drapeau"
-                
-                # Force dynamic refresh for specialized cinematic phases
-                if self.current_phase in ["miroir_celeste", "act1_desert", "act2_desert_seveille", "phase1_pluie", "phase10_touareg", "dubai_camel", "act5_tree_of_life", "act8_finale", "act9_eagle"]:
-                    current_targets, current_colors = self.formations.get_phase(self.current_phase, self.drone_manager.num_drones, t=self.phase_timer, audio_energy=self.audio_energy)
-
-                # --- PHASE 6: FLAG LOGIC (Neutral Stars until Reveal) ---
-                if is_flag_phase and self.phase_state < 3: # Before Reveal
-                    # Keep neutral star colors during movement and blackout
-                    current_colors = np.tile(self.formations.colors["star_white"], (len(current_colors), 1))
-
-                # --- GENERAL SPARKLE (Subtle, for all except Flag Reveal) ---
-                # "Ciel étoilé vivant" - Subtle sparkle for elegance
-                if not (is_flag_phase and self.phase_state >= 3):
-                    sparkle_intensity = 0.85 + 0.15 * np.random.uniform(0, 1, len(current_colors))
-                    current_colors = current_colors * sparkle_intensity[:, np.newaxis]
-
-                if self.phase_state == 0: # TRANSIT (Mouvement)
-                    if is_text_phase:
-                        # TEXT PHASES: Start Alive -> Fade to Stealth -> Invisible Arrival
-                        # 0-2s: Visible (Alive)
-                        # 2-4s: Fade Out
-                        # >4s: Stealth (Near Invisible)
-                        fade_start, fade_end = 2.0, 4.0
-                        if self.state_timer < fade_start:
-                            intensity = 1.0
-                        elif self.state_timer < fade_end:
-                            progress = (self.state_timer - fade_start) / (fade_end - fade_start)
-                            intensity = 1.0 - (0.95 * progress) # Fade to 0.05
-                        else:
-                            intensity = 0.05 # Stealth mode
-                        current_colors = current_colors * intensity
-                    
-                    # Update Transit Time
-                    if self.state_timer > TRANSIT_TIME: 
-                        self.phase_state = 1 # ARRIVED
-                        self.state_timer = 0
-                
-                elif self.phase_state == 1: # ARRIVED (PAUSE DANS LE NOIR / STEALTH)
-                    if is_text_phase:
-                        current_colors = current_colors * 0.02 # Almost invisible
-                    
-                    if self.state_timer > 0.5:
-                        self.phase_state = 2 # Pre-Ignition
-                        self.state_timer = 0
-                        
-                elif self.phase_state == 2: # BLACKOUT (Silence Visuel)
-                    current_colors = current_colors * 0.0 # Total silence
-                    if self.state_timer > BLACKOUT_TIME:
-                        self.phase_state = 3
-                        self.state_timer = 0
-                        
-                elif self.phase_state == 3: # FADE IN (RÉVÉLATION)
-                    # For Flag: Colors are already correct (passed the < 3 check)
-                    # For Text: Fade in to solid letters
-                    
-                    brightness = min(1.0, self.state_timer / FADE_IN_TIME)
-                    current_colors = current_colors * brightness
-                    
-                    if self.state_timer > FADE_IN_TIME:
-                        if self.current_phase in ["phase11_croix_agadez", "phase1_pluie", "phase7_carte", "act1_desert", "act6_identity", "act8_finale"]:
-                            self.phase_state = 5 # Skip flashy show, go straight to Hold
-                        else:
-                            self.phase_state = 4 # LIGHT SHOW / Sparkling Birth
-                        self.state_timer = 0
-                        
-                elif self.phase_state == 4: # LIGHT SHOW (Sparkling Birth)
-                    # No artificial sparkle override, respect original colors + subtle sparkle
-                    if self.state_timer > SHOW_TIME:
-                        self.phase_state = 5 # HOLD
-                        self.state_timer = 0
-                
-                elif self.phase_state == 5: # HOLD (Contemplation)
-                    # No artificial breathing/sparkle override, respect original colors + subtle sparkle
-                    
-                    # --- DYNAMIC FORMATIONS (HOLD STATE) ---
-                    if self.current_phase in ["phase6_drapeau", "act7_flag"]:
-                        # Realistic Waving: Apply dynamic Z wave
-                        wave_speed = 3.0
-                        wave_freq = 0.05
-                        amp = 8.0 if self.current_phase == "phase6_drapeau" else 15.0 # Act 7 is more majestic
-                        
-                        for i in range(len(current_targets)):
-                             x = current_targets[i, 0]
-                             current_targets[i, 2] = amp * np.sin(x * wave_freq + self.phase_timer * wave_speed)
-                    
-                    if self.current_phase == "act1_desert":
-                        # Slow dune breathing
-                        amp = 4.0
-                        for i in range(len(current_targets)):
-                             x, z = current_targets[i, 0], current_targets[i, 2]
-                             current_targets[i, 1] += amp * np.sin(x*0.05 + self.phase_timer*0.5) * np.cos(z*0.05)
-                    
-                # Apply to Manager
-                self.drone_manager.set_formation(current_targets, current_colors)
-                self.drone_manager.update(dt, time_absolute=self.phase_timer)
+                self._step_formation(spec, dt)
+                if not self.transition_mode:
+                    self._record_checkpoint(dt)
                 
                 # === MORPHING TRANSITION LOGIC (Legacy) ===
                 # If in transition mode, smoothly interpolate positions toward target formation
@@ -528,9 +495,8 @@ class SimulationCore(QOpenGLWidget):
                     self.transition_progress += dt / self.transition_duration
                     
                     if self.transition_progress < 1.0:
-                        # Ease-in-out cubic interpolation for smooth morphing
-                        t_ease = self.transition_progress
-                        t_ease = t_ease * t_ease * (3.0 - 2.0 * t_ease) if t_ease <= 1.0 else 1.0
+                        # Smoothstep easing for smooth morphing
+                        t_ease = smoothstep(self.transition_progress)
                         
                         # Linear interpolation with easing
                         morphed_pos = (1.0 - t_ease) * self.transition_start_pos + t_ease * self.transition_target_pos
@@ -539,8 +505,127 @@ class SimulationCore(QOpenGLWidget):
                         # Transition complete
                         self.transition_mode = False
                         self.drone_manager.positions[:] = self.transition_target_pos
+
+    def _step_formation(self, spec, dt):
+        """
+        Cibles, couleurs (machine à états de révélation, scintillement, effets
+        HOLD) puis physique d'un pas, au temps local phase_timer. Partagé par
+        la lecture et le rejeu d'un seek depuis un checkpoint.
+        """
+        # État de révélation: fonction pure du temps local (show_clock.reveal_state),
+        # identique après un seek ou une lecture continue
+        self.phase_state, self.state_timer = reveal_state(self.phase_timer, spec.skip_show)
+        
+        # Default Targets, written in place into the drone manager buffers
+        current_targets, current_colors = self.formations.get_phase(
+            self.current_phase, 
+            self.sim_config['simulation']['max_drones'],
+            t=self.phase_timer,
+            audio_energy=self.audio_energy,
+            out=self.drone_manager.formation_buffers()
+        )
+        
+        # --- STATE MACHINE COLOR OVERRIDES ---
+        
+        # Determine if this is a "Text" or "Narrative" phase for specific logic
+        is_text_phase = spec.text
+        is_flag_phase = spec.neutral_until_reveal
+
+        # --- PHASE 6: FLAG LOGIC (Neutral Stars until Reveal) ---
+        if is_flag_phase and self.phase_state < 3: # Before Reveal
+            # Keep neutral star colors during movement and blackout
+            current_colors[:] = self.formations.colors["star_white"]
+
+        # --- GENERAL SPARKLE (Subtle, for all except Flag Reveal) ---
+        # "Ciel étoilé vivant" - Subtle sparkle for elegance
+        if not (is_flag_phase and self.phase_state >= 3):
+            # Tirage de la frame (phase, temps local): identique en lecture et au rejeu
+            sparkle = self._effect_buffers[0, :len(current_colors)]
+            np.random.default_rng(frame_seed(self.current_phase + "/sparkle", len(sparkle), self.phase_timer)
+                                  ).random(dtype=np.float32, out=sparkle)
+            sparkle *= 0.15
+            sparkle += 0.85 # Uniforme [0.85, 1.0)
+            current_colors *= sparkle[:, np.newaxis]
+
+        if self.phase_state == 0: # TRANSIT (Mouvement)
+            if is_text_phase:
+                # TEXT PHASES: Start Alive -> Fade to Stealth -> Invisible Arrival
+                # 0-2s: Visible (Alive)
+                # 2-4s: Fade Out
+                # >4s: Stealth (Near Invisible)
+                fade_start, fade_end = 2.0, 4.0
+                if self.state_timer < fade_start:
+                    intensity = 1.0
+                elif self.state_timer < fade_end:
+                    progress = (self.state_timer - fade_start) / (fade_end - fade_start)
+                    intensity = 1.0 - (0.95 * progress) # Fade to 0.05
+                else:
+                    intensity = 0.05 # Stealth mode
+                current_colors *= intensity
+        
+        elif self.phase_state == 1: # ARRIVED (PAUSE DANS LE NOIR / STEALTH)
+            if is_text_phase:
+                current_colors *= 0.02 # Almost invisible
+                
+        elif self.phase_state == 2: # BLACKOUT (Silence Visuel)
+            current_colors[:] = 0.0 # Total silence
+                
+        elif self.phase_state == 3: # FADE IN (RÉVÉLATION)
+            # For Flag: Colors are already correct (passed the < 3 check)
+            # For Text: Fade in to solid letters
             
-        self.update()
+            brightness = min(1.0, self.state_timer / FADE_IN_TIME)
+            current_colors *= brightness
+                
+        elif self.phase_state == 4: # LIGHT SHOW (Sparkling Birth, sauté si spec.skip_show)
+            # No artificial sparkle override, respect original colors + subtle sparkle
+            pass
+        
+        elif self.phase_state == 5: # HOLD (Contemplation)
+            # No artificial breathing/sparkle override, respect original colors + subtle sparkle
+            
+            # --- DYNAMIC FORMATIONS (HOLD STATE) ---
+            # Computed in place in the effect buffers (no per-drone loop)
+            wave, ripple = self._effect_buffers[:, :len(current_targets)]
+            if spec.hold_effect == "flag_wave":
+                # Realistic Waving: Apply dynamic Z wave
+                wave_speed = 3.0
+                wave_freq = 0.05
+                amp = spec.hold_amplitude # 8m drapeau, 15m Act 7 (more majestic)
+                
+                np.multiply(current_targets[:, 0], wave_freq, out=wave)
+                wave += self.phase_timer * wave_speed
+                np.sin(wave, out=wave)
+                np.multiply(wave, amp, out=current_targets[:, 2])
+            
+            if spec.hold_effect == "dune_breathing":
+                # Slow dune breathing
+                amp = spec.hold_amplitude
+                np.multiply(current_targets[:, 0], 0.05, out=wave)
+                wave += self.phase_timer * 0.5
+                np.sin(wave, out=wave)
+                np.multiply(current_targets[:, 2], 0.05, out=ripple)
+                np.cos(ripple, out=ripple)
+                wave *= ripple
+                wave *= amp
+                current_targets[:, 1] += wave
+            
+        # Apply to Manager
+        self.drone_manager.set_formation(current_targets, current_colors)
+        self.drone_manager.update(dt, time_absolute=self.phase_timer)
+
+    def _sequence_step(self, show_time):
+        """Indice de pas (dt des checkpoints) d'un instant de la séquence."""
+        return int(round(show_time / self.checkpoints.dt))
+
+    def _record_checkpoint(self, dt):
+        """Checkpoint de la séquence automatique, hors transitions (pas fixe dt seulement)."""
+        if not (self.sequence_enabled and dt == self.checkpoints.dt and
+                self.current_phase == self.sequence_list[self.sequence_index]):
+            return
+        step = self._sequence_step(self.sequence_index * self.sequence_duration + self.phase_timer)
+        if step % int(round(self.CHECKPOINT_INTERVAL / dt)) == 0:
+            self.checkpoints.add(step, self.drone_manager.positions)
 
     def play(self):
         self.is_playing = True
@@ -564,16 +649,21 @@ class SimulationCore(QOpenGLWidget):
     # === AUTO-SEQUENCING CONTROLS ===
     def start_sequence(self, sequence_list=None, duration_per_phase=8.0):
         """Start automatic phase sequencing."""
+        self._on_sim_thread(self._start_sequence, sequence_list, duration_per_phase)
+        self.update()
+
+    def _start_sequence(self, sequence_list, duration_per_phase):
         if sequence_list:
             self.sequence_list = sequence_list
         self.sequence_duration = duration_per_phase
+        self.checkpoints = CheckpointStore(self.checkpoints.dt)  # Autre séquence: checkpoints périmés
         self.sequence_index = 0
         self.sequence_timer = 0.0
         self.sequence_paused = False
         self.sequence_enabled = True
         self.is_playing = True
         # Start with first phase
-        self.set_phase(self.sequence_list[0])
+        self._set_phase(self.sequence_list[0])
     
     def stop_sequence(self):
         """Stop automatic sequencing."""
@@ -585,25 +675,95 @@ class SimulationCore(QOpenGLWidget):
     
     def rewind_sequence(self):
         """Reset to first phase in sequence."""
-        if self.sequence_enabled:
-            self.sequence_index = 0
-            self.sequence_timer = 0.0
-            self.set_phase(self.sequence_list[0])
+        self._on_sim_thread(self._seek_sequence, 0, absolute=True)
     
     def next_phase_in_sequence(self):
         """Manually advance to next phase."""
-        if self.sequence_enabled:
-            self.sequence_index = (self.sequence_index + 1) % len(self.sequence_list)
-            self.sequence_timer = 0.0
-            self.set_phase(self.sequence_list[self.sequence_index])
+        self._on_sim_thread(self._seek_sequence, 1)
     
     def prev_phase_in_sequence(self):
         """Manually go back to previous phase."""
+        self._on_sim_thread(self._seek_sequence, -1)
+
+    def _seek_sequence(self, offset, absolute=False):
         if self.sequence_enabled:
-            self.sequence_index = (self.sequence_index - 1) % len(self.sequence_list)
+            base = 0 if absolute else self.sequence_index
+            self.sequence_index = (base + offset) % len(self.sequence_list)
             self.sequence_timer = 0.0
-            self.set_phase(self.sequence_list[self.sequence_index])
+            self._set_phase(self.sequence_list[self.sequence_index])
     
+    # === SEEK (RÉPÉTITION / SCRUBBING) ===
+    def show_clock(self):
+        """Horloge de la séquence automatique (temps global → phase / temps local)."""
+        return ShowClock.from_sequence(self.sequence_list, self.sequence_duration)
+
+    def seek(self, show_time):
+        """Saute à show_time (secondes) dans la séquence, sans rejouer le début."""
+        self._on_sim_thread(self._seek, show_time)
+        self.update()
+
+    def _seek(self, show_time):
+        """
+        Comme ShowRunner.seek: checkpoint de la même phase le plus proche avant
+        show_time puis rejeu de la physique (au plus CHECKPOINT_INTERVAL s).
+        Exact si la lecture ayant posé le checkpoint n'avait pas de fichier
+        audio (énergie placeholder du temps local, sinon énergie courante).
+        Sans checkpoint, approximation: essaim posé sur la formation de
+        l'instant, la physique reprend de là. C'est le cas d'une phase pas
+        encore jouée et du mode pro, dont la transition d'entrée (non
+        rejouable, hors physique) couvre souvent toute la phase.
+        """
+        position = self.show_clock().locate(show_time)
+        spec = self.formations.phase_spec(position.phase)
+
+        # Animateur: même décalage au temps du show qu'en lecture continue
+        played = self.sequence_index * self.sequence_duration + self.sequence_timer
+        self.living_animator.time += position.show_time - played
+
+        # Séquence + horloges dérivées du temps global (aucun cumul)
+        self.sequence_index = position.index
+        self.sequence_timer = position.local_time
+        self.current_phase = position.phase
+        self.phase_timer = position.local_time
+        self.phase_state, self.state_timer = position.state, position.state_time
+        self.pro_transition.is_active = False
+        self.transition_mode = False
+        self.global_light_multiplier = 1.0
+
+        self.camera.set_phase_view(position.phase, spec.camera_preset)
+        self.camera.seek(position.local_time, position.show_time)
+
+        if self.process_backend is not None:
+            self.process_backend.seek(position.phase, position.local_time)
+            return
+
+        dt = self.checkpoints.dt
+        phase_start = self._sequence_step(position.show_time - position.local_time)
+        target = self._sequence_step(position.show_time)
+        checkpoint = self.checkpoints.at_or_before(target)
+        if checkpoint is not None and checkpoint[0] >= phase_start and target > checkpoint[0]:
+            step, positions = checkpoint
+            self.drone_manager.positions = np.array(positions)  # Même dtype: reprise bit à bit
+            while step < target:
+                step += 1
+                self.phase_timer = (step - phase_start) * dt
+                if not self.audio.audio_loaded:
+                    self.audio_energy = 0.5 + 0.5 * np.sin(self.phase_timer * 2.0)
+                self._step_formation(spec, dt)
+            self.sequence_timer = self.phase_timer
+        else:
+            # Essaim posé sur la formation de l'instant (ou sur le checkpoint exact)
+            targets, colors = self.formations.get_phase(
+                position.phase, self.sim_config['simulation']['max_drones'], t=position.local_time,
+                audio_energy=self.audio_energy, out=self.drone_manager.formation_buffers())
+            self.drone_manager.set_formation(targets, colors)
+            if checkpoint is not None and checkpoint[0] == target and target >= phase_start:
+                self.drone_manager.positions = np.array(checkpoint[1])
+            else:
+                self.drone_manager.positions[:] = self.drone_manager.targets
+        self.target_colors = self.drone_manager.colors.copy()
+        self._publish_frame()
+
     # === BLOOM/GLOW CONTROLS ===
     def toggle_bloom(self):
         """Toggle bloom effect on/off."""
@@ -615,8 +775,20 @@ class SimulationCore(QOpenGLWidget):
         self.bloom_intensity = np.clip(intensity, 0.0, 3.0)
     
     def load_audio_file(self, filepath):
-        """Load audio file for music reactivity."""
-        return self.audio.load_audio(filepath)
+        """
+        Load audio file for music reactivity. Decoding happens on the calling
+        thread into a fresh AudioSystem, swapped in on the simulation thread.
+        """
+        audio = AudioSystem()
+        if not audio.load_audio(filepath):
+            return False
+        self._on_sim_thread(self._use_audio, audio)
+        return True
+
+    def _use_audio(self, audio):
+        if self.audio.is_playing:
+            self.audio.stop()
+        self.audio = audio
     
     # ═══════════════════════════════════════════════════════════════════════════
     # SYSTÈME DE TRANSITIONS PROFESSIONNELLES - CONTRÔLES
@@ -624,18 +796,23 @@ class SimulationCore(QOpenGLWidget):
     
     def toggle_pro_mode(self):
         """Active/désactive le mode transitions professionnelles."""
-        self.pro_mode_enabled = not self.pro_mode_enabled
+        enabled = not self.pro_mode_enabled
+        self._on_sim_thread(self._set_pro_mode, enabled)
+        return enabled
+
+    def _set_pro_mode(self, enabled):
+        self.pro_mode_enabled = enabled
         status = "ACTIVÉ" if self.pro_mode_enabled else "DÉSACTIVÉ"
         print(f"[PRO MODE] {status}")
-        return self.pro_mode_enabled
     
     def set_transition_timing(self, preset: str = 'dramatic'):
         """
         Définit le timing des transitions.
         Presets: 'quick', 'dramatic', 'instant', 'ethereal'
         """
-        from formation_choreographer import TransitionPresets
-        
+        self._on_sim_thread(self._set_transition_timing, preset)
+
+    def _set_transition_timing(self, preset):
         presets = {
             'quick': TransitionPresets.quick_fade(),
             'dramatic': TransitionPresets.dramatic(),
@@ -671,8 +848,15 @@ class SimulationCore(QOpenGLWidget):
             'is_blackout': False
         }
     
+    def get_render_stats(self) -> dict:
+        """Compteurs LOD de la dernière frame dessinée (visibles, halos, coût économisé)."""
+        return self.lod.stats.as_dict()
+    
     def force_blackout(self, duration: float = 2.0):
         """Force un blackout immédiat."""
+        self._on_sim_thread(self._force_blackout, duration)
+
+    def _force_blackout(self, duration):
         self.global_light_multiplier = 0.0
         # Programmer le retour de la lumière
         print(f"[BLACKOUT] Forcé pour {duration}s")
@@ -685,6 +869,6 @@ class SimulationCore(QOpenGLWidget):
             if self.last_mouse_pos:
                 dx = event.pos().x() - self.last_mouse_pos.x()
                 dy = event.pos().y() - self.last_mouse_pos.y()
-                self.camera.rotate_orbit(dx * 0.5)
+                self._on_sim_thread(self.camera.rotate_orbit, dx * 0.5)
             self.last_mouse_pos = event.pos()
             self.update()
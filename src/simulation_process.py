@@ -0,0 +1,349 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+           BACKEND MULTI-PROCESSUS (MÉMOIRE PARTAGÉE) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Pour les très grands essaims, le GIL limite encore le thread de simulation.
+Ce backend optionnel exécute DroneManager / PhysicsEngine / FormationLibrary
+dans un processus séparé et publie les frames dans un anneau en mémoire
+partagée (multiprocessing.shared_memory):
+
+    [en-tête int64][méta float64 × slots][positions f32 × slots][couleurs f32 × slots]
+
+1. Le renderer mappe les slots comme vues NumPy (zéro copie, lecture seule)
+2. Compteur de séquence `published` écrit par le producteur, `reading`
+   écrit par le consommateur: le producteur ne réécrit jamais le slot lu
+3. Back-pressure: le producteur attend s'il a (slots - 1) frames d'avance
+4. Arrêt propre: drapeau d'arrêt dans l'en-tête + join + unlink
+
+Usage (benchmark in-process vs out-of-process):
+    python src/simulation_process.py [num_drones ...]     (10000 50000 par défaut)
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import multiprocessing as mp
+import queue
+import sys
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from simulation_thread import FrameExchange, FrameSnapshot
+
+
+# En-tête (int64): indices des champs
+_PUBLISHED, _READING, _STOP, _NUM_DRONES, _SLOTS, _DROPPED = range(6)
+_HEADER_FIELDS = 8
+# Métadonnées par slot (float64): séquence, temps, lumière, pose caméra (9)
+_META_FIELDS = 12
+
+
+class SharedFrameRing:
+    """
+    Anneau de frames en mémoire partagée, un producteur / un consommateur.
+
+    Le producteur écrit la frame k dans le slot k % slots puis incrémente
+    `published`. Le consommateur lit la dernière frame et la déclare dans
+    `reading`; tant que k - reading >= slots, le producteur attend
+    (back-pressure) pour ne pas écraser le slot affiché.
+    """
+
+    def __init__(self, num_drones, slots=4, name=None, create=True):
+        if slots < 2:
+            raise ValueError("SharedFrameRing nécessite au moins 2 slots")
+        self.num_drones = int(num_drones)
+        self.slots = int(slots)
+        frame_bytes = self.num_drones * 3 * 4
+        size = 8 * _HEADER_FIELDS + 8 * _META_FIELDS * self.slots + 2 * frame_bytes * self.slots
+
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+        self._owner = create
+        buf = self.shm.buf
+        offset = 0
+        self.header = np.ndarray((_HEADER_FIELDS,), dtype=np.int64, buffer=buf, offset=offset)
+        offset += 8 * _HEADER_FIELDS
+        self.meta = np.ndarray((self.slots, _META_FIELDS), dtype=np.float64, buffer=buf, offset=offset)
+        offset += 8 * _META_FIELDS * self.slots
+        self.positions = np.ndarray((self.slots, self.num_drones, 3), dtype=np.float32,
+                                    buffer=buf, offset=offset)
+        offset += frame_bytes * self.slots
+        self.colors = np.ndarray((self.slots, self.num_drones, 3), dtype=np.float32,
+                                 buffer=buf, offset=offset)
+
+        if create:
+            self.header[:] = 0
+            self.header[_READING] = -1
+            self.header[_NUM_DRONES] = self.num_drones
+            self.header[_SLOTS] = self.slots
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def published(self):
+        return int(self.header[_PUBLISHED])
+
+    @property
+    def dropped(self):
+        """Nombre d'attentes de back-pressure abandonnées (timeout)."""
+        return int(self.header[_DROPPED])
+
+    @property
+    def stop_requested(self):
+        return bool(self.header[_STOP])
+
+    def request_stop(self):
+        self.header[_STOP] = 1
+
+    # --- Producteur ---------------------------------------------------------
+
+    def wait_writable(self, timeout=0.1):
+        """
+        Attend qu'un slot soit libre (back-pressure). Retourne False si le
+        consommateur n'a pas avancé avant timeout ou si l'arrêt est demandé.
+        """
+        deadline = time.perf_counter() + timeout
+        while self.published - int(self.header[_READING]) >= self.slots:
+            if self.stop_requested or time.perf_counter() > deadline:
+                self.header[_DROPPED] += 1
+                return False
+            time.sleep(0.0005)
+        return not self.stop_requested
+
+    def write_buffers(self):
+        """Buffers (positions, couleurs) du prochain slot à écrire."""
+        slot = self.published % self.slots
+        return self.positions[slot], self.colors[slot]
+
+    def publish(self, sim_time=0.0, light_multiplier=1.0, camera_pose=None):
+        """Valide le slot écrit: métadonnées puis compteur (toujours en dernier)."""
+        seq = self.published
+        meta = self.meta[seq % self.slots]
+        meta[0] = seq
+        meta[1] = sim_time
+        meta[2] = light_multiplier
+        if camera_pose is not None:
+            meta[3:12] = camera_pose
+        self.header[_PUBLISHED] = seq + 1
+
+    # --- Consommateur -------------------------------------------------------
+
+    def latest(self):
+        """Dernière frame publiée en vues lecture seule, ou None."""
+        seq = self.published - 1
+        if seq < 0:
+            return None
+        self.header[_READING] = seq
+        slot = seq % self.slots
+        positions = self.positions[slot].view()
+        colors = self.colors[slot].view()
+        positions.setflags(write=False)
+        colors.setflags(write=False)
+        meta = self.meta[slot]
+        return FrameSnapshot(
+            frame_index=seq + 1,
+            sim_time=float(meta[1]),
+            positions=positions,
+            colors=colors,
+            light_multiplier=float(meta[2]),
+            camera_pose=tuple(float(v) for v in meta[3:12]),
+        )
+
+    def close(self):
+        """Détache les vues; le créateur libère aussi le segment."""
+        self.header = self.meta = self.positions = self.colors = None
+        self.shm.close()
+        if self._owner:
+            self.shm.unlink()
+
+
+def _simulation_process_main(shm_name, num_drones, slots, sim_config, vis_config,
+                             commands, dt, realtime):
+    """Boucle du processus de simulation (formations + physique)."""
+    from drone_manager import DroneManager
+    from formation_library import FormationLibrary
+
+    ring = SharedFrameRing(num_drones, slots, name=shm_name, create=False)
+    manager = DroneManager(sim_config, vis_config)
+    library = FormationLibrary(min_separation=sim_config['simulation']['physics']['min_separation_m'])
+    phase, playing, phase_time = None, False, 0.0
+
+    try:
+        next_tick = time.perf_counter()
+        while not ring.stop_requested:
+            while True:
+                try:
+                    cmd, *args = commands.get_nowait()
+                except queue.Empty:
+                    break
+                if cmd == "set_phase":
+                    phase, phase_time = args[0], 0.0
+                    targets, colors = library.get_phase(phase, num_drones,
+                                                        out=manager.formation_buffers())
+                    manager.set_formation(targets, colors)
+                elif cmd == "seek":
+                    # Saut direct: essaim posé sur la formation à phase_time
+                    phase, phase_time = args
+                    targets, colors = library.get_phase(
+                        phase, num_drones, t=phase_time,
+                        audio_energy=0.5 + 0.5 * np.sin(phase_time * 2.0),
+                        out=manager.formation_buffers())
+                    manager.set_formation(targets, colors)
+                    manager.positions[:] = manager.targets
+                elif cmd == "play":
+                    playing = True
+                elif cmd == "pause":
+                    playing = False
+                elif cmd == "stop":
+                    ring.request_stop()
+
+            # Back-pressure: ne pas simuler plus vite que le renderer ne consomme
+            if not ring.wait_writable():
+                continue
+
+            if playing and phase:
+                phase_time += dt
+                targets, colors = library.get_phase(
+                    phase, num_drones, t=phase_time,
+                    audio_energy=0.5 + 0.5 * np.sin(phase_time * 2.0),
+                    out=manager.formation_buffers())
+                manager.set_formation(targets, colors)
+                manager.update(dt, time_absolute=phase_time)
+
+            positions, colors = ring.write_buffers()
+            np.copyto(positions, manager.positions)
+            np.copyto(colors, manager.colors)
+            ring.publish(phase_time)
+
+            if realtime:
+                next_tick = max(next_tick + dt, time.perf_counter())
+                time.sleep(max(0.0, next_tick - time.perf_counter()))
+    finally:
+        ring.close()
+
+
+class ProcessSimulationBackend:
+    """
+    Simulation hors processus. Le renderer appelle latest() pour obtenir la
+    dernière frame (vues zéro copie sur la mémoire partagée).
+    """
+
+    def __init__(self, sim_config, vis_config, slots=4, dt=0.016, realtime=True):
+        self.num_drones = sim_config['simulation']['max_drones']
+        self.ring = SharedFrameRing(self.num_drones, slots)
+        ctx = mp.get_context("spawn")
+        self._commands = ctx.Queue()
+        self.process = ctx.Process(
+            target=_simulation_process_main,
+            args=(self.ring.name, self.num_drones, slots, sim_config, vis_config,
+                  self._commands, dt, realtime),
+            name="SimulationProcess",
+            daemon=True,
+        )
+
+    def start(self):
+        self.process.start()
+        return self
+
+    def set_phase(self, phase_name):
+        self._commands.put(("set_phase", phase_name))
+
+    def seek(self, phase_name, phase_time):
+        self._commands.put(("seek", phase_name, phase_time))
+
+    def play(self):
+        self._commands.put(("play",))
+
+    def pause(self):
+        self._commands.put(("pause",))
+
+    def latest(self):
+        return self.ring.latest()
+
+    def shutdown(self, timeout=2.0):
+        """Arrêt propre: drapeau d'arrêt, join, puis libération du segment."""
+        if self.ring.header is None:
+            return
+        self.ring.request_stop()
+        if self.process.is_alive():
+            self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self._commands.close()
+        self.ring.close()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                    BENCHMARK IN-PROCESS VS OUT-OF-PROCESS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _benchmark_config(num_drones):
+    import os
+    import yaml
+    config_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'config')
+    with open(os.path.join(config_dir, 'simulation.yaml'), 'r', encoding='utf-8') as f:
+        sim_config = yaml.safe_load(f)
+    with open(os.path.join(config_dir, 'visuals.yaml'), 'r', encoding='utf-8') as f:
+        vis_config = yaml.safe_load(f)
+    sim_config['simulation']['max_drones'] = num_drones
+    return sim_config, vis_config
+
+
+def benchmark_in_process(sim_config, vis_config, phase="act1_desert", duration=3.0, dt=0.016):
+    """Frames/s: simulation + publication dans un FrameExchange, même processus."""
+    from drone_manager import DroneManager
+    from formation_library import FormationLibrary
+
+    num = sim_config['simulation']['max_drones']
+    manager = DroneManager(sim_config, vis_config)
+    library = FormationLibrary(min_separation=sim_config['simulation']['physics']['min_separation_m'])
+    exchange = FrameExchange(num)
+    library.get_phase(phase, num, t=0.0, out=manager.formation_buffers())
+
+    frames, t = 0, 0.0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        t += dt
+        targets, colors = library.get_phase(phase, num, t=t, audio_energy=0.5,
+                                            out=manager.formation_buffers())
+        manager.set_formation(targets, colors)
+        manager.update(dt, time_absolute=t)
+        positions, cols = exchange.begin_write()
+        np.copyto(positions, manager.positions)
+        np.copyto(cols, manager.colors)
+        exchange.publish(t, 1.0, (0.0,) * 9)
+        exchange.latest()
+        frames += 1
+    return frames / (time.perf_counter() - start)
+
+
+def benchmark_out_of_process(sim_config, vis_config, phase="act1_desert", duration=3.0):
+    """Frames/s reçues par le consommateur depuis le processus de simulation."""
+    backend = ProcessSimulationBackend(sim_config, vis_config, realtime=False).start()
+    try:
+        backend.set_phase(phase)
+        backend.play()
+        # Attendre la première frame (import + préchauffage dans l'enfant)
+        while backend.latest() is None and backend.process.is_alive():
+            time.sleep(0.01)
+        first = backend.latest().frame_index
+        start = time.perf_counter()
+        while time.perf_counter() - start < duration:
+            backend.latest()
+            time.sleep(0.001)
+        received = backend.latest().frame_index - first
+        return received / (time.perf_counter() - start)
+    finally:
+        backend.shutdown()
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [10000, 50000]
+    print(f"{'drones':>8s} {'in-process':>12s} {'out-of-process':>15s}")
+    for n in sizes:
+        sim_config, vis_config = _benchmark_config(n)
+        fps_in = benchmark_in_process(sim_config, vis_config)
+        fps_out = benchmark_out_of_process(sim_config, vis_config)
+        print(f"{n:8d} {fps_in:10.1f}/s {fps_out:13.1f}/s")
@@ -0,0 +1,183 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+              THREAD DE SIMULATION & ÉCHANGE DE FRAMES - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+La simulation (formations, physique, transitions, caméra, audio) tourne sur un
+thread dédié; le thread Qt ne fait plus que dessiner.
+
+1. FrameSnapshot  : état immuable d'une frame (positions, couleurs, lumière,
+                    pose caméra) - tableaux en lecture seule
+2. FrameExchange  : triple buffer préalloué. Le writer remplit un slot libre
+                    puis le publie; paintGL prend le dernier slot complet.
+                    Le slot en cours de lecture n'est jamais réécrit.
+3. SimulationWorker : boucle à pas fixe + file de commandes (set_phase, play...)
+                    exécutées entre deux pas, donc sans verrou côté GUI.
+                    Une exception (pas, capture, commande) est journalisée
+                    et la boucle continue: le thread ne meurt jamais en silence
+
+Les grosses opérations NumPy relâchent le GIL: simulation et rendu se
+recouvrent réellement.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import queue
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class FrameSnapshot:
+    """Frame complète, prête à dessiner (tableaux en lecture seule)"""
+    frame_index: int
+    sim_time: float                   # phase_timer au moment de la capture
+    positions: np.ndarray             # (N, 3) float32
+    colors: np.ndarray                # (N, 3) float32
+    light_multiplier: float
+    camera_pose: Tuple[float, ...]    # eye(3) + target(3) + up(3) pour gluLookAt
+
+
+class FrameExchange:
+    """
+    Triple buffer entre le thread de simulation (writer) et paintGL (reader).
+
+    Trois slots préalloués suffisent: un publié, un en lecture, un en
+    écriture. Le writer ne touche jamais au slot publié ni à celui que le
+    reader a obtenu au dernier latest(); aucune copie ni allocation par frame.
+    """
+
+    def __init__(self, num_drones: int, slots: int = 3):
+        if slots < 3:
+            raise ValueError("FrameExchange nécessite au moins 3 slots")
+        self._positions = [np.zeros((num_drones, 3), dtype=np.float32) for _ in range(slots)]
+        self._colors = [np.zeros((num_drones, 3), dtype=np.float32) for _ in range(slots)]
+        self._snapshots = [None] * slots
+        self._lock = threading.Lock()
+        self._published = None   # Dernier slot complet
+        self._reading = None     # Slot détenu par le reader
+        self._writing = None
+        self.frame_index = 0
+
+    def begin_write(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Réserve un slot libre et retourne ses buffers (positions, couleurs)."""
+        with self._lock:
+            busy = (self._published, self._reading)
+            self._writing = next(i for i in range(len(self._snapshots)) if i not in busy)
+            return self._positions[self._writing], self._colors[self._writing]
+
+    def publish(self, sim_time: float, light_multiplier: float, camera_pose) -> FrameSnapshot:
+        """Fige le slot réservé par begin_write() et en fait la dernière frame."""
+        with self._lock:
+            slot = self._writing
+            if slot is None:
+                raise RuntimeError("publish() sans begin_write()")
+            self.frame_index += 1
+            positions = self._positions[slot].view()
+            colors = self._colors[slot].view()
+            positions.setflags(write=False)
+            colors.setflags(write=False)
+            snapshot = FrameSnapshot(
+                frame_index=self.frame_index,
+                sim_time=float(sim_time),
+                positions=positions,
+                colors=colors,
+                light_multiplier=float(light_multiplier),
+                camera_pose=tuple(float(v) for v in camera_pose),
+            )
+            self._snapshots[slot] = snapshot
+            self._published = slot
+            self._writing = None
+            return snapshot
+
+    def latest(self) -> Optional[FrameSnapshot]:
+        """Dernière frame publiée (None avant la première). Réservée au reader."""
+        with self._lock:
+            if self._published is None:
+                return None
+            self._reading = self._published
+            return self._snapshots[self._reading]
+
+
+class SimulationWorker(threading.Thread):
+    """
+    Boucle de simulation à pas fixe sur un thread dédié.
+
+    step(dt) avance la simulation, capture() publie une frame dans
+    l'échange. Les commandes soumises via submit() (depuis le thread GUI)
+    sont exécutées sur ce thread, avant le pas suivant.
+    """
+
+    def __init__(self, step: Callable[[float], None], capture: Callable[[], None],
+                 dt: float = 0.016):
+        super().__init__(name="SimulationWorker", daemon=True)
+        self._step = step
+        self._capture = capture
+        self.dt = dt
+        self._commands = queue.SimpleQueue()
+        self._stop_event = threading.Event()
+        self.last_step_ms = 0.0
+        self.error_count = 0
+        self._last_error = None
+
+    def submit(self, func, *args, **kwargs):
+        """Exécute func(*args, **kwargs) sur le thread de simulation."""
+        self._commands.put((func, args, kwargs))
+
+    def run(self):
+        next_tick = time.perf_counter()
+        while not self._stop_event.is_set():
+            self._drain_commands()
+
+            start = time.perf_counter()
+            self._guarded(self._step, self.dt)
+            self._guarded(self._capture)
+            self.last_step_ms = (time.perf_counter() - start) * 1000.0
+
+            # Cadence fixe; un pas trop long ne crée pas de dette (comme QTimer)
+            next_tick = max(next_tick + self.dt, time.perf_counter())
+            self._stop_event.wait(max(0.0, next_tick - time.perf_counter()))
+
+    def stop(self, timeout: float = 1.0):
+        """Arrête la boucle et attend la fin du pas en cours."""
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def _drain_commands(self):
+        while True:
+            try:
+                func, args, kwargs = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            self._guarded(func, *args, **kwargs)
+
+    def _guarded(self, func, *args, **kwargs):
+        """
+        Appelle func en journalisant toute exception. La trace complète n'est
+        affichée qu'au premier échec d'une même erreur (pas de flot à 60 Hz).
+        """
+        try:
+            func(*args, **kwargs)
+        except Exception as exc:
+            self.error_count += 1
+            name = getattr(func, '__name__', func)
+            signature = (name, type(exc), str(exc))
+            if signature != self._last_error:
+                print(f"[SIM THREAD] {name} a échoué: {exc!r}")
+                traceback.print_exc()
+            self._last_error = signature
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'FrameSnapshot',
+    'FrameExchange',
+    'SimulationWorker',
+]
@@ -0,0 +1,503 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+          PLANIFICATEUR DE TRANSIT ANTI-COLLISION (BLACKOUT) - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Pendant TRANSIT_DARK chaque drone suit une courbe de Bézier quadratique
+(départ → point de contrôle → arrivée). Le planificateur:
+1. Réaffecte les drones aux cibles (somme des distances² minimale, par
+   bissection médiane + affectation exacte par feuille): des trajectoires
+   synchrones qui partagent le même point de contrôle relatif ne se croisent
+   alors pas (principe CAPT)
+2. Échantillonne toutes les trajectoires à des instants communs (tranches
+   de temps assez fines pour qu'un drone bouge de moins de min_separation/2)
+3. Indexe chaque tranche dans un arbre spatial (cKDTree) et liste les paires
+   candidates: écart < min_separation + déplacement possible des deux drones
+   jusqu'à la tranche suivante (vitesse propre, nulle au sol)
+4. Vérifie chaque paire candidate entre sa tranche et la suivante (distance
+   minimale exacte pour deux drones synchrones de même couche)
+5. Résout les conflits: pour chaque paire, essaie sur ses seules trajectoires
+   synchroniser les départs, échanger les cibles (2-opt), changer l'un des
+   deux de couche d'altitude, et applique le premier ajustement qui la sépare
+6. Recommence (sur les seuls drones modifiés) jusqu'à zéro conflit, et garde
+   le meilleur état rencontré
+7. Escalade quand la résolution stagne (deux itérations sans progrès ou
+   max_iterations atteint): repart du meilleur état et replanifie chaque
+   drone encore en conflit contre tous ses voisins, avec plus de couches
+   d'altitude et un départ retardé dans la marge de l'échelonnement,
+   jusqu'à max_escalations paliers.
+   Le budget de temps (time_budget) borne toute la résolution après le
+   premier passage complet; les conflits restants sont signalés bruyamment
+   (ou lèvent RuntimeError avec strict=True)
+
+Les paires déjà trop proches dans les formations elles-mêmes ne dépendent pas
+du transit: elles sont comptées à part (endpoint_conflicts) et relèvent du
+validateur de show.
+
+Usage:  python src/transit_planner.py [num_drones] [phase_départ] [phase_arrivée]
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from scipy.spatial import cKDTree
+
+from curves import ease_in_out_cubic
+
+
+@dataclass
+class TransitPlan:
+    """Trajectoires planifiées (tableaux (N,) / (N, 3)) et diagnostic"""
+    start: np.ndarray
+    end: np.ndarray
+    control: np.ndarray
+    delays: np.ndarray
+    flight_time: float
+    layers: np.ndarray
+    conflicts: int = 0               # Paires en conflit restantes pendant le vol
+    endpoint_conflicts: int = 0      # Paires sous min_separation dans les formations elles-mêmes
+    iterations: int = 0
+    samples: int = 0
+    order: Optional[np.ndarray] = None  # start[order[i]] rejoint end[i] (échanges de cibles)
+
+    @property
+    def ok(self) -> bool:
+        return self.conflicts == 0
+
+    def progress(self, elapsed: float) -> np.ndarray:
+        """Avancement (avant easing) de chaque drone à `elapsed` s du début du transit."""
+        return np.clip((elapsed - self.delays) / self.flight_time, 0.0, 1.0)
+
+    def positions(self, elapsed: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Positions (N, 3) à `elapsed` s du début du transit (dans out si fourni)."""
+        u = ease_in_out_cubic(self.progress(elapsed))[:, np.newaxis]
+        w = 1.0 - u
+        result = (w * w) * self.start + (2.0 * w * u) * self.control + (u * u) * self.end
+        if out is None:
+            return result
+        out[:] = result
+        return out
+
+
+class TransitPlanner:
+    """
+    Planificateur de transit respectant min_separation.
+
+    base_boost / layer_spacing sont des hauteurs d'apex (m): le point de
+    contrôle d'une Bézier quadratique est placé au double au-dessus du milieu.
+    Au palier d'escalade k (k >= 1), les drones encore en conflit disposent
+    de max_layers × (k + 1) couches et de tout départ dans la marge de
+    l'échelonnement (délai max du StaggerScheduler).
+    """
+
+    def __init__(self, min_separation: float = 3.0, base_boost: float = 10.0,
+                 layer_spacing: Optional[float] = None, max_layers: int = 4,
+                 max_iterations: int = 8, leaf_size: int = 256, time_budget: float = 2.0,
+                 max_escalations: int = 3):
+        self.min_separation = min_separation
+        self.base_boost = base_boost
+        self.layer_spacing = layer_spacing or 1.5 * min_separation
+        self.max_layers = max_layers
+        self.max_iterations = max_iterations  # Itérations par palier d'escalade
+        self.leaf_size = leaf_size
+        self.time_budget = time_budget  # s de résolution au-delà du premier passage
+        self.max_escalations = max_escalations
+
+    # --- Affectation drones → cibles -------------------------------------------
+
+    def assign(self, start, end) -> np.ndarray:
+        """
+        Ordre des drones: start[order[i]] rejoint end[i]. Minimise la somme des
+        distances² de façon approchée (bissection médiane sur l'axe le plus
+        étendu, affectation exacte dans les feuilles de leaf_size drones).
+        """
+        start = np.asarray(start, dtype=np.float64)
+        end = np.asarray(end, dtype=np.float64)
+        order = np.empty(len(start), dtype=np.int64)
+        stack = [(np.arange(len(start)), np.arange(len(end)))]
+        while stack:
+            s_idx, e_idx = stack.pop()
+            if len(s_idx) <= self.leaf_size:
+                diff = start[s_idx][:, np.newaxis, :] - end[e_idx][np.newaxis, :, :]
+                rows, cols = linear_sum_assignment(np.einsum('ijk,ijk->ij', diff, diff))
+                order[e_idx[cols]] = s_idx[rows]
+                continue
+            both = np.vstack((start[s_idx], end[e_idx]))
+            axis = int(np.argmax(np.ptp(both, axis=0)))
+            half = len(s_idx) // 2
+            s_sorted = s_idx[np.argsort(start[s_idx, axis], kind="stable")]
+            e_sorted = e_idx[np.argsort(end[e_idx, axis], kind="stable")]
+            stack.append((s_sorted[:half], e_sorted[:half]))
+            stack.append((s_sorted[half:], e_sorted[half:]))
+        return order
+
+    # --- Planification -------------------------------------------------------
+
+    def plan(self, start, end, delays, flight_time, strict: bool = False) -> TransitPlan:
+        """
+        Planifie les trajectoires; delays (N,) et flight_time viennent du
+        StaggerScheduler. Les départs peuvent être permutés (échange de cibles):
+        plan.order donne, pour chaque cible, l'indice du drone dans `start`.
+        Si des conflits subsistent après escalade et budget de temps: message
+        [TRANSIT PLANNER] et plan.ok False, ou RuntimeError si strict.
+        """
+        start = np.array(start, dtype=np.float64)
+        end = np.asarray(end, dtype=np.float64)
+        n = len(start)
+        delays = np.array(delays, dtype=np.float64)
+        transit = float(delays.max(initial=0.0)) + flight_time
+        latest = transit - flight_time  # Départ le plus tardif qui finit dans le transit
+
+        plan = TransitPlan(start=start, end=end, control=np.empty_like(start),
+                           delays=delays, flight_time=flight_time,
+                           layers=np.zeros(n, dtype=np.int64),
+                           order=np.arange(n))
+        plan.endpoint_conflicts = (
+            len(cKDTree(start).query_pairs(self.min_separation, output_type='ndarray')) +
+            len(cKDTree(end).query_pairs(self.min_separation, output_type='ndarray')))
+        self._update_controls(plan)
+
+        pairs = np.empty((0, 2), dtype=np.int64)
+        movers = None  # Premier passage: toutes les paires
+        best = None    # (conflits, itération, tranches, état, paires) le plus sûr rencontré
+        deadline = None  # Le budget de résolution démarre après le premier passage
+        escalation = 0
+        stage_start = 0  # Première itération du palier courant
+        iteration = 0
+        while True:
+            times = self._sample_times(plan, transit)
+            found = self._find_conflicts(plan, times, movers)
+            if movers is not None:
+                # Seules les trajectoires des drones modifiés ont changé
+                keep = ~(np.isin(pairs[:, 0], movers) | np.isin(pairs[:, 1], movers))
+                found = np.concatenate([pairs[keep], found])
+            pairs = np.unique(found, axis=0)
+            if best is None or len(pairs) < best[0]:
+                best = (len(pairs), iteration, len(times),
+                        (plan.start.copy(), plan.delays.copy(), plan.layers.copy(), plan.order.copy()),
+                        pairs)
+            if not len(pairs):
+                break
+            if deadline is None:
+                deadline = time.perf_counter() + self.time_budget
+            elif time.perf_counter() > deadline:
+                break
+            if (iteration - max(best[1], stage_start) >= 2 or
+                    iteration - stage_start >= self.max_iterations):
+                # Stagnation: escalade depuis le meilleur état (voir _reroute)
+                if escalation == self.max_escalations:
+                    break
+                escalation += 1
+                stage_start = iteration
+                plan.start, plan.delays, plan.layers, plan.order = (array.copy() for array in best[3])
+                pairs = best[4]
+            if escalation:
+                movers = self._reroute(plan, pairs, self.max_layers * (escalation + 1), latest, deadline)
+            else:
+                movers = self._resolve(plan, pairs)
+            self._update_controls(plan)
+            iteration += 1
+
+        plan.conflicts, plan.iterations, plan.samples, state, _ = best
+        plan.start, plan.delays, plan.layers, plan.order = state
+        self._update_controls(plan)
+        if plan.conflicts:
+            message = (f"{plan.conflicts} paires sous {self.min_separation}m pendant le transit "
+                       f"après {escalation} escalade(s) et {plan.iterations} itérations "
+                       f"(formations: {plan.endpoint_conflicts})")
+            if strict:
+                raise RuntimeError(f"Transit non sûr: {message}")
+            print(f"[TRANSIT PLANNER] ATTENTION: {message}")
+        return plan
+
+    # Ajustements candidats d'une paire (i, j), essayés dans cet ordre
+    _FIXES = ("sync", "swap", "raise_i", "raise_j", "lower_i", "lower_j")
+
+    def _resolve(self, plan, pairs, rounds: int = 4):
+        """
+        Ajuste les paires en conflit; rend les drones modifiés. Chaque
+        candidat est évalué sur les trajectoires de la paire seule et le
+        premier qui la sépare est appliqué (sinon celui qui l'écarte le plus):
+        1. départs désynchronisés → caler le plus tardif sur le partenaire
+        2. échanger leurs cibles si la somme des distances² baisse
+        3. monter (puis descendre) l'un des deux d'une couche d'altitude
+        Un drone n'est ajusté qu'une fois par tour; les paires restantes sont
+        réévaluées au tour suivant avec les trajectoires à jour.
+        """
+        changed = np.zeros(len(plan.start), dtype=bool)
+        for _ in range(rounds):
+            if not len(pairs):
+                break
+            busy = np.zeros(len(plan.start), dtype=bool)
+            chosen = []
+            for i, j in pairs.tolist():
+                if not (busy[i] or busy[j]):
+                    busy[i] = busy[j] = True
+                    chosen.append((i, j))
+            changed[self._apply_fixes(plan, np.array(chosen, dtype=np.int64))] = True
+            # Paires encore en conflit (trajectoires à jour), hors celles traitées
+            pairs = pairs[busy[pairs[:, 0]] | busy[pairs[:, 1]]]
+            i, j = pairs[:, 0], pairs[:, 1]
+            current = (plan.start[i], plan.start[j], plan.delays[i], plan.delays[j],
+                       plan.layers[i], plan.layers[j])
+            pairs = pairs[self._pair_clearance(plan, i, j, *current) < self.min_separation ** 2]
+        return np.flatnonzero(changed)
+
+    def _apply_fixes(self, plan, chosen):
+        """
+        Applique à chaque paire (i, j) disjointe le premier ajustement qui la
+        sépare; rend les drones dont la trajectoire a changé.
+        """
+        i, j = chosen[:, 0], chosen[:, 1]
+        start, end, delays, layers = plan.start, plan.end, plan.delays, plan.layers
+
+        early = np.minimum(delays[i], delays[j])
+        top = self.max_layers
+        shorter = (np.einsum('pk,pk->p', start[i] - end[j], start[i] - end[j]) +
+                   np.einsum('pk,pk->p', start[j] - end[i], start[j] - end[i]) <
+                   np.einsum('pk,pk->p', start[i] - end[i], start[i] - end[i]) +
+                   np.einsum('pk,pk->p', start[j] - end[j], start[j] - end[j]))
+        candidates = (
+            (start[i], start[j], early, early, layers[i], layers[j]),
+            (start[j], start[i], delays[i], delays[j], layers[i], layers[j]),
+            (start[i], start[j], delays[i], delays[j], np.minimum(layers[i] + 1, top), layers[j]),
+            (start[i], start[j], delays[i], delays[j], layers[i], np.minimum(layers[j] + 1, top)),
+            (start[i], start[j], delays[i], delays[j], np.maximum(layers[i] - 1, 0), layers[j]),
+            (start[i], start[j], delays[i], delays[j], layers[i], np.maximum(layers[j] - 1, 0)),
+        )
+        clearance = np.stack([self._pair_clearance(plan, i, j, *c) for c in candidates])
+        clearance[1, ~shorter] = -np.inf  # Échange seulement s'il raccourcit (CAPT)
+        cleared = clearance >= self.min_separation ** 2
+        fix = np.where(cleared.any(axis=0), cleared.argmax(axis=0), clearance.argmax(axis=0))
+
+        changed = []
+        for (a, b), k in zip(chosen.tolist(), fix.tolist()):
+            name = self._FIXES[k]
+            if name == "sync":
+                late = a if delays[a] > delays[b] else b
+                delays[late] = min(delays[a], delays[b])
+                changed.append(late)
+            elif name == "swap":
+                start[[a, b]] = start[[b, a]]
+                plan.order[[a, b]] = plan.order[[b, a]]
+                changed += (a, b)
+            else:
+                drone = a if name.endswith("_i") else b
+                layers[drone] = np.clip(layers[drone] + (1 if name.startswith("raise") else -1), 0, top)
+                changed.append(drone)
+        self._update_controls(plan)
+        return np.array(changed, dtype=np.int64)
+
+    def _reroute(self, plan, pairs, top, latest, deadline, delay_steps: int = 4, samples: int = 97):
+        """
+        Escalade: replanifie chaque drone des paires restantes (les plus
+        impliqués d'abord) contre tous les drones dont l'enveloppe de vol
+        (boîte des points de contrôle) croise la sienne, pas seulement contre
+        son partenaire. Candidats: couches 0..top × départs entre 0 et latest
+        (plus le départ actuel); garde le plus proche de l'état actuel qui
+        dégage tous les voisins, sinon le plus dégagé. Rend les drones modifiés.
+        """
+        d = self.min_separation
+        counts = np.bincount(pairs.ravel(), minlength=len(plan.start))
+        movers = np.unique(pairs)
+        movers = movers[np.argsort(-counts[movers], kind="stable")]
+        points = np.stack((plan.start, plan.control, plan.end))
+        low, high = points.min(axis=0) - d, points.max(axis=0) + d
+        changed = []
+        for k in movers.tolist():
+            if time.perf_counter() > deadline:
+                break
+            # Voisins: enveloppes qui se croisent (celle de k montée jusqu'à la couche top)
+            high_k = high[k].copy()
+            high_k[1] += 2.0 * top * self.layer_spacing
+            near = np.flatnonzero(np.all((low <= high_k) & (high >= low[k]), axis=1))
+            near = near[(near != k) &
+                        (np.linalg.norm(plan.start[near] - plan.start[k], axis=1) >= d) &
+                        (np.linalg.norm(plan.end[near] - plan.end[k], axis=1) >= d)]
+            if not len(near):
+                continue
+
+            layer_grid, delay_grid = np.meshgrid(
+                np.arange(top + 1), np.append(np.linspace(0.0, latest, delay_steps), plan.delays[k]))
+            layer_grid, delay_grid = layer_grid.ravel(), delay_grid.ravel()
+            c, p = len(layer_grid), len(near)
+            i, j = np.full(c * p, k), np.tile(near, c)
+            clearance = self._pair_clearance(plan, i, j, plan.start[i], plan.start[j],
+                                             np.repeat(delay_grid, p), plan.delays[j],
+                                             np.repeat(layer_grid, p), plan.layers[j], samples)
+            clearance = clearance.reshape(c, p).min(axis=1)
+            change = (np.abs(layer_grid - plan.layers[k]) +
+                      np.abs(delay_grid - plan.delays[k]) / max(latest, 1e-6))
+            cleared = clearance >= (1.1 * d) ** 2  # Marge: l'écart est échantillonné
+            pick = int(np.argmin(np.where(cleared, change, np.inf))) if cleared.any() else int(np.argmax(clearance))
+
+            plan.delays[k], plan.layers[k] = delay_grid[pick], layer_grid[pick]
+            plan.control[k] = self._control(plan.start[k:k + 1], plan.end[k:k + 1], plan.layers[k:k + 1])[0]
+            points[1, k] = plan.control[k]
+            low[k], high[k] = points[:, k].min(axis=0) - d, points[:, k].max(axis=0) + d
+            changed.append(k)
+        return np.array(changed, dtype=np.int64)
+
+    def _pair_clearance(self, plan, i, j, start_i, start_j, delay_i, delay_j, layer_i, layer_j,
+                        samples: int = 49):
+        """Distance² minimale (P,) entre i et j sur leur vol commun, pour ces paramètres."""
+        first = np.minimum(delay_i, delay_j)
+        span = np.maximum(delay_i, delay_j) + plan.flight_time - first
+        times = first[:, np.newaxis] + span[:, np.newaxis] * np.linspace(0.0, 1.0, samples)
+        gap = (self._bezier(start_i, plan.end[i], self._control(start_i, plan.end[i], layer_i),
+                            delay_i, plan.flight_time, times) -
+               self._bezier(start_j, plan.end[j], self._control(start_j, plan.end[j], layer_j),
+                            delay_j, plan.flight_time, times))
+        return np.einsum('pfk,pfk->pf', gap, gap).min(axis=1)
+
+    def _update_controls(self, plan):
+        plan.control[:] = self._control(plan.start, plan.end, plan.layers)
+
+    def _control(self, start, end, layers):
+        # Même décalage pour tous à couche égale: préserve l'absence de croisement
+        control = (start + end) / 2.0
+        control[:, 1] += 2.0 * (self.base_boost + layers * self.layer_spacing)
+        return control
+
+    @staticmethod
+    def _max_speeds(plan):
+        """Borne de vitesse de chaque drone (m/s) pendant son vol."""
+        # Longueur de Bézier <= longueur du polygone de contrôle; easing cubique: vitesse max 1.5×
+        length = (np.linalg.norm(plan.control - plan.start, axis=1) +
+                  np.linalg.norm(plan.end - plan.control, axis=1))
+        return 1.5 * length / plan.flight_time
+
+    def _sample_times(self, plan, transit):
+        """Instants de contrôle: chaque drone bouge de moins de min_separation/2 entre deux."""
+        max_speed = float(self._max_speeds(plan).max(initial=0.0))
+        step = 0.5 * self.min_separation / max(max_speed, 1e-6)
+        count = int(np.ceil(transit / step)) + 1
+        return np.linspace(0.0, transit, max(count, 2))
+
+    def _find_conflicts(self, plan, times, movers=None):
+        """
+        Paires (i, j) uniques qui passent sous min_separation pendant le vol
+        (toutes, ou seulement celles impliquant `movers`), hors paires déjà
+        sous min_separation dans une des deux formations.
+        """
+        # Intervalle [t0, t1] entre deux tranches: une paire n'y entre en
+        # conflit que si son écart en t0 < min_separation + déplacement
+        # possible des deux drones (vitesse propre × durée, nulle au sol).
+        # Candidats de l'arbre à 2 × min_separation (déplacement <=
+        # min_separation/2 chacun), puis borne par paire, puis vérification
+        # fine (exacte pour les paires synchrones)
+        d = self.min_separation
+        radius = 2.0 * d
+        n = len(plan.start)
+        departure = plan.delays
+        arrival = plan.delays + plan.flight_time
+        speeds = self._max_speeds(plan)
+        queried = np.zeros(n, dtype=bool)
+        found = []
+        positions = np.empty_like(plan.start)
+        for t0, t1 in zip(times[:-1], times[1:]):
+            flying = (departure < t1) & (arrival > t0)
+            # Premier passage: toute paire en conflit contient un drone en vol
+            query = np.flatnonzero(flying) if movers is None else movers
+            if not len(query) or not flying.any():
+                continue
+            plan.positions(t0, out=positions)
+            queried[:] = False
+            queried[query] = True
+            hits = cKDTree(positions[query]).sparse_distance_matrix(
+                cKDTree(positions), radius, output_type='ndarray')
+            i, j, gap = query[hits['i']], hits['j'], hits['v']
+            # Paires vues depuis les deux drones interrogés: une seule fois
+            keep = (i != j) & ~(queried[j] & (j < i))
+            keep &= gap < d + (t1 - t0) * (speeds[i] * flying[i] + speeds[j] * flying[j])
+            keep &= flying[i] | flying[j]
+            i, j = i[keep], j[keep]
+            keep = np.linalg.norm(plan.start[i] - plan.start[j], axis=1) >= d
+            keep &= np.linalg.norm(plan.end[i] - plan.end[j], axis=1) >= d
+            if not keep.any():
+                continue
+            pairs = np.sort(np.column_stack((i[keep], j[keep])), axis=1)
+
+            # Même départ et même couche: l'écart est linéaire en l'avancement
+            # (gap = Δstart + e·(Δend − Δstart)), distance minimale exacte
+            i, j = pairs[:, 0], pairs[:, 1]
+            linear = (departure[i] == departure[j]) & (plan.layers[i] == plan.layers[j])
+            if linear.any():
+                found.append(self._linear_conflicts(plan, pairs[linear]))
+            pairs = pairs[~linear]
+            if not len(pairs):
+                continue
+
+            fine = np.broadcast_to(np.linspace(t0, t1, 5), (len(pairs), 5))
+            gap = self._pair_positions(plan, pairs[:, 0], fine) - self._pair_positions(plan, pairs[:, 1], fine)
+            closest = np.einsum('pfk,pfk->pf', gap, gap).min(axis=1)
+            found.append(pairs[closest < d ** 2])
+
+        if not found:
+            return np.empty((0, 2), dtype=np.int64)
+        conflicts = np.concatenate(found)
+        return np.unique(conflicts, axis=0) if len(conflicts) else np.empty((0, 2), dtype=np.int64)
+
+    def _linear_conflicts(self, plan, pairs):
+        """Paires synchrones (même départ, même couche) qui passent sous min_separation."""
+        delta_start = plan.start[pairs[:, 0]] - plan.start[pairs[:, 1]]
+        drift = (plan.end[pairs[:, 0]] - plan.end[pairs[:, 1]]) - delta_start
+        norm2 = np.einsum('pk,pk->p', drift, drift)
+        e = np.clip(-np.einsum('pk,pk->p', delta_start, drift) / np.maximum(norm2, 1e-12), 0.0, 1.0)
+        gap = delta_start + e[:, np.newaxis] * drift
+        return pairs[np.einsum('pk,pk->p', gap, gap) < self.min_separation ** 2]
+
+    @classmethod
+    def _pair_positions(cls, plan, idx, times):
+        """Positions (P, F, 3) des drones idx (P,) aux instants times (P, F)."""
+        return cls._bezier(plan.start[idx], plan.end[idx], plan.control[idx], plan.delays[idx],
+                           plan.flight_time, times)
+
+    @staticmethod
+    def _bezier(start, end, control, delays, flight_time, times):
+        """Positions (P, F, 3) de trajectoires (P, 3) aux instants times (P, F)."""
+        u = np.clip((times - delays[:, np.newaxis]) / flight_time, 0.0, 1.0)
+        u = ease_in_out_cubic(u)[..., np.newaxis]
+        w = 1.0 - u
+        return ((w * w) * start[:, np.newaxis] + (2.0 * w * u) * control[:, np.newaxis] +
+                (u * u) * end[:, np.newaxis])
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'TransitPlan',
+    'TransitPlanner',
+]
+
+
+if __name__ == "__main__":
+    import sys
+    from formation_library import FormationLibrary
+    from transition_system import StaggerScheduler, TransitionTiming
+
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    phase_a = sys.argv[2] if len(sys.argv) > 2 else "act1_desert"
+    phase_b = sys.argv[3] if len(sys.argv) > 3 else "phase2_anem"
+
+    library = FormationLibrary()
+    start, _ = library.get_phase(phase_a, num, t=0.0)
+    end, _ = library.get_phase(phase_b, num, t=0.0)
+    planner = TransitPlanner()
+
+    began = time.perf_counter()
+    order = planner.assign(start, end)
+    start = np.asarray(start, dtype=np.float64)[order]
+    delays, flight_time = StaggerScheduler().schedule(start, np.asarray(end), TransitionTiming().transit)
+    plan = planner.plan(start, end, delays, flight_time)
+    elapsed = time.perf_counter() - began
+
+    print(f"{phase_a} → {phase_b}, {num} drones: {elapsed:.2f}s  "
+          f"({plan.samples} tranches, {plan.iterations} itérations)")
+    print(f"Conflits de transit: {plan.conflicts}  "
+          f"paires sous min_separation dans les formations: {plan.endpoint_conflicts}")
@@ -11,11 +11,17 @@ Implémente les 4 principes fondamentaux des shows de drones professionnels:
 """
 
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict
 import time as time_module
 
+from transit_planner import TransitPlanner, TransitPlan
+from compute_backend import SwarmParams, get_backend
+from turbulence_field import get_turbulence_field
+import curves
+
 
 class TransitionState(Enum):
     """Machine à états professionnelle pour les transitions"""
@@ -44,76 +50,70 @@ class DroneTrajectory:
     end: np.ndarray
     control_point: np.ndarray
     delay: float                 # Délai de démarrage (staggered)
-    duration: float
+    duration: float              # Durée du vol (delay + duration <= transit)
     
 
-class EasingFunctions:
-    """Fonctions d'easing pour mouvements naturels"""
-    
-    @staticmethod
-    def ease_in_quad(t: float) -> float:
-        """Accélération quadratique"""
-        return t * t
-    
-    @staticmethod
-    def ease_out_quad(t: float) -> float:
-        """Décélération quadratique"""
-        return 1 - (1 - t) * (1 - t)
-    
-    @staticmethod
-    def ease_in_out_quad(t: float) -> float:
-        """Accélération puis décélération"""
-        if t < 0.5:
-            return 2 * t * t
-        else:
-            return 1 - pow(-2 * t + 2, 2) / 2
-    
-    @staticmethod
-    def ease_in_cubic(t: float) -> float:
-        """Accélération cubique (plus douce)"""
-        return t * t * t
-    
-    @staticmethod
-    def ease_out_cubic(t: float) -> float:
-        """Décélération cubique"""
-        return 1 - pow(1 - t, 3)
-    
-    @staticmethod
-    def ease_in_out_cubic(t: float) -> float:
-        """Transition cubique complète"""
-        if t < 0.5:
-            return 4 * t * t * t
+@dataclass
+class StaggerScheduler:
+    """
+    Départs échelonnés par vagues: le décalage total est borné à
+    max_fraction × transit quel que soit le nombre de drones, et chaque drone
+    vole pendant transit - décalage max, donc termine avant FADE_IN.
+
+    Modes de regroupement en vagues:
+    - "distance": rang de distance au point d'arrivée (les plus proches d'abord)
+    - "altitude": couches d'altitude d'arrivée (les plus basses d'abord)
+    - "cell":     cellules au sol de cell_size m, vagues entrelacées entre voisines
+    """
+    waves: int = 8
+    max_fraction: float = 0.3    # Part du transit consacrée à l'échelonnement
+    mode: str = "distance"
+    cell_size: float = 10.0
+
+    def schedule(self, start: np.ndarray, end: np.ndarray, transit: float) -> Tuple[np.ndarray, float]:
+        """Retourne (délais par drone, durée de vol commune) en une passe vectorisée."""
+        n = len(start)
+        waves = max(1, min(self.waves, n))
+        max_stagger = transit * float(np.clip(self.max_fraction, 0.0, 0.9))
+
+        if waves == 1 or n == 0:
+            return np.zeros(n), transit
+
+        if self.mode == "altitude":
+            y = end[:, 1]
+            span = max(float(y.max() - y.min()), 1e-6)
+            wave = np.minimum(((y - y.min()) / span * waves).astype(np.int64), waves - 1)
+        elif self.mode == "cell":
+            cells = np.floor(start[:, [0, 2]] / self.cell_size).astype(np.int64)
+            wave = (cells[:, 0] + 3 * cells[:, 1]) % waves
         else:
-            return 1 - pow(-2 * t + 2, 3) / 2
-    
-    @staticmethod
-    def smoothstep(t: float) -> float:
-        """Transition très douce (Hermite)"""
-        t = np.clip(t, 0, 1)
-        return t * t * (3 - 2 * t)
-    
-    @staticmethod
-    def smootherstep(t: float) -> float:
-        """Transition encore plus douce"""
-        t = np.clip(t, 0, 1)
-        return t * t * t * (t * (6 * t - 15) + 10)
+            distances = np.linalg.norm(end - start, axis=1)
+            rank = np.empty(n, dtype=np.int64)
+            rank[np.argsort(distances, kind="stable")] = np.arange(n)
+            wave = rank * waves // n
+
+        delays = wave * (max_stagger / (waves - 1))
+        return delays, transit - max_stagger
+
+
+class EasingFunctions:
+    """Fonctions d'easing pour mouvements naturels (scalaires ou tableaux, voir curves)"""
+    
+    ease_in_quad = staticmethod(curves.ease_in_quad)
+    ease_out_quad = staticmethod(curves.ease_out_quad)
+    ease_in_out_quad = staticmethod(curves.ease_in_out_quad)
+    ease_in_cubic = staticmethod(curves.ease_in_cubic)
+    ease_out_cubic = staticmethod(curves.ease_out_cubic)
+    ease_in_out_cubic = staticmethod(curves.ease_in_out_cubic)
+    smoothstep = staticmethod(curves.smoothstep)
+    smootherstep = staticmethod(curves.smootherstep)
 
 
 class BezierCurve:
-    """Calcul de courbes de Bézier pour trajectoires organiques"""
-    
-    @staticmethod
-    def quadratic(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray, t: float) -> np.ndarray:
-        """Courbe de Bézier quadratique (3 points)"""
-        return (1-t)**2 * p0 + 2*(1-t)*t * p1 + t**2 * p2
+    """Calcul de courbes de Bézier pour trajectoires organiques (t scalaire ou par point)"""
     
-    @staticmethod
-    def cubic(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray, t: float) -> np.ndarray:
-        """Courbe de Bézier cubique (4 points)"""
-        return ((1-t)**3 * p0 + 
-                3*(1-t)**2*t * p1 + 
-                3*(1-t)*t**2 * p2 + 
-                t**3 * p3)
+    quadratic = staticmethod(curves.bezier_quadratic)
+    cubic = staticmethod(curves.bezier_cubic)
 
 
 class ProfessionalLighting:
@@ -145,15 +145,11 @@ class ProfessionalLighting:
         
         if state == TransitionState.FORMATION_HOLD:
             # Lumière pleine + scintillement subtil
-            for i in range(num_drones):
-                freq = self.twinkle_frequencies[i]
-                phase = self.twinkle_phases[i]
-                twinkle = np.sin(self.time * freq + phase) * 0.08
-                intensities[i] = 1.0 + twinkle
-                
-                # Occasionnellement, un scintillement plus fort (comme une étoile)
-                if np.random.random() < 0.0005:
-                    intensities[i] += np.random.uniform(0.1, 0.25)
+            intensities += np.sin(self.time * self.twinkle_frequencies + self.twinkle_phases) * 0.08
+            
+            # Occasionnellement, un scintillement plus fort (comme une étoile)
+            stars = np.flatnonzero(np.random.random(num_drones) < 0.0005)
+            intensities[stars] += np.random.uniform(0.1, 0.25, len(stars))
         
         elif state == TransitionState.FADE_OUT:
             # Éteint progressivement avec easing quadratique
@@ -197,8 +193,10 @@ class ProfessionalLighting:
 class BioSwarmEngine:
     """Moteur de mouvement organique type essaim"""
     
-    def __init__(self, num_drones: int):
+    def __init__(self, num_drones: int, backend=None, turbulence=None):
         self.num_drones = num_drones
+        self.backend = backend or get_backend()
+        self.turbulence = turbulence or get_turbulence_field()
         self.velocities = np.zeros((num_drones, 3))
         self.rng = np.random.RandomState(123)
         
@@ -209,6 +207,7 @@ class BioSwarmEngine:
         self.separation_weight = 2.0
         self.cohesion_weight = 0.1
         self.target_weight = 1.0
+        self.turbulence_weight = 0.1   # m/s (champ curl-noise normalisé)
         
         # Rayon de perception
         self.perception_radius = 15.0
@@ -217,122 +216,41 @@ class BioSwarmEngine:
     def calculate_movement(self, current_positions: np.ndarray, 
                           target_positions: np.ndarray, 
                           time: float, dt: float) -> np.ndarray:
-        """Calcule le mouvement naturel d'essaim vers les cibles"""
-        
-        new_positions = current_positions.copy()
-        
-        for i in range(self.num_drones):
-            # 1. VECTEUR VERS LA CIBLE
-            to_target = target_positions[i] - current_positions[i]
-            distance = np.linalg.norm(to_target)
-            
-            if distance < 0.1:
-                continue  # Déjà à destination
-                
-            # 2. VITESSE ADAPTATIVE
-            if distance > 50:
-                target_speed = self.max_speed
-            elif distance > 20:
-                target_speed = 5.0
-            elif distance > 5:
-                target_speed = 2.0
-            else:
-                target_speed = distance * 0.5  # Ralentit en approche
-            
-            # Direction vers la cible
-            if distance > 0:
-                direction = to_target / distance
-            else:
-                direction = np.array([0, 0, 0])
-            
-            # 3. FORCE D'ALIGNEMENT (avec voisins)
-            alignment_force = self._calculate_alignment(i, current_positions)
-            
-            # 4. FORCE DE SÉPARATION (évitement)
-            separation_force = self._calculate_separation(i, current_positions)
-            
-            # 5. TURBULENCE NATURELLE
-            turbulence = np.array([
-                np.sin(time * 0.8 + i * 0.1) * 0.5,
-                np.cos(time * 0.6 + i * 0.15) * 0.3,
-                np.sin(time * 0.9 + i * 0.12) * 0.4
-            ])
-            
-            # 6. COMBINAISON DES FORCES
-            desired_velocity = (
-                direction * target_speed * self.target_weight +
-                alignment_force * self.alignment_weight +
-                separation_force * self.separation_weight +
-                turbulence * 0.3
-            )
-            
-            # 7. ACCÉLÉRATION DOUCE (pas de changements brusques)
-            acceleration = (desired_velocity - self.velocities[i])
-            accel_magnitude = np.linalg.norm(acceleration)
-            if accel_magnitude > self.max_acceleration:
-                acceleration = acceleration / accel_magnitude * self.max_acceleration
-            
-            self.velocities[i] += acceleration * dt
-            
-            # 8. LIMITE DE VITESSE
-            speed = np.linalg.norm(self.velocities[i])
-            if speed > self.max_speed:
-                self.velocities[i] = self.velocities[i] / speed * self.max_speed
-            
-            # 9. INTÉGRATION DE POSITION
-            new_positions[i] += self.velocities[i] * dt
-            
-            # 10. MICRO-VIBRATIONS (anti-robot)
-            new_positions[i] += np.array([
-                np.sin(time * 10 + i) * 0.03,
-                np.cos(time * 8 + i * 0.7) * 0.02,
-                np.sin(time * 12 + i * 0.5) * 0.03
-            ])
-        
-        return new_positions
-    
-    def _calculate_alignment(self, drone_idx: int, positions: np.ndarray) -> np.ndarray:
-        """Calcule la force d'alignement avec les voisins"""
-        avg_velocity = np.zeros(3)
-        count = 0
-        
-        for j in range(self.num_drones):
-            if j == drone_idx:
-                continue
-            
-            dist = np.linalg.norm(positions[j] - positions[drone_idx])
-            if dist < self.perception_radius:
-                avg_velocity += self.velocities[j]
-                count += 1
-        
-        if count > 0:
-            avg_velocity /= count
-        
-        return avg_velocity
-    
-    def _calculate_separation(self, drone_idx: int, positions: np.ndarray) -> np.ndarray:
-        """Calcule la force de séparation pour éviter les collisions"""
-        separation = np.zeros(3)
-        
-        for j in range(self.num_drones):
-            if j == drone_idx:
-                continue
-            
-            diff = positions[drone_idx] - positions[j]
-            dist = np.linalg.norm(diff)
-            
-            if dist < self.separation_radius and dist > 0:
-                # Plus proche = plus forte répulsion
-                separation += diff / (dist * dist)
-        
-        return separation
+        """
+        Calcule le mouvement naturel d'essaim vers les cibles (cible,
+        alignement, séparation, turbulence). Les voisins sont lus avec les
+        vitesses du pas précédent; self.velocities est mis à jour en place.
+        """
+        params = SwarmParams(
+            max_speed=self.max_speed,
+            max_acceleration=self.max_acceleration,
+            alignment_weight=self.alignment_weight,
+            separation_weight=self.separation_weight,
+            target_weight=self.target_weight,
+            perception_radius=self.perception_radius,
+            separation_radius=self.separation_radius,
+        )
+        flow = self.turbulence.sample(current_positions, time)
+        flow *= self.turbulence_weight
+        return self.backend.swarm_step(current_positions, target_positions,
+                                       self.velocities, time, dt, params, flow)
 
 
 class ProfessionalTransitionSystem:
-    """Système de transition complet niveau professionnel"""
-    
-    def __init__(self, num_drones: int = 1000):
+    """
+    Système de transition complet niveau professionnel.
+
+    Le plan de transit est calculé hors du thread appelant (background_planning)
+    pendant FADE_OUT + BLACKOUT; le blackout est prolongé tant qu'il n'est pas
+    prêt. La réaffectation des drones qu'il impose est à récupérer une fois via
+    take_assignment().
+    """
+    
+    def __init__(self, num_drones: int = 1000, min_separation: float = 3.0, backend=None,
+                 turbulence=None, background_planning: bool = True):
         self.num_drones = num_drones
+        self.backend = backend or get_backend()
+        self.turbulence = turbulence or get_turbulence_field()
         self.state = TransitionState.IDLE
         self.progress = 0.0
         self.total_time = 0.0
@@ -340,7 +258,7 @@ class ProfessionalTransitionSystem:
         # Composants
         self.timing = TransitionTiming()
         self.lighting = ProfessionalLighting()
-        self.swarm = BioSwarmEngine(num_drones)
+        self.swarm = BioSwarmEngine(num_drones, self.backend, self.turbulence)
         
         # Données de transition
         self.current_positions = np.zeros((num_drones, 3))
@@ -348,8 +266,16 @@ class ProfessionalTransitionSystem:
         self.target_positions = np.zeros((num_drones, 3))
         self.target_colors = np.ones((num_drones, 3))
         
-        # Trajectoires pré-calculées
-        self.trajectories: List[DroneTrajectory] = []
+        # Trajectoires pré-calculées (planifiées sans collision)
+        self.stagger = StaggerScheduler()
+        self.planner = TransitPlanner(min_separation)
+        self.plan: Optional[TransitPlan] = None
+        # Permutation appliquée aux drones: nouveau drone i = ancien drone assignment[i]
+        self.assignment = np.arange(num_drones)
+        self.background_planning = background_planning
+        self._planner_pool: Optional[ThreadPoolExecutor] = None  # Créé au premier transit
+        self._pending_plan = None        # Future du plan en cours de calcul
+        self._new_assignment = None      # Réaffectation pas encore récupérée (take_assignment)
         
         # État actif
         self.is_active = False
@@ -360,9 +286,14 @@ class ProfessionalTransitionSystem:
     def start_transition(self, from_positions: np.ndarray, from_colors: np.ndarray,
                         to_positions: np.ndarray, to_colors: np.ndarray,
                         transit_duration: float = None):
-        """Démarre une transition professionnelle"""
-        
-        self.current_positions = from_positions.copy()
+        """
+        Démarre une transition professionnelle. Les drones sont réaffectés aux
+        cibles quand le plan est prêt: l'appelant doit alors permuter ses
+        tableaux par drone avec take_assignment() (positions/couleurs
+        courantes déjà permutées ici).
+        """
+        
+        self.current_positions = np.array(from_positions, dtype=np.float64)
         self.current_colors = from_colors.copy()
         self.target_positions = to_positions.copy()
         self.target_colors = to_colors.copy()
@@ -370,8 +301,22 @@ class ProfessionalTransitionSystem:
         if transit_duration:
             self.timing.transit = transit_duration
         
-        # Pré-calculer toutes les trajectoires
-        self._calculate_trajectories()
+        # Pré-calculer toutes les trajectoires (en tâche de fond: la résolution
+        # est bornée par la durée du noir qu'elle recouvre)
+        self.plan = None
+        self.assignment = np.arange(self.num_drones)
+        self._new_assignment = None
+        self.planner.time_budget = self.timing.fade_out + self.timing.blackout
+        if self._pending_plan is not None:
+            self._pending_plan.cancel()  # Plan d'une transition abandonnée: ignoré
+        args = (self.current_positions, self.target_positions, self.timing.transit)
+        if self.background_planning:
+            if self._planner_pool is None:
+                self._planner_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TransitPlanner")
+            self._pending_plan = self._planner_pool.submit(self._calculate_trajectories, *args)
+        else:
+            self._pending_plan = None
+            self._adopt_plan(*self._calculate_trajectories(*args))
         
         # Démarrer la machine à états
         self.state = TransitionState.FADE_OUT
@@ -380,46 +325,49 @@ class ProfessionalTransitionSystem:
         
         print(f"[TRANSITION] Démarrage: FADE_OUT ({self.timing.fade_out}s)")
         
-    def _calculate_trajectories(self):
-        """Pré-calcule toutes les trajectoires avec courbes de Bézier"""
-        
-        self.trajectories = []
-        
-        # Calculer les distances pour le staggered start
-        distances = np.linalg.norm(self.target_positions - self.current_positions, axis=1)
-        
-        # Trier par distance (les plus proches partent en premier)
-        sorted_indices = np.argsort(distances)
-        delays = np.zeros(self.num_drones)
-        
-        for rank, idx in enumerate(sorted_indices):
-            delays[idx] = rank * 0.012  # 12ms entre chaque drone
-        
-        for i in range(self.num_drones):
-            start = self.current_positions[i]
-            end = self.target_positions[i]
-            
-            # Point de contrôle pour courbe de Bézier
-            # Monte légèrement au milieu pour éviter les croisements
-            mid_point = (start + end) / 2
-            height_boost = 10 + self.rng.uniform(5, 15)
-            lateral_offset = self.rng.uniform(-8, 8, 2)
-            
-            control_point = np.array([
-                mid_point[0] + lateral_offset[0],
-                mid_point[1] + height_boost,
-                mid_point[2] + lateral_offset[1]
-            ])
-            
-            traj = DroneTrajectory(
-                start=start.copy(),
-                end=end.copy(),
-                control_point=control_point,
-                delay=delays[i],
-                duration=self.timing.transit
-            )
-            
-            self.trajectories.append(traj)
+    def _calculate_trajectories(self, positions, targets, transit):
+        """
+        Pré-calcule toutes les trajectoires (Bézier sans collision, départs
+        échelonnés). Sans effet de bord: peut tourner hors du thread appelant.
+        Retourne (réaffectation, plan).
+        """
+        
+        # Affectation drones → cibles: limite les croisements dans le noir
+        order = self.planner.assign(positions, targets)
+        start = positions[order]
+        
+        # Départs échelonnés par vagues (décalage total borné, vol complet garanti)
+        delays, flight_time = self.stagger.schedule(start, targets, transit)
+        
+        plan = self.planner.plan(start, targets, delays, flight_time)
+        return order[plan.order], plan
+    
+    def _adopt_plan(self, assignment, plan):
+        """Installe le plan calculé et réaffecte les drones courants."""
+        self.plan = plan
+        self.assignment = assignment
+        self._new_assignment = assignment
+        self.current_positions = self.current_positions[assignment]
+        self.current_colors = self.current_colors[assignment]
+        
+        if not plan.ok:
+            print(f"[TRANSITION] {plan.conflicts} paires sous {self.planner.min_separation}m "
+                  f"pendant le transit (formations: {plan.endpoint_conflicts})")
+    
+    def take_assignment(self) -> Optional[np.ndarray]:
+        """
+        Réaffectation (nouveau drone i = ancien drone assignment[i]) du plan
+        arrivé depuis le dernier appel, à appliquer par l'appelant; None sinon.
+        """
+        assignment, self._new_assignment = self._new_assignment, None
+        return assignment
+    
+    def shutdown(self):
+        """Abandonne le plan en cours et libère le thread de planification."""
+        if self._planner_pool is not None:
+            self._planner_pool.shutdown(wait=False, cancel_futures=True)
+            self._planner_pool = None
+        self._pending_plan = None
     
     def update(self, dt: float) -> bool:
         """Met à jour l'état de transition. Retourne True si actif."""
@@ -430,15 +378,30 @@ class ProfessionalTransitionSystem:
         self.total_time += dt
         self.lighting.update(dt)
         
+        # Plan calculé en tâche de fond: l'installer dès qu'il est prêt
+        if self._pending_plan is not None and self._pending_plan.done():
+            pending, self._pending_plan = self._pending_plan, None
+            try:
+                self._adopt_plan(*pending.result())
+            except Exception as exc:
+                # Pas de trajectoires: abandonner le transit plutôt que rester dans le noir
+                print(f"[TRANSITION] Échec de la planification du transit: {exc!r}")
+                self.state = TransitionState.FORMATION_HOLD
+                self._advance_state()
+                return False
+        
         # Déterminer la durée de l'état actuel
         current_duration = self._get_current_duration()
         
         # Progresser
         self.progress += dt / current_duration
         
-        # Transition d'état si nécessaire
+        # Transition d'état si nécessaire (le blackout dure tant que le plan n'est pas prêt)
         if self.progress >= 1.0:
-            self._advance_state()
+            if self.state == TransitionState.BLACKOUT and self.plan is None:
+                self.progress = 1.0
+            else:
+                self._advance_state()
             
         return self.is_active
     
@@ -477,74 +440,68 @@ class ProfessionalTransitionSystem:
             
         print(f"[TRANSITION] {old_state.name} → {self.state.name}")
     
-    def get_positions(self) -> np.ndarray:
-        """Retourne les positions actuelles des drones"""
+    def get_frame(self, out: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions et couleurs courantes, écrites dans out=(positions, couleurs) si fourni"""
+        if out is None:
+            return self.get_positions(), self.get_colors()
+        return self.get_positions(out=out[0]), self.get_colors(out=out[1])
+    
+    def get_positions(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Retourne les positions actuelles des drones (dans out si fourni, sinon une copie)"""
         
         if self.state == TransitionState.TRANSIT_DARK:
             # Calcule les positions pendant le transit (mais drones éteints!)
-            positions = np.zeros_like(self.current_positions)
-            
-            for i, traj in enumerate(self.trajectories):
-                # Appliquer le délai individualisé (staggered)
-                effective_progress = self.progress - (traj.delay / traj.duration)
-                effective_progress = np.clip(effective_progress, 0, 1)
-                
-                # Appliquer easing
-                eased_progress = EasingFunctions.ease_in_out_cubic(effective_progress)
-                
-                # Calculer position sur courbe de Bézier
-                positions[i] = BezierCurve.quadratic(
-                    traj.start, traj.control_point, traj.end, eased_progress
-                )
-            
-            return positions
+            elapsed = self.progress * self.timing.transit
+            return self.plan.positions(elapsed, out=out)
             
         elif self.state == TransitionState.FADE_IN:
             # Pendant fade-in, on est déjà aux positions cibles
-            return self.target_positions.copy()
+            return self._copy_into(self.target_positions, out)
             
         elif self.state == TransitionState.FORMATION_HOLD:
             # Position cible avec micro-mouvements
-            return self._apply_living_formation(self.target_positions)
+            return self._apply_living_formation(self.target_positions, out=out)
             
         else:
             # FADE_OUT, BLACKOUT : rester aux positions courantes
-            return self.current_positions.copy()
+            return self._copy_into(self.current_positions, out)
     
-    def _apply_living_formation(self, positions: np.ndarray) -> np.ndarray:
+    @staticmethod
+    def _copy_into(source: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        """Copie source dans out (ou une nouvelle copie si out est None)"""
+        if out is None:
+            return source.copy()
+        out[:] = source
+        return out
+    
+    def _apply_living_formation(self, positions: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """Ajoute des micro-mouvements pour donner vie à la formation"""
         
-        living_positions = positions.copy()
-        t = self.total_time
-        
-        for i in range(len(positions)):
-            # 1. Respiration subtile (mouvement vertical)
-            breath = np.sin(t * 0.3 + i * 0.01) * 0.15
-            
-            # 2. Légère oscillation latérale
-            sway_x = np.sin(t * 0.2 + i * 0.02) * 0.1
-            sway_z = np.cos(t * 0.25 + i * 0.015) * 0.1
-            
-            living_positions[i, 0] += sway_x
-            living_positions[i, 1] += breath
-            living_positions[i, 2] += sway_z
+        # Respiration subtile (verticale) + légère oscillation latérale
+        living_positions = np.empty_like(positions) if out is None else out
+        self.backend.living_formation(positions, self.total_time, living_positions)
         
         return living_positions
     
-    def get_colors(self) -> np.ndarray:
-        """Retourne les couleurs actuelles des drones"""
+    def get_colors(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Retourne les couleurs actuelles des drones (dans out si fourni, sinon une copie)"""
         
         if self.state in [TransitionState.FADE_OUT, TransitionState.BLACKOUT, 
                           TransitionState.TRANSIT_DARK]:
-            return self.current_colors.copy()
+            return self._copy_into(self.current_colors, out)
             
         elif self.state == TransitionState.FADE_IN:
-            # Transition de couleur progressive
+            # Transition de couleur progressive: current + (target - current) * progress
             progress = EasingFunctions.smoothstep(self.progress)
-            return self.current_colors * (1 - progress) + self.target_colors * progress
+            if out is None:
+                return self.current_colors * (1 - progress) + self.target_colors * progress
+            np.subtract(self.target_colors, self.current_colors, out=out)
+            out *= progress
+            out += self.current_colors
+            return out
             
         else:
-            return self.target_colors.copy()
+            return self._copy_into(self.target_colors, out)
     
     def get_intensities(self) -> np.ndarray:
         """Retourne les intensités lumineuses"""
@@ -573,8 +530,9 @@ class ProfessionalTransitionSystem:
 class LivingFormationAnimator:
     """Anime les formations pour qu'elles ne soient jamais statiques"""
     
-    def __init__(self):
+    def __init__(self, turbulence=None):
         self.time = 0.0
+        self.turbulence = turbulence or get_turbulence_field()
         
     def update(self, dt: float):
         self.time += dt
@@ -583,38 +541,31 @@ class LivingFormationAnimator:
                 formation_type: str = 'default') -> Tuple[np.ndarray, np.ndarray]:
         """Anime une formation avec des micro-mouvements"""
         
-        animated_positions = positions.copy()
-        animated_colors = colors.copy()
-        num = len(positions)
         t = self.time
+        index = np.arange(len(positions))
         
         # Calculer le centre de la formation
         center = np.mean(positions, axis=0)
+        from_center = positions - center
+        dist_to_center = np.sqrt(np.einsum('ij,ij->i', from_center, from_center))
         
-        for i in range(num):
-            # Distance au centre
-            dist_to_center = np.linalg.norm(positions[i] - center)
-            
-            # 1. RESPIRATION GLOBALE
-            breath_scale = 1.0 + 0.02 * np.sin(t * 0.4)
-            vector_from_center = positions[i] - center
-            animated_positions[i] = center + vector_from_center * breath_scale
-            
-            # 2. ONDULATION VERTICALE
-            wave = np.sin(t * 0.5 + positions[i, 0] * 0.05 + positions[i, 2] * 0.03) * 0.2
-            animated_positions[i, 1] += wave
-            
-            # 3. MICRO-ROTATION autour du centre (très lent)
-            if dist_to_center > 5:
-                angle = np.sin(t * 0.1) * 0.005
-                rx = vector_from_center[0]
-                rz = vector_from_center[2]
-                animated_positions[i, 0] = center[0] + rx * np.cos(angle) - rz * np.sin(angle)
-                animated_positions[i, 2] = center[2] + rx * np.sin(angle) + rz * np.cos(angle)
-            
-            # 4. SCINTILLEMENT DE COULEUR
-            twinkle = 1.0 + 0.08 * np.sin(t * 3 + i * 0.1)
-            animated_colors[i] = np.clip(colors[i] * twinkle, 0, 1.5)
+        # 1. RESPIRATION GLOBALE
+        breath_scale = 1.0 + 0.02 * np.sin(t * 0.4)
+        animated_positions = center + from_center * breath_scale
+        
+        # 2. ONDULATION VERTICALE
+        animated_positions[:, 1] += np.sin(t * 0.5 + positions[:, 0] * 0.05 + positions[:, 2] * 0.03) * 0.2
+        
+        # 3. MICRO-ROTATION autour du centre (très lent), hors du cœur de la formation
+        far = dist_to_center > 5
+        angle = np.sin(t * 0.1) * 0.005
+        rx, rz = from_center[far, 0], from_center[far, 2]
+        animated_positions[far, 0] = center[0] + rx * np.cos(angle) - rz * np.sin(angle)
+        animated_positions[far, 2] = center[2] + rx * np.sin(angle) + rz * np.cos(angle)
+        
+        # 4. SCINTILLEMENT DE COULEUR
+        twinkle = 1.0 + 0.08 * np.sin(t * 3 + index * 0.1)
+        animated_colors = np.clip(colors * twinkle[:, np.newaxis], 0, 1.5)
         
         return animated_positions, animated_colors
     
@@ -629,22 +580,17 @@ class LivingFormationAnimator:
         wind_dir = np.array([wind_direction[0], 0, wind_direction[1]])
         wind_dir = wind_dir / (np.linalg.norm(wind_dir) + 0.001)
         
-        for i in range(len(positions)):
-            # Les drones plus hauts sont plus affectés par le vent
-            height_factor = np.clip((positions[i, 1] - 10) / 50, 0, 1)
-            
-            # Rafales variables
-            gust = wind_strength * (1 + 0.5 * np.sin(t * 2 + i * 0.05))
-            
-            # Appliquer le déplacement
-            displacement = wind_dir * gust * height_factor
-            displacement += np.array([
-                np.sin(t * 3 + i * 0.1) * 0.2,
-                np.cos(t * 2.5 + i * 0.08) * 0.1,
-                np.sin(t * 2.8 + i * 0.12) * 0.2
-            ]) * height_factor
-            
-            animated[i] += displacement
+        # Les drones plus hauts sont plus affectés par le vent
+        height_factor = np.clip((positions[:, 1] - 10) / 50, 0, 1)
+        
+        # Rafales variables: composante du champ de turbulence dans l'axe du vent
+        flow = self.turbulence.sample(positions, t)
+        gust = wind_strength * (1 + 0.5 * np.clip(flow @ wind_dir, -1.0, 1.0))
+        
+        # Appliquer le déplacement
+        displacement = wind_dir * gust[:, np.newaxis]
+        displacement += flow * 0.15
+        animated += displacement * height_factor[:, np.newaxis]
         
         return animated
 
@@ -656,6 +602,7 @@ class LivingFormationAnimator:
 __all__ = [
     'TransitionState',
     'TransitionTiming', 
+    'StaggerScheduler',
     'ProfessionalTransitionSystem',
     'ProfessionalLighting',
     'BioSwarmEngine',
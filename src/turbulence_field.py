@@ -0,0 +1,221 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+              CHAMP DE TURBULENCE CURL-NOISE PRÉCALCULÉ - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Source unique de turbulence pour la physique, l'essaim et les animateurs:
+
+1. Précalcul : potentiel vecteur ψ aléatoire lissé (gaussien, périodique) sur
+               une grille couvrant l'espace du show, puis v = ∇ × ψ par
+               différences centrées → champ à divergence nulle (pas de
+               puits ni de sources: les drones ne s'agglutinent pas)
+2. Animation : le champ défile dans le temps (advection par scroll_m_s),
+               la grille étant périodique il se répète sans couture
+3. Lecture   : interpolation trilinéaire vectorisée pour tous les drones
+               (les 8 coins d'une cellule sont stockés côte à côte: un seul
+               gather par drone, aucune trigonométrie par drone)
+
+Le champ est normalisé: écart-type 1 m/s par composante. Chaque
+consommateur applique son propre gain.
+
+Configuration (simulation.yaml, section physics):
+    turbulence:
+      cell_m: 5.0              # pas de la grille
+      scale_m: 25.0            # taille caractéristique des tourbillons
+      scroll_m_s: [1.5, 0.2, 0.8]
+      seed: 2025
+
+Usage (divergence + benchmark):  python src/turbulence_field.py [num_drones ...]
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import sys
+import time
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.ndimage import gaussian_filter
+
+# Espace par défaut (simulation.yaml) quand aucune configuration n'est fournie
+DEFAULT_SPACE = {
+    'x_range': [-200, 200],
+    'y_range': [0, 150],
+    'z_range': [-200, 200],
+}
+
+
+class CurlNoiseField:
+    """Champ de vitesse curl-noise périodique échantillonné par interpolation trilinéaire"""
+
+    def __init__(self, bounds: Tuple[Sequence[float], Sequence[float]],
+                 cell_size: float = 5.0, scale: float = 25.0,
+                 scroll: Sequence[float] = (1.5, 0.2, 0.8), seed: int = 2025):
+        lo = np.asarray(bounds[0], dtype=np.float64)
+        hi = np.asarray(bounds[1], dtype=np.float64)
+        self.cell_size = float(cell_size)
+        self.dims = np.maximum(np.ceil((hi - lo) / self.cell_size).astype(np.int64), 4)
+        self.origin = lo
+        self.period = self.dims * self.cell_size
+        self.scroll = np.asarray(scroll, dtype=np.float64)
+        self.seed = seed
+
+        # 1. Potentiel vecteur lissé (mode 'wrap' → grille périodique)
+        rng = np.random.default_rng(seed)
+        sigma = scale / self.cell_size
+        potential = [gaussian_filter(rng.standard_normal(tuple(self.dims)), sigma, mode='wrap')
+                     for _ in range(3)]
+
+        # 2. v = ∇ × ψ (différences centrées périodiques)
+        def d(field, axis):
+            return (np.roll(field, -1, axis) - np.roll(field, 1, axis)) / (2.0 * self.cell_size)
+
+        px, py, pz = potential
+        velocity = np.stack((d(pz, 1) - d(py, 2),
+                             d(px, 2) - d(pz, 0),
+                             d(py, 0) - d(px, 1)), axis=-1)
+        velocity /= velocity.reshape(-1, 3).std(axis=0)
+
+        # Table (cellule, coin, composante): les 8 coins d'une cellule sont
+        # contigus, un seul gather par drone suffit à l'interpolation
+        corners = [np.roll(velocity, (-cx, -cy, -cz), axis=(0, 1, 2))
+                   for cx in (0, 1) for cy in (0, 1) for cz in (0, 1)]
+        self.table = np.ascontiguousarray(np.stack(corners, axis=3).reshape(-1, 24),
+                                          dtype=np.float32)
+        # Constantes float32 de la lecture (indices exacts jusqu'à 2^24 cellules)
+        self._dims = self.dims.astype(np.float32)
+        self._inv_dims = np.float32(1.0) / self._dims
+        self._strides = np.array([self.dims[1] * self.dims[2], self.dims[2], 1], dtype=np.float32)
+
+    @classmethod
+    def from_config(cls, sim_config: Optional[dict] = None) -> "CurlNoiseField":
+        """Champ couvrant simulation.space avec les réglages physics.turbulence."""
+        simulation = (sim_config or {}).get('simulation', {})
+        space = simulation.get('space', DEFAULT_SPACE)
+        settings = simulation.get('physics', {}).get('turbulence', {}) or {}
+        bounds = ([space['x_range'][0], space['y_range'][0], space['z_range'][0]],
+                  [space['x_range'][1], space['y_range'][1], space['z_range'][1]])
+        return cls(bounds,
+                   cell_size=settings.get('cell_m', 5.0),
+                   scale=settings.get('scale_m', 25.0),
+                   scroll=settings.get('scroll_m_s', (1.5, 0.2, 0.8)),
+                   seed=settings.get('seed', 2025))
+
+    @property
+    def nbytes(self) -> int:
+        return self.table.nbytes
+
+    def sample(self, positions: np.ndarray, t: float = 0.0,
+               out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Vitesse de turbulence (N, 3) float64 aux positions, à l'instant t."""
+        grid = np.subtract(positions, self.origin + self.scroll * t, dtype=np.float32)
+        grid *= np.float32(1.0 / self.cell_size)
+
+        # Repli périodique dans [0, dims) (floor: bien plus rapide que np.mod)
+        wrap = grid * self._inv_dims
+        np.floor(wrap, out=wrap)
+        wrap *= self._dims
+        grid -= wrap
+        base = np.floor(grid)
+        np.minimum(base, self._dims - 1, out=base)  # Arrondi float32 au bord
+        grid -= base                                # grid = fraction dans la cellule
+        corners = np.take(self.table, (base @ self._strides).astype(np.intp), axis=0)
+
+        # Interpolations linéaires successives selon x, y puis z
+        a = corners[:, 12:] - corners[:, :12]
+        a *= grid[:, 0:1]
+        a += corners[:, :12]
+        b = a[:, 6:] - a[:, :6]
+        b *= grid[:, 1:2]
+        b += a[:, :6]
+        c = b[:, 3:] - b[:, :3]
+        c *= grid[:, 2:3]
+        c += b[:, :3]
+
+        if out is None:
+            return c.astype(np.float64)
+        out[:] = c
+        return out
+
+    def divergence(self, samples: int = 20000, step: float = 0.25, seed: int = 0) -> Tuple[float, float]:
+        """
+        Divergence moyenne |∇·v| mesurée sur le champ interpolé, comparée à
+        la norme moyenne du gradient (ratio proche de 0 = champ sans sources).
+        """
+        rng = np.random.default_rng(seed)
+        points = self.origin + rng.uniform(0.0, 1.0, (samples, 3)) * self.period
+        div = np.zeros(samples)
+        grad = np.zeros(samples)
+        for axis in range(3):
+            offset = np.zeros(3)
+            offset[axis] = step
+            derivative = (self.sample(points + offset) - self.sample(points - offset)) / (2.0 * step)
+            div += derivative[:, axis]
+            grad += np.abs(derivative).sum(axis=1)
+        return float(np.abs(div).mean()), float(np.abs(div).mean() / (grad.mean() / 3.0))
+
+
+_FIELDS = {}
+
+
+def get_turbulence_field(sim_config: Optional[dict] = None) -> CurlNoiseField:
+    """Champ partagé par configuration (précalculé une seule fois)."""
+    simulation = (sim_config or {}).get('simulation', {})
+    space = simulation.get('space', DEFAULT_SPACE)
+    settings = simulation.get('physics', {}).get('turbulence', {}) or {}
+    key = (repr(sorted(space.items())), repr(sorted(settings.items())))
+    if key not in _FIELDS:
+        _FIELDS[key] = CurlNoiseField.from_config(sim_config)
+    return _FIELDS[key]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                        DIVERGENCE & BENCHMARK DU CHAMP
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _legacy_turbulence(positions, t):
+    """Ancien pseudo curl-noise sin/cos de PhysicsEngine (référence de coût)."""
+    freq = 0.05
+    fx, fy, fz = positions[:, 0] * freq, positions[:, 1] * freq, positions[:, 2] * freq
+    return np.column_stack((np.sin(fy) * np.cos(fz) * 2.0,
+                            np.sin(fx) * np.cos(fz) * 2.0,
+                            np.cos(fx) * np.sin(fy) * 2.0))
+
+
+def benchmark_field(field: CurlNoiseField, num_drones: int, repeats: int = 50):
+    """Temps moyen (ms) par appel: champ précalculé vs ancien sin/cos."""
+    rng = np.random.default_rng(3)
+    positions = field.origin + rng.uniform(0.0, 1.0, (num_drones, 3)) * field.period
+    out = np.empty((num_drones, 3))
+    timings = {}
+    for name, call in (('curl_field', lambda: field.sample(positions, 2.0, out=out)),
+                       ('legacy_sincos', lambda: _legacy_turbulence(positions, 2.0))):
+        call()
+        start = time.perf_counter()
+        for _ in range(repeats):
+            call()
+        timings[name] = (time.perf_counter() - start) / repeats * 1000.0
+    return timings
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'CurlNoiseField',
+    'get_turbulence_field',
+    'benchmark_field',
+]
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000]
+    start = time.perf_counter()
+    field = get_turbulence_field()
+    print(f"Champ {tuple(field.dims)} cellules, {field.nbytes / 1e6:.1f} Mo, "
+          f"précalculé en {time.perf_counter() - start:.2f}s")
+    mean_div, ratio = field.divergence()
+    print(f"Divergence moyenne {mean_div:.2e} (s⁻¹), ratio divergence / gradient {ratio:.3f}")
+    print(f"{'drones':>8s} {'curl_field':>12s} {'legacy_sincos':>14s}  (ms/appel)")
+    for n in sizes:
+        t = benchmark_field(field, n)
+        print(f"{n:8d} {t['curl_field']:12.3f} {t['legacy_sincos']:14.3f}")
@@ -273,6 +273,11 @@ class MainWindow(QMainWindow):
         self.control_dock.setWidget(scroll)
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.control_dock)
 
+    def closeEvent(self, event):
+        # Arrêter le thread de simulation avant la destruction du contexte GL
+        self.simulation_widget.shutdown()
+        super().closeEvent(event)
+
     def change_phase(self, phase_code):
         print(f"Switching to phase: {phase_code}")
         self.simulation_widget.set_phase(phase_code)
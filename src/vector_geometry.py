@@ -0,0 +1,251 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+              ÉCHANTILLONNAGE VECTORIEL DE POLYGONES - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Formations cartographiques (Afrique, Niger, silhouettes) échantillonnées
+directement sur la géométrie, sans passer par une image rasterisée:
+
+1. Triangulation : ear clipping du contour extérieur + trous (chaque trou
+                   est relié au contour par un pont invisible), faite une
+                   seule fois par forme
+2. Intérieur     : tirage stratifié pondéré par l'aire des triangles puis
+                   point uniforme dans le triangle (coordonnées barycentriques)
+3. Contour       : points répartis à abscisse curviligne régulière sur tous
+                   les anneaux (contour + trous)
+4. Appartenance  : test pair-impair vectorisé pour des milliers de points
+5. Découpage     : anneau limité à un rectangle (cadre d'une carte)
+
+Nombre de points exact, résultats déterministes pour une graine donnée,
+aucune limite de résolution (10k+ drones sans aliasing).
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                               ANNEAUX
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def polygon_area(ring) -> float:
+    """Aire signée (formule du lacet): positive pour un anneau anti-horaire."""
+    ring = np.asarray(ring, dtype=np.float64)
+    x, y = ring[:, 0], ring[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def clean_ring(ring) -> np.ndarray:
+    """Anneau (K, 2) float64 sans point de fermeture ni doublons consécutifs."""
+    ring = np.asarray(ring, dtype=np.float64).reshape(-1, 2)
+    keep = np.any(ring != np.roll(ring, 1, axis=0), axis=1)
+    ring = ring[keep] if keep.any() else ring[:1]
+    if len(ring) < 3:
+        raise ValueError("Un anneau de polygone doit avoir au moins 3 sommets distincts")
+    return ring
+
+
+def clip_ring(ring, bounds) -> np.ndarray:
+    """Anneau découpé par le rectangle (min_x, max_x, min_y, max_y) (Sutherland-Hodgman)."""
+    min_x, max_x, min_y, max_y = bounds
+    points = clean_ring(ring)
+    for axis, limit, keep_below in ((0, min_x, False), (0, max_x, True),
+                                    (1, min_y, False), (1, max_y, True)):
+        if len(points) == 0:
+            break
+        inside = points[:, axis] <= limit if keep_below else points[:, axis] >= limit
+        previous = np.roll(points, 1, axis=0)
+        prev_inside = np.roll(inside, 1)
+        clipped = []
+        for p, q, p_in, q_in in zip(previous, points, prev_inside, inside):
+            if p_in != q_in:
+                u = (limit - p[axis]) / (q[axis] - p[axis])
+                clipped.append(p + (q - p) * u)
+            if q_in:
+                clipped.append(q)
+        points = np.array(clipped).reshape(-1, 2)
+    return clean_ring(points)
+
+
+def _oriented(ring, ccw: bool) -> np.ndarray:
+    ring = clean_ring(ring)
+    return ring if (polygon_area(ring) > 0) == ccw else ring[::-1].copy()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                             TRIANGULATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _segments_cross(p, q, starts, ends) -> np.ndarray:
+    """Intersection propre du segment p-q avec chaque segment starts[i]-ends[i]."""
+    def orient(a, b, c):
+        return (b[..., 0] - a[..., 0]) * (c[..., 1] - a[..., 1]) - \
+               (b[..., 1] - a[..., 1]) * (c[..., 0] - a[..., 0])
+    d1 = orient(starts, ends, p)
+    d2 = orient(starts, ends, q)
+    d3 = orient(p, q, starts)
+    d4 = orient(p, q, ends)
+    return (d1 * d2 < 0) & (d3 * d4 < 0)
+
+
+def _bridge_holes(outer: np.ndarray, holes: List[np.ndarray]) -> np.ndarray:
+    """
+    Relie chaque trou au contour par un pont aller-retour vers le sommet
+    visible le plus proche: un seul anneau simple (dégénéré sur les ponts).
+    """
+    ring = outer
+    # Trous traités du plus à droite au plus à gauche (ponts sans croisement)
+    for hole in sorted(holes, key=lambda h: -h[:, 0].max()):
+        m = int(np.argmax(hole[:, 0]))
+        point = hole[m]
+        others = [h for h in holes if h is not hole]
+        edges = [ring] + others + [hole]
+        starts = np.vstack(edges)
+        ends = np.vstack([np.roll(e, -1, axis=0) for e in edges])
+        order = np.argsort(np.einsum('ij,ij->i', ring - point, ring - point))
+        for candidate in order:
+            if not _segments_cross(point, ring[candidate], starts, ends).any():
+                break
+        hole_loop = np.roll(hole, -m, axis=0)
+        ring = np.vstack((ring[:candidate + 1], hole_loop, hole_loop[:1], ring[candidate:]))
+    return ring
+
+
+def triangulate(outer, holes: Sequence = ()) -> np.ndarray:
+    """
+    Triangles (T, 3, 2) couvrant le polygone outer privé des trous
+    (ear clipping, O(n²) - fait une seule fois par forme).
+    """
+    outer = _oriented(outer, ccw=True)
+    holes = [_oriented(h, ccw=False) for h in holes]
+    ring = _bridge_holes(outer, holes) if holes else outer
+
+    remaining = list(range(len(ring)))
+    triangles = []
+    i = 0
+    stalled = 0
+    while len(remaining) > 3:
+        n = len(remaining)
+        a, b, c = remaining[(i - 1) % n], remaining[i % n], remaining[(i + 1) % n]
+        pa, pb, pc = ring[a], ring[b], ring[c]
+        cross = (pb[0] - pa[0]) * (pc[1] - pa[1]) - (pb[1] - pa[1]) * (pc[0] - pa[0])
+        is_ear = cross >= 0.0
+        if is_ear:
+            # Aucun autre sommet strictement à l'intérieur du triangle candidat
+            others = ring[remaining]
+            d1 = (pb[0] - pa[0]) * (others[:, 1] - pa[1]) - (pb[1] - pa[1]) * (others[:, 0] - pa[0])
+            d2 = (pc[0] - pb[0]) * (others[:, 1] - pb[1]) - (pc[1] - pb[1]) * (others[:, 0] - pb[0])
+            d3 = (pa[0] - pc[0]) * (others[:, 1] - pc[1]) - (pa[1] - pc[1]) * (others[:, 0] - pc[0])
+            is_ear = not np.any((d1 > 0) & (d2 > 0) & (d3 > 0))
+        # Sécurité numérique: après un tour complet sans oreille, on coupe quand même
+        if is_ear or stalled > n:
+            if cross > 0:
+                triangles.append((a, b, c))
+            del remaining[i % n]
+            i = (i - 1) % (n - 1)
+            stalled = 0
+        else:
+            i = (i + 1) % n
+            stalled += 1
+    a, b, c = remaining
+    triangles.append((a, b, c))
+    return ring[np.array(triangles)]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                               APPARTENANCE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def points_in_polygon(points, outer, holes: Sequence = (), chunk: int = 4096) -> np.ndarray:
+    """Masque (N,) des points (N, 2) dans outer et hors des trous (règle pair-impair)."""
+    rings = [clean_ring(outer)] + [clean_ring(h) for h in holes]
+    starts = np.vstack(rings)
+    ends = np.vstack([np.roll(r, -1, axis=0) for r in rings])
+    x1, y1, x2, y2 = starts[:, 0], starts[:, 1], ends[:, 0], ends[:, 1]
+    dy = np.where(y2 != y1, y2 - y1, 1.0)
+
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    inside = np.zeros(len(points), dtype=bool)
+    for lo in range(0, len(points), chunk):
+        px = points[lo:lo + chunk, 0:1]
+        py = points[lo:lo + chunk, 1:2]
+        straddle = (y1 > py) != (y2 > py)
+        x_cross = x1 + (py - y1) * (x2 - x1) / dy
+        inside[lo:lo + chunk] = np.count_nonzero(straddle & (px < x_cross), axis=1) % 2 == 1
+    return inside
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                            FORME ÉCHANTILLONNABLE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class PolygonShape:
+    """Polygone (contour + trous) triangulé une fois, échantillonné en vectoriel"""
+
+    def __init__(self, outer, holes: Sequence = ()):
+        self.outer = clean_ring(outer)
+        self.holes = [clean_ring(h) for h in holes]
+        self.triangles = triangulate(self.outer, self.holes)
+
+        # Aires cumulées des triangles (tirage pondéré par l'aire)
+        e1 = self.triangles[:, 1] - self.triangles[:, 0]
+        e2 = self.triangles[:, 2] - self.triangles[:, 0]
+        self._tri_area = 0.5 * np.abs(e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0])
+        self._tri_cum = np.cumsum(self._tri_area)
+
+        # Longueurs cumulées des arêtes de tous les anneaux (tirage curviligne)
+        rings = [self.outer] + self.holes
+        self._edge_start = np.vstack(rings)
+        self._edge_vec = np.vstack([np.roll(r, -1, axis=0) for r in rings]) - self._edge_start
+        self._edge_cum = np.cumsum(np.hypot(self._edge_vec[:, 0], self._edge_vec[:, 1]))
+
+    @property
+    def area(self) -> float:
+        return float(self._tri_cum[-1])
+
+    @property
+    def perimeter(self) -> float:
+        return float(self._edge_cum[-1])
+
+    @property
+    def bounds(self):
+        """(min_x, max_x, min_y, max_y) du contour extérieur"""
+        lo, hi = self.outer.min(axis=0), self.outer.max(axis=0)
+        return float(lo[0]), float(hi[0]), float(lo[1]), float(hi[1])
+
+    def sample_interior(self, n: int, seed: Optional[int] = 0) -> np.ndarray:
+        """n points (n, 2) uniformes dans la surface (stratifiés par aire)."""
+        rng = np.random.default_rng(seed)
+        target = (np.arange(n) + rng.random(n)) * (self.area / max(n, 1))
+        tri = np.minimum(np.searchsorted(self._tri_cum, target, side='right'), len(self._tri_cum) - 1)
+        r1 = np.sqrt(rng.random(n))
+        r2 = rng.random(n)
+        a, b, c = self.triangles[tri, 0], self.triangles[tri, 1], self.triangles[tri, 2]
+        return a * (1.0 - r1)[:, None] + b * (r1 * (1.0 - r2))[:, None] + c * (r1 * r2)[:, None]
+
+    def sample_outline(self, n: int, seed: Optional[int] = 0) -> np.ndarray:
+        """n points (n, 2) régulièrement espacés le long du contour et des trous."""
+        offset = np.random.default_rng(seed).random()
+        s = (np.arange(n) + offset) * (self.perimeter / max(n, 1))
+        edge = np.minimum(np.searchsorted(self._edge_cum, s, side='right'), len(self._edge_cum) - 1)
+        length = np.diff(self._edge_cum, prepend=0.0)[edge]
+        u = (s - (self._edge_cum[edge] - length)) / np.where(length > 0, length, 1.0)
+        return self._edge_start[edge] + self._edge_vec[edge] * u[:, None]
+
+    def contains(self, points) -> np.ndarray:
+        return points_in_polygon(points, self.outer, self.holes)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'PolygonShape',
+    'triangulate',
+    'points_in_polygon',
+    'polygon_area',
+    'clean_ring',
+    'clip_ring',
+]
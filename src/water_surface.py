@@ -0,0 +1,176 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+                 SURFACE D'EAU "LAC DE NUIT" EN VBO STATIQUE - ANEM 2025
+═══════════════════════════════════════════════════════════════════════════════
+Le plan d'eau, les lignes de reflets et le cercle de gouttes sont construits
+une seule fois dans un vertex buffer (initializeGL). À chaque frame, le CPU ne
+fait qu'un bind + 3 glDrawArrays; l'ondulation est calculée dans le vertex
+shader à partir de l'uniform `time`:
+
+    reflets : z += sin(x * 0.02 + time) * 3            (lignes ondulées)
+    cercle  : rayon = 50 + sin(time * 2) * 5           (sommets stockés à 50 m)
+    plan    : houle très légère, grille subdivisée     (coût CPU nul)
+
+Le type de sommet (plan / reflet / cercle) est passé dans gl_MultiTexCoord0.
+Sans GLSL, le même VBO est dessiné par le pipeline fixe (ondulation figée).
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import ctypes
+import time
+
+import numpy as np
+import OpenGL.GL as gl
+
+from shader_system import ShaderProgram
+
+
+WATER_VERTEX_SHADER = """
+#version 120
+
+uniform float time;
+
+void main(void)
+{
+    vec4 v = gl_Vertex;
+    float kind = gl_MultiTexCoord0.s;
+    if (kind > 1.5) {
+        // Cercle de gouttes: sommets stockés au rayon 50 m
+        v.xz *= 1.0 + sin(time * 2.0) * 0.1;
+    } else if (kind > 0.5) {
+        // Lignes de reflets de la lune
+        v.z += sin(v.x * 0.02 + time) * 3.0;
+    } else {
+        // Houle du plan (reste sous les reflets posés à +0.1 m)
+        v.y += sin(v.x * 0.03 + time * 0.7) * cos(v.z * 0.025 + time * 0.5) * 0.05;
+    }
+    gl_Position = gl_ModelViewProjectionMatrix * v;
+    gl_FrontColor = gl_Color;
+}
+"""
+
+WATER_FRAGMENT_SHADER = """
+#version 120
+
+void main(void)
+{
+    gl_FragColor = gl_Color;
+}
+"""
+
+# Sommet entrelacé: position (3) + couleur RGBA (4) + type (1), float32
+VERTEX_FLOATS = 8
+KIND_PLANE, KIND_REFLECTION, KIND_RING = 0.0, 1.0, 2.0
+
+
+def build_water_geometry(water_level=-5.0, water_size=300.0, plane_cells=64,
+                         line_step=2.0, ring_segments=96):
+    """
+    Sommets entrelacés (V, 8) float32 et segments [(mode, premier, nombre)]
+    pour GL_QUADS (plan), GL_LINES (reflets) et GL_LINE_LOOP (cercle).
+    """
+    # 1. Plan d'eau subdivisé (bleu nuit profond, alpha 0.85)
+    edges = np.linspace(-water_size, water_size, plane_cells + 1)
+    x0, z0 = np.meshgrid(edges[:-1], edges[:-1], indexing='ij')
+    x1, z1 = x0 + (edges[1] - edges[0]), z0 + (edges[1] - edges[0])
+    corners = np.stack((np.stack((x0, z0), -1), np.stack((x1, z0), -1),
+                        np.stack((x1, z1), -1), np.stack((x0, z1), -1)), axis=2).reshape(-1, 2)
+    plane = np.empty((len(corners), VERTEX_FLOATS), dtype=np.float32)
+    plane[:, 0] = corners[:, 0]
+    plane[:, 1] = water_level
+    plane[:, 2] = corners[:, 1]
+    plane[:, 3:7] = (0.02, 0.04, 0.12, 0.85)
+    plane[:, 7] = KIND_PLANE
+
+    # 2. Lignes de reflets: 11 lignes z = -250..250, segments de line_step mètres
+    xs = np.arange(-water_size, water_size + line_step / 2, line_step)
+    seg_x = np.stack((xs[:-1], xs[1:]), axis=1).reshape(-1)
+    z_bases = np.arange(-10, 11, 2) * 25.0
+    reflections = np.empty((len(z_bases) * len(seg_x), VERTEX_FLOATS), dtype=np.float32)
+    reflections[:, 0] = np.tile(seg_x, len(z_bases))
+    reflections[:, 1] = water_level + 0.1
+    reflections[:, 2] = np.repeat(z_bases, len(seg_x))
+    reflections[:, 3:7] = (0.05, 0.08, 0.18, 0.4)
+    reflections[:, 7] = KIND_REFLECTION
+
+    # 3. Cercle concentrique de 50 m (pulsation du rayon appliquée par le shader)
+    angles = np.linspace(0.0, 2.0 * np.pi, ring_segments, endpoint=False)
+    ring = np.empty((ring_segments, VERTEX_FLOATS), dtype=np.float32)
+    ring[:, 0] = np.cos(angles) * 50.0
+    ring[:, 1] = water_level + 0.1
+    ring[:, 2] = np.sin(angles) * 50.0
+    ring[:, 3:7] = (0.08, 0.12, 0.22, 0.25)
+    ring[:, 7] = KIND_RING
+
+    vertices = np.ascontiguousarray(np.concatenate((plane, reflections, ring)))
+    segments = [
+        (gl.GL_QUADS, 0, len(plane)),
+        (gl.GL_LINES, len(plane), len(reflections)),
+        (gl.GL_LINE_LOOP, len(plane) + len(reflections), len(ring)),
+    ]
+    return vertices, segments
+
+
+class WaterSurface:
+    """VBO statique du lac + programme GLSL d'ondulation"""
+
+    def __init__(self, water_level=-5.0, water_size=300.0, plane_cells=64):
+        self.water_level = water_level
+        self.water_size = water_size
+        self.plane_cells = plane_cells
+        self.vbo = None
+        self.shader = None
+        self.segments = []
+        self.start_time = time.perf_counter()
+
+    def initialize(self):
+        """À appeler dans initializeGL (contexte OpenGL courant)."""
+        vertices, self.segments = build_water_geometry(
+            self.water_level, self.water_size, self.plane_cells)
+        self.vbo = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, vertices.nbytes, vertices, gl.GL_STATIC_DRAW)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+        self.shader = ShaderProgram(WATER_VERTEX_SHADER, WATER_FRAGMENT_SHADER, "Water")
+        if self.shader.program is None:
+            self.shader = None
+
+    def draw(self):
+        """Dessine le lac: aucun calcul par sommet côté Python."""
+        if self.vbo is None:
+            return
+        stride = VERTEX_FLOATS * 4
+        # Animation lente sur l'horloge murale (comme l'ancien time.time() * 0.3)
+        t = (time.perf_counter() - self.start_time) * 0.3
+
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+        gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glEnableClientState(gl.GL_COLOR_ARRAY)
+        gl.glEnableClientState(gl.GL_TEXTURE_COORD_ARRAY)
+        gl.glVertexPointer(3, gl.GL_FLOAT, stride, ctypes.c_void_p(0))
+        gl.glColorPointer(4, gl.GL_FLOAT, stride, ctypes.c_void_p(12))
+        gl.glTexCoordPointer(1, gl.GL_FLOAT, stride, ctypes.c_void_p(28))
+
+        if self.shader is not None:
+            self.shader.use()
+            self.shader.set_uniform_1f("time", t)
+        for mode, first, count in self.segments:
+            gl.glDrawArrays(mode, first, count)
+        if self.shader is not None:
+            self.shader.stop()
+
+        gl.glDisableClientState(gl.GL_TEXTURE_COORD_ARRAY)
+        gl.glDisableClientState(gl.GL_COLOR_ARRAY)
+        gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          EXPORT DES CLASSES PRINCIPALES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    'WaterSurface',
+    'build_water_geometry',
+]
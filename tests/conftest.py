@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modules plats de src/ importés comme au lancement de main.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from compute_backend import NumpyBackend, check_equivalence, get_backend
+
+
+def test_numpy_backend_is_always_available():
+    assert get_backend({'compute_backend': 'numpy'}).name == 'numpy'
+
+
+def test_living_formation_writes_into_out():
+    positions = np.random.default_rng(1).uniform(-50, 50, (64, 3))
+    out = np.empty_like(positions)
+    assert NumpyBackend().living_formation(positions, 3.0, out) is out
+
+
+@pytest.mark.parametrize("num_drones", [1, 257, 2000])
+def test_numba_kernels_match_numpy(num_drones):
+    pytest.importorskip("numba")
+    from compute_backend import NumbaBackend
+
+    results = check_equivalence(NumbaBackend(), num_drones=num_drones)
+    failing = {name: err for name, (err, ok) in results.items() if not ok}
+    assert not failing, f"écarts Numba / NumPy: {failing}"
+
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from formation_library import FormationLibrary
+from phase_registry import PHASE_REGISTRY
+
+NUM_DRONES = 1000
+ANIMATED = sorted(name for name, spec in PHASE_REGISTRY.items() if not spec.static)
+
+
+@pytest.fixture(scope="module")
+def library():
+    return FormationLibrary()
+
+
+@pytest.mark.parametrize("phase", sorted(PHASE_REGISTRY))
+def test_cached_and_per_frame_paths_share_drone_mapping(library, phase):
+    # Transitions ciblent get_phase(p, n), chaque frame get_phase(p, n, t=...):
+    # le drone i doit viser le même point à t = 0
+    cached, _ = library.get_phase(phase, NUM_DRONES)
+    framed, _ = library.get_phase(phase, NUM_DRONES, t=0.0)
+    np.testing.assert_allclose(np.asarray(framed, dtype=np.float64),
+                               np.asarray(cached, dtype=np.float64), atol=1e-4)
+
+
+@pytest.mark.parametrize("phase", ANIMATED)
+def test_out_buffers_match_allocating_path(library, phase):
+    out = (np.zeros((NUM_DRONES, 3), dtype=np.float32), np.zeros((NUM_DRONES, 3), dtype=np.float32))
+    framed, _ = library.get_phase(phase, NUM_DRONES, t=2.5)
+    written, _ = library.get_phase(phase, NUM_DRONES, t=2.5, out=out)
+    count = min(len(framed), NUM_DRONES)
+    np.testing.assert_allclose(written[:count], np.asarray(framed[:count], dtype=np.float32), atol=1e-3)
+
+
+def test_per_frame_noise_depends_only_on_time(library):
+    first, _ = library.get_phase("phase1_pluie", NUM_DRONES, t=3.21)
+    first = np.array(first)
+    library.get_phase("phase1_pluie", NUM_DRONES, t=7.0)
+    np.random.rand(10)
+    again, _ = library.get_phase("phase1_pluie", NUM_DRONES, t=3.21)
+    np.testing.assert_array_equal(again, first)
@@ -0,0 +1,34 @@
+import pytest
+
+from formation_library import FormationLibrary
+from frame_profiler import (UFUNC_BUFFER_ALLOWANCE, check_frame_allocations, frame_buffer_bytes,
+                            measure_frame_allocations)
+from phase_registry import PHASE_REGISTRY
+
+NUM_DRONES = 10000
+ANIMATED = sorted(name for name, spec in PHASE_REGISTRY.items() if not spec.static)
+THRESHOLD = frame_buffer_bytes(NUM_DRONES) + UFUNC_BUFFER_ALLOWANCE
+
+
+@pytest.fixture(scope="module")
+def library():
+    return FormationLibrary()
+
+
+@pytest.mark.parametrize("phase", ANIMATED)
+def test_animated_phases_write_into_out_buffers(phase):
+    assert PHASE_REGISTRY[phase].writes_out
+
+
+@pytest.mark.parametrize("t", [0.5, 5.0, 12.0, 45.0])
+@pytest.mark.parametrize("phase", ANIMATED)
+def test_frame_makes_no_large_allocation(library, phase, t):
+    # Une frame en régime ne doit jamais allouer un buffer de la taille de l'essaim
+    peak = measure_frame_allocations(library, phase, NUM_DRONES, t=t)
+    assert peak < THRESHOLD, f"{phase} à t={t}: pic {peak} octets (seuil {THRESHOLD})"
+
+
+def test_check_frame_allocations_reports_every_animated_phase(library):
+    report = check_frame_allocations(NUM_DRONES, library=library)
+    assert sorted(report) == ANIMATED
+    assert all(ok for _, _, ok in report.values())
@@ -0,0 +1,34 @@
+import numpy as np
+
+from show_validator import SafetyLimits, ShowValidator
+
+
+LIMITS = SafetyLimits(min_separation=2.0, collision_radius=0.5, max_speed=10.0,
+                      max_acceleration=5.0, x_range=(-100.0, 100.0),
+                      y_range=(0.0, 100.0), z_range=(-100.0, 100.0))
+
+
+def test_every_pair_inside_a_cluster_is_counted():
+    # Amas de 4 drones à 1 m les uns des autres (6 paires) + un drone isolé et un au sol
+    positions = np.array([[0.0, 10.0, 0.0], [1.0, 10.0, 0.0], [0.0, 11.0, 0.0],
+                          [0.0, 10.0, 1.0], [50.0, 10.0, 0.0], [0.5, 0.0, 0.0]])
+    validator = ShowValidator(LIMITS, worst_pairs=3)
+    validator.feed(0.0, positions, "amas")
+    report = validator.report()
+    assert report.separation_violations == 6
+    assert report.collisions == 0
+    assert report.per_phase["amas"]["separation"] == 6
+    assert report.min_distance == 1.0
+
+
+def test_worst_pairs_keep_closest_distinct_pairs():
+    positions = np.array([[0.0, 10.0, 0.0], [0.2, 10.0, 0.0], [1.5, 10.0, 0.0],
+                          [20.0, 10.0, 0.0], [20.0, 10.0, 0.0]])
+    validator = ShowValidator(LIMITS, worst_pairs=2)
+    validator.feed(0.0, positions, "a")
+    positions[3, 0] += 0.1
+    validator.feed(0.1, positions, "b")
+    report = validator.report()
+    assert report.collisions == 4      # (0, 1) et (3, 4) sous collision_radius aux deux frames
+    assert [(i, j) for _, _, i, j, _ in report.worst_pairs] == [(3, 4), (0, 1)]
+    assert report.worst_pairs[0][1] == 0.0 and report.worst_pairs[0][4] == "a"
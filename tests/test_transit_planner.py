@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from transit_planner import TransitPlanner
+from transition_system import ProfessionalTransitionSystem, StaggerScheduler, TransitionState
+
+
+def crossing_swarm():
+    # Grille 8 × 8 qui traverse vers sa symétrique, cibles mélangées: beaucoup de croisements
+    grid = np.stack(np.meshgrid(np.arange(8) * 6.0, np.arange(8) * 6.0), -1).reshape(-1, 2)
+    start = np.column_stack([grid[:, 0] - 21.0, np.full(len(grid), 20.0), grid[:, 1]])
+    end = start.copy()
+    end[:, 0] = -start[:, 0]
+    end[:, 2] = start[::-1, 2]
+    end = end[np.random.default_rng(0).permutation(len(end))]
+    delays, flight_time = StaggerScheduler().schedule(start, end, 5.0)
+    return start, end, delays, flight_time
+
+
+def test_escalation_clears_conflicts_left_by_pairwise_fixes():
+    start, end, delays, flight_time = crossing_swarm()
+    stalled = TransitPlanner(max_escalations=0, time_budget=10.0).plan(start, end, delays, flight_time)
+    assert stalled.conflicts > 0
+    plan = TransitPlanner(time_budget=10.0).plan(start, end, delays, flight_time)
+    assert plan.ok
+    assert plan.delays.max() <= delays.max() + 1e-9  # Retards dans la marge de l'échelonnement
+
+
+def test_strict_plan_raises_when_conflicts_remain():
+    start, end, delays, flight_time = crossing_swarm()
+    planner = TransitPlanner(max_iterations=0, max_escalations=0)
+    with pytest.raises(RuntimeError):
+        planner.plan(start, end, delays, flight_time, strict=True)
+
+
+def test_background_plan_holds_blackout_until_ready():
+    start, end, _, _ = crossing_swarm()
+    system = ProfessionalTransitionSystem(len(start))
+    system.start_transition(start, np.ones_like(start), end, np.ones_like(end))
+    assert system.state == TransitionState.FADE_OUT
+
+    assignments = []
+    while system.state in (TransitionState.FADE_OUT, TransitionState.BLACKOUT):
+        system.update(0.05)
+        assignment = system.take_assignment()
+        if assignment is not None:
+            assignments.append(assignment)
+    system.shutdown()
+
+    assert system.state == TransitionState.TRANSIT_DARK
+    assert len(assignments) == 1
+    np.testing.assert_array_equal(np.sort(assignments[0]), np.arange(len(start)))
+    np.testing.assert_allclose(system.get_positions(), system.plan.positions(0.0))